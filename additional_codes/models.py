@@ -9,7 +9,9 @@ from common.fields import LongDescription
 from common.fields import ShortDescription
 from common.fields import SignedIntSID
 from common.models import TrackedModel
+from common.models.managers import TrackedModelManager
 from common.models.mixins.description import DescribedMixin
+from common.models.mixins.description import DescribedQueryset
 from common.models.mixins.description import DescriptionMixin
 from common.models.mixins.validity import ValidityMixin
 from footnotes import business_rules as footnotes_business_rules
@@ -70,6 +72,7 @@ class AdditionalCode(TrackedModel, ValidityMixin, DescribedMixin):
     subrecord_code = "00"
 
     identifying_fields = ("sid",)
+    search_identifier_fields = ("type__sid", "code")
 
     sid = SignedIntSID(db_index=True)
     type = models.ForeignKey(AdditionalCodeType, on_delete=models.PROTECT)
@@ -78,6 +81,8 @@ class AdditionalCode(TrackedModel, ValidityMixin, DescribedMixin):
         validators=[validators.additional_code_validator],
     )
 
+    objects = TrackedModelManager.from_queryset(DescribedQueryset)()
+
     indirect_business_rules = (
         footnotes_business_rules.FO15,
         footnotes_business_rules.FO9,
@@ -26,6 +26,7 @@ from additional_codes.serializers import AdditionalCodeTypeSerializer
 from common.models import TrackedModel
 from common.serializers import AutoCompleteSerializer
 from common.validators import UpdateType
+from common.views import CachedAutoCompleteMixin
 from common.views import DescriptionDeleteMixin
 from common.views import TamatoListView
 from common.views import TrackedModelDetailMixin
@@ -38,7 +39,7 @@ from workbaskets.views.generic import CreateTaricUpdateView
 from workbaskets.views.generic import EditTaricView
 
 
-class AdditionalCodeViewSet(viewsets.ReadOnlyModelViewSet):
+class AdditionalCodeViewSet(CachedAutoCompleteMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint that allows additional codes to be viewed."""
 
     serializer_class = AutoCompleteSerializer
@@ -49,7 +50,7 @@ class AdditionalCodeViewSet(viewsets.ReadOnlyModelViewSet):
         return (
             AdditionalCode.objects.approved_up_to_transaction(tx)
             .select_related("type")
-            .prefetch_related("descriptions")
+            .with_latest_description(tx)
         )
 
 
@@ -83,6 +84,10 @@ class AdditionalCodeList(AdditionalCodeMixin, TamatoListView):
         "descriptions__description",
     ]
 
+    def get_queryset(self):
+        tx = WorkBasket.get_current_transaction(self.request)
+        return super().get_queryset().with_latest_description(tx)
+
 
 class AdditionalCodeCreate(CreateTaricCreateView):
     """UI endpoint for creating AdditionalCode CREATE instances."""
@@ -144,8 +149,8 @@ class AdditionalCodeDetail(AdditionalCodeMixin, TrackedModelDetailView):
             Measure.objects.with_effective_valid_between()
             .filter(
                 (
-                    Q(db_effective_end_date__isnull=True)
-                    | Q(db_effective_end_date__gte=datetime.today())
+                    Q(effective_validity__end_date__isnull=True)
+                    | Q(effective_validity__end_date__gte=datetime.today())
                 )
                 & Q(is_current__isnull=False),
             )
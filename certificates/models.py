@@ -7,7 +7,9 @@ from common.business_rules import UpdateValidity
 from common.fields import ShortDescription
 from common.fields import SignedIntSID
 from common.models import TrackedModel
+from common.models.managers import TrackedModelManager
 from common.models.mixins.description import DescribedMixin
+from common.models.mixins.description import DescribedQueryset
 from common.models.mixins.description import DescriptionMixin
 from common.models.mixins.validity import ValidityMixin
 from measures import business_rules as measures_business_rules
@@ -59,6 +61,9 @@ class Certificate(TrackedModel, ValidityMixin, DescribedMixin):
         "certificate_type__sid",
         "sid",
     )
+    search_identifier_fields = ("certificate_type__sid", "sid")
+
+    objects = TrackedModelManager.from_queryset(DescribedQueryset)()
 
     indirect_business_rules = (
         measures_business_rules.ME56,
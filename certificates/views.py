@@ -17,6 +17,7 @@ from certificates.models import Certificate
 from certificates.serializers import CertificateTypeSerializer
 from common.models import TrackedModel
 from common.serializers import AutoCompleteSerializer
+from common.views import CachedAutoCompleteMixin
 from common.views import DescriptionDeleteMixin
 from common.views import SortingMixin
 from common.views import TamatoListView
@@ -32,7 +33,7 @@ from workbaskets.views.generic import CreateTaricUpdateView
 from workbaskets.views.generic import EditTaricView
 
 
-class CertificatesViewSet(viewsets.ReadOnlyModelViewSet):
+class CertificatesViewSet(CachedAutoCompleteMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint that allows certificates to be viewed."""
 
     serializer_class = AutoCompleteSerializer
@@ -44,7 +45,7 @@ class CertificatesViewSet(viewsets.ReadOnlyModelViewSet):
         return (
             models.Certificate.objects.approved_up_to_transaction(tx)
             .select_related("certificate_type")
-            .prefetch_related("descriptions")
+            .with_latest_description(tx)
         )
 
 
@@ -78,6 +79,10 @@ class CertificateList(CertificateMixin, TamatoListView):
         "descriptions__description",
     ]
 
+    def get_queryset(self):
+        tx = WorkBasket.get_current_transaction(self.request)
+        return super().get_queryset().with_latest_description(tx)
+
 
 class CertificateCreate(CreateTaricCreateView):
     """UI endpoint for creating Certificates CREATE instances."""
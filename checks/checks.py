@@ -1,7 +1,10 @@
 import time
+from collections import defaultdict
 from functools import cached_property
+from itertools import chain
 from typing import Collection
 from typing import Dict
+from typing import Iterable
 from typing import Iterator
 from typing import Optional
 from typing import Tuple
@@ -11,6 +14,7 @@ from typing import TypeVar
 from checks.models import TrackedModelCheck
 from checks.models import TransactionCheck
 from common.business_rules import ALL_RULES
+from common.business_rules import BatchBusinessRule
 from common.business_rules import BusinessRule
 from common.business_rules import BusinessRuleViolation
 from common.models.trackedmodel import TrackedModel
@@ -233,8 +237,134 @@ def checker_types() -> Iterator[Type[Checker]]:
         yield IndirectBusinessRuleChecker.of(rule)
 
 
+class CheckerRegistry:
+    """
+    Maps each ``TrackedModel`` subclass to the ordered ``Checker`` types that
+    apply to it, so that finding the checkers for a model is a dictionary lookup
+    rather than a scan over every rule in ``ALL_RULES``.
+
+    An entry is built the first time its model type is looked up, with a
+    ``BusinessRuleChecker`` for each of the type's ``business_rules`` followed
+    by an ``IndirectBusinessRuleChecker`` for each of its
+    ``indirect_business_rules``. Rules that skip some models (see
+    ``common.business_rules.skip_when_deleted``) are included and decide
+    whether to skip when they are run. An entry is rebuilt if either set of
+    rules on the model type has since been replaced.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[
+            Type[TrackedModel],
+            Tuple[Iterable, Iterable, Tuple[Type[BusinessRuleChecker], ...]],
+        ] = {}
+
+    def checker_types_for(
+        self,
+        model_type: Type[TrackedModel],
+    ) -> Tuple[Type[BusinessRuleChecker], ...]:
+        """Return the ``Checker`` types that apply to models of
+        ``model_type``."""
+        business_rules = model_type.business_rules
+        indirect_business_rules = model_type.indirect_business_rules
+
+        entry = self._entries.get(model_type)
+        if (
+            entry is not None
+            and entry[0] is business_rules
+            and entry[1] is indirect_business_rules
+        ):
+            return entry[2]
+
+        checker_types = tuple(
+            dict.fromkeys(
+                chain(
+                    (BusinessRuleChecker.of(rule) for rule in business_rules),
+                    (
+                        IndirectBusinessRuleChecker.of(rule)
+                        for rule in indirect_business_rules
+                    ),
+                ),
+            ),
+        )
+        self._entries[model_type] = (
+            business_rules,
+            indirect_business_rules,
+            checker_types,
+        )
+        return checker_types
+
+    def checkers_for(self, model: TrackedModel) -> Iterator[Checker]:
+        """Return instances of the ``Checker`` types that apply to the supplied
+        TrackedModel instance."""
+        for checker_type in self.checker_types_for(type(model)):
+            yield from checker_type.checkers_for(model)
+
+
+checker_registry = CheckerRegistry()
+
+
 def applicable_to(model: TrackedModel) -> Iterator[Checker]:
     """Return instances of any Checker classes applicable to the supplied
     TrackedModel instance."""
-    for checker_type in checker_types():
-        yield from checker_type.checkers_for(model)
+    return checker_registry.checkers_for(model)
+
+
+def apply_batch_checks(context: TransactionCheck) -> None:
+    """
+    Run every ``BatchBusinessRule`` against all of the models it applies to in
+    the context's transaction at once, and record a result for each model.
+
+    Per-model checks that have already been recorded are skipped when the
+    transaction's models are checked individually, so rules that are expensive
+    to run one model at a time are only run once per transaction.
+    """
+    models_by_type = defaultdict(list)
+    for model in context.transaction.tracked_models.all():
+        models_by_type[type(model)].append(model)
+
+    with override_current_transaction(context.transaction):
+        for model_type, models in models_by_type.items():
+            for rule in model_type.business_rules:
+                if not issubclass(rule, BatchBusinessRule) or hasattr(
+                    rule.validate,
+                    "__wrapped__",
+                ):
+                    # Decorated rules only run for some models, so can't be
+                    # batched.
+                    continue
+
+                check_name = BusinessRuleChecker.of(rule)().name
+                checked = set(
+                    context.model_checks.filter(
+                        model__in=models,
+                        check_name=check_name,
+                    ).values_list("model", flat=True),
+                )
+                unchecked = [model for model in models if model.pk not in checked]
+                if not unchecked:
+                    continue
+
+                start_time = time.time()
+                try:
+                    messages = {
+                        violation.model.pk: violation.args[0]
+                        for violation in rule(context.transaction).violations(
+                            unchecked,
+                        )
+                    }
+                except Exception as e:
+                    message = INTERNAL_ERROR_MESSAGE + " : " + str(e)
+                    messages = {model.pk: message for model in unchecked}
+                elapsed_time = (time.time() - start_time) / len(unchecked)
+
+                TrackedModelCheck.objects.bulk_create(
+                    TrackedModelCheck(
+                        model=model,
+                        transaction_check=context,
+                        check_name=check_name,
+                        successful=model.pk not in messages,
+                        message=messages.get(model.pk),
+                        processing_time=elapsed_time,
+                    )
+                    for model in unchecked
+                )
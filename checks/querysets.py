@@ -10,7 +10,7 @@ from common.models.transactions import Transaction
 from common.models.transactions import TransactionPartition
 from common.models.utils import LazyTransaction
 
-latest_transaction = LazyTransaction(get_value=Transaction.approved.last)
+latest_transaction = LazyTransaction(get_value=Transaction.latest_approved)
 
 
 class TransactionCheckQueryset(CTEQuerySet):
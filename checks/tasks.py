@@ -1,9 +1,11 @@
+from collections import defaultdict
 from itertools import cycle
 
 from celery import group
 from celery.utils.log import get_task_logger
 
-from checks.checks import applicable_to
+from checks.checks import apply_batch_checks
+from checks.checks import checker_registry
 from checks.models import TransactionCheck
 from common.celery import app
 from common.models.trackedmodel import TrackedModel
@@ -30,12 +32,16 @@ def check_model(trackedmodel_id: int, context_id: int):
     context: TransactionCheck = TransactionCheck.objects.get(pk=context_id)
     transaction = context.transaction
 
+    performed_checks = set(
+        context.model_checks.filter(model=model).values_list(
+            "check_name",
+            flat=True,
+        ),
+    )
+
     with override_current_transaction(transaction):
-        for check in applicable_to(model):
-            if not context.model_checks.filter(
-                model=model,
-                check_name=check.name,
-            ).exists():
+        for check in checker_registry.checkers_for(model):
+            if check.name not in performed_checks:
                 # Run the checker on the model and record the result. (This is
                 # not Celery ``apply`` but ``Checker.apply``).
                 check.apply(model, context)
@@ -49,17 +55,20 @@ def is_transaction_check_complete(check_id: int) -> bool:
     check: TransactionCheck = TransactionCheck.objects.get(pk=check_id)
     check.completed = True
 
+    performed_checks = defaultdict(set)
+    for model_id, check_name in check.model_checks.values_list(
+        "model",
+        "check_name",
+    ):
+        performed_checks[model_id].add(check_name)
+
     with override_current_transaction(check.transaction):
         for model in check.transaction.tracked_models.all():
-            applicable_checks = set(check.name for check in applicable_to(model))
-            performed_checks = set(
-                check.model_checks.filter(model=model).values_list(
-                    "check_name",
-                    flat=True,
-                ),
+            applicable_checks = set(
+                checker.name for checker in checker_registry.checkers_for(model)
             )
 
-            if applicable_checks != performed_checks:
+            if applicable_checks != performed_checks[model.pk]:
                 check.completed = False
                 break
 
@@ -113,9 +122,13 @@ def check_transaction(self, transaction_id: int):
         )
         return
 
+    # Run the rules that check the whole transaction at once first, so that
+    # the model checks can skip them.
+    logger.info("Beginning check of %s", transaction.summary)
+    apply_batch_checks(check)
+
     # Create a workflow: firstly run all of the model checks (in parallel) and
     # then once they are all done see if the transaction check is now complete.
-    logger.info("Beginning check of %s", transaction.summary)
     workflow = group(
         check_model.si(*args) for args in zip(model_ids, cycle([check.pk]))
     ) | is_transaction_check_complete.si(check.pk)
@@ -140,6 +153,7 @@ def check_transaction_sync(transaction: Transaction):
         )
     else:
         logger.info("Beginning synchronous check of %s", transaction.summary)
+        apply_batch_checks(check)
         for model_id in model_ids:
             check_model(model_id, check.pk)
         is_transaction_check_complete(check.pk)
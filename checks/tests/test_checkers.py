@@ -5,8 +5,12 @@ import pytest
 
 import checks.tests.factories
 from checks.checks import BusinessRuleChecker
+from checks.checks import CheckerRegistry
 from checks.checks import IndirectBusinessRuleChecker
+from checks.checks import applicable_to
+from checks.checks import apply_batch_checks
 from checks.checks import checker_types
+from common.business_rules import BatchBusinessRule
 from common.models.transactions import Transaction
 from common.models.utils import override_current_transaction
 from common.tests import factories
@@ -16,6 +20,15 @@ from common.tests.util import add_business_rules
 pytestmark = pytest.mark.django_db
 
 
+class FirstModelViolates(BatchBusinessRule):
+    __test__ = False
+    batches = []
+
+    def violations(self, models):
+        self.batches.append(list(models))
+        yield self.violation(min(models, key=lambda model: model.pk))
+
+
 def test_all_business_rules_have_a_checker(trackedmodel_factory):
     """Verify that each BusinessRule has a corresponding Checker."""
     checkers = set(checker.rule for checker in checker_types())
@@ -26,6 +39,46 @@ def test_all_business_rules_have_a_checker(trackedmodel_factory):
     assert checkers.intersection(model_rules) == model_rules
 
 
+def test_checker_registry_maps_model_types_to_checkers():
+    """Verify that the registry lists a model type's direct rule checkers
+    followed by its indirect ones, and reuses the mapping on later lookups."""
+    registry = CheckerRegistry()
+    model_type = factories.TestModelDescription1Factory._meta.model
+
+    with add_business_rules(model_type, TestRule, indirect=True):
+        checker_types = registry.checker_types_for(model_type)
+
+        assert checker_types == (
+            *(BusinessRuleChecker.of(rule) for rule in model_type.business_rules),
+            IndirectBusinessRuleChecker.of(TestRule),
+            *(
+                IndirectBusinessRuleChecker.of(rule)
+                for rule in model_type.indirect_business_rules[1:]
+            ),
+        )
+        assert registry.checker_types_for(model_type) is checker_types
+
+    assert IndirectBusinessRuleChecker.of(TestRule) not in (
+        registry.checker_types_for(model_type)
+    )
+
+
+def test_applicable_to_matches_all_checker_types():
+    """Verify that the checkers found through the registry are the same as
+    those found by asking every checker type."""
+    model = factories.TestModel1Factory.create()
+
+    with add_business_rules(type(model), TestRule):
+        with override_current_transaction(model.transaction):
+            expected = {
+                checker.name
+                for checker_type in checker_types()
+                for checker in checker_type.checkers_for(model)
+            }
+            assert {checker.name for checker in applicable_to(model)} == expected
+        assert BusinessRuleChecker.of(TestRule)().name in expected
+
+
 def test_business_rules_validation():
     """Verify that ``Checker.apply`` calls ``validate`` on it's matching
     BusinessRule."""
@@ -91,3 +144,22 @@ def test_indirect_business_rule_validation():
                 call(model),
             ],
         )
+
+
+def test_apply_batch_checks():
+    """Verify that ``apply_batch_checks`` runs a BatchBusinessRule once against
+    all of the models in a transaction and records a result for each model."""
+    transaction = factories.UnapprovedTransactionFactory.create()
+    factories.TestModel1Factory.create_batch(2, transaction=transaction)
+    check = checks.tests.factories.TransactionCheckFactory(transaction=transaction)
+    models = sorted(transaction.tracked_models.all(), key=lambda model: model.pk)
+
+    with add_business_rules(type(models[0]), FirstModelViolates):
+        apply_batch_checks(check)
+        apply_batch_checks(check)
+
+    assert len(FirstModelViolates.batches) == 1
+    assert set(FirstModelViolates.batches[0]) == set(models)
+    assert set(check.model_checks.values_list("model", "successful")) == {
+        (model.pk, model != models[0]) for model in models
+    }
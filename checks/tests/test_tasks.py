@@ -75,7 +75,11 @@ def check(request):
     assert check.model_checks.count() == num_completed
     assert check.model_checks.filter(successful=True).count() == num_successful
 
-    with mock.patch("checks.tasks.applicable_to", new=lambda m: checkers):
+    with mock.patch.object(
+        tasks.checker_registry,
+        "checkers_for",
+        new=lambda m: checkers,
+    ):
         yield check, num_checks, num_completed, num_successful
 
 
@@ -1,12 +1,15 @@
 """Business rules for commodities/goods nomenclatures."""
 
 import logging
+from collections import defaultdict
 from datetime import date
 from datetime import datetime
 from datetime import timedelta
 
+from django.db.models import prefetch_related_objects
 from django.utils.timezone import make_aware
 
+from common.business_rules import BatchBusinessRule
 from common.business_rules import BusinessRule
 from common.business_rules import DescriptionsRules
 from common.business_rules import FootnoteApplicability
@@ -17,7 +20,6 @@ from common.business_rules import ValidityStartDateRules
 from common.business_rules import only_applicable_after
 from common.business_rules import skip_when_deleted
 from common.business_rules import skip_when_not_deleted
-from common.models.trackedmodel import TrackedModel
 from common.util import TaricDateRange
 from common.util import validity_range_contains_range
 
@@ -27,7 +29,7 @@ class NIG1(NoOverlapping):
     goods nomenclature with the same SID."""
 
 
-class NIG2(BusinessRule):
+class NIG2(BatchBusinessRule):
     """The validity period of the goods nomenclature must be within the validity
     period of the product line above in the hierarchy."""
 
@@ -58,21 +60,27 @@ class NIG2(BusinessRule):
         if len(parents) == 0:
             raise Exception("No parents")
 
-        # get all date ranges
-        parents_validity = []
-        for parent in parents:
-            parents_validity.append(
+        return self.validities_span_future(
+            [
                 parent.indented_goods_nomenclature.version_at(
                     self.transaction,
-                ).valid_between,
-            )
+                ).valid_between
+                for parent in parents
+            ],
+            child.indented_goods_nomenclature.version_at(
+                self.transaction,
+            ).valid_between,
+        )
 
-        # sort by start date so any gaps will be obvious
-        parents_validity.sort(key=lambda daterange: daterange.lower)
+    def validities_span_future(self, parents_validity, child_validity) -> bool:
+        """Returns True if, from today onwards, the combined validity of the
+        parents spans the validity of the child."""
 
-        child_validity = child.indented_goods_nomenclature.version_at(
-            self.transaction,
-        ).valid_between
+        # sort by start date so any gaps will be obvious
+        parents_validity = sorted(
+            parents_validity,
+            key=lambda daterange: daterange.lower,
+        )
 
         if (
             not child_validity.upper_inf
@@ -106,36 +114,72 @@ class NIG2(BusinessRule):
 
         return validity_range_contains_range(multi_parent_validity, child_validity)
 
-    def validate(self, indent):
+    def violations(self, indents):
+        """
+        Check a batch of indents against their potential parents.
+
+        The indented goods are loaded as at the transaction in one query and
+        grouped by chapter, so that one snapshot of each chapter's tree is used
+        to find the potential parents of all of the indents in that chapter.
+        """
         from commodities.models.dc import Commodity
         from commodities.models.dc import get_chapter_collection
+        from commodities.models.orm import GoodsNomenclature
 
-        try:
-            good = indent.indented_goods_nomenclature.version_at(self.transaction)
-        except TrackedModel.DoesNotExist:
-            self.logger.warning(
-                "Goods nomenclature %s no longer exists at transaction %s "
-                "but indent %s is still referring to it.",
-                indent.indented_goods_nomenclature,
+        prefetch_related_objects(indents, "indented_goods_nomenclature")
+        goods = {
+            good.version_group_id: good
+            for good in GoodsNomenclature.objects.approved_up_to_transaction(
                 self.transaction,
-                indent,
+            ).filter(
+                version_group__in=[
+                    indent.indented_goods_nomenclature.version_group_id
+                    for indent in indents
+                ],
             )
-            return
-
-        commodity = Commodity(obj=good, indent_obj=indent)
-        collection = get_chapter_collection(good)
-        snapshot = collection.get_snapshot(
-            self.transaction,
-            make_aware(datetime.today()),
-        )
-
-        potential_parents = snapshot.get_potential_parents(commodity)
-
-        if len(potential_parents) == 0:
-            return
+        }
+
+        chapters = defaultdict(list)
+        for indent in indents:
+            good = goods.get(indent.indented_goods_nomenclature.version_group_id)
+            if good is None:
+                self.logger.warning(
+                    "Goods nomenclature %s no longer exists at transaction %s "
+                    "but indent %s is still referring to it.",
+                    indent.indented_goods_nomenclature,
+                    self.transaction,
+                    indent,
+                )
+                continue
+            chapters[good.code.chapter].append(Commodity(obj=good, indent_obj=indent))
 
-        if not self.parents_span_childs_future(potential_parents, indent):
-            raise self.violation(indent)
+        for commodities in chapters.values():
+            snapshot = get_chapter_collection(commodities[0].obj).get_snapshot(
+                self.transaction,
+                make_aware(datetime.today()),
+            )
+            children = defaultdict(list)
+            for commodity in snapshot.commodities:
+                children[snapshot.get_parent(commodity)].append(commodity)
+
+            for commodity in commodities:
+                parent = snapshot.get_parent(commodity)
+                grandparent = snapshot.get_parent(parent)
+                potential_parents = [
+                    sibling
+                    for sibling in children[grandparent]
+                    if (int(sibling.item_id), int(sibling.suffix))
+                    < (int(commodity.item_id), int(commodity.suffix))
+                ]
+
+                if len(potential_parents) == 0:
+                    continue
+
+                if not self.validities_span_future(
+                    [parent.obj.valid_between for parent in potential_parents],
+                    commodity.obj.valid_between,
+                ):
+                    yield self.violation(commodity.indent_obj)
 
 
 @skip_when_deleted
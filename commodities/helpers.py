@@ -1,19 +1,132 @@
+from datetime import date as date_type
+from typing import List
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from commodities.models.dc import Commodity
 from commodities.models.dc import CommodityCollectionLoader
 from commodities.models.dc import CommodityTreeSnapshot
 from commodities.models.dc import SnapshotMoment
+from commodities.models.orm import GoodsNomenclature
+from commodities.models.orm import GoodsNomenclatureIndent
+from common.models.transactions import Transaction
+from common.models.transactions import TransactionPartition
 from measures.snapshots import MeasureSnapshot
 
 
+def get_approved_commodities(prefix: str) -> List[Commodity]:
+    """
+    Returns the latest approved commodities matching `prefix`.
+
+    Loading the commodities for a busy heading is slow, so they are cached keyed
+    on the prefix and the latest approved transaction. Approving a workbasket,
+    e.g. one containing goods nomenclature, indent or origin changes, therefore
+    changes the key, so cached commodities never need to be explicitly
+    invalidated.
+    """
+    latest_approved = Transaction.latest_approved()
+    cache_key = (
+        f"approved-commodities:{prefix}:{latest_approved and latest_approved.pk}"
+    )
+
+    return cache.get_or_set(
+        cache_key,
+        lambda: CommodityCollectionLoader(prefix=prefix)
+        .load(current_only=True)
+        .commodities,
+        settings.COMMODITY_TREE_CACHE_TIMEOUT,
+    )
+
+
+def get_commodities_as_at(
+    prefix: str,
+    transaction: Optional[Transaction],
+) -> List[Commodity]:
+    """
+    Returns the commodities matching `prefix` as of `transaction`.
+
+    These are the cached latest approved commodities, with any goods or indents
+    that the workbasket of a draft `transaction` has changed loaded as of that
+    transaction in place of their approved versions.
+    """
+    commodities = get_approved_commodities(prefix)
+    if transaction is None or transaction.partition != TransactionPartition.DRAFT:
+        return commodities
+
+    changed_sids = set(
+        GoodsNomenclature.objects.filter(
+            transaction__workbasket_id=transaction.workbasket_id,
+            item_id__startswith=prefix,
+        ).values_list("sid", flat=True),
+    ) | set(
+        GoodsNomenclatureIndent.objects.filter(
+            transaction__workbasket_id=transaction.workbasket_id,
+            indented_goods_nomenclature__item_id__startswith=prefix,
+        ).values_list("indented_goods_nomenclature__sid", flat=True),
+    )
+    if not changed_sids:
+        return commodities
+
+    # Commodities that the workbasket deletes are not loaded, so are dropped.
+    drafts = (
+        CommodityCollectionLoader(prefix=prefix)
+        .load(transaction=transaction, sids=changed_sids)
+        .commodities
+    )
+    return [
+        commodity for commodity in commodities if commodity.sid not in changed_sids
+    ] + drafts
+
+
+def get_active_commodities_snapshot(
+    prefix: str,
+    snapshot_date: Optional[date_type] = None,
+) -> CommodityTreeSnapshot:
+    """
+    Returns a snapshot of the latest approved commodities matching `prefix`
+    that have not ended before `snapshot_date` (today by default).
+
+    Snapshots are cached in the same way as `get_approved_commodities`, and
+    also keyed on the date. The returned snapshot is taken at the latest
+    approved transaction – use `CommodityTreeSnapshot.with_moment` to move it to
+    another transaction.
+    """
+    snapshot_date = snapshot_date or date_type.today()
+    latest_approved = Transaction.latest_approved()
+    cache_key = (
+        f"commodity-tree-snapshot:{prefix}:"
+        f"{latest_approved and latest_approved.pk}:{snapshot_date.isoformat()}"
+    )
+
+    def build_snapshot() -> CommodityTreeSnapshot:
+        return CommodityTreeSnapshot(
+            commodities=[
+                commodity
+                for commodity in get_approved_commodities(prefix)
+                if commodity.valid_between.upper is None
+                or commodity.valid_between.upper > snapshot_date
+            ],
+            moment=SnapshotMoment(transaction=latest_approved, date=snapshot_date),
+        )
+
+    return cache.get_or_set(
+        cache_key,
+        build_snapshot,
+        settings.COMMODITY_TREE_CACHE_TIMEOUT,
+    )
+
+
 def get_measures_on_declarable_commodities(transaction, item_id, date=None):
     """Uses CommodityTreeSnapshot and MeasureSnapshot to look up the commodity
     tree to find measures defined on parent commodities that therefore also
     apply to the given child commodity."""
     prefix = item_id[0:2]
-    commodities_collection = CommodityCollectionLoader(prefix=prefix).load()
 
     moment = SnapshotMoment(transaction=transaction, date=date)
     tree = CommodityTreeSnapshot(
-        commodities=commodities_collection.commodities,
+        commodities=get_commodities_as_at(prefix, transaction),
         moment=moment,
     )
     this_commodity = list(
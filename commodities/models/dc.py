@@ -425,6 +425,13 @@ class CommodityTreeSnapshot(CommodityTreeBase):
 
         super().__post_init__()
 
+    def with_moment(self, moment: SnapshotMoment) -> "CommodityTreeSnapshot":
+        """Returns a copy of the snapshot taken at a different moment, reusing
+        the tree that has already been built rather than building it again."""
+        snapshot = copy(self)
+        object.__setattr__(snapshot, "moment", moment)
+        return snapshot
+
     def get_potential_parents(self, commodity: Commodity) -> List[Commodity]:
         """Gets possible parents, for queries where a parent may be end-dated,
         and another parent could potentially be present to inherit the child."""
@@ -509,12 +516,12 @@ class CommodityTreeSnapshot(CommodityTreeBase):
 
         if as_at is not None and as_at is not NOT_PROVIDED:
             measure_qs = measure_qs.with_effective_valid_between().filter(
-                Q(db_effective_valid_between__contains=as_at)
+                Q(effective_validity__valid_between__contains=as_at)
                 | Q(valid_between__startswith__gte=as_at),
             )
         elif as_at is NOT_PROVIDED and self.moment.clock_type.is_calendar_clock:
             measure_qs = measure_qs.with_effective_valid_between().filter(
-                db_effective_valid_between__contains=self.moment.date,
+                effective_validity__valid_between__contains=self.moment.date,
             )
 
         return measure_qs
@@ -1572,6 +1579,8 @@ class CommodityCollectionLoader:
         self,
         current_only: bool = False,
         effective_only: bool = False,
+        transaction: Optional[Transaction] = None,
+        sids: Optional[Set[int]] = None,
     ) -> CommodityCollection:
         """
         Returns a CommodityCollection including all commodities that match the
@@ -1582,10 +1591,16 @@ class CommodityCollectionLoader:
         and will only select objects with with a validity range that includes today.
         This is equivalent to getting the current snapshot of the commodity collection
         (see the docs for CommodityCollection for more detail on snapshots.)
+
+        If a transaction is passed, the loader will instead only add the
+        versions that are current as of that transaction, which may be a draft.
+        If sids are passed, only the commodities with those SIDs are added.
         """
 
         def _apply_filters(qs: TrackedModelQuerySet):
-            if current_only:
+            if transaction:
+                qs = qs.approved_up_to_transaction(transaction)
+            elif current_only:
                 qs = qs.latest_approved()
 
             if effective_only:
@@ -1596,6 +1611,8 @@ class CommodityCollectionLoader:
         goods_query = _apply_filters(GoodsNomenclature.objects).filter(
             item_id__startswith=self.prefix,
         )
+        if sids is not None:
+            goods_query = goods_query.filter(sid__in=sids)
 
         goods_sids = Subquery(goods_query.values("sid"))
 
@@ -20,6 +20,7 @@ from common.models import NumericSID
 from common.models import TrackedModel
 from common.models.managers import TrackedModelManager
 from common.models.mixins.description import DescribedMixin
+from common.models.mixins.description import DescribedQueryset
 from common.models.mixins.description import DescriptionMixin
 from common.models.mixins.description import DescriptionQueryset
 from common.models.mixins.validity import ValidityMixin
@@ -34,6 +35,7 @@ class GoodsNomenclature(TrackedModel, ValidityMixin, DescribedMixin):
     subrecord_code = "00"
 
     identifying_fields = ("sid",)
+    search_identifier_fields = ("item_id",)
 
     sid = NumericSID()
 
@@ -66,6 +68,8 @@ class GoodsNomenclature(TrackedModel, ValidityMixin, DescribedMixin):
         ),
     )
 
+    objects = TrackedModelManager.from_queryset(DescribedQueryset)()
+
     @property
     def code(self) -> CommodityCode:
         """Returns a CommodityCode instance for the good."""
@@ -189,6 +189,29 @@ def test_NIG2_is_valid_with_multiple_parents_spanning_child_valid_period(date_ra
         business_rules.NIG2(type(child.transaction).objects.last()).validate(child)
 
 
+@pytest.mark.business_rules
+def test_NIG2_violations_are_reported_per_indent_across_chapters(date_ranges):
+    def indent(item_id, indent, validity):
+        return factories.GoodsNomenclatureIndentFactory.create(
+            indented_goods_nomenclature__valid_between=getattr(date_ranges, validity),
+            indented_goods_nomenclature__item_id=item_id,
+            indent=indent,
+        )
+
+    indent("2901000000", 0, "starts_1_month_ago_to_1_month_ahead")
+    invalid_child = indent("2901210000", 1, "starts_1_month_ago_no_end")
+    indent("3001000000", 0, "starts_delta_no_end")
+    valid_child = indent("3001210000", 1, "starts_1_month_ago_no_end")
+
+    violations = list(
+        business_rules.NIG2(type(valid_child.transaction).objects.last()).violations(
+            [invalid_child, valid_child],
+        ),
+    )
+
+    assert [violation.model for violation in violations] == [invalid_child]
+
+
 @pytest.mark.business_rules
 @pytest.mark.parametrize(
     ("parent_validities", "child_validity", "expected"),
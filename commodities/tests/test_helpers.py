@@ -3,6 +3,8 @@ from datetime import timedelta
 
 import pytest
 
+from commodities.helpers import get_active_commodities_snapshot
+from commodities.helpers import get_approved_commodities
 from commodities.helpers import get_measures_on_declarable_commodities
 from commodities.models.orm import GoodsNomenclature
 from common.tests import factories
@@ -29,3 +31,67 @@ def test_modc_query(seed_database_with_indented_goods):
     assert result.count() == 2
     assert measure1 in result
     assert measure2 in result
+
+
+def test_active_commodities_snapshot_is_cached(
+    seed_database_with_indented_goods,
+    django_assert_num_queries,
+):
+    snapshot = get_active_commodities_snapshot("2903")
+
+    with django_assert_num_queries(1):
+        cached = get_active_commodities_snapshot("2903")
+
+    assert cached.commodities == snapshot.commodities
+    assert cached.edges == snapshot.edges
+
+
+def test_active_commodities_snapshot_changes_on_approval(
+    seed_database_with_indented_goods,
+):
+    before = get_active_commodities_snapshot("2903")
+    good = factories.GoodsNomenclatureFactory.create(item_id="2903990000")
+
+    after = get_active_commodities_snapshot("2903")
+
+    assert good.item_id not in {c.item_id for c in before.commodities}
+    assert good.item_id in {c.item_id for c in after.commodities}
+
+
+def test_measures_on_declarable_commodities_includes_draft_goods(
+    seed_database_with_indented_goods,
+    unapproved_transaction,
+):
+    parent = GoodsNomenclature.objects.get(item_id="2903690000")
+    measure = factories.MeasureFactory.create(
+        goods_nomenclature=parent,
+        valid_between=TaricDateRange(date.today() + timedelta(days=-100)),
+    )
+    draft = factories.GoodsNomenclatureFactory.create(
+        item_id="2903693000",
+        suffix=80,
+        indent__indent=3,
+        transaction=unapproved_transaction,
+    )
+
+    result = get_measures_on_declarable_commodities(
+        unapproved_transaction,
+        draft.item_id,
+    )
+
+    assert measure in result
+    assert draft.item_id not in {
+        c.item_id for c in get_approved_commodities(draft.item_id[:2])
+    }
+
+
+def test_approved_commodities_are_cached(
+    seed_database_with_indented_goods,
+    django_assert_num_queries,
+):
+    commodities = get_approved_commodities("29")
+
+    with django_assert_num_queries(1):
+        cached = get_approved_commodities("29")
+
+    assert cached == commodities
@@ -12,16 +12,17 @@ from commodities import business_rules
 from commodities import forms
 from commodities.filters import CommodityFilter
 from commodities.filters import GoodsNomenclatureFilterBackend
+from commodities.helpers import get_active_commodities_snapshot
 from commodities.helpers import get_measures_on_declarable_commodities
 from commodities.models import GoodsNomenclature
-from commodities.models.dc import CommodityCollectionLoader
-from commodities.models.dc import CommodityTreeSnapshot
 from commodities.models.dc import SnapshotMoment
 from commodities.models.dc import get_chapter_collection
 from commodities.models.orm import FootnoteAssociationGoodsNomenclature
 from common.serializers import AutoCompleteSerializer
+from common.tariffs_api import JSONAPIDocument
 from common.tariffs_api import URLs
 from common.tariffs_api import get_commodity_data
+from common.views import CachedAutoCompleteMixin
 from common.views import SortingMixin
 from common.views import TrackedModelDetailMixin
 from common.views import TrackedModelDetailView
@@ -34,7 +35,7 @@ from workbaskets.views.generic import CreateTaricDeleteView
 from workbaskets.views.generic import CreateTaricUpdateView
 
 
-class GoodsNomenclatureViewset(viewsets.ReadOnlyModelViewSet):
+class GoodsNomenclatureViewset(CachedAutoCompleteMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint that allows Goods Nomenclature to be viewed."""
 
     serializer_class = AutoCompleteSerializer
@@ -52,7 +53,7 @@ class GoodsNomenclatureViewset(viewsets.ReadOnlyModelViewSet):
             GoodsNomenclature.objects.approved_up_to_transaction(
                 tx,
             )
-            .prefetch_related("descriptions")
+            .with_latest_description(tx)
             .as_at_and_beyond(date.today())
             .filter(suffix=80)
         )
@@ -80,7 +81,11 @@ class CommodityList(CommodityMixin, WithPaginationListView):
     filterset_class = CommodityFilter
 
     def get_queryset(self):
-        return GoodsNomenclature.objects.current().order_by("item_id")
+        return (
+            GoodsNomenclature.objects.current()
+            .with_latest_description()
+            .order_by("item_id")
+        )
 
     def get_context_data(self, *args, **kwargs):
         context = super().get_context_data(*args, **kwargs)
@@ -181,22 +186,10 @@ class CommodityHierarchy(CommodityDetail):
         context["is_current"] = is_current
 
         if is_current:
-            prefix = self.object.item_id[0:4]
-            commodities_collection = CommodityCollectionLoader(prefix=prefix).load(
-                current_only=True,
-            )
-            active_commodities = [
-                commodity
-                for commodity in commodities_collection.commodities
-                if commodity.valid_between.upper is None
-                or commodity.valid_between.upper > date.today()
-            ]
-
             tx = WorkBasket.get_current_transaction(self.request)
-            snapshot = CommodityTreeSnapshot(
-                commodities=active_commodities,
-                moment=SnapshotMoment(transaction=tx, date=date.today()),
-            )
+            snapshot = get_active_commodities_snapshot(
+                self.object.item_id[0:4],
+            ).with_moment(SnapshotMoment(transaction=tx, date=date.today()))
 
             context["snapshot"] = snapshot
             context["this_commodity"] = list(
@@ -258,53 +251,22 @@ class CommodityMeasuresVATExcise(CommodityMixin, TrackedModelDetailView):
             return None
         return data
 
+    @cached_property
+    def commodity_document(self):
+        if not self.commodity_data:
+            return None
+        return JSONAPIDocument(self.commodity_data)
+
     def get_related(self, measure, relationship_name):
         """
-        The data we get from the tariffs API is structured like this:
-        {
-            "data": {
-                "id": <id>,
-                "type": <object type>,
-                "attributes": {<commodity attributes>}
-            },
-            "relationships": {
-                <relationship name>: {
-                    "data": [
-                        {"id": <id>,"type": <object type>},
-                        etc
-                    ]
-            },
-            "included": [
-                {
-                    "id": <id>,
-                    "type": <object type>,
-                    "attributes": {<object attributes>},
-                    "relationships": {
-                        <relationship name>: {
-                            "data": [
-                                {"id": <id>,"type": <object type>},
-                                etc
-                            ]
-                    },
-                }
-            ]
-        }
-        We use the relationships dictionaries to return the full data for a related object.
+        Returns the full data for the object related to a measure through the
+        relationship `relationship_name`, as found in the "included" list of the
+        tariffs API data – see `JSONAPIDocument`.
 
         :param measure: Measure data as returned in "included" list
         :param relationship_name: <relationship name> used as a key to lookup the data in the "relationships" dictionary
         """
-        all_related = [
-            related
-            for related in self.commodity_data["included"]
-            if measure["relationships"].get(relationship_name)
-            and related["id"]
-            == measure["relationships"][relationship_name]["data"]["id"]
-        ]
-        if all_related:
-            # don't expect there to be duplicate ids
-            return all_related[0]
-        return None
+        return self.commodity_document.get_related(measure, relationship_name)
 
     def get_context_data(self, *args, **kwargs):
         context = super().get_context_data(*args, **kwargs)
@@ -315,11 +277,7 @@ class CommodityMeasuresVATExcise(CommodityMixin, TrackedModelDetailView):
             f"{URLs.BASE_URL.value}commodities/{self.object.item_id}#vat_excise"
         )
         if self.commodity_data:
-            measures = [
-                item
-                for item in self.commodity_data["included"]
-                if item["type"] == "measure"
-            ]
+            measures = self.commodity_document.get_included("measure")
             vat_excise_measures = [
                 {
                     "measure": item,
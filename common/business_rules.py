@@ -12,12 +12,16 @@ from typing import Iterable
 from typing import Iterator
 from typing import Mapping
 from typing import Optional
+from typing import Sequence
 from typing import Set
 from typing import Type
 from typing import Union
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F
+from django.db.models import OuterRef
 from django.db.models import QuerySet
+from django.db.models import Subquery
 
 from common.models.mixins.validity import ValidityMixin
 from common.models.tracked_utils import get_relations
@@ -185,6 +189,36 @@ class BusinessRule(metaclass=BusinessRuleBase):
         )
 
 
+class BatchBusinessRule(BusinessRule):
+    """
+    A business rule that can validate all of the models it applies to in a
+    transaction at once.
+
+    Rather than ``validate``, subclasses implement ``violations``, which is
+    passed models of a single type from ``self.transaction`` and should load
+    whatever it needs to check them with a fixed number of queries. A single
+    model is validated as a batch of one, so both paths share the same logic.
+    Rule checks run ``violations`` once per transaction, see
+    ``checks.checks.apply_batch_checks``.
+    """
+
+    def violations(
+        self,
+        models: Sequence[TrackedModel],
+    ) -> Iterator[BusinessRuleViolation]:
+        """
+        Yield a violation for each of the passed models that violates this
+        business rule.
+
+        :raises NotImplementedError: Must be overridden by subclasses
+        """
+        raise NotImplementedError()
+
+    def validate(self, model):
+        for violation in self.violations([model]):
+            raise violation
+
+
 def only_applicable_after(cutoff: Union[date, datetime, str]):
     """
     Decorate BusinessRules to make them only applicable after a given date.
@@ -444,6 +478,63 @@ class ValidityPeriodContained(BusinessRule):
                 raise self.violation(model)
 
 
+class BatchValidityPeriodContained(BatchBusinessRule, ValidityPeriodContained):
+    """
+    A ``ValidityPeriodContained`` rule that checks a whole batch of models with
+    one query.
+
+    The container and contained objects must each be the model itself or one
+    of its foreign keys, and the latest versions of both as at the transaction
+    are compared in the database.
+    """
+
+    def latest_valid_between(self, model: Type[TrackedModel], field_name):
+        """Return an expression for the validity period of the latest version
+        of the object ``field_name`` refers to, or of the model itself."""
+        if field_name:
+            model = model._meta.get_field(field_name).related_model
+            version_group = f"{field_name}__version_group"
+        else:
+            version_group = "version_group"
+
+        return Subquery(
+            model.objects.approved_up_to_transaction(self.transaction)
+            .filter(version_group=OuterRef(version_group))
+            .values("valid_between")[:1],
+        )
+
+    def violations(self, models):
+        # As in ``ValidityPeriodContained``, the latest version of each model
+        # is checked, so models that have since been deleted are skipped.
+        model = type(models[0])
+        violating = (
+            model.objects.approved_up_to_transaction(self.transaction)
+            .filter(version_group__in=[m.version_group_id for m in models])
+            .annotate(
+                container_valid_between=self.latest_valid_between(
+                    model,
+                    self.container_field_name,
+                ),
+                contained_valid_between=self.latest_valid_between(
+                    model,
+                    self.contained_field_name,
+                ),
+            )
+            .filter(
+                container_valid_between__isnull=False,
+                contained_valid_between__isnull=False,
+            )
+            .exclude(
+                contained_valid_between__contained_by=F("container_valid_between"),
+            )
+            .values_list("version_group_id", flat=True)
+        )
+        violating = set(violating)
+        for obj in models:
+            if obj.version_group_id in violating:
+                yield self.violation(obj)
+
+
 class MustExist(BusinessRule):
     """Rule enforcing a referenced record exists."""
 
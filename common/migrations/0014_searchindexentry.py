@@ -0,0 +1,120 @@
+# Generated by Django 4.2.16 on 2026-10-19 11:00
+
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+from django.db.models.functions import Cast
+from django.db.models.functions import Concat
+from django.db.models.functions import Upper
+
+from common.validators import UpdateType
+
+# The search_identifier_fields of each searchable model when the index was
+# introduced, as class attributes are not available on historical models.
+SEARCH_IDENTIFIER_FIELDS = {
+    ("additional_codes", "AdditionalCode"): ("type__sid", "code"),
+    ("certificates", "Certificate"): ("certificate_type__sid", "sid"),
+    ("commodities", "GoodsNomenclature"): ("item_id",),
+    ("footnotes", "Footnote"): ("footnote_type__footnote_type_id", "footnote_id"),
+    ("geo_areas", "GeographicalArea"): ("area_id",),
+    ("measures", "Measure"): ("sid",),
+    ("quotas", "QuotaOrderNumber"): ("order_number",),
+    ("regulations", "Regulation"): ("regulation_id",),
+}
+
+
+def populate_search_index(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    SearchIndexEntry = apps.get_model("common", "SearchIndexEntry")
+
+    for (app_label, model_name), fields in SEARCH_IDENTIFIER_FIELDS.items():
+        model = apps.get_model(app_label, model_name)
+        content_type = ContentType.objects.get_for_model(model)
+        identifier = [Cast(field, output_field=models.CharField()) for field in fields]
+        if len(identifier) > 1:
+            identifier = Upper(Concat(*identifier, output_field=models.CharField()))
+        else:
+            identifier = Upper(identifier[0])
+
+        # Index the latest approved, non-deleted version of each model.
+        rows = (
+            model.objects.filter(is_current__isnull=False)
+            .exclude(update_type=UpdateType.DELETE)
+            .annotate(search_identifier=identifier)
+            .values_list("pk", "version_group_id", "search_identifier")
+            .order_by()
+        )
+        SearchIndexEntry.objects.bulk_create(
+            [
+                SearchIndexEntry(
+                    version_group_id=version_group_id,
+                    current_version_id=pk,
+                    content_type=content_type,
+                    identifier=search_identifier,
+                )
+                for pk, version_group_id, search_identifier in rows
+            ],
+            batch_size=10000,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("common", "0013_versiongroup_common_vers_current_04c358_idx"),
+        ("additional_codes", "0007_allow_blank_descriptions"),
+        ("certificates", "0004_validity_start"),
+        ("commodities", "0013_alter_goodsnomenclature_origins_and_more"),
+        ("footnotes", "0006_allow_blank_descriptions"),
+        ("geo_areas", "0006_alter_geographicalarea_memberships"),
+        ("measures", "0018_measureeffectivevalidity"),
+        ("quotas", "0009_alter_quotadefinition_sub_quotas_and_more"),
+        (
+            "regulations",
+            "0010_alter_regulation_amends_alter_regulation_extends_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchIndexEntry",
+            fields=[
+                (
+                    "version_group",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="common.versiongroup",
+                    ),
+                ),
+                ("identifier", models.CharField(max_length=50)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "current_version",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="common.trackedmodel",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="searchindexentry",
+            index=models.Index(
+                fields=["identifier"],
+                name="common_search_identifier_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+        migrations.RunPython(populate_search_index, migrations.RunPython.noop),
+    ]
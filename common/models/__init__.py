@@ -8,6 +8,7 @@ from common.models.mixins import TimestampedMixin
 from common.models.mixins.description import DescriptionMixin
 from common.models.mixins.validity import ValidityMixin
 from common.models.mixins.validity import ValidityStartMixin
+from common.models.search import SearchIndexEntry
 from common.models.trackedmodel import TrackedModel
 from common.models.trackedmodel import VersionGroup
 from common.models.transactions import Transaction
@@ -16,6 +17,7 @@ from common.models.user import User
 __all__ = [
     "ApplicabilityCode",
     "NumericSID",
+    "SearchIndexEntry",
     "ShortDescription",
     "SignedIntSID",
     "TimestampedMixin",
@@ -1,5 +1,7 @@
 from typing import Type
 
+from django.db.models import OuterRef
+from django.db.models import Subquery
 from django.db.models.fields import Field
 from django.urls import NoReverseMatch
 from django.urls import reverse
@@ -13,6 +15,8 @@ from common.models.mixins.validity import ValidityStartMixin
 from common.models.mixins.validity import ValidityStartQueryset
 from common.models.tracked_qs import TrackedModelQuerySet
 from common.models.tracked_utils import get_relations
+from common.models.utils import LazyTransaction
+from common.models.utils import get_current_transaction
 from common.util import classproperty
 from common.validators import UpdateType
 from workbaskets.validators import WorkflowStatus
@@ -89,6 +93,38 @@ class DescriptionMixin(ValidityStartMixin):
         abstract = True
 
 
+class DescribedQueryset(TrackedModelQuerySet):
+    def with_latest_description(
+        self,
+        transaction=LazyTransaction(get_value=get_current_transaction),
+    ):
+        """
+        Returns a queryset annotated with the ``description`` of the latest
+        description of each object, linking the description subquery on the
+        version_group field.
+
+        Descriptions are those visible as of the passed transaction, following
+        the same rules as ``approved_up_to_transaction()``, and default to those
+        visible as of the globally defined current transaction. Where an object
+        has multiple descriptions, the description with the latest
+        validity_start date is used.
+        """
+        description_type = self.model.description_type
+        descriptions = description_type.objects.approved_up_to_transaction(
+            transaction,
+        )
+        latest_descriptions = descriptions.filter(
+            **{
+                f"{description_type.described_object_field.name}__version_group": OuterRef(
+                    "version_group",
+                ),
+            },
+        ).order_by("-validity_start")
+        return self.annotate(
+            description=Subquery(latest_descriptions.values("description")[:1]),
+        )
+
+
 class DescribedMixin:
     """Mixin adding convenience methods for TrackedModels with associated
     Descriptions."""
@@ -156,9 +192,23 @@ class DescribedMixin:
         return self.get_descriptions().last()
 
     @property
-    def autocomplete_label(self):
+    def latest_description(self):
+        """
+        Returns the text of the latest description, using the value annotated
+        by ``with_latest_description()`` where present to avoid a query.
+
+        Returns ``None`` if the object has no descriptions.
+        """
+        if hasattr(self, "description"):
+            return self.description
+
         description = self.get_description()
+        return description.description if description else None
+
+    @property
+    def autocomplete_label(self):
+        description = self.latest_description
         if not description:
             return f"{self}"
 
-        return f"{self} - {description.description}"
+        return f"{self} - {description}"
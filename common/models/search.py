@@ -0,0 +1,209 @@
+"""An index of the identifiers that users search for tariff elements by."""
+
+import re
+from typing import Type
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models import CharField
+from django.db.models import ExpressionWrapper
+from django.db.models import Q
+from django.db.models.functions import Cast
+from django.db.models.functions import Concat
+from django.db.models.functions import Upper
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from common.models.trackedmodel import TrackedModel
+from common.models.trackedmodel import VersionGroup
+from common.validators import UpdateType
+
+
+def normalise_search_identifier(search_term: str) -> str:
+    """
+    Returns the search term in the form that identifiers are stored in the
+    index: upper case, with any whitespace or punctuation removed.
+
+    This allows users to find "TN001" by searching for "tn 001" or "TN-001".
+    """
+    return re.sub(r"[\s.',\-]", "", search_term).upper()
+
+
+def search_identifier_expression(model: Type[TrackedModel]):
+    """Returns an expression that builds the normalised search identifier of the
+    passed model from its `search_identifier_fields`."""
+    fields = [
+        Cast(field, output_field=CharField())
+        for field in model.search_identifier_fields
+    ]
+    if len(fields) > 1:
+        return Upper(Concat(*fields, output_field=CharField()))
+    return Upper(fields[0])
+
+
+class SearchIndexEntryQuerySet(models.QuerySet):
+    def search(self, search_term: str) -> "SearchIndexEntryQuerySet":
+        """
+        Returns the entries whose identifier starts with the normalised search
+        term, annotated with whether the identifier is an ``exact`` match.
+
+        Exact matches are ordered first, and the most recent versions are
+        ordered first within those, so that the best match is the first entry.
+        """
+        identifier = normalise_search_identifier(search_term)
+        return (
+            self.filter(identifier__startswith=identifier)
+            .annotate(
+                exact=ExpressionWrapper(
+                    Q(identifier=identifier),
+                    output_field=models.BooleanField(),
+                ),
+            )
+            .order_by("-exact", "-current_version_id")
+        )
+
+
+class SearchIndexEntryManager(models.Manager.from_queryset(SearchIndexEntryQuerySet)):
+    def index(self, queryset: models.QuerySet) -> int:
+        """
+        Adds or updates the entries for every model in the passed queryset,
+        returning the number of models indexed.
+
+        The queryset should contain the current version of each model.
+        """
+        model = queryset.model
+        content_type = ContentType.objects.get_for_model(model)
+        entries = [
+            self.model(
+                version_group_id=version_group_id,
+                current_version_id=pk,
+                content_type=content_type,
+                identifier=identifier,
+            )
+            for pk, version_group_id, identifier in queryset.exclude(
+                update_type=UpdateType.DELETE,
+            )
+            .annotate(search_identifier=search_identifier_expression(model))
+            .values_list("pk", "version_group_id", "search_identifier")
+            .order_by()
+        ]
+        self.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=["version_group"],
+            update_fields=["current_version", "content_type", "identifier"],
+        )
+        return len(entries)
+
+    def refresh(self, version_group: VersionGroup) -> None:
+        """Updates the entry for the passed version group so that it points at
+        its current version, removing the entry if there is no longer a current
+        version."""
+        current_version = version_group.current_version
+        if current_version is None:
+            self.filter(version_group=version_group).delete()
+            return
+
+        model = ContentType.objects.get_for_id(
+            current_version.polymorphic_ctype_id,
+        ).model_class()
+        if not model.search_identifier_fields:
+            return
+
+        if current_version.update_type == UpdateType.DELETE:
+            self.filter(version_group=version_group).delete()
+        else:
+            self.index(model.objects.filter(pk=current_version.pk))
+
+    def rebuild(self) -> int:
+        """Replaces the entries for every searchable model with the latest
+        approved versions of those models, returning the number of models
+        indexed."""
+        count = 0
+        for model in apps.get_models():
+            if (
+                issubclass(model, TrackedModel)
+                and model.search_identifier_fields
+                and not model._meta.proxy
+            ):
+                self.filter(
+                    content_type=ContentType.objects.get_for_model(model),
+                ).delete()
+                count += self.index(model.objects.latest_approved())
+        return count
+
+
+class SearchIndexEntry(models.Model):
+    """
+    The normalised search identifier of the current version of a tariff
+    element, such as a commodity code, footnote ID or regulation ID.
+
+    There is one entry per version group of each model that defines
+    :attr:`~common.models.TrackedModel.search_identifier_fields`, pointing at
+    the current version in that group. Entries are refreshed whenever the
+    current version of a group changes (i.e. when a workbasket is approved or
+    reverted) so that looking up an element by its identifier is a single
+    indexed query, rather than one version-aware query per type of element.
+    """
+
+    version_group = models.OneToOneField(
+        VersionGroup,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="+",
+    )
+    current_version = models.ForeignKey(
+        TrackedModel,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    identifier = models.CharField(max_length=50)
+
+    objects = SearchIndexEntryManager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["identifier"],
+                name="common_search_identifier_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
+
+    def __str__(self):
+        return self.identifier
+
+    def get_object(self) -> TrackedModel:
+        """Returns the current version of the tariff element as an instance of
+        its own model."""
+        model = ContentType.objects.get_for_id(self.content_type_id).model_class()
+        return model.objects.get(pk=self.current_version_id)
+
+
+@receiver(post_save, sender=VersionGroup, dispatch_uid="refresh_search_index_entry")
+def refresh_search_index_entry(sender, instance: VersionGroup, created, **kwargs):
+    """Refresh the search index whenever the current version of a version group
+    changes."""
+    if instance.current_version_id is None:
+        if not created:
+            # The model of a group without a current version is unknown, so
+            # remove any entry that it may have had.
+            SearchIndexEntry.objects.filter(version_group=instance).delete()
+        # Version groups for new drafts have no current version until approved.
+        return
+
+    # The current version is almost always already cached on the group, so
+    # this avoids any queries for version groups of unsearchable models.
+    model = ContentType.objects.get_for_id(
+        instance.current_version.polymorphic_ctype_id,
+    ).model_class()
+    if not model.search_identifier_fields:
+        return
+
+    SearchIndexEntry.objects.refresh(instance)
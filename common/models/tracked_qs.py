@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from typing import List
+from typing import Optional
 
 from django.db.models import Case
 from django.db.models import CharField
@@ -23,6 +25,9 @@ from common.querysets import ValidityQuerySet
 from common.util import resolve_path
 from common.validators import UpdateType
 
+if TYPE_CHECKING:
+    from common.models.trackedmodel import TrackedModel
+
 
 class TrackedModelQuerySet(
     PolymorphicQuerySet,
@@ -162,6 +167,93 @@ class TrackedModelQuerySet(
         "published" - see `published()` filter."""
         return self.filter(self.approved_query_filter())
 
+    def bulk_create_versions(
+        self,
+        objs: List[TrackedModel],
+        batch_size: Optional[int] = None,
+    ) -> List[TrackedModel]:
+        """
+        Save the passed unsaved versions of this queryset's model using one
+        batched insert per table, returning the saved versions.
+
+        Django's `bulk_create` does not support multi-table inheritance, so the
+        `TrackedModel` rows are inserted first and their primary keys used for
+        the rows of the concrete model. Versions with an `update_type` of CREATE
+        and no version group are given new version groups in one further
+        insert. As with `bulk_create`, no signals are sent and many-to-many
+        fields are not saved.
+
+        Versions in approved workbaskets are saved individually so that their
+        version groups are updated to point at them.
+        """
+        from workbaskets.validators import WorkflowStatus
+
+        if not objs:
+            return objs
+
+        if any(
+            obj.transaction.workbasket.status in WorkflowStatus.approved_statuses()
+            for obj in objs
+        ):
+            for obj in objs:
+                obj.save()
+            return objs
+
+        self._for_write = True
+        parent_link = self.model._meta.pk
+        parent_model = parent_link.remote_field.model
+        version_group_model = self.model._meta.get_field(
+            "version_group",
+        ).related_model
+
+        new_groups = [
+            obj
+            for obj in objs
+            if obj.version_group_id is None and obj.update_type == UpdateType.CREATE
+        ]
+        version_groups = version_group_model.objects.using(self.db).bulk_create(
+            [version_group_model() for _ in new_groups],
+            batch_size=batch_size,
+        )
+        for obj, version_group in zip(new_groups, version_groups):
+            obj.version_group = version_group
+
+        for obj in objs:
+            obj.pre_save_polymorphic(using=self.db)
+
+        parent_fields = [
+            field
+            for field in parent_model._meta.concrete_fields
+            if not field.primary_key
+        ]
+        parents = parent_model._base_manager.using(self.db).bulk_create(
+            [
+                parent_model(
+                    **{
+                        field.attname: getattr(obj, field.attname)
+                        for field in parent_fields
+                    },
+                )
+                for obj in objs
+            ],
+            batch_size=batch_size,
+        )
+        for obj, parent in zip(objs, parents):
+            for field in parent_fields:
+                setattr(obj, field.attname, getattr(parent, field.attname))
+            setattr(obj, parent_link.attname, parent.pk)
+
+        self._batched_insert(
+            objs,
+            self.model._meta.local_concrete_fields,
+            batch_size,
+        )
+        for obj in objs:
+            obj._state.adding = False
+            obj._state.db = self.db
+
+        return objs
+
     def annotate_record_codes(self) -> TrackedModelQuerySet:
         """
         Annotate results with TARIC Record code and Subrecord code.
@@ -149,6 +149,17 @@ class TrackedModel(PolymorphicModel, TimestampedMixin):
     TrackedModel itself defaults to ("pk",) as it does not have an SID.
     """
 
+    search_identifier_fields: Sequence[str] = ()
+    """
+    The fields which, concatenated together, form the identifier that users
+    search for this model by – e.g. ``("type__sid", "code")`` for an additional
+    code such as "8001".
+
+    The current version of each model with search identifier fields is kept in
+    the :class:`~common.models.search.SearchIndexEntry` index. TrackedModel
+    itself defaults to no fields as it is not searchable.
+    """
+
     url_suffix = ""
     """
     This is to add a link within a page for get_url() e.g. for linking to a
@@ -172,6 +183,43 @@ class TrackedModel(PolymorphicModel, TimestampedMixin):
         The new version is added to a transaction which is created and added to the passed in workbasket
         (or may be supplied as a keyword arg).
 
+        `update_type` must be UPDATE or DELETE, with UPDATE as the default.
+        """
+        if transaction is None:
+            transaction = workbasket.new_transaction()
+
+        new_object = self.build_new_version(transaction, update_type, **overrides)
+        new_object.save()
+
+        deferred_kwargs = {
+            field.name: field.value_from_object(self)
+            for field in get_deferred_set_fields(self)
+        }
+        deferred_overrides = {
+            name: value
+            for name, value in overrides.items()
+            if name in [f.name for f in get_deferred_set_fields(self)]
+        }
+        deferred_kwargs.update(deferred_overrides)
+        for field in deferred_kwargs:
+            getattr(new_object, field).set(deferred_kwargs[field])
+
+        return new_object
+
+    def build_new_version(
+        self: Cls,
+        transaction,
+        update_type: UpdateType = UpdateType.UPDATE,
+        **overrides,
+    ) -> Cls:
+        """
+        Return a new, unsaved version of the object in the passed transaction.
+        Callers can override existing data by passing in keyword args.
+
+        Many-to-many fields with auto-generated through models can only be set
+        once the new version has been saved, so they are not copied – see
+        :meth:`new_version`.
+
         `update_type` must be UPDATE or DELETE, with UPDATE as the default.
         """
         if update_type not in (
@@ -197,28 +245,9 @@ class TrackedModel(PolymorphicModel, TimestampedMixin):
 
         new_object_kwargs["update_type"] = update_type
         new_object_kwargs.update(new_object_overrides)
-
-        if transaction is None:
-            transaction = workbasket.new_transaction()
         new_object_kwargs["transaction"] = transaction
 
-        new_object = cls(**new_object_kwargs)
-        new_object.save()
-
-        deferred_kwargs = {
-            field.name: field.value_from_object(self)
-            for field in get_deferred_set_fields(self)
-        }
-        deferred_overrides = {
-            name: value
-            for name, value in overrides.items()
-            if name in [f.name for f in get_deferred_set_fields(self)]
-        }
-        deferred_kwargs.update(deferred_overrides)
-        for field in deferred_kwargs:
-            getattr(new_object, field).set(deferred_kwargs[field])
-
-        return new_object
+        return cls(**new_object_kwargs)
 
     def get_versions(self):
         """Find all versions of this model."""
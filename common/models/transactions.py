@@ -4,16 +4,22 @@ from __future__ import annotations
 
 import json
 from logging import getLogger
+from typing import Optional
 
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.db.models import Q
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
 from django.db.transaction import atomic
+from django.dispatch import receiver
 from django_fsm import FSMIntegerField
 from django_fsm import transition
 
 from common.models.mixins import TimestampedMixin
+from common.models.utils import clear_request_cache
 from common.models.utils import lazy_string
+from common.models.utils import request_cached
 from common.renderers import counter_generator
 from workbaskets.validators import WorkflowStatus
 
@@ -300,6 +306,12 @@ class Transaction(TimestampedMixin):
 
     approved = ApprovedTransactionManager.from_queryset(TransactionQueryset)()
 
+    @classmethod
+    def latest_approved(cls) -> Optional[Transaction]:
+        """Returns the most recently approved transaction, resolved at most once
+        per request (see ``common.models.utils.request_cached()``)."""
+        return request_cached("latest_approved_transaction", cls.approved.last)
+
     @transition(
         field=partition,
         source=TransactionPartition.DRAFT,
@@ -391,3 +403,12 @@ class TransactionGroup(models.Model):
     group_id = models.IntegerField()
     order_in_group = models.IntegerField()
     transaction = models.ForeignKey(Transaction, on_delete=models.PROTECT)
+
+
+@receiver(post_save, sender=Transaction, dispatch_uid="transaction_saved")
+@receiver(post_delete, sender=Transaction, dispatch_uid="transaction_deleted")
+def clear_request_cache_on_transaction_change(sender, **kwargs):
+    """Values cached for the current request may include the current or latest
+    approved transaction, so clear them whenever a transaction is created,
+    changed or deleted."""
+    clear_request_cache()
@@ -1,5 +1,9 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from common.models.utils import clear_request_cache
 
 
 class User(AbstractUser):
@@ -32,3 +36,10 @@ class User(AbstractUser):
         general display purposes."""
 
         return self.get_full_name() or self.email or str(self)
+
+
+@receiver(post_save, sender=User, dispatch_uid="user_saved")
+def clear_request_cache_on_user_change(sender, **kwargs):
+    """Values cached for the current request may include the user's current
+    workbasket, so clear them whenever a user is saved."""
+    clear_request_cache()
@@ -1,6 +1,9 @@
 import contextlib
 import threading
+from typing import Any
+from typing import Callable
 from typing import FrozenSet
+from typing import Optional
 
 import wrapt
 from django.db.models import Value
@@ -94,6 +97,47 @@ def override_current_transaction(transaction=None):
         set_current_transaction(old_transaction)
 
 
+def get_request_cache() -> Optional[dict]:
+    """Returns the cache of values resolved while processing the current
+    request, or ``None`` outside of request processing (see
+    ``RequestCacheMiddleware``)."""
+    return getattr(_thread_locals, "request_cache", None)
+
+
+def clear_request_cache():
+    """Clear any values cached for the current request, so that they are next
+    resolved from the database."""
+    cache = get_request_cache()
+    if cache is not None:
+        cache.clear()
+
+
+@contextlib.contextmanager
+def override_request_cache():
+    """Use a new, empty request cache for the duration of the context."""
+    old_cache = get_request_cache()
+    try:
+        _thread_locals.request_cache = {}
+        yield _thread_locals.request_cache
+    finally:
+        _thread_locals.request_cache = old_cache
+
+
+def request_cached(key, get_value: Callable[[], Any]):
+    """
+    Returns the value cached against ``key`` for the current request, calling
+    ``get_value`` to resolve and cache it on first use.
+
+    Outside of request processing ``get_value`` is called every time.
+    """
+    cache = get_request_cache()
+    if cache is None:
+        return get_value()
+    if key not in cache:
+        cache[key] = get_value()
+    return cache[key]
+
+
 def is_current_workbasket_valid(request):
     """Returns True if a user's current workbasket is valid (i.e. exists and has
     status EDITING.)"""
@@ -109,6 +153,24 @@ def is_current_workbasket_valid(request):
         return False
 
 
+class RequestCacheMiddleware:
+    """
+    Middleware that provides a request cache for the duration of view
+    processing, so that values such as the user's current workbasket and
+    transaction are resolved once per request (see ``request_cached()``).
+
+    This middleware should be placed before any other middleware in
+    settings.MIDDLEWARE that references workbaskets.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with override_request_cache():
+            return self.get_response(request)
+
+
 class ValidateUserWorkBasketMiddleware:
     """
     WorkBasket middleware that:
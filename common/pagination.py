@@ -1,8 +1,22 @@
+import json
+from collections.abc import Sequence
+from datetime import date
+from datetime import datetime
 from typing import List
+from typing import Optional
+from typing import Tuple
 
 from django.conf import settings
+from django.core import signing
 from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import F
+from django.db.models import Q
+from django.db.models import QuerySet
 from django.utils.functional import cached_property
+from psycopg.types.range import Range
+
+from common.util import TaricDateRange
 
 
 def build_pagination_list(
@@ -88,3 +102,240 @@ class LimitedPaginator(Paginator):
             return self.max_count
         else:
             return super().count
+
+
+class KeysetPage(Sequence):
+    """A single page of results from a :class:`KeysetPaginator`."""
+
+    def __init__(
+        self,
+        object_list: List,
+        paginator: "KeysetPaginator",
+        next_cursor: Optional[str],
+        previous_cursor: Optional[str],
+    ):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f"<KeysetPage of {len(self)} objects>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Provides keyset (or "seek") pagination over a queryset.
+
+    Django's `Paginator` pages using `OFFSET`, which requires the database to
+    produce and then discard every row before the requested page. For very long
+    object lists, such as Find and Edit Measures, deep pages become
+    progressively slower to fetch.
+
+    A keyset paginator instead orders the queryset by a single sort key, with
+    the primary key as a tie-breaker, and fetches the rows that sort
+    immediately after (or before) the last row that was displayed. Each page
+    costs the same regardless of how deep into the results it is.
+
+    Positions are exchanged with the client as opaque, signed cursors rather
+    than page numbers, so it is not possible to jump to an arbitrary page.
+
+    The total number of objects is never counted. Where a count is wanted,
+    `estimated_count` returns the query planner's row estimate instead.
+    """
+
+    cursor_salt = "common.pagination.KeysetPaginator"
+    sort_value_annotation = "keyset_sort_value"
+
+    def __init__(self, object_list: QuerySet, per_page: int, ordering=None):
+        """
+        :param object_list: The queryset to paginate.
+        :param per_page: The maximum number of objects on each page.
+        :param ordering: An optional field name, or annotation, to sort by.
+            Prefix with "-" to sort in descending order. Objects are always
+            additionally ordered by primary key.
+        """
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = ordering or "pk"
+
+    @cached_property
+    def descending(self) -> bool:
+        return self.ordering.startswith("-")
+
+    @cached_property
+    def sort_field(self) -> str:
+        return self.ordering.lstrip("-")
+
+    def get_page(self, cursor: Optional[str] = None) -> KeysetPage:
+        """
+        Return the page positioned by `cursor`, or the first page if `cursor` is
+        empty, invalid or positioned where there are no objects.
+
+        A forward cursor selects the objects after the position it encodes; a
+        backward cursor selects the objects before it.
+        """
+        position = self.decode_cursor(cursor)
+        forwards = position is None or position["forwards"]
+
+        # Seeking backwards is a forwards seek over the reversed ordering.
+        descending = self.descending != (not forwards)
+
+        queryset = self.object_list
+        if self.sort_field != "pk":
+            queryset = queryset.annotate(
+                **{self.sort_value_annotation: F(self.sort_field)},
+            )
+        queryset = queryset.order_by(*self.get_ordering(descending))
+        if position is not None:
+            queryset = queryset.filter(
+                self.get_seek_filter(position["value"], position["pk"], descending),
+            )
+
+        rows = list(queryset[: self.per_page + 1])
+        if not rows and position is not None:
+            # The cursor is stale, e.g. the objects around it were deleted or
+            # the filters changed, so start again from the first page.
+            return self.get_page()
+
+        more_rows = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if not forwards:
+            rows.reverse()
+
+        if forwards:
+            has_next, has_previous = more_rows, position is not None
+        else:
+            has_next, has_previous = True, more_rows
+
+        return KeysetPage(
+            rows,
+            self,
+            next_cursor=self.encode_cursor(rows[-1], True) if has_next else None,
+            previous_cursor=(
+                self.encode_cursor(rows[0], False) if has_previous else None
+            ),
+        )
+
+    def get_ordering(self, descending: bool) -> Tuple[str, str]:
+        if self.sort_field == "pk":
+            return ("-pk",) if descending else ("pk",)
+        if descending:
+            return (f"-{self.sort_field}", "-pk")
+        return (self.sort_field, "pk")
+
+    def get_seek_filter(self, value, pk, descending: bool) -> Q:
+        """
+        Return a filter selecting the objects that sort after (`value`, `pk`).
+
+        Postgres sorts nulls last in ascending order and first in descending
+        order, so nullable sort keys need an extra branch either side of them.
+        """
+        if self.sort_field == "pk":
+            return Q(pk__lt=pk) if descending else Q(pk__gt=pk)
+
+        field = self.sort_field
+        if descending:
+            if value is None:
+                return Q(**{f"{field}__isnull": False}) | Q(
+                    **{f"{field}__isnull": True, "pk__lt": pk},
+                )
+            return Q(**{f"{field}__lt": value}) | Q(**{field: value, "pk__lt": pk})
+
+        if value is None:
+            return Q(**{f"{field}__isnull": True, "pk__gt": pk})
+        return (
+            Q(**{f"{field}__gt": value})
+            | Q(**{field: value, "pk__gt": pk})
+            | Q(**{f"{field}__isnull": True})
+        )
+
+    def encode_cursor(self, obj, forwards: bool) -> str:
+        if self.sort_field == "pk":
+            value = None
+        else:
+            value = encode_keyset_value(getattr(obj, self.sort_value_annotation))
+
+        return signing.dumps(
+            {"value": value, "pk": obj.pk, "forwards": forwards},
+            salt=self.cursor_salt,
+            compress=True,
+        )
+
+    def decode_cursor(self, cursor: Optional[str]) -> Optional[dict]:
+        if not cursor:
+            return None
+
+        try:
+            position = signing.loads(cursor, salt=self.cursor_salt)
+        except signing.BadSignature:
+            return None
+
+        position["value"] = decode_keyset_value(position["value"])
+        return position
+
+    @cached_property
+    def estimated_count(self) -> int:
+        """
+        Return the query planner's estimate of the number of objects, taken from
+        `EXPLAIN` rather than by counting them.
+
+        The estimate is based on table statistics so may be some way out,
+        particularly for small or recently changed tables.
+        """
+        sql, params = self.object_list.query.sql_with_params()
+        with connections[self.object_list.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def encode_keyset_value(value):
+    """Convert a sort key value into a form that can be serialized as JSON."""
+    if isinstance(value, Range):
+        return {
+            "range": [
+                encode_keyset_value(value.lower),
+                encode_keyset_value(value.upper),
+                value.bounds,
+            ],
+        }
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    return value
+
+
+def decode_keyset_value(value):
+    """Reverse `encode_keyset_value()`."""
+    if not isinstance(value, dict):
+        return value
+    if "range" in value:
+        lower, upper, bounds = value["range"]
+        return TaricDateRange(
+            decode_keyset_value(lower),
+            decode_keyset_value(upper),
+            bounds,
+        )
+    if "datetime" in value:
+        return datetime.fromisoformat(value["datetime"])
+    return date.fromisoformat(value["date"])
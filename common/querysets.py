@@ -1,9 +1,20 @@
 from datetime import date
+from types import SimpleNamespace
 
+from django.db.models import OuterRef
 from django.db.models import Q
 from django.db.models import QuerySet
 
 
+def nested_outer_ref(name: str, depth: int = 1):
+    """Returns a reference to the field `name` of the query `depth` levels out
+    from the current subquery."""
+    ref = name
+    for _ in range(depth):
+        ref = OuterRef(ref)
+    return ref
+
+
 class ValidityQuerySet(QuerySet):
     """A mixin for querysets dealing with models that have validity periods."""
 
@@ -165,3 +176,20 @@ class TransactionPartitionQuerySet(QuerySet):
         }
 
         return (Q(**this_partition) & workbasket_select) | Q(**earlier_partition)
+
+    @classmethod
+    def as_at_outer_transaction_filter(cls, prefix="", depth=1):
+        """
+        As :meth:`as_at_transaction_filter`, but for use in a subquery, taking
+        the transaction of the model `depth` queries out rather than a
+        transaction instance.
+
+        This allows versions to be filtered as of each outer row's own
+        transaction in a single query.
+        """
+        transaction = SimpleNamespace(
+            partition=nested_outer_ref("transaction__partition", depth),
+            order=nested_outer_ref("transaction__order", depth),
+            workbasket_id=nested_outer_ref("transaction__workbasket_id", depth),
+        )
+        return cls.as_at_transaction_filter(transaction, prefix)
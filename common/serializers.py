@@ -23,6 +23,7 @@ from common.renderers import Counter
 from common.renderers import counter_generator
 from common.util import TaricDateRange
 from common.util import get_taric_template
+from common.util import get_xml_schema
 from common.util import parse_xml
 
 User = get_user_model()
@@ -361,25 +362,24 @@ def validate_envelope(envelope_file, skip_declaration=False):
     """
     xml_declaration = '<?xml version="1.0" encoding="UTF-8"?>\n'
 
-    with open(settings.PATH_XSD_TARIC) as xsd_file:
-        if skip_declaration:
-            pos = envelope_file.tell()
-            xml_declaration = envelope_file.read(len(xml_declaration))
-            if xml_declaration != xml_declaration:
-                logger.warning(
-                    "Expected XML declaration first line of envelope to be XML encoding declaration, but found: ",
-                    xml_declaration,
-                )
-                envelope_file.seek(pos, os.SEEK_SET)
-
-        schema = etree.XMLSchema(parse_xml(xsd_file))
-        xml = parse_xml(envelope_file)
-
-        try:
-            schema.assertValid(xml)
-        except etree.DocumentInvalid as e:
-            logger.error("Envelope did not validate against XSD: %s", str(e.error_log))
-            raise
+    if skip_declaration:
+        pos = envelope_file.tell()
+        xml_declaration = envelope_file.read(len(xml_declaration))
+        if xml_declaration != xml_declaration:
+            logger.warning(
+                "Expected XML declaration first line of envelope to be XML encoding declaration, but found: ",
+                xml_declaration,
+            )
+            envelope_file.seek(pos, os.SEEK_SET)
+
+    schema = get_xml_schema(settings.PATH_XSD_TARIC)
+    xml = parse_xml(envelope_file)
+
+    try:
+        schema.assertValid(xml)
+    except etree.DocumentInvalid as e:
+        logger.error("Envelope did not validate against XSD: %s", str(e.error_log))
+        raise
 
 
 class AutoCompleteSerializer(serializers.BaseSerializer):
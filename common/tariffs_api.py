@@ -1,14 +1,20 @@
+import hashlib
 import logging
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from typing import Callable
 from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from urllib.parse import urlencode
 
 import requests
+from django.conf import settings
+from django.core.cache import cache
 
 from quotas.models import QuotaDefinition
 
@@ -49,15 +55,132 @@ def parse_response(response):
         return None
 
 
+def get_from_endpoint(url: str) -> Optional[Dict]:
+    return parse_response(requests.get(url))
+
+
+_refresh_executor = ThreadPoolExecutor(max_workers=2)
+
+
+def _refresh_cached_response(
+    url: str,
+    cache_key: str,
+    fetch: Callable[[str], Optional[Dict]],
+) -> Optional[Dict]:
+    try:
+        data = fetch(url)
+    except Exception:
+        # Exceptions raised by a background refresh are otherwise discarded.
+        logger.exception(f"Failed to fetch {url} from the tariff API.")
+        raise
+    finally:
+        # Always release the refresh lock, so that a failed refresh is retried.
+        cache.delete(f"{cache_key}:refreshing")
+
+    if data is not None:
+        cache.set(
+            cache_key,
+            (time.time(), data),
+            settings.TARIFF_API_CACHE_TIMEOUT + settings.TARIFF_API_CACHE_STALE_TIMEOUT,
+        )
+    return data
+
+
+def cached_get_from_endpoint(
+    url: str,
+    fetch: Callable[[str], Optional[Dict]] = get_from_endpoint,
+) -> Optional[Dict]:
+    """
+    Returns the JSON content from the tariff API endpoint at `url`, using
+    `fetch` to call the API.
+
+    Successful responses are cached for `TARIFF_API_CACHE_TIMEOUT` seconds.
+    For a further `TARIFF_API_CACHE_STALE_TIMEOUT` seconds a stale response is
+    returned immediately while it is refreshed in the background, so that pages
+    only block on the API when there is no usable response cached. Failed calls
+    are not cached. Setting `TARIFF_API_CACHE_TIMEOUT` to 0 disables caching.
+    """
+    if not settings.TARIFF_API_CACHE_TIMEOUT:
+        return fetch(url)
+
+    cache_key = f"tariff-api:{hashlib.sha256(url.encode()).hexdigest()}"
+    cached: Optional[Tuple[float, Dict]] = cache.get(cache_key)
+
+    if cached is None:
+        return _refresh_cached_response(url, cache_key, fetch)
+
+    fetched_at, data = cached
+    is_stale = time.time() - fetched_at > settings.TARIFF_API_CACHE_TIMEOUT
+    if is_stale and cache.add(
+        f"{cache_key}:refreshing",
+        True,
+        settings.TARIFF_API_CACHE_STALE_TIMEOUT,
+    ):
+        _refresh_executor.submit(_refresh_cached_response, url, cache_key, fetch)
+
+    return data
+
+
 def get_commodity_data(id):
     url = f"{Endpoints.COMMODITIES.value}{id}"
-    return parse_response(requests.get(url))
+    return cached_get_from_endpoint(url)
 
 
 def get_quota_data(params):
     params = urlencode({**params})
     url = f"{Endpoints.QUOTAS.value}?{params}"
-    return parse_response(requests.get(url))
+    return cached_get_from_endpoint(url)
+
+
+class JSONAPIDocument:
+    """
+    Wraps a JSON:API document returned by the tariff API, indexing its included
+    resources by type and id so that relationships resolve in constant time.
+
+    A document is structured like this:
+
+    .. code-block:: python
+
+        {
+            "data": {"id": <id>, "type": <object type>, ...},
+            "included": [
+                {
+                    "id": <id>,
+                    "type": <object type>,
+                    "attributes": {<object attributes>},
+                    "relationships": {
+                        <relationship name>: {
+                            "data": {"id": <id>, "type": <object type>},
+                        },
+                    },
+                },
+                ...
+            ],
+        }
+    """
+
+    def __init__(self, document: Dict) -> None:
+        self.document = document
+        self.included_by_key = {}
+        self.included_by_type = {}
+        for resource in document.get("included", []):
+            self.included_by_key[(resource["type"], resource["id"])] = resource
+            self.included_by_type.setdefault(resource["type"], []).append(resource)
+
+    def get_included(self, type: str) -> List[Dict]:
+        """Returns the included resources of the given type, in document
+        order."""
+        return self.included_by_type.get(type, [])
+
+    def get_related(self, resource: Dict, relationship_name: str) -> Optional[Dict]:
+        """Returns the included resource that `resource` refers to through its
+        to-one relationship `relationship_name`, or None if there isn't one."""
+        relationship = resource.get("relationships", {}).get(relationship_name)
+        if not relationship or not relationship.get("data"):
+            return None
+
+        related = relationship["data"]
+        return self.included_by_key.get((related["type"], related["id"]))
 
 
 def build_quota_definition_urls(
@@ -136,7 +259,10 @@ def threaded_get_from_all_endpoints(urls: List[str], max_threads: int = 4) -> It
     """Return an iterator that can be used to retrieve the JSON content returned
     from each of the endpoints referenced via the URLs in `urls`."""
     with ThreadPoolExecutor(max_workers=max_threads) as executor:
-        return executor.map(threaded_get_from_endpoint, urls)
+        return executor.map(
+            lambda url: cached_get_from_endpoint(url, threaded_get_from_endpoint),
+            urls,
+        )
 
 
 def get_quota_definitions_data(
@@ -8,7 +8,9 @@ from django.db import models
 from common.fields import NumericSID
 from common.fields import ShortDescription
 from common.models import TrackedModel
+from common.models.managers import TrackedModelManager
 from common.models.mixins.description import DescribedMixin
+from common.models.mixins.description import DescribedQueryset
 from common.models.mixins.description import DescriptionMixin
 from common.models.mixins.validity import ValidityMixin
 from common.validators import UpdateType
@@ -23,6 +25,8 @@ class TestModel1(TrackedModel, ValidityMixin, DescribedMixin):
 
     identifying_fields = ("sid",)
 
+    objects = TrackedModelManager.from_queryset(DescribedQueryset)()
+
     sid = NumericSID()
     name = models.CharField(max_length=24, null=True)
 
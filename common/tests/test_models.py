@@ -362,6 +362,56 @@ def test_get_descriptions_with_update(sample_model, valid_user):
         assert new_description in description_queryset
 
 
+def test_with_latest_description(
+    description_factory,
+    date_ranges,
+    django_assert_num_queries,
+):
+    """Verify that described objects can be annotated with their latest
+    description in the same query as the objects themselves."""
+    description = description_factory.create()
+    described_record = description.get_described_object()
+    latest_description = description_factory.create(
+        **{description.described_object_field.name: described_record},
+        validity_start=date_ranges.adjacent_later.lower,
+    )
+
+    with override_current_transaction(Transaction.objects.last()):
+        with django_assert_num_queries(1):
+            annotated = (
+                type(described_record)
+                .objects.with_latest_description()
+                .get(pk=described_record.pk)
+            )
+            assert annotated.latest_description == latest_description.description
+
+        assert annotated.autocomplete_label.endswith(latest_description.description)
+        assert (
+            annotated.latest_description
+            == described_record.get_description().description
+        )
+
+
+def test_with_latest_description_as_at_transaction(sample_model):
+    description = factories.TestModelDescription1Factory.create(
+        described_record=sample_model,
+    )
+    new_description = description.new_version(
+        factories.WorkBasketFactory.create(),
+        description="Updated description",
+    )
+    queryset = TestModel1.objects.filter(pk=sample_model.pk)
+
+    assert (
+        queryset.with_latest_description(description.transaction).get().description
+        == description.description
+    )
+    assert (
+        queryset.with_latest_description(new_description.transaction).get().description
+        == new_description.description
+    )
+
+
 def test_get_description_dates(description_factory, date_ranges):
     """Verify that description models know how to calculate their end dates,
     which should be up until the next description model starts or inifnite if
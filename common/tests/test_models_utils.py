@@ -4,9 +4,12 @@ import pytest
 
 from common.models.utils import LazyString
 from common.models.utils import LazyValue
+from common.models.utils import clear_request_cache
 from common.models.utils import get_current_transaction
 from common.models.utils import lazy_string
 from common.models.utils import override_current_transaction
+from common.models.utils import override_request_cache
+from common.models.utils import request_cached
 from common.models.utils import set_current_transaction
 from common.tests import factories
 from common.tests.models import TestModel1
@@ -61,6 +64,29 @@ def test_override_current_transaction():
     assert get_current_transaction() is tx
 
 
+def test_request_cached():
+    get_value = mock.Mock(side_effect=range(10))
+
+    assert request_cached("key", get_value) == 0
+    assert request_cached("key", get_value) == 1
+
+    with override_request_cache():
+        assert request_cached("key", get_value) == 2
+        assert request_cached("key", get_value) == 2
+
+        clear_request_cache()
+        assert request_cached("key", get_value) == 3
+
+
+def test_request_cache_cleared_by_new_transaction():
+    with override_request_cache() as cache:
+        request_cached("key", lambda: "value")
+        assert cache == {"key": "value"}
+
+        factories.TransactionFactory.create()
+        assert cache == {}
+
+
 def test_current_objects_model_manager(model1_with_history):
     for model_version in model1_with_history.all_models:
         with override_current_transaction(model_version.transaction):
@@ -1,6 +1,9 @@
 import pytest
 
+from common.pagination import KeysetPaginator
 from common.pagination import build_pagination_list
+from common.tests import factories
+from measures.models import Measure
 
 
 @pytest.mark.parametrize(
@@ -20,3 +23,101 @@ from common.pagination import build_pagination_list
 def test_pagination_provides_correct_object(current_page, total_pages, expected_result):
     result = build_pagination_list(current_page, total_pages)
     assert result == expected_result
+
+
+def walk_keyset_pages(paginator):
+    """Follow next cursors from the first page, returning every page."""
+    pages = [paginator.get_page()]
+    while pages[-1].has_next():
+        pages.append(paginator.get_page(pages[-1].next_cursor))
+    return pages
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "ordering",
+    [None, "sid", "-sid", "valid_between", "-valid_between", "measure_type__sid"],
+)
+def test_keyset_paginator_pages_through_all_objects(ordering, date_ranges):
+    factories.MeasureFactory.create_batch(3, valid_between=date_ranges.no_end)
+    factories.MeasureFactory.create_batch(2, valid_between=date_ranges.earlier)
+    queryset = Measure.objects.all()
+
+    paginator = KeysetPaginator(queryset, per_page=2, ordering=ordering)
+    pages = walk_keyset_pages(paginator)
+
+    expected = list(queryset.order_by(*paginator.get_ordering(paginator.descending)))
+    assert [obj for page in pages for obj in page] == expected
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert not pages[0].has_previous()
+    assert all(page.has_previous() for page in pages[1:])
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "ordering",
+    ["effective_validity__end_date", "-effective_validity__end_date"],
+)
+def test_keyset_paginator_handles_null_sort_values(ordering, date_ranges):
+    factories.MeasureFactory.create_batch(3, valid_between=date_ranges.no_end)
+    factories.MeasureFactory.create_batch(2, valid_between=date_ranges.normal)
+    queryset = Measure.objects.all()
+
+    paginator = KeysetPaginator(queryset, per_page=2, ordering=ordering)
+    pages = walk_keyset_pages(paginator)
+
+    expected = list(queryset.order_by(*paginator.get_ordering(paginator.descending)))
+    assert [obj for page in pages for obj in page] == expected
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_previous_cursor_returns_previous_page():
+    factories.MeasureFactory.create_batch(5)
+    paginator = KeysetPaginator(Measure.objects.all(), per_page=2, ordering="sid")
+
+    first = paginator.get_page()
+    second = paginator.get_page(first.next_cursor)
+    back = paginator.get_page(second.previous_cursor)
+
+    assert list(back) == list(first)
+    assert back.has_next()
+    assert not back.has_previous()
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_ignores_invalid_cursor():
+    factories.MeasureFactory.create_batch(3)
+    paginator = KeysetPaginator(Measure.objects.all(), per_page=2)
+
+    assert list(paginator.get_page("not-a-cursor")) == list(paginator.get_page())
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_falls_back_to_first_page_for_stale_cursor():
+    measures = sorted(factories.MeasureFactory.create_batch(3), key=lambda m: m.sid)
+    paginator = KeysetPaginator(Measure.objects.all(), per_page=2, ordering="sid")
+    first = paginator.get_page()
+    second = paginator.get_page(first.next_cursor)
+
+    # Once the list is filtered, nothing remains beyond either cursor.
+    before = KeysetPaginator(
+        Measure.objects.filter(sid__lte=measures[1].sid),
+        per_page=2,
+        ordering="sid",
+    )
+    after = KeysetPaginator(
+        Measure.objects.filter(sid__gte=measures[2].sid),
+        per_page=2,
+        ordering="sid",
+    )
+
+    assert list(before.get_page(first.next_cursor)) == measures[:2]
+    assert list(after.get_page(second.previous_cursor)) == measures[2:]
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_estimated_count():
+    factories.MeasureFactory.create_batch(3)
+    paginator = KeysetPaginator(Measure.objects.all(), per_page=2)
+
+    assert paginator.estimated_count >= 1
@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+import pytest
+
+from common.models import SearchIndexEntry
+from common.models.search import normalise_search_identifier
+from common.tests import factories
+from common.validators import UpdateType
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize(
+    "search_term, expected",
+    [
+        ("tn001", "TN001"),
+        ("TN 001", "TN001"),
+        ("tn-001", "TN001"),
+        (" 0101.21 ", "010121"),
+    ],
+)
+def test_normalise_search_identifier(search_term, expected):
+    assert normalise_search_identifier(search_term) == expected
+
+
+def test_approved_model_is_indexed():
+    footnote = factories.FootnoteFactory.create()
+
+    entry = SearchIndexEntry.objects.get(version_group=footnote.version_group)
+    assert entry.identifier == str(footnote).upper()
+    assert entry.get_object() == footnote
+
+
+def test_draft_model_is_not_indexed(unapproved_transaction):
+    footnote = factories.FootnoteFactory.create(transaction=unapproved_transaction)
+
+    assert not SearchIndexEntry.objects.filter(
+        version_group=footnote.version_group,
+    ).exists()
+
+
+def test_unsearchable_model_is_not_indexed():
+    with patch.object(SearchIndexEntry.objects, "refresh") as refresh:
+        factories.FootnoteTypeFactory.create()
+
+    refresh.assert_not_called()
+    assert not SearchIndexEntry.objects.exists()
+
+
+def test_entry_follows_current_version():
+    footnote = factories.FootnoteFactory.create()
+    new_version = factories.FootnoteFactory.create(
+        version_group=footnote.version_group,
+        update_type=UpdateType.UPDATE,
+        footnote_type=footnote.footnote_type,
+        footnote_id=footnote.footnote_id,
+    )
+
+    entry = SearchIndexEntry.objects.get(version_group=footnote.version_group)
+    assert entry.current_version_id == new_version.pk
+
+
+def test_entry_removed_when_deleted():
+    regulation = factories.RegulationFactory.create()
+    factories.RegulationFactory.create(
+        version_group=regulation.version_group,
+        update_type=UpdateType.DELETE,
+        regulation_id=regulation.regulation_id,
+    )
+
+    assert not SearchIndexEntry.objects.filter(
+        version_group=regulation.version_group,
+    ).exists()
+
+
+def test_search_orders_exact_matches_first():
+    prefix_match = factories.GoodsNomenclatureFactory.create(item_id="0101210010")
+    exact_match = factories.QuotaOrderNumberFactory.create(order_number="010121")
+
+    entries = list(SearchIndexEntry.objects.search("010121"))
+
+    assert [entry.current_version_id for entry in entries] == [
+        exact_match.pk,
+        prefix_match.pk,
+    ]
+    assert [entry.exact for entry in entries] == [True, False]
+
+
+def test_rebuild():
+    footnote = factories.FootnoteFactory.create()
+    SearchIndexEntry.objects.all().delete()
+
+    SearchIndexEntry.objects.rebuild()
+
+    assert SearchIndexEntry.objects.get().current_version_id == footnote.pk
@@ -1,11 +1,16 @@
+from concurrent.futures import Future
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
 import requests
 import requests_mock
+from django.core.cache import cache
 
 from common.tariffs_api import Endpoints
+from common.tariffs_api import JSONAPIDocument
 from common.tariffs_api import build_quota_definition_urls
+from common.tariffs_api import cached_get_from_endpoint
 from common.tariffs_api import deserialize_quota_data
 from common.tariffs_api import get_quota_data
 from common.tariffs_api import threaded_get_from_endpoint
@@ -236,3 +241,112 @@ def test_serialize_quota_data():
     assert deserialized["2222"]["balance"] == "23401000.0"
     assert deserialized["3333"]["status"] == "Open"
     assert deserialized["3333"]["balance"] == "78849000.0"
+
+
+@pytest.fixture
+def tariff_api_cache(settings):
+    settings.TARIFF_API_CACHE_TIMEOUT = 60
+    settings.TARIFF_API_CACHE_STALE_TIMEOUT = 60
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_cached_get_from_endpoint_reuses_response(tariff_api_cache, quotas_json):
+    fetch = MagicMock(return_value=quotas_json)
+    url = f"{Endpoints.QUOTAS.value}?order_number=1"
+
+    assert cached_get_from_endpoint(url, fetch) == quotas_json
+    assert cached_get_from_endpoint(url, fetch) == quotas_json
+    fetch.assert_called_once_with(url)
+
+
+def test_cached_get_from_endpoint_does_not_cache_failures(tariff_api_cache):
+    fetch = MagicMock(return_value=None)
+    url = f"{Endpoints.QUOTAS.value}?order_number=1"
+
+    assert cached_get_from_endpoint(url, fetch) is None
+    assert cached_get_from_endpoint(url, fetch) is None
+    assert fetch.call_count == 2
+
+
+def test_cached_get_from_endpoint_serves_stale_while_revalidating(
+    tariff_api_cache,
+    quotas_json,
+):
+    fetch = MagicMock(side_effect=[{"version": 1}, {"version": 2}])
+    url = f"{Endpoints.QUOTAS.value}?order_number=1"
+
+    with patch("common.tariffs_api.time.time", return_value=1000):
+        cached_get_from_endpoint(url, fetch)
+
+    with (
+        patch("common.tariffs_api.time.time", return_value=1061),
+        patch(
+            "common.tariffs_api._refresh_executor.submit",
+            side_effect=lambda refresh, *args: refresh(*args),
+        ) as submit,
+    ):
+        assert cached_get_from_endpoint(url, fetch) == {"version": 1}
+        submit.assert_called_once()
+
+        assert cached_get_from_endpoint(url, fetch) == {"version": 2}
+        assert fetch.call_count == 2
+
+
+def test_cached_get_from_endpoint_retries_failed_refresh(tariff_api_cache):
+    fetch = MagicMock(
+        side_effect=[
+            {"version": 1},
+            requests.exceptions.ConnectionError(),
+            {"version": 2},
+        ],
+    )
+    url = f"{Endpoints.QUOTAS.value}?order_number=1"
+
+    def run_refresh(refresh, *args):
+        # Like the executor, hold on to any exception rather than raising it.
+        future = Future()
+        try:
+            future.set_result(refresh(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    with patch("common.tariffs_api.time.time", return_value=1000):
+        cached_get_from_endpoint(url, fetch)
+
+    with (
+        patch("common.tariffs_api.time.time", return_value=1061),
+        patch("common.tariffs_api._refresh_executor.submit", side_effect=run_refresh),
+        patch("common.tariffs_api.logger") as logger,
+    ):
+        assert cached_get_from_endpoint(url, fetch) == {"version": 1}
+        logger.exception.assert_called_once()
+
+        assert cached_get_from_endpoint(url, fetch) == {"version": 1}
+        assert cached_get_from_endpoint(url, fetch) == {"version": 2}
+        assert fetch.call_count == 3
+
+
+def test_json_api_document_resolves_relationships():
+    measure_type = {"id": "305", "type": "measure_type"}
+    geo_area = {"id": "305", "type": "geographical_area"}
+    measure = {
+        "id": "1",
+        "type": "measure",
+        "relationships": {
+            "measure_type": {"data": {"id": "305", "type": "measure_type"}},
+            "geographical_area": {"data": {"id": "305", "type": "geographical_area"}},
+            "duty_expression": {"data": None},
+        },
+    }
+    document = JSONAPIDocument(
+        {"data": {}, "included": [measure_type, geo_area, measure]},
+    )
+
+    assert document.get_included("measure") == [measure]
+    assert document.get_related(measure, "measure_type") is measure_type
+    assert document.get_related(measure, "geographical_area") is geo_area
+    assert document.get_related(measure, "duty_expression") is None
+    assert document.get_related(measure, "footnotes") is None
@@ -349,6 +349,37 @@ def test_homepage_search_by_element_name_returns_result(
     assert response.url == reverse(expected_url)
 
 
+@pytest.mark.parametrize(
+    "search_term",
+    ["tn 001", "TN0", "tn-001"],
+)
+def test_homepage_search_by_normalised_or_prefix_id_returns_result(
+    search_term,
+    valid_user_client,
+):
+    footnote = factories.FootnoteFactory.create(
+        footnote_type__footnote_type_id="TN",
+        footnote_id="001",
+    )
+    response = valid_user_client.post(reverse("home"), {"search_term": search_term})
+    assert response.status_code == 302
+    assert response.url == footnote.get_url()
+
+
+def test_homepage_search_ambiguous_prefix_returns_no_result(valid_user_client):
+    factories.FootnoteFactory.create(
+        footnote_type__footnote_type_id="TN",
+        footnote_id="001",
+    )
+    factories.FootnoteFactory.create(
+        footnote_type__footnote_type_id="TN",
+        footnote_id="002",
+    )
+    response = valid_user_client.post(reverse("home"), {"search_term": "TN0"})
+    assert response.status_code == 302
+    assert response.url == reverse("search-page")
+
+
 def test_homepage_search_no_result(valid_user_client):
     factories.FootnoteFactory.create()
     response = valid_user_client.post(reverse("home"), {"search_term": "empty"})
@@ -386,3 +417,56 @@ def test_admin_login_shows_404_when_sso_enabled(superuser_client):
     assert response.status_code == 200
     page = BeautifulSoup(response.content.decode(response.charset), "html.parser")
     assert page.find("h1", string="Site administration")
+
+
+def test_cached_autocomplete_returns_not_modified_for_matching_etag(
+    valid_user_api_client,
+):
+    footnote = factories.FootnoteFactory.create()
+    url = reverse("footnote-list")
+
+    response = valid_user_api_client.get(url, {"search": str(footnote)})
+    assert response.status_code == 200
+    assert response.json()["results"][0]["value"] == footnote.pk
+
+    response = valid_user_api_client.get(
+        url,
+        {"search": str(footnote)},
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+    assert response.status_code == 304
+
+
+def test_cached_autocomplete_is_invalidated_by_approval(valid_user_api_client):
+    footnote_type = factories.FootnoteTypeFactory.create(footnote_type_id="TN")
+    factories.FootnoteFactory.create(footnote_type=footnote_type, footnote_id="001")
+    url = reverse("footnote-list")
+
+    response = valid_user_api_client.get(url, {"search": "TN"})
+    assert len(response.json()["results"]) == 1
+
+    factories.FootnoteFactory.create(footnote_type=footnote_type, footnote_id="002")
+
+    new_response = valid_user_api_client.get(
+        url,
+        {"search": "TN"},
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+    assert new_response.status_code == 200
+    assert new_response["ETag"] != response["ETag"]
+    assert len(new_response.json()["results"]) == 2
+
+
+def test_cached_autocomplete_is_invalidated_by_workbasket_changes(
+    api_client_with_current_workbasket,
+    valid_user,
+):
+    url = reverse("footnote-list")
+    response = api_client_with_current_workbasket.get(url)
+
+    factories.FootnoteFactory.create(
+        transaction=valid_user.current_workbasket.new_transaction(),
+    )
+
+    new_response = api_client_with_current_workbasket.get(url)
+    assert new_response["ETag"] != response["ETag"]
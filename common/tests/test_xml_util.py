@@ -4,9 +4,13 @@ from django.db import transaction
 from common.models.transactions import Transaction
 from common.tests import factories
 from common.tests.util import serialize_xml
+from common.xml.util import filtered_transactions
 from common.xml.util import remove_transactions
 from common.xml.util import renumber_records
 from common.xml.util import renumber_transactions
+from common.xml.util import renumbered_records
+from common.xml.util import renumbered_transactions
+from common.xml.util import rewrite_transactions
 
 pytestmark = pytest.mark.django_db
 
@@ -114,3 +118,104 @@ def test_transaction_removing_produces_valid_import_data(import_xml, export_xml)
     assert Transaction.objects.filter(order=second.transaction.order).exists()
     assert not type(first).objects.filter(sid=first.sid).exists()
     assert type(second).objects.filter(sid=second.sid).exists()
+
+
+def write_envelope(xml, path):
+    path.write_bytes(serialize_xml(xml).read())
+    return str(path)
+
+
+def test_streaming_transaction_renumbering(import_xml, export_xml, tmp_path):
+    """Tests that renumbering transactions while streaming the file produces
+    the same valid import data as renumbering the parsed tree."""
+    with transaction.atomic():
+        model = factories.AdditionalCodeTypeFactory.create()
+        filename = write_envelope(
+            export_xml(workbasket=model.transaction.workbasket),
+            tmp_path / "envelope.xml",
+        )
+        original_order = model.transaction.order
+        transaction.set_rollback(True)
+
+    rewrite_transactions(
+        filename,
+        lambda transactions: renumbered_transactions(
+            transactions,
+            original_order + 1,
+        ),
+    )
+    with open(filename, "rb") as file:
+        import_xml(file)
+
+    txn = Transaction.objects.get(order=original_order + 1)
+    assert txn.tracked_models.get().sid == model.sid
+
+
+def test_streaming_record_renumbering(import_xml, export_xml, tmp_path):
+    """Tests that renumbering records while streaming the file produces valid
+    import data with the records correctly renumbered."""
+    code_type = factories.AdditionalCodeTypeFactory.create()
+    workbasket = factories.QueuedWorkBasketFactory.create()
+    first = factories.AdditionalCodeFactory.create(
+        type=code_type,
+        transaction__workbasket=workbasket,
+    )
+    second = factories.AdditionalCodeFactory.create(
+        type=code_type,
+        transaction__workbasket=workbasket,
+    )
+    filename = write_envelope(
+        export_xml(workbasket=workbasket),
+        tmp_path / "envelope.xml",
+    )
+
+    rewrite_transactions(
+        filename,
+        lambda transactions: renumbered_records(
+            transactions,
+            second.sid + 1,
+            "oub:additional.code",
+            "oub:additional.code.sid",
+        ),
+    )
+    with open(filename, "rb") as file:
+        import_xml(file)
+
+    for instance in (first, second):
+        new_instance = type(instance).objects.get(sid=instance.sid + 2)
+        assert new_instance.code == instance.code
+
+
+def test_streaming_transaction_filtering(import_xml, export_xml, tmp_path):
+    """Tests that filtering transactions while streaming the file removes only
+    the matching transactions."""
+    code_type = factories.AdditionalCodeTypeFactory.create()
+    with transaction.atomic():
+        workbasket = factories.QueuedWorkBasketFactory.create()
+        first = factories.AdditionalCodeFactory.create(
+            type=code_type,
+            transaction__workbasket=workbasket,
+        )
+        second = factories.AdditionalCodeFactory.create(
+            type=code_type,
+            transaction__workbasket=workbasket,
+        )
+        filename = write_envelope(
+            export_xml(workbasket=workbasket),
+            tmp_path / "envelope.xml",
+        )
+        transaction.set_rollback(True)
+
+    rewrite_transactions(
+        filename,
+        lambda transactions: filtered_transactions(
+            transactions,
+            "oub:additional.code.sid",
+            [str(first.sid)],
+        ),
+    )
+    with open(filename, "rb") as file:
+        import_xml(file)
+
+    assert not type(first).objects.filter(sid=first.sid).exists()
+    assert type(second).objects.filter(sid=second.sid).exists()
@@ -628,6 +628,19 @@ def parse_xml(source: Union[str, Path, IO], forbid_dtd=True):
     return elementtree
 
 
+@lru_cache
+def get_xml_schema(path: Union[str, Path]) -> etree.XMLSchema:
+    """
+    Returns the compiled XML schema of the XSD file at `path`.
+
+    Compiling the TARIC3 XSD is comparatively expensive, so the result is cached
+    for the lifetime of the process and shared by every caller that validates
+    against the same file.
+    """
+    with open(path) as xsd_file:
+        return etree.XMLSchema(parse_xml(xsd_file))
+
+
 def xml_fromstring(text, forbid_dtd=True):
     parser = etree.XMLParser(resolve_entities=False)
     rootelement = etree.fromstring(text, parser)
@@ -1,3 +1,4 @@
+from .api import CachedAutoCompleteMixin
 from .base import *
 from .mixins import *
 from .pages import *
@@ -0,0 +1,67 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
+from django.utils.http import quote_etag
+from rest_framework.response import Response
+
+from common.models import Transaction
+from workbaskets.models import WorkBasket
+
+
+class CachedAutoCompleteMixin:
+    """
+    Mixin for read-only API viewsets that back autocomplete widgets, caching
+    each page of results so that repeated keystrokes do not re-query the
+    database.
+
+    Cached results are keyed on the model, the latest approved transaction, the
+    contents of the user's current workbasket and the query string. Approving a
+    workbasket or editing the current one therefore changes the key, so cached
+    results never need to be explicitly invalidated.
+
+    The key is also returned as the response's ETag so that clients which have
+    already seen a page of results get a ``304 Not Modified`` response.
+    """
+
+    autocomplete_cache_timeout = settings.AUTOCOMPLETE_CACHE_TIMEOUT
+    """The number of seconds that results are cached for."""
+
+    def get_draft_state(self) -> str:
+        """Returns a string that changes whenever a model is added to, removed
+        from or edited within the user's current workbasket."""
+        workbasket = WorkBasket.current(self.request)
+        if workbasket is None:
+            return ""
+
+        return workbasket.get_contents_state()
+
+    def get_autocomplete_cache_key(self) -> str:
+        latest_approved = Transaction.approved.values_list("pk", flat=True).last()
+        key = ":".join(
+            [
+                self.get_queryset().model._meta.label,
+                str(latest_approved),
+                self.get_draft_state(),
+                self.request.build_absolute_uri(),
+            ],
+        )
+        return f"autocomplete:{hashlib.sha256(key.encode()).hexdigest()}"
+
+    def list(self, request, *args, **kwargs):
+        cache_key = self.get_autocomplete_cache_key()
+        etag = quote_etag(cache_key.split(":")[-1])
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            data = cache.get(cache_key)
+            if data is None:
+                data = super().list(request, *args, **kwargs).data
+                cache.set(cache_key, data, self.autocomplete_cache_timeout)
+            response = Response(data)
+
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
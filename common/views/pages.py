@@ -18,6 +18,7 @@ from botocore.exceptions import EndpointConnectionError
 from dbt_copilot_python.utility import is_copilot
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.db import OperationalError
 from django.db import connection
@@ -37,6 +38,7 @@ from certificates.models import Certificate
 from commodities.models import GoodsNomenclature
 from common.celery import app as celery_app
 from common.forms import HomeSearchForm
+from common.models import SearchIndexEntry
 from common.models import Transaction
 from common.util import is_cloud_foundry
 from common.views.mixins import RequiresSuperuserMixin
@@ -105,6 +107,19 @@ class HomeView(LoginRequiredMixin, FormView):
         )
         return context
 
+    search_result_priority = [
+        AdditionalCode,
+        Certificate,
+        GeographicalArea,
+        Footnote,
+        QuotaOrderNumber,
+        GoodsNomenclature,
+        Measure,
+        Regulation,
+    ]
+    """The order in which types of tariff element are preferred when more than
+    one of them has an ID exactly matching the search term."""
+
     def get_search_result(self, search_term: str) -> Optional[str]:
         """
         Returns the outcome of a search for a given `search_term`.
@@ -115,8 +130,11 @@ class HomeView(LoginRequiredMixin, FormView):
         For a tariff element name, we attempt to find a matching key in `list_view_map` dict,
         returning the corresponding 'Find and edit' view URL of the matching element.
 
-        For a tariff element ID, we perform case-insensitive DB lookups for tariff elements whose ID
-        takes the form of the search term, returning the detail view URL of the matching element.
+        For a tariff element ID, we look up the search term in the
+        :class:`~common.models.SearchIndexEntry` index, ignoring case, spaces
+        and punctuation, and return the detail view URL of the matching element.
+        An element whose ID exactly matches is preferred, otherwise an element
+        whose ID starts with the search term is returned if it is the only one.
 
         If no match can be found for a given search term, then `None` is returned.
         """
@@ -136,88 +154,25 @@ class HomeView(LoginRequiredMixin, FormView):
             return match
 
         # Otherwise attempt to match the search term to an element ID
-        search_len = len(search_term)
-        if search_len == 2:
-            match = (
-                GeographicalArea.objects.filter(area_id__iexact=search_term)
-                .current()
-                .last()
-            )
-            return match.get_url() if match else None
-
-        elif search_len == 4:
-            match = (
-                AdditionalCode.objects.filter(
-                    type__sid__iexact=search_term[0],
-                    code__iexact=search_term[1:],
-                )
-                .current()
-                .last()
-            )
-            if match:
-                return match.get_url()
-
-            match = (
-                Certificate.objects.filter(
-                    certificate_type__sid__iexact=search_term[0],
-                    sid__iexact=search_term[1:],
-                )
-                .current()
-                .last()
-            )
-            if match:
-                return match.get_url()
-
-            match = (
-                GeographicalArea.objects.filter(area_id__iexact=search_term)
-                .current()
-                .last()
+        entries = list(SearchIndexEntry.objects.search(search_term)[:10])
+        exact_matches = [entry for entry in entries if entry.exact]
+        if exact_matches:
+            priority = {
+                ContentType.objects.get_for_model(model).pk: index
+                for index, model in enumerate(self.search_result_priority)
+            }
+            match = min(
+                exact_matches,
+                key=lambda entry: priority.get(entry.content_type_id, len(priority)),
             )
-            return match.get_url() if match else None
-
-        elif search_len == 5:
-            match = (
-                Footnote.objects.filter(
-                    footnote_type__footnote_type_id__iexact=search_term[:2],
-                    footnote_id=search_term[2:],
-                )
-                .current()
-                .last()
-            )
-            return match.get_url() if match else None
-
-        elif search_term.isnumeric():
-            if search_len == 6 and search_term[0] == "0":
-                match = (
-                    QuotaOrderNumber.objects.filter(order_number=search_term)
-                    .current()
-                    .last()
-                )
-                return match.get_url() if match else None
-            if search_len == 10:
-                match = (
-                    GoodsNomenclature.objects.filter(item_id=search_term)
-                    .current()
-                    .last()
-                )
-            if match:
-                return match.get_url()
-            else:
-                match = Measure.objects.filter(sid=search_term).current().last()
-                return match.get_url() if match else None
-
-        elif search_len == 8:
-            match = (
-                Regulation.objects.filter(regulation_id__iexact=search_term)
-                .current()
-                .last()
-            )
-            return match.get_url() if match else None
-
-        # No match has been found for the search term
+        elif len(entries) == 1:
+            match = entries[0]
         else:
+            # No match has been found for the search term
             return None
 
+        return match.get_object().get_url()
+
     def form_valid(self, form):
         search_term = form.cleaned_data["search_term"]
         if not search_term:
@@ -1,10 +1,18 @@
 import contextlib
 import logging
+import os
 import re
+from tempfile import NamedTemporaryFile
+from typing import Callable
 from typing import Collection
+from typing import Iterable
+from typing import Iterator
 from xml.etree import ElementTree
 
+from lxml import etree
+
 from common.validators import UpdateType
+from common.xml.namespaces import ENVELOPE
 from common.xml.namespaces import nsmap
 
 
@@ -22,6 +30,74 @@ def rewrite(filename: str):
     tree.write(filename, "utf-8", True)
 
 
+TRANSACTION_TAG = f"{{{nsmap[ENVELOPE]}}}transaction"
+
+
+def _iter_transactions(
+    events: Iterator,
+    envelope: etree._Element,
+) -> Iterator[etree._Element]:
+    """Yields each transaction element of the envelope as soon as it has been
+    parsed, and discards it once the consumer asks for the next one."""
+    for event, element in events:
+        if (
+            event == "end"
+            and element.tag == TRANSACTION_TAG
+            and element.getparent() is envelope
+        ):
+            yield element
+            element.clear()
+            while element.getprevious() is not None:
+                del envelope[0]
+
+
+def rewrite_transactions(
+    filename: str,
+    transform: Callable[[Iterator[etree._Element]], Iterable[etree._Element]],
+):
+    """
+    Streams the transactions of the passed XML file one at a time through
+    `transform` and then overwrites the original file with the transactions
+    that it yields.
+
+    Unlike :func:`rewrite`, only one transaction is held in memory at a time, so
+    arbitrarily large envelopes can be rewritten in a single pass. `transform`
+    receives an iterator of transaction elements and should lazily yield the
+    (possibly modified) transactions to keep, e.g. one of
+    :func:`renumbered_transactions`, :func:`renumbered_records` or
+    :func:`filtered_transactions`.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+
+    with (
+        open(filename, "rb") as file,
+        NamedTemporaryFile(
+            dir=directory,
+            delete=False,
+        ) as output,
+    ):
+        try:
+            events = etree.iterparse(file, events=("start", "end"))
+            _, envelope = next(events)
+
+            with etree.xmlfile(output, encoding="utf-8") as xf:
+                xf.write_declaration()
+                with xf.element(
+                    envelope.tag,
+                    dict(envelope.attrib),
+                    nsmap=envelope.nsmap,
+                ):
+                    for transaction in transform(
+                        _iter_transactions(events, envelope),
+                    ):
+                        xf.write(transaction)
+        except BaseException:
+            os.unlink(output.name)
+            raise
+
+    os.replace(output.name, filename)
+
+
 ATTRIBUTE_XPATH = re.compile(r"\[@([a-z]+)\]")
 
 
@@ -91,6 +167,31 @@ def renumber_transactions(envelope: ElementTree.Element, start_from: int):
     )
 
 
+def renumbered_transactions(
+    transactions: Iterable[etree._Element],
+    start_from: int,
+) -> Iterator[etree._Element]:
+    """Renumbers each of the passed transactions in turn so that transaction
+    numbers start from the specified value, for use with
+    :func:`rewrite_transactions`."""
+    add_value = None
+
+    for transaction in transactions:
+        transaction_ids = transaction.findall(".//oub:transaction.id", nsmap)
+
+        if add_value is None:
+            first_value = (
+                transaction_ids[0].text if transaction_ids else transaction.get("id")
+            )
+            add_value = start_from - int(first_value)
+
+        transaction.set("id", str(int(transaction.get("id")) + add_value))
+        for tag in transaction_ids:
+            tag.text = str(int(tag.text) + add_value)
+
+        yield transaction
+
+
 def renumber_records(
     envelope: ElementTree.Element,
     start_from: int,
@@ -105,6 +206,24 @@ def renumber_records(
     UPDATEd or DELETEd will only receive a new value if they were CREATEd in
     this file.
     """
+    for _ in renumbered_records(
+        envelope.findall(".//env:transaction", nsmap),
+        start_from,
+        record_name,
+        record_attribute,
+    ):
+        pass
+
+
+def renumbered_records(
+    transactions: Iterable[ElementTree.Element],
+    start_from: int,
+    record_name: str,
+    record_attribute: str,
+) -> Iterator[ElementTree.Element]:
+    """Renumbers the records of each of the passed transactions in turn, as
+    described by :func:`renumber_records`, for use with
+    :func:`rewrite_transactions`."""
     logger = logging.getLogger(__name__)
     add_value = None
     remaps = dict()
@@ -115,7 +234,7 @@ def renumber_records(
     def set(element: ElementTree.Element, value: int):
         element.text = str(value)
 
-    for transaction in envelope.findall(".//env:transaction", nsmap):
+    for transaction in transactions:
         for record in transaction.findall(".//oub:record", nsmap):
             update_type = get(record.find(".//oub:update.type", namespaces=nsmap))
 
@@ -136,6 +255,8 @@ def renumber_records(
                 if current_value in remaps:
                     set(tag, remaps[current_value])
 
+        yield transaction
+
     logger.debug("Renumbered %d distinct values of %s", len(remaps), record_name)
 
 
@@ -174,3 +295,19 @@ def remove_transactions(
         if element_contains(transaction, element_name, element_values):
             logger.debug("Removing transaction %s", transaction.attrib["id"])
             envelope.remove(transaction)
+
+
+def filtered_transactions(
+    transactions: Iterable[etree._Element],
+    element_name: str,
+    element_values: Collection[str],
+) -> Iterator[etree._Element]:
+    """Yields only those of the passed transactions that would not be removed by
+    :func:`remove_transactions`, for use with :func:`rewrite_transactions`."""
+    logger = logging.getLogger(__name__)
+
+    for transaction in transactions:
+        if element_contains(transaction, element_name, element_values):
+            logger.debug("Removing transaction %s", transaction.attrib["id"])
+        else:
+            yield transaction
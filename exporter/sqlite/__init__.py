@@ -38,6 +38,12 @@ from exporter.sqlite import tasks  # noqa
 
 SKIPPED_MODELS = {
     "QuotaEvent",
+    # Derived from measures and regulations, and relies on a date range column.
+    "MeasureEffectiveValidity",
+    # Derived from the current versions of other models.
+    "SearchIndexEntry",
+    # Cached report output, regenerated from the tariff data.
+    "ReportResult",
 }
 
 
@@ -6,7 +6,9 @@ from common.fields import LongDescription
 from common.fields import ShortDescription
 from common.fields import SignedIntSID
 from common.models import TrackedModel
+from common.models.managers import TrackedModelManager
 from common.models.mixins.description import DescribedMixin
+from common.models.mixins.description import DescribedQueryset
 from common.models.mixins.description import DescriptionMixin
 from common.models.mixins.validity import ValidityMixin
 from footnotes import business_rules
@@ -69,6 +71,9 @@ class Footnote(TrackedModel, ValidityMixin, DescribedMixin):
     footnote_type = models.ForeignKey(FootnoteType, on_delete=models.PROTECT)
 
     identifying_fields = ("footnote_id", "footnote_type__footnote_type_id")
+    search_identifier_fields = ("footnote_type__footnote_type_id", "footnote_id")
+
+    objects = TrackedModelManager.from_queryset(DescribedQueryset)()
 
     indirect_business_rules = (
         measures_business_rules.ME71,
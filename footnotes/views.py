@@ -11,6 +11,7 @@ from rest_framework import viewsets
 from common.models import TrackedModel
 from common.serializers import AutoCompleteSerializer
 from common.validators import UpdateType
+from common.views import CachedAutoCompleteMixin
 from common.views import DescriptionDeleteMixin
 from common.views import SortingMixin
 from common.views import TamatoListView
@@ -30,7 +31,7 @@ from workbaskets.views.generic import CreateTaricUpdateView
 from workbaskets.views.generic import EditTaricView
 
 
-class FootnoteViewSet(viewsets.ReadOnlyModelViewSet):
+class FootnoteViewSet(CachedAutoCompleteMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint that allows footnotes to be viewed and edited."""
 
     serializer_class = AutoCompleteSerializer
@@ -48,7 +49,7 @@ class FootnoteViewSet(viewsets.ReadOnlyModelViewSet):
         return (
             models.Footnote.objects.approved_up_to_transaction(tx)
             .select_related("footnote_type")
-            .prefetch_related("descriptions")
+            .with_latest_description(tx)
         )
 
 
@@ -107,6 +108,10 @@ class FootnoteList(FootnoteMixin, TamatoListView):
         "footnote_type__description",
     ]
 
+    def get_queryset(self):
+        tx = WorkBasket.get_current_transaction(self.request)
+        return super().get_queryset().with_latest_description(tx)
+
 
 class FootnoteCreate(CreateTaricCreateView):
     """UI endpoint for creating Footnote CREATE instances."""
@@ -12,9 +12,9 @@ from common.business_rules import UpdateValidity
 from common.fields import ShortDescription
 from common.fields import SignedIntSID
 from common.models.mixins.description import DescribedMixin
+from common.models.mixins.description import DescribedQueryset
 from common.models.mixins.description import DescriptionMixin
 from common.models.mixins.validity import ValidityMixin
-from common.models.tracked_qs import TrackedModelQuerySet
 from common.models.trackedmodel import TrackedModel
 from common.models.utils import GetTabURLMixin
 from geo_areas import business_rules
@@ -24,28 +24,10 @@ from measures import business_rules as measures_business_rules
 from quotas import business_rules as quotas_business_rules
 
 
-class GeographicalAreaQuerySet(TrackedModelQuerySet):
+class GeographicalAreaQuerySet(DescribedQueryset):
     def erga_omnes(self):
         return self.filter(area_code=AreaCode.GROUP, area_id=1011)
 
-    def with_latest_description(qs):
-        """
-        Returns a GeographicalArea queryset annotated with the latest result of
-        a GeographicalAreaDescription subquery's description value, linking
-        these two queries on version_group field.
-
-        Where an area has multiple current descriptions, the description with
-        the latest validity_start date is used.
-        """
-        current_descriptions = (
-            GeographicalAreaDescription.objects.current()
-            .filter(described_geographicalarea__version_group=OuterRef("version_group"))
-            .order_by("-validity_start")
-        )
-        return qs.annotate(
-            description=Subquery(current_descriptions.values("description")[:1]),
-        )
-
     def with_current_descriptions(qs):
         """Returns a GeographicalArea queryset annotated with the result of a a
         GeographicalAreaDescription subquery's description values chained
@@ -86,6 +68,7 @@ class GeographicalArea(TrackedModel, ValidityMixin, DescribedMixin):
     subrecord_code = "00"
 
     identifying_fields = ("sid",)
+    search_identifier_fields = ("area_id",)
 
     url_pattern_name_prefix = "geo_area"
 
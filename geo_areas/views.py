@@ -12,6 +12,7 @@ from common.models.trackedmodel import TrackedModel
 from common.serializers import AutoCompleteSerializer
 from common.util import TaricDateRange
 from common.validators import UpdateType
+from common.views import CachedAutoCompleteMixin
 from common.views import DescriptionDeleteMixin
 from common.views import SortingMixin
 from common.views import TamatoListView
@@ -35,16 +36,10 @@ from workbaskets.views.generic import CreateTaricUpdateView
 from workbaskets.views.generic import EditTaricView
 
 
-class GeoAreaViewSet(viewsets.ReadOnlyModelViewSet):
+class GeoAreaViewSet(CachedAutoCompleteMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint that allows geographical areas to be viewed."""
 
-    queryset = (
-        GeographicalArea.objects.latest_approved()
-        .with_latest_description()
-        .prefetch_related(
-            "descriptions",
-        )
-    )
+    queryset = GeographicalArea.objects.latest_approved().with_latest_description()
 
     serializer_class = AutoCompleteSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -5,6 +5,7 @@ from tempfile import TemporaryFile
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Set
 
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.template.loader import render_to_string
@@ -20,6 +21,23 @@ from settings import MAX_IMPORT_FILE_SIZE
 Tags = make_schema_dataclass(xsd_schema_paths)
 logger = getLogger(__name__)
 
+RECORD_KEY_SUFFIXES = (".sid", ".id", ".code")
+"""Suffixes of the record fields that identify, or reference by identity, a
+tariff object - e.g. `footnote.type.id` or `goods.nomenclature.sid`."""
+
+IGNORED_RECORD_KEY_TAGS = {
+    "transaction.id",
+    "record.code",
+    "subrecord.code",
+    "language.id",
+}
+"""Fields with identifying suffixes that are shared by unrelated records, and so
+would otherwise make every chunk depend on every other."""
+
+PARALLEL_RECORD_CODES = {"400", "430"}
+"""Record codes whose chunks are scheduled by chapter heading (commodities) or
+entirely asynchronously (measures) rather than by chunk dependencies."""
+
 
 def get_chunk(
     chunks_in_progress: dict,
@@ -211,6 +229,62 @@ def get_chapter_heading(transaction: ET.Element) -> str:
     return chapter_heading
 
 
+def get_record_keys(element: ET.Element) -> Set[str]:
+    """
+    Returns the identifying values of every record in the given element.
+
+    Each value is returned as a `tag=value` string, for instance
+    `goods.nomenclature.sid=12345`. As the same tags are used both by a record
+    that creates a tariff object and by records that reference it, two elements
+    sharing a key may touch the same object.
+    """
+    keys = set()
+    for record in Tags.OUB_RECORD.iter(element):
+        for field in record.iter():
+            if not isinstance(field.tag, str):
+                # Skip comments and processing instructions.
+                continue
+            tag = field.tag.rpartition("}")[2]
+            if (
+                field.text
+                and tag.endswith(RECORD_KEY_SUFFIXES)
+                and tag not in IGNORED_RECORD_KEY_TAGS
+            ):
+                keys.add(f"{tag}={field.text}")
+
+    return keys
+
+
+def link_chunk_dependencies(batch: models.ImportBatch):
+    """
+    Record which chunks of a split batch depend on an earlier chunk of the same
+    record code.
+
+    A chunk depends on an earlier chunk when they both create or reference a
+    record with the same identifying value. Chunks without dependencies on each
+    other can then be imported concurrently, while dependencies between record
+    codes are still resolved by the record code dependency tree.
+    """
+    chunks = (
+        batch.chunks.exclude(record_code__in=PARALLEL_RECORD_CODES)
+        .only("pk", "record_code", "chunk_text")
+        .order_by("record_code", "chunk_number")
+    )
+
+    earlier_chunk_keys = {}
+    for chunk in chunks.iterator():
+        keys = get_record_keys(xml_fromstring(chunk.chunk_text.encode()))
+        earlier_chunks = earlier_chunk_keys.setdefault(chunk.record_code, {})
+        chunk.dependencies.set(
+            [
+                earlier_chunk_pk
+                for earlier_chunk_pk, earlier_keys in earlier_chunks.items()
+                if keys & earlier_keys
+            ],
+        )
+        earlier_chunks[chunk.pk] = keys
+
+
 def write_transaction_to_chunk(
     transaction: ET.Element,
     chunks_in_progress: dict,
@@ -237,7 +311,7 @@ def write_transaction_to_chunk(
             return
 
         # Commodities and measures are special cases which can be split on chapter heading as well.
-        if record_code in {"400", "430"}:
+        if record_code in PARALLEL_RECORD_CODES:
             chapter_heading = get_chapter_heading(transaction)
 
     else:
@@ -373,5 +447,6 @@ def chunk_taric(
 
     if batch.split_job:
         rewrite_comm_codes(batch, envelope_id)
+        link_chunk_dependencies(batch)
 
     return chunk_count
@@ -19,6 +19,7 @@ from sentry_sdk import capture_exception
 from werkzeug.utils import secure_filename
 
 from common.util import get_mime_type
+from common.util import get_xml_schema
 from common.util import parse_xml
 from common.validators import validate_filename
 from common.validators import validate_filepath
@@ -102,8 +103,7 @@ class ImporterV2FormMixin:
                 capture_exception(e)
             raise ValidationError(generic_error_message)
 
-        with open(self.xsd_file) as xsd_file:
-            xmlschema = lxml.etree.XMLSchema(file=xsd_file)
+        xmlschema = get_xml_schema(self.xsd_file)
 
         try:
             xmlschema.assertValid(xml_file)
@@ -177,8 +177,7 @@ class ImportFormMixin:
                 capture_exception(e)
             raise ValidationError(generic_error_message)
 
-        with open(self.xsd_file) as xsd_file:
-            xmlschema = lxml.etree.XMLSchema(file=xsd_file)
+        xmlschema = get_xml_schema(self.xsd_file)
 
         try:
             xmlschema.assertValid(xml_file)
@@ -5,12 +5,14 @@ from dataclasses import dataclass
 from io import BytesIO
 from io import StringIO
 from typing import Generator
+from typing import Iterable
 from typing import List
 from typing import TextIO
 from typing import Tuple
 from xml.etree import ElementTree as ET
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
 from tabulate import tabulate
 
@@ -35,6 +37,17 @@ GOODS_NOMENCLATURE_ORIGIN_TAG = "oub:goods.nomenclature.origin"
 GOODS_NOMENCLATURE_SUCCESSOR_TAG = "oub:goods.nomenclature.successor"
 
 
+# Qualified envelope element names, as reported by incremental parsing.
+TRANSACTION_ELEMENT = f"{{{TARIC3_NAMESPACES['env']}}}transaction"
+MESSAGE_ELEMENT = f"{{{TARIC3_NAMESPACES['env']}}}app.message"
+RECORD_ELEMENT_PATH = [
+    TRANSACTION_ELEMENT,
+    MESSAGE_ELEMENT,
+    f"{{{TARIC3_NAMESPACES['oub']}}}transmission",
+    f"{{{TARIC3_NAMESPACES['oub']}}}record",
+]
+
+
 @dataclass
 class RecordInfo:
     """Informational class for Goods Nomenclature related record types."""
@@ -299,6 +312,50 @@ class GoodsReportLine:
         return self.as_csv()
 
 
+def write_csv(
+    rows: Iterable[List[str]],
+    csv_io: TextIO,
+    delimiter: str = ",",
+    include_column_names: bool = True,
+) -> None:
+    """Write report rows to the text stream `csv_io` in csv format, one row at a
+    time."""
+    writer = csv.writer(csv_io, delimiter=delimiter)
+    if include_column_names:
+        writer.writerow(GoodsReportLine.COLUMN_NAMES)
+    for row in rows:
+        writer.writerow(row)
+
+
+def write_xlsx_file(
+    rows: Iterable[List[str]],
+    xlsx_io: BytesIO,
+    include_column_names: bool = True,
+) -> None:
+    """
+    Write report rows to the file backing `xlsx_io` in Excel (xlsx) file
+    format.
+
+    A write-only workbook is used so that rows are flushed to the file as they
+    are appended rather than being held in memory until the workbook is saved.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+
+    if include_column_names:
+        header = []
+        for column_name in GoodsReportLine.COLUMN_NAMES:
+            cell = WriteOnlyCell(sheet, value=column_name)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        sheet.append(header)
+
+    for row in rows:
+        sheet.append(row)
+
+    workbook.save(xlsx_io.name)
+
+
 class GoodsReport:
     """
     Represents a report providing information about goods-related entities.
@@ -335,19 +392,11 @@ class GoodsReport:
         """Write report contents to a BytesIO object, xlsx_io, in Excel (xlsx)
         file format."""
 
-        workbook = Workbook()
-        sheet = workbook.active
-
-        if include_column_names:
-            column_names = GoodsReportLine.COLUMN_NAMES
-            sheet.append(column_names)
-            for cell in sheet[1]:
-                cell.font = Font(bold=True)
-
-        for line in self.report_lines:
-            sheet.append(line.as_list())
-
-        workbook.save(xlsx_io.name)
+        write_xlsx_file(
+            (line.as_list() for line in self.report_lines),
+            xlsx_io,
+            include_column_names,
+        )
 
     def markdown(self) -> str:
         """Return a Markdown table representation of the report."""
@@ -369,31 +418,66 @@ class GoodsReporter:
         """Create an instance of GoodsReport by parsing a TARIC3 XML file,
         extracting information relevant to a goods report."""
 
+        goods_report = GoodsReport()
+        goods_report.report_lines.extend(self.iter_report_lines())
+        return goods_report
+
+    def iter_report_lines(self) -> Generator[GoodsReportLine, None, None]:
+        """Generator yielding a GoodsReportLine for each goods-related record in
+        the TARIC3 XML file, in the order that they appear within the file."""
+
         base_filename = os.path.basename(self.goods_file.name)
 
-        logger.debug(f"Begin generating report object for {base_filename}.")
+        logger.debug(f"Begin generating report lines for {base_filename}.")
 
-        goods_report = GoodsReport()
         record_count = 0
+        report_line_count = 0
 
         for transaction_id, message_id, record_element in self._iter_records():
             record_count += 1
 
             if self._is_reportable(record_element):
-                report_line = GoodsReportLine(
+                report_line_count += 1
+                yield GoodsReportLine(
                     transaction_id,
                     message_id,
                     record_element,
                 )
-                goods_report.report_lines.append(report_line)
 
         logger.debug(
-            f"Found {len(goods_report.report_lines)} goods-related "
+            f"Found {report_line_count} goods-related "
             f"records from a total of {record_count} records.",
         )
-        logger.debug(f"Finished generating report object for {base_filename}.")
+        logger.debug(f"Finished generating report lines for {base_filename}.")
 
-        return goods_report
+    def write_csv(
+        self,
+        csv_io: TextIO,
+        delimiter: str = ",",
+        include_column_names: bool = True,
+    ) -> None:
+        """Write the report to the text stream `csv_io` in csv format as the
+        TARIC3 XML file is parsed, without building a GoodsReport."""
+        write_csv(
+            (line.as_list() for line in self.iter_report_lines()),
+            csv_io,
+            delimiter,
+            include_column_names,
+        )
+
+    def write_xlsx_file(
+        self,
+        xlsx_io: BytesIO,
+        include_column_names: bool = True,
+    ) -> None:
+        """Write the report to the file backing `xlsx_io` in Excel (xlsx) file
+        format as the TARIC3 XML file is parsed, without building a
+        GoodsReport."""
+        write_xlsx_file(
+            (line.as_list() for line in self.iter_report_lines()),
+            xlsx_io,
+            include_column_names,
+        )
 
     def _is_reportable(self, record_element: ET.Element) -> bool:
         """Returns True if record is a match by record code and subrecord code
@@ -439,24 +523,32 @@ class GoodsReporter:
                 </env:transaction>
                 ...
             </env:envelope>
-        """
-        tree = ET.parse(self.goods_file)
-        root = tree.getroot()
 
-        for transaction in root.iterfind(
-            "./env:transaction",
-            namespaces=TARIC3_NAMESPACES,
-        ):
-            transaction_id = transaction.attrib.get("id", "")
-
-            for message in transaction.iterfind(
-                "./env:app.message",
-                namespaces=TARIC3_NAMESPACES,
-            ):
-                message_id = message.attrib.get("id", "")
-
-                for record in message.iterfind(
-                    "./oub:transmission/oub:record",
-                    namespaces=TARIC3_NAMESPACES,
-                ):
-                    yield transaction_id, message_id, record
+        The file is parsed incrementally and each record element is cleared
+        once it has been consumed, as are completed transactions, so memory use
+        does not grow with the size of the file.
+        """
+        transaction_id = ""
+        message_id = ""
+        path = []
+        root = None
+
+        for event, element in ET.iterparse(self.goods_file, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                path.append(element.tag)
+
+                if element.tag == TRANSACTION_ELEMENT:
+                    transaction_id = element.attrib.get("id", "")
+                elif element.tag == MESSAGE_ELEMENT:
+                    message_id = element.attrib.get("id", "")
+                continue
+
+            if path[-4:] == RECORD_ELEMENT_PATH and len(path) == 5:
+                yield transaction_id, message_id, element
+                element.clear()
+            elif element.tag == TRANSACTION_ELEMENT and len(path) == 2:
+                root.clear()
+
+            path.pop()
@@ -1,7 +1,8 @@
 from django.core.management import BaseCommand
 
+from common.xml.util import filtered_transactions
 from common.xml.util import remove_transactions
-from common.xml.util import rewrite
+from common.xml.util import rewrite_transactions
 
 
 class Command(BaseCommand):
@@ -19,5 +20,11 @@ class Command(BaseCommand):
         return super().add_arguments(parser)
 
     def handle(self, *args, **options):
-        with rewrite(options["file"]) as root:
-            remove_transactions(root, options["name"], options["values"])
+        rewrite_transactions(
+            options["file"],
+            lambda transactions: filtered_transactions(
+                transactions,
+                options["name"],
+                options["values"],
+            ),
+        )
@@ -128,19 +128,18 @@ class Command(BaseCommand):
         self.validate_taric_file_source()
         taric_file = self.get_taric_file()
         reporter = GoodsReporter(taric_file)
-        goods_report = reporter.create_report()
 
         output_format = self.options.get("output_format")
         if output_format == "csv":
-            self.stdout.write(goods_report.csv(delimiter=","))
+            reporter.write_csv(self.stdout, delimiter=",")
         elif output_format == "md":
-            self.stdout.write(goods_report.markdown())
+            self.stdout.write(reporter.create_report().markdown())
         else:
             directory = self.get_output_directory()
             filename = self.get_output_base_filename()
             filepath = f"{directory}{filename}.xlsx"
             with open(filepath, "w+") as report_file:
-                goods_report.xlsx_file(report_file)
+                reporter.write_xlsx_file(report_file)
             self.stdout.write(
                 self.style.SUCCESS(f"Generated report file {filepath}"),
             )
@@ -1,7 +1,8 @@
 from django.core.management import BaseCommand
 
 from common.xml.util import renumber_records
-from common.xml.util import rewrite
+from common.xml.util import renumbered_records
+from common.xml.util import rewrite_transactions
 
 
 class Command(BaseCommand):
@@ -23,10 +24,12 @@ class Command(BaseCommand):
         return super().add_arguments(parser)
 
     def handle(self, *args, **options):
-        with rewrite(options["file"]) as root:
-            renumber_records(
-                root,
+        rewrite_transactions(
+            options["file"],
+            lambda transactions: renumbered_records(
+                transactions,
                 options["number"],
                 options["record"],
                 options["attribute"],
-            )
+            ),
+        )
@@ -1,7 +1,8 @@
 from django.core.management import BaseCommand
 
 from common.xml.util import renumber_transactions
-from common.xml.util import rewrite
+from common.xml.util import renumbered_transactions
+from common.xml.util import rewrite_transactions
 
 
 class Command(BaseCommand):
@@ -13,5 +14,10 @@ class Command(BaseCommand):
         return super().add_arguments(parser)
 
     def handle(self, *args, **options):
-        with rewrite(options["file"]) as root:
-            renumber_transactions(root, options["number"])
+        rewrite_transactions(
+            options["file"],
+            lambda transactions: renumbered_transactions(
+                transactions,
+                options["number"],
+            ),
+        )
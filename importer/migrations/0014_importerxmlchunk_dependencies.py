@@ -0,0 +1,22 @@
+# Generated by Django 4.2.21 on 2026-10-19 02:26
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("importer", "0013_alter_importbatch_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="importerxmlchunk",
+            name="dependencies",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="dependents",
+                to="importer.importerxmlchunk",
+            ),
+        ),
+    ]
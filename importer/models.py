@@ -47,6 +47,15 @@ class ImporterQuerySet(QuerySet):
         return self.filter(chunks__status__in=running_statuses)
 
 
+class ImporterXMLChunkQuerySet(QuerySet):
+    def unblocked(self) -> QuerySet:
+        """Returns chunks that are waiting to run and that have no dependencies
+        still to complete."""
+        return self.filter(status=ImporterChunkStatus.WAITING).exclude(
+            dependencies__status__in=running_statuses,
+        )
+
+
 class ImportBatchStatus(models.TextChoices):
     IMPORTING = "IMPORTING", "Importing"
     """The import process has not yet completed - possibly it is still queued,
@@ -351,6 +360,17 @@ class ImporterXMLChunk(TimestampedMixin):
         choices=ImporterChunkStatus.choices,
         default=1,
     )
+    dependencies = models.ManyToManyField(
+        "self",
+        symmetrical=False,
+        related_name="dependents",
+        blank=True,
+    )
+    """Earlier chunks of the same record code, in a split batch, which create or
+    reference the same records as this chunk and so must complete before it is
+    imported."""
+
+    objects = models.Manager.from_queryset(ImporterXMLChunkQuerySet)()
 
     def __str__(self):
         name = "Chunk"
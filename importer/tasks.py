@@ -133,8 +133,15 @@ def setup_chunk_task(
     if not chunk:
         return
 
-    chunk.status = ImporterChunkStatus.RUNNING
-    chunk.save()
+    # Claim the chunk with a conditional update, so that concurrently finishing
+    # chunks cannot both set up a task for it.
+    claimed = ImporterXMLChunk.objects.filter(
+        pk=chunk.pk,
+        status=ImporterChunkStatus.WAITING,
+    ).update(status=ImporterChunkStatus.RUNNING)
+    if not claimed:
+        return
+
     import_chunk.delay(
         chunk.pk,
         workbasket_id,
@@ -166,12 +173,19 @@ def find_and_run_next_batch_chunks(
     running. Unblocked in this case meaning all the record codes the chunk may
     be dependent on have run.
 
-    Record codes for split jobs are run in chunk order excluding two cases:
+    Record codes for split jobs are run in chunk order excluding three cases:
 
     1) Commodity codes can be split and run by chapter heading as well.
 
     2) Measures from split files are assumed to be able to run completely
     asynchronously and so all chunks are setup as tasks once unblocked.
+
+    3) Chunks of other record codes are setup as tasks as soon as the earlier
+    chunks of the same record code that they depend on are done, so chunks
+    which do not touch the same records run concurrently.
+
+    Transactions keep their envelope order whichever order the chunks are
+    imported in.
     """
 
     if batch.dependencies.still_running().exists():
@@ -270,13 +284,20 @@ def find_and_run_next_batch_chunks(
                     chapter=chunk.chapter,
                     chunk_number=chunk.chunk_number,
                 )
+        # Other chunks run concurrently once the earlier chunks they depend on
+        # are done, see importer.chunker.link_chunk_dependencies
         else:
-            setup_chunk_task(
-                batch,
-                workbasket_id,
-                workbasket_status,
-                partition_scheme_setting,
-                username,
-                record_code=code,
-                record_group=record_group,
-            )
+            for chunk_number in chunk_query.unblocked().values_list(
+                "chunk_number",
+                flat=True,
+            ):
+                setup_chunk_task(
+                    batch,
+                    workbasket_id,
+                    workbasket_status,
+                    partition_scheme_setting,
+                    username,
+                    record_code=code,
+                    record_group=record_group,
+                    chunk_number=chunk_number,
+                )
@@ -12,6 +12,7 @@ from django.forms.models import model_to_dict
 from commodities.models.orm import GoodsNomenclature
 from common.tests import factories
 from common.tests.util import generate_test_import_xml
+from common.util import xml_fromstring
 from importer import chunker
 from importer.chunker import chunk_taric
 from importer.chunker import filter_transaction_records
@@ -180,6 +181,69 @@ def test_write_transaction_to_chunk_record_code_not_in_tree(
     assert result is None
 
 
+def get_goods_nomenclature_chunk_text(sid: int) -> str:
+    return (
+        get_chunk_opener("1").decode()
+        + '<env:transaction id="1"><env:app.message id="1">'
+        '<oub:transmission xmlns:oub="urn:publicid:-:DGTAXUD:TARIC:MESSAGE:1.0">'
+        "<oub:record>"
+        "<oub:transaction.id>1</oub:transaction.id>"
+        "<oub:record.code>400</oub:record.code>"
+        "<oub:subrecord.code>15</oub:subrecord.code>"
+        "<oub:update.type>3</oub:update.type>"
+        "<oub:goods.nomenclature.description.period>"
+        f"<oub:goods.nomenclature.sid>{sid}</oub:goods.nomenclature.sid>"
+        "</oub:goods.nomenclature.description.period>"
+        "</oub:record>"
+        "<oub:record>"
+        "<oub:transaction.id>1</oub:transaction.id>"
+        "<oub:record.code>400</oub:record.code>"
+        "<oub:subrecord.code>15</oub:subrecord.code>"
+        "<oub:update.type>3</oub:update.type>"
+        "<oub:goods.nomenclature.description>"
+        "<oub:language.id>EN</oub:language.id>"
+        f"<oub:goods.nomenclature.sid>{sid}</oub:goods.nomenclature.sid>"
+        "</oub:goods.nomenclature.description>"
+        "</oub:record>"
+        "</oub:transmission></env:app.message></env:transaction></env:envelope>"
+    )
+
+
+def test_get_record_keys():
+    """Test that get_record_keys returns the identifying values of the records
+    in a chunk, ignoring those shared by unrelated records."""
+    envelope = xml_fromstring(get_goods_nomenclature_chunk_text(1).encode())
+
+    assert chunker.get_record_keys(envelope) == {"goods.nomenclature.sid=1"}
+
+
+def test_link_chunk_dependencies():
+    """Test that chunks of a split batch depend on earlier chunks of the same
+    record code that touch the same records."""
+    batch = factories.ImportBatchFactory.create(split_job=True)
+    first, second, unrelated, measures = (
+        factories.ImporterXMLChunkFactory.create(
+            batch=batch,
+            record_code=record_code,
+            chunk_number=chunk_number,
+            chunk_text=get_goods_nomenclature_chunk_text(sid),
+        )
+        for record_code, chunk_number, sid in (
+            ("200", 0, 1),
+            ("200", 1, 1),
+            ("200", 2, 2),
+            ("430", 0, 1),
+        )
+    )
+
+    chunker.link_chunk_dependencies(batch)
+
+    assert not first.dependencies.exists()
+    assert list(second.dependencies.all()) == [first]
+    assert not unrelated.dependencies.exists()
+    assert not measures.dependencies.exists()
+
+
 def test_get_record_code(envelope_commodity, taric_schema_tags, record_group):
     """Test that get_record_code returns the correct value for GoodsNomenclature
     when passed an xml ElementTree element."""
@@ -1,9 +1,11 @@
+from io import StringIO
 from os import path
 from tempfile import NamedTemporaryFile
 from typing import List
 from xml.etree import ElementTree as ET
 
 import pytest
+from openpyxl import load_workbook
 
 from common.validators import UpdateType
 from importer.goods_report import TARIC3_NAMESPACES
@@ -446,3 +448,45 @@ def test_goods_report_markdown():
         goods_report = goods_reporter.create_report()
     with open(f"{TEST_FILES_PATH}/goods_xml_report.md", "rt") as md_file:
         assert goods_report.markdown() == md_file.read()
+
+
+def test_goods_reporter_write_csv():
+    """Test that `GoodsReporter.write_csv()` streams the same csv content as
+    `GoodsReport.csv()`."""
+    with open(f"{TEST_FILES_PATH}/goods.xml", "rb") as taric_file:
+        expected = GoodsReporter(taric_file).create_report().csv()
+    with open(f"{TEST_FILES_PATH}/goods.xml", "rb") as taric_file:
+        csv_io = StringIO()
+        GoodsReporter(taric_file).write_csv(csv_io)
+
+    assert csv_io.getvalue() == expected
+
+
+def test_goods_reporter_write_xlsx_file():
+    """Test that `GoodsReporter.write_xlsx_file()` writes a column name row
+    followed by a row for each report line."""
+    with open(f"{TEST_FILES_PATH}/goods.xml", "rb") as taric_file:
+        report_lines = GoodsReporter(taric_file).create_report().report_lines
+    with (
+        open(f"{TEST_FILES_PATH}/goods.xml", "rb") as taric_file,
+        NamedTemporaryFile(
+            suffix=".xlsx",
+        ) as xlsx_io,
+    ):
+        GoodsReporter(taric_file).write_xlsx_file(xlsx_io)
+        rows = list(load_workbook(xlsx_io.name).active.values)
+
+    assert rows[0] == tuple(GoodsReportLine.COLUMN_NAMES)
+    assert [[value or "" for value in row] for row in rows[1:]] == [
+        line.as_list() for line in report_lines
+    ]
+
+
+def test_goods_reporter_clears_consumed_records():
+    """Test that `GoodsReporter` clears each record element once it has been
+    consumed."""
+    with open(f"{TEST_FILES_PATH}/goods.xml", "rb") as taric_file:
+        records = [record for _, _, record in GoodsReporter(taric_file)._iter_records()]
+
+    assert records
+    assert all(len(record) == 0 for record in records)
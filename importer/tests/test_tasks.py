@@ -189,3 +189,55 @@ def test_find_and_run_next_batch_chunks(mock_import_chunk, batch, valid_user):
         valid_user.username,
         record_group=None,
     )
+
+
+@mock.patch("importer.tasks.time.sleep")
+@mock.patch("importer.tasks.import_chunk")
+def test_find_and_run_next_batch_chunks_split_job_runs_unblocked_chunks(
+    mock_import_chunk,
+    mock_sleep,
+    valid_user,
+):
+    """Assert that chunks of a split batch run concurrently unless they depend
+    on an earlier chunk that is not yet done."""
+    batch = factories.ImportBatchFactory.create(split_job=True)
+    first, second, unrelated = (
+        factories.ImporterXMLChunkFactory.create(
+            batch=batch,
+            record_code="200",
+            chunk_number=chunk_number,
+        )
+        for chunk_number in range(3)
+    )
+    second.dependencies.add(first)
+
+    tasks.find_and_run_next_batch_chunks(
+        batch,
+        None,
+        "PUBLISHED",
+        "REVISION_ONLY",
+        valid_user.username,
+    )
+
+    for chunk, status in (
+        (first, ImporterChunkStatus.RUNNING),
+        (second, ImporterChunkStatus.WAITING),
+        (unrelated, ImporterChunkStatus.RUNNING),
+    ):
+        chunk.refresh_from_db()
+        assert chunk.status == status
+    assert mock_import_chunk.delay.call_count == 2
+
+    first.status = ImporterChunkStatus.DONE
+    first.save()
+    tasks.find_and_run_next_batch_chunks(
+        batch,
+        None,
+        "PUBLISHED",
+        "REVISION_ONLY",
+        valid_user.username,
+    )
+
+    second.refresh_from_db()
+    assert second.status == ImporterChunkStatus.RUNNING
+    assert mock_import_chunk.delay.call_count == 3
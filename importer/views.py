@@ -271,8 +271,7 @@ class DownloadGoodsReportMixin:
 
         with NamedTemporaryFile(suffix=".xlsx") as tmp:
             reporter = GoodsReporter(import_batch.taric_file)
-            goods_report = reporter.create_report()
-            goods_report.xlsx_file(tmp)
+            reporter.write_xlsx_file(tmp)
             file_content = tmp.read()
 
         response = HttpResponse(file_content)
@@ -368,7 +367,6 @@ class ImportedGoodsReview(
 
         if taric_file:
             reporter = GoodsReporter(import_batch.taric_file)
-            goods_report = reporter.create_report()
             today = date.today()
 
             context["report_lines"] = [
@@ -409,7 +407,7 @@ class ImportedGoodsReview(
                     ),
                     "comments": line.comments,
                 }
-                for line in goods_report.report_lines
+                for line in reporter.iter_report_lines()
             ]
             context["import_batch_pk"] = import_batch.pk
 
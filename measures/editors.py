@@ -1,14 +1,25 @@
+from collections import defaultdict
+from datetime import date
+from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Type
 
+from django.db.models import F
+from django.db.models import QuerySet
 from django.db.transaction import atomic
 
 from workbaskets import models as workbasket_models
 from measures import models as measure_models
+from common.models import TrackedModel
+from common.models import Transaction
 from common.util import TaricDateRange
 from common.validators import UpdateType
 from common.models.utils import override_current_transaction
+from geo_areas.utils import get_all_members_of_geo_groups
 from measures.util import update_measure_components
 from measures.util import update_measure_condition_components
 from measures.util import update_measure_excluded_geographical_areas
@@ -116,3 +127,397 @@ class MeasuresEditor:
                     edited_measures.append(new_measure)
 
             return edited_measures
+
+
+class MeasuresBulkEditEngine(MeasuresEditor):
+    """
+    Set-based counterpart to `MeasuresEditor`, used by `MeasuresBulkEditor` to
+    edit large numbers of measures.
+
+    New versions of the selected measures and of their dependent components,
+    conditions, excluded geographical areas and footnote associations are built
+    in memory a batch of measures at a time and written with one insert per
+    table, all within a single transaction of the workbasket.
+    """
+
+    batch_size: int = 500
+    """The number of selected measures to edit per batch of queries."""
+
+    progress_callback: Optional[Callable[[int], None]]
+    """Called with the number of measures edited so far after each batch."""
+
+    def __init__(
+        self,
+        workbasket: Type["workbasket_models.WorkBasket"],
+        selected_measures: List,
+        data: Dict,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ):
+        super().__init__(workbasket, selected_measures, data)
+        self.progress_callback = progress_callback
+
+    @atomic
+    def edit_measures(self) -> List["measure_models.Measure"]:
+        """
+        Returns a list of the edited measures.
+
+        `data` must be a dictionary of the accumulated cleaned / validated data
+        created from the `MeasureEditWizard`.
+        """
+
+        with override_current_transaction(
+            transaction=self.workbasket.current_transaction,
+        ):
+            measures = self.selected_measures
+            if isinstance(measures, QuerySet):
+                # New versions copy every foreign key of the measure, so fetch
+                # them with the measures rather than one query per measure.
+                measures = measures.select_related(*self.copied_relations())
+            measures = list(measures)
+            if not measures:
+                return []
+
+            transaction = self.workbasket.new_transaction()
+            self.workbasket_transaction_ids = set(
+                self.workbasket.transactions.values_list("pk", flat=True),
+            )
+            self.parsers = {}
+            self.exclusion_members = {}
+
+            edited_measures = []
+            for start in range(0, len(measures), self.batch_size):
+                batch = measures[start : start + self.batch_size]
+                edited_measures.extend(self.edit_batch(batch, transaction))
+                if self.progress_callback:
+                    self.progress_callback(len(edited_measures))
+
+            return edited_measures
+
+    @staticmethod
+    def copied_relations() -> List[str]:
+        """Returns the names of the relations that
+        :meth:`~common.models.TrackedModel.build_new_version` copies from a
+        measure to its new version."""
+        Measure = measure_models.Measure
+        return [
+            field.name
+            for field in Measure._meta.fields
+            if field.is_relation
+            and (
+                field.name == "version_group"
+                or field.name not in Measure.system_set_field_names
+            )
+        ]
+
+    def edit_batch(
+        self,
+        measures: List["measure_models.Measure"],
+        transaction: Transaction,
+    ) -> List["measure_models.Measure"]:
+        """Edit one batch of measures, returning their new versions."""
+        from measures.signals import update_terminating_regulation
+
+        new_start_date = self.data.get("start_date", None)
+        new_end_date = self.data.get("end_date", False)
+        new_quota_order_number = self.data.get("order_number", None)
+        new_generating_regulation = self.data.get("generating_regulation", None)
+
+        new_measures = []
+        for measure in measures:
+            new_measure = measure.build_new_version(
+                transaction=transaction,
+                valid_between=TaricDateRange(
+                    lower=new_start_date or measure.valid_between.lower,
+                    upper=new_end_date or measure.valid_between.upper,
+                ),
+                order_number=new_quota_order_number or measure.order_number,
+                generating_regulation=(
+                    new_generating_regulation or measure.generating_regulation
+                ),
+            )
+            update_terminating_regulation(
+                sender=measure_models.Measure,
+                instance=new_measure,
+            )
+            new_measures.append(new_measure)
+
+        measure_models.Measure.objects.bulk_create_versions(new_measures)
+        measure_models.Measure.objects.filter(
+            pk__in=[measure.pk for measure in new_measures],
+        ).refresh_effective_validity()
+
+        new_measures_by_group = {
+            measure.version_group_id: measure for measure in new_measures
+        }
+        self.edit_components(new_measures_by_group, transaction)
+        self.edit_conditions(new_measures_by_group, transaction)
+        self.edit_excluded_geographical_areas(new_measures_by_group, transaction)
+        self.edit_footnote_associations(new_measures_by_group, transaction)
+
+        return new_measures
+
+    def get_dependents(
+        self,
+        model: Type[TrackedModel],
+        measure_field: str,
+        new_measures_by_group: Dict[int, "measure_models.Measure"],
+        transaction: Transaction,
+    ) -> Dict[int, List[TrackedModel]]:
+        """Returns the current versions of `model` that refer to any of the
+        measures through `measure_field`, grouped by the version group of the
+        measure they refer to."""
+
+        dependents = defaultdict(list)
+        for dependent in (
+            model.objects.approved_up_to_transaction(transaction)
+            .filter(
+                **{f"{measure_field}__version_group__in": new_measures_by_group},
+            )
+            .annotate(measure_version_group=F(f"{measure_field}__version_group"))
+            .order_by("pk")
+        ):
+            dependents[dependent.measure_version_group].append(dependent)
+        return dependents
+
+    def edit_components(self, new_measures_by_group, transaction) -> None:
+        """
+        Re-parent the measure components onto the new measure versions.
+
+        If new duties have been entered they are diffed against the existing
+        components in the same way as `measures.util.diff_components`.
+        """
+
+        new_duties = self.data.get("duties", None)
+        existing = self.get_dependents(
+            measure_models.MeasureComponent,
+            "component_measure",
+            new_measures_by_group,
+            transaction,
+        )
+
+        components = []
+        for version_group_id, measure in new_measures_by_group.items():
+            old_by_id = {
+                c.duty_expression_id: c for c in existing.get(version_group_id, [])
+            }
+            if not new_duties:
+                components.extend(
+                    old.build_new_version(
+                        transaction=transaction,
+                        component_measure=measure,
+                    )
+                    for old in old_by_id.values()
+                )
+                continue
+
+            new_by_id = {
+                c.duty_expression.id: c
+                for c in self.get_parser(measure.valid_between.lower).parse(
+                    new_duties,
+                )
+            }
+            for id in new_by_id.keys() | old_by_id.keys():
+                new = new_by_id.get(id)
+                old = old_by_id.get(id)
+                if new:
+                    new.update_type = UpdateType.UPDATE if old else UpdateType.CREATE
+                    if old:
+                        new.version_group_id = old.version_group_id
+                    new.component_measure = measure
+                    new.transaction = transaction
+                    components.append(new)
+                else:
+                    components.append(
+                        old.build_new_version(
+                            transaction=transaction,
+                            update_type=UpdateType.DELETE,
+                        ),
+                    )
+
+        measure_models.MeasureComponent.objects.bulk_create_versions(components)
+
+    def get_parser(self, start_date: date):
+        """Returns a duty sentence parser for measures starting on
+        `start_date`, reusing parsers between measures."""
+        from measures.parsers import DutySentenceParser
+
+        if start_date not in self.parsers:
+            self.parsers[start_date] = DutySentenceParser.create(
+                start_date,
+                component_output=measure_models.MeasureComponent,
+            )
+        return self.parsers[start_date]
+
+    def edit_conditions(self, new_measures_by_group, transaction) -> None:
+        """Create new versions of the measure conditions that refer to the new
+        measure versions."""
+
+        existing = self.get_dependents(
+            measure_models.MeasureCondition,
+            "dependent_measure",
+            new_measures_by_group,
+            transaction,
+        )
+        measure_models.MeasureCondition.objects.bulk_create_versions(
+            [
+                condition.build_new_version(
+                    transaction=transaction,
+                    dependent_measure=new_measures_by_group[version_group_id],
+                )
+                for version_group_id, conditions in existing.items()
+                for condition in conditions
+            ],
+        )
+
+    def edit_excluded_geographical_areas(
+        self,
+        new_measures_by_group,
+        transaction,
+    ) -> None:
+        """
+        Point the excluded geographical areas at the new measure versions and,
+        if the exclusions have been edited, add and remove exclusions to match.
+
+        Exclusions already changed in the workbasket are updated in place in the
+        same way as `common.util.make_real_edit`.
+        """
+
+        edited = "geographical_area_exclusions" in self.data.get(
+            "fields_to_edit",
+            [],
+        )
+        exclusions = [
+            e["excluded_area"]
+            for e in self.data.get("formset-geographical_area_exclusions", [])
+        ]
+        existing = self.get_dependents(
+            measure_models.MeasureExcludedGeographicalArea,
+            "modified_measure",
+            new_measures_by_group,
+            transaction,
+        )
+
+        changes = []
+        for version_group_id, measure in new_measures_by_group.items():
+            existing_exclusions = {
+                e.excluded_geographical_area_id: e
+                for e in existing.get(version_group_id, [])
+            }
+            if not edited:
+                changes.extend(
+                    (exclusion, UpdateType.UPDATE, measure)
+                    for exclusion in existing_exclusions.values()
+                )
+                continue
+
+            new_excluded_areas = self.get_exclusion_members(
+                measure.valid_between,
+                exclusions,
+            )
+            for geo_area in new_excluded_areas:
+                existing_exclusion = existing_exclusions.get(geo_area.pk)
+                if existing_exclusion:
+                    changes.append((existing_exclusion, UpdateType.UPDATE, measure))
+                else:
+                    changes.append(
+                        (
+                            measure_models.MeasureExcludedGeographicalArea(
+                                modified_measure=measure,
+                                excluded_geographical_area=geo_area,
+                                update_type=UpdateType.CREATE,
+                                transaction=transaction,
+                            ),
+                            UpdateType.CREATE,
+                            measure,
+                        ),
+                    )
+
+            retained_areas = {geo_area.pk for geo_area in exclusions}
+            changes.extend(
+                (exclusion, UpdateType.DELETE, measure)
+                for area_id, exclusion in existing_exclusions.items()
+                if area_id not in retained_areas
+            )
+
+        self.apply_changes(
+            measure_models.MeasureExcludedGeographicalArea,
+            "modified_measure",
+            changes,
+            transaction,
+        )
+
+    def get_exclusion_members(self, validity, exclusions):
+        """Returns the geographical areas excluded by `exclusions` over
+        `validity`, reusing the result for measures with the same validity."""
+
+        if validity not in self.exclusion_members:
+            self.exclusion_members[validity] = get_all_members_of_geo_groups(
+                validity=validity,
+                geo_areas=exclusions,
+            )
+        return self.exclusion_members[validity]
+
+    def edit_footnote_associations(self, new_measures_by_group, transaction) -> None:
+        """Point the footnote associations at the new measure versions."""
+
+        existing = self.get_dependents(
+            measure_models.FootnoteAssociationMeasure,
+            "footnoted_measure",
+            new_measures_by_group,
+            transaction,
+        )
+        self.apply_changes(
+            measure_models.FootnoteAssociationMeasure,
+            "footnoted_measure",
+            [
+                (association, UpdateType.UPDATE, new_measures_by_group[group_id])
+                for group_id, associations in existing.items()
+                for association in associations
+            ],
+            transaction,
+        )
+
+    def apply_changes(
+        self,
+        model: Type[TrackedModel],
+        measure_field: str,
+        changes: List[Tuple[TrackedModel, UpdateType, Any]],
+        transaction: Transaction,
+    ) -> None:
+        """
+        Write `(obj, update_type, new_measure)` changes to versions of `model`
+        in bulk, with the same outcome as calling `common.util.make_real_edit`
+        for each of them.
+
+        New versions are created for objects not yet in the workbasket, while
+        objects already in the workbasket are updated in place or removed.
+        """
+
+        new_versions = []
+        updated = []
+        deleted = []
+        removed = []
+        for obj, update_type, measure in changes:
+            if update_type == UpdateType.CREATE:
+                new_versions.append(obj)
+            elif obj.transaction_id not in self.workbasket_transaction_ids:
+                new_versions.append(
+                    obj.build_new_version(
+                        transaction=transaction,
+                        update_type=update_type,
+                        **{measure_field: measure},
+                    ),
+                )
+            elif update_type == UpdateType.UPDATE:
+                setattr(obj, measure_field, measure)
+                obj.transaction = transaction
+                updated.append(obj)
+            elif obj.update_type == UpdateType.CREATE:
+                removed.append(obj.pk)
+            elif obj.update_type == UpdateType.UPDATE:
+                deleted.append(obj.pk)
+
+        model.objects.bulk_create_versions(new_versions)
+        model.objects.bulk_update(updated, [measure_field, "transaction"])
+        model.objects.filter(pk__in=deleted).update(update_type=UpdateType.DELETE)
+        model.objects.filter(pk__in=removed).delete()
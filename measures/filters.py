@@ -16,7 +16,6 @@ from common.filters import AutoCompleteFilter
 from common.filters import TamatoFilter
 from common.filters import TamatoFilterBackend
 from common.forms import DateInputFieldFixed
-from common.util import EndDate
 from common.util import StartDate
 from common.validators import NumericValidator
 from footnotes.models import Footnote
@@ -240,16 +239,14 @@ class MeasureFilter(TamatoFilter):
         if value:
             modifier = self.data["end_date_modifier"]
             if modifier == "after":
-                filter_query = Q(end_date__gt=value) | Q(end_date__isnull=True)
+                filter_query = Q(effective_validity__end_date__gt=value) | Q(
+                    effective_validity__end_date__isnull=True,
+                )
             elif modifier == "before":
-                filter_query = Q(end_date__lt=value)
+                filter_query = Q(effective_validity__end_date__lt=value)
             else:
-                filter_query = Q(end_date=value)
-            queryset = (
-                queryset.with_effective_valid_between()
-                .annotate(end_date=EndDate("db_effective_valid_between"))
-                .filter(filter_query)
-            )
+                filter_query = Q(effective_validity__end_date=value)
+            queryset = queryset.filter(filter_query)
         return queryset
 
     def workbasket_filter(self, queryset, name, value):
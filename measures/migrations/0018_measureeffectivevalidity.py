@@ -0,0 +1,140 @@
+# Generated by Django 4.2.15 on 2026-10-19 10:00
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations
+from django.db import models
+from django.db.models.functions import Cast
+from django.db.models.functions import Coalesce
+from django.db.models.functions import NullIf
+
+import common.fields
+from common.util import EndDate
+from common.util import StartDate
+from common.util import TaricDateRange
+
+BATCH_SIZE = 10000
+
+
+def populate_effective_validity(apps, schema_editor):
+    # This mirrors MeasuresQuerySet.refresh_effective_validity, which is not
+    # available on historical models.
+    Measure = apps.get_model("measures", "Measure")
+    MeasureEffectiveValidity = apps.get_model("measures", "MeasureEffectiveValidity")
+    Regulation = apps.get_model("regulations", "Regulation")
+
+    infinity = Cast(models.Value("infinity"), models.DateField())
+    amended_end_date = models.Subquery(
+        Regulation.objects.filter(pk=models.OuterRef("generating_regulation_id"))
+        .annotate(
+            amended_end_date=NullIf(
+                models.Max(
+                    Coalesce(
+                        models.F("amendments__enacting_regulation__effective_end_date"),
+                        EndDate("amendments__enacting_regulation__valid_between"),
+                        infinity,
+                    ),
+                ),
+                infinity,
+            ),
+        )
+        .values("amended_end_date"),
+        output_field=models.DateField(),
+    )
+    effective_end_date = Coalesce(
+        EndDate("valid_between"),
+        models.F("generating_regulation__effective_end_date"),
+        EndDate("generating_regulation__valid_between"),
+        amended_end_date,
+        models.F("generating_regulation__amends__effective_end_date"),
+        EndDate("generating_regulation__amends__valid_between"),
+        output_field=models.DateField(),
+    )
+
+    pks = list(Measure.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(pks), BATCH_SIZE):
+        rows = (
+            Measure.objects.filter(pk__in=pks[start : start + BATCH_SIZE])
+            .annotate(effective_end_date=effective_end_date)
+            .values_list("pk", StartDate("valid_between"), "effective_end_date")
+            .order_by()
+        )
+
+        # A modification regulation may amend more than one base regulation,
+        # so keep the latest of the end dates, treating open-ended as latest.
+        end_dates = {}
+        for pk, start_date, end_date in rows:
+            if pk in end_dates:
+                previous_end_date = end_dates[pk][1]
+                if previous_end_date is None or (
+                    end_date is not None and end_date <= previous_end_date
+                ):
+                    continue
+            end_dates[pk] = (start_date, end_date)
+
+        MeasureEffectiveValidity.objects.bulk_create(
+            [
+                MeasureEffectiveValidity(
+                    measure_id=pk,
+                    end_date=end_date,
+                    valid_between=(
+                        TaricDateRange(start_date, end_date)
+                        if end_date is None or start_date <= end_date
+                        else None
+                    ),
+                )
+                for pk, (start_date, end_date) in end_dates.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["measure"],
+            update_fields=["end_date", "valid_between"],
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("measures", "0017_measuresbulkeditor"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MeasureEffectiveValidity",
+            fields=[
+                (
+                    "measure",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        related_query_name="effective_validity",
+                        serialize=False,
+                        to="measures.measure",
+                    ),
+                ),
+                (
+                    "end_date",
+                    models.DateField(blank=True, db_index=True, null=True),
+                ),
+                (
+                    "valid_between",
+                    common.fields.TaricDateRangeField(blank=True, null=True),
+                ),
+            ],
+        ),
+    ]
+
+    if not settings.SQLITE:
+        operations += [
+            migrations.AddIndex(
+                model_name="measureeffectivevalidity",
+                index=django.contrib.postgres.indexes.GistIndex(
+                    fields=["valid_between"],
+                    name="measures_effective_vb_gist",
+                ),
+            ),
+            migrations.RunPython(
+                populate_effective_validity,
+                migrations.RunPython.noop,
+            ),
+        ]
@@ -2,6 +2,7 @@ from measures.models.bulk_processing import BulkProcessor
 from measures.models.bulk_processing import MeasuresBulkCreator
 from measures.models.bulk_processing import MeasuresBulkEditor
 from measures.models.bulk_processing import ProcessingState
+from measures.models.effective_validity import MeasureEffectiveValidity
 from measures.models.tracked_models import AdditionalCodeTypeMeasureType
 from measures.models.tracked_models import DutyExpression
 from measures.models.tracked_models import FootnoteAssociationMeasure
@@ -26,6 +27,8 @@ __all__ = [
     "MeasuresBulkCreator",
     "MeasuresBulkEditor",
     "ProcessingState",
+    # - Classes exported from effective_validity.py.
+    "MeasureEffectiveValidity",
     # - Classes exported from tracked_model.py.
     "AdditionalCodeTypeMeasureType",
     "DutyExpression",
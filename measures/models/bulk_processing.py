@@ -18,7 +18,7 @@ from common.celery import app
 from common.models.mixins import TimestampedMixin
 from common.models.utils import override_current_transaction
 from measures.models.tracked_models import Measure
-from measures.editors import MeasuresEditor
+from measures.editors import MeasuresBulkEditEngine
 
 logger = logging.getLogger(__name__)
 
@@ -516,11 +516,33 @@ class MeasuresBulkEditor(BulkProcessor):
                 pk__in=self.selected_measures
             )
 
-            measures_editor = MeasuresEditor(
-                self.workbasket, deserialized_selected_measures, cleaned_data
+            measures_editor = MeasuresBulkEditEngine(
+                self.workbasket,
+                deserialized_selected_measures,
+                cleaned_data,
+                progress_callback=self._report_progress,
             )
             return measures_editor.edit_measures()
 
+    def _report_progress(self, edited_count: int) -> None:
+        """
+        Record the number of measures edited so far by `edit_measures()`.
+
+        Measures are edited within a single transaction, so the count is written
+        using the separate `PROGRESS_DATABASE_ALIAS` connection in order for it
+        to be visible while editing is still in progress.
+        """
+
+        self.successfully_processed_count = edited_count
+        MeasuresBulkEditor.objects.using(settings.PROGRESS_DATABASE_ALIAS).filter(
+            pk=self.pk,
+        ).update(successfully_processed_count=edited_count)
+
+        logger.info(
+            f"MeasuresBulkEditor({self.pk}) edited {edited_count} of "
+            f"{self.expected_measures_count} measures.",
+        )
+
     def get_forms_cleaned_data(self) -> Dict:
         """
         Returns a merged dictionary of all Form cleaned_data.
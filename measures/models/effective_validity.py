@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.contrib.postgres.indexes import GistIndex
+from django.db import models
+
+from common.fields import TaricDateRangeField
+from measures.models.tracked_models import Measure
+
+
+class MeasureEffectiveValidity(models.Model):
+    """
+    The effective validity period of a single :class:`~measures.models.Measure`
+    version, taking into account any end date that the measure inherits from
+    its generating regulation or from the regulations in that regulation's
+    base/modification chain.
+
+    This is derived data and rows should not be edited directly. A row is
+    recomputed whenever the measure, or any regulation or amendment that
+    contributes to its end date, is saved (see :mod:`measures.signals`) so that
+    queries filtering or sorting measures by their effective validity can use
+    the indexes on this table rather than re-deriving it from the regulation
+    chain each time.
+    """
+
+    measure = models.OneToOneField(
+        Measure,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="+",
+        related_query_name="effective_validity",
+    )
+    end_date = models.DateField(db_index=True, null=True, blank=True)
+    """The effective end date of the measure, or ``None`` if it is open
+    ended."""
+    valid_between = TaricDateRangeField(null=True, blank=True)
+    """The effective validity period of the measure, or ``None`` if the
+    effective end date falls before the start of the measure (which is a
+    violation of :class:`~measures.business_rules.ME25`)."""
+
+    class Meta:
+        if not settings.SQLITE:
+            indexes = [
+                GistIndex(
+                    fields=["valid_between"],
+                    name="measures_effective_vb_gist",
+                ),
+            ]
+
+    def __str__(self):
+        return f"{self.measure_id}: {self.valid_between}"
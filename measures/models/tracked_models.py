@@ -553,6 +553,7 @@ class Measure(TrackedModel, ValidityMixin):
     )
 
     identifying_fields = ("sid",)
+    search_identifier_fields = ("sid",)
 
     indirect_business_rules = (
         business_rules.MA4,
@@ -619,30 +620,35 @@ class Measure(TrackedModel, ValidityMixin):
     @property
     def effective_end_date(self) -> date:
         """Measure end dates may be overridden by regulations."""
-        if not hasattr(self, self.validity_field_name):
-            effective_valid_between = (
+        if not hasattr(self, "db_effective_end_date"):
+            self.db_effective_end_date = (
                 type(self)
-                .objects.with_validity_field()
+                .objects.with_effective_valid_between()
                 .filter(pk=self.pk)
+                .values_list("db_effective_end_date", flat=True)
                 .get()
-                .db_effective_valid_between
             )
-            setattr(self, self.validity_field_name, effective_valid_between)
 
-        return getattr(self, self.validity_field_name).upper
+        return self.db_effective_end_date
 
     def __str__(self):
         return str(self.sid)
 
     @property
     def effective_valid_between(self) -> TaricDateRange:
-        if hasattr(self, self.validity_field_name):
+        if getattr(self, self.validity_field_name, None) is not None:
             return getattr(self, self.validity_field_name)
 
         return TaricDateRange(self.valid_between.lower, self.effective_end_date)
 
     @property
     def duty_sentence(self) -> str:
+        """Measures annotated using
+        :meth:`~measures.querysets.MeasuresQuerySet.with_duty_sentence` use the
+        annotated value rather than querying their components."""
+        if hasattr(self, "db_duty_sentence"):
+            return self.db_duty_sentence
+
         return MeasureComponent.objects.duty_sentence(self)
 
     @classproperty
@@ -847,6 +853,12 @@ class MeasureCondition(GetTabURLMixin, TrackedModel):
 
     @property
     def duty_sentence(self) -> str:
+        """Conditions annotated using
+        :meth:`~measures.querysets.MeasureConditionQuerySet.with_duty_sentence`
+        use the annotated value rather than querying their components."""
+        if hasattr(self, "db_duty_sentence"):
+            return self.db_duty_sentence
+
         return MeasureConditionComponent.objects.duty_sentence(self)
 
 
@@ -3,9 +3,12 @@ from typing import Union
 from django.contrib.postgres.aggregates import StringAgg
 from django.db.models import Case
 from django.db.models import CharField
+from django.db.models import Exists
 from django.db.models import F
 from django.db.models import Func
+from django.db.models import OuterRef
 from django.db.models import Q
+from django.db.models import Subquery
 from django.db.models import Value
 from django.db.models import When
 from django.db.models.aggregates import Max
@@ -21,8 +24,11 @@ import measures
 from common.fields import TaricDateRangeField
 from common.models.tracked_qs import TrackedModelQuerySet
 from common.querysets import ValidityQuerySet
+from common.querysets import nested_outer_ref
 from common.util import EndDate
 from common.util import StartDate
+from common.util import TaricDateRange
+from common.validators import UpdateType
 
 
 class ComponentQuerySet(TrackedModelQuerySet):
@@ -109,85 +115,250 @@ class ComponentQuerySet(TrackedModelQuerySet):
         # Aggregate all the current Components for component_parent to form its
         # duty sentence.
         duty_sentence = component_qs.aggregate(
-            duty_sentence=StringAgg(
-                expression=Trim(
-                    Concat(
-                        Case(
-                            When(
-                                Q(duty_expression__prefix__isnull=True)
-                                | Q(duty_expression__prefix=""),
-                                then=Value(""),
-                            ),
-                            default=Concat(
-                                F("duty_expression__prefix"),
-                                Value(" "),
-                            ),
+            duty_sentence=self.duty_sentence_aggregate(),
+        )
+        return duty_sentence.get("duty_sentence", "")
+
+    @staticmethod
+    def duty_sentence_aggregate() -> StringAgg:
+        """Returns the string aggregation of components that forms a duty
+        sentence, as described in :meth:`duty_sentence`."""
+        return StringAgg(
+            expression=Trim(
+                Concat(
+                    Case(
+                        When(
+                            Q(duty_expression__prefix__isnull=True)
+                            | Q(duty_expression__prefix=""),
+                            then=Value(""),
                         ),
-                        "duty_amount",
-                        Case(
-                            When(
-                                monetary_unit=None,
-                                duty_amount__isnull=False,
-                                then=Value("%"),
-                            ),
-                            When(
-                                duty_amount__isnull=True,
-                                then=Value(""),
-                            ),
-                            default=Concat(
-                                Value(" "),
-                                F("monetary_unit__code"),
-                            ),
+                        default=Concat(
+                            F("duty_expression__prefix"),
+                            Value(" "),
                         ),
-                        Case(
-                            When(
-                                Q(component_measurement=None)
-                                | Q(component_measurement__measurement_unit=None)
-                                | Q(
-                                    component_measurement__measurement_unit__abbreviation=None,
-                                ),
-                                then=Value(""),
-                            ),
-                            When(
-                                monetary_unit__isnull=True,
-                                then=F(
-                                    "component_measurement__measurement_unit__abbreviation",
-                                ),
+                    ),
+                    "duty_amount",
+                    Case(
+                        When(
+                            monetary_unit=None,
+                            duty_amount__isnull=False,
+                            then=Value("%"),
+                        ),
+                        When(
+                            duty_amount__isnull=True,
+                            then=Value(""),
+                        ),
+                        default=Concat(
+                            Value(" "),
+                            F("monetary_unit__code"),
+                        ),
+                    ),
+                    Case(
+                        When(
+                            Q(component_measurement=None)
+                            | Q(component_measurement__measurement_unit=None)
+                            | Q(
+                                component_measurement__measurement_unit__abbreviation=None,
                             ),
-                            default=Concat(
-                                Value(" / "),
-                                F(
-                                    "component_measurement__measurement_unit__abbreviation",
-                                ),
+                            then=Value(""),
+                        ),
+                        When(
+                            monetary_unit__isnull=True,
+                            then=F(
+                                "component_measurement__measurement_unit__abbreviation",
                             ),
                         ),
-                        Case(
-                            When(
-                                component_measurement__measurement_unit_qualifier__abbreviation=None,
-                                then=Value(""),
+                        default=Concat(
+                            Value(" / "),
+                            F(
+                                "component_measurement__measurement_unit__abbreviation",
                             ),
-                            default=Concat(
-                                Value(" / "),
-                                F(
-                                    "component_measurement__measurement_unit_qualifier__abbreviation",
-                                ),
+                        ),
+                    ),
+                    Case(
+                        When(
+                            component_measurement__measurement_unit_qualifier__abbreviation=None,
+                            then=Value(""),
+                        ),
+                        default=Concat(
+                            Value(" / "),
+                            F(
+                                "component_measurement__measurement_unit_qualifier__abbreviation",
                             ),
                         ),
-                        output_field=CharField(),
                     ),
+                    output_field=CharField(),
                 ),
-                delimiter=" ",
-                ordering="duty_expression__sid",
             ),
+            delimiter=" ",
+            ordering="duty_expression__sid",
+        )
+
+    def approved_up_to_parent_transaction(self, parent_field: str, depth=1):
+        """
+        Filters to the components of the measure or condition in the query
+        `depth` levels out, as of that parent's own transaction.
+
+        This is the subquery equivalent of
+        ``parent.components.approved_up_to_transaction(parent.transaction)``,
+        where `parent_field` is the name of the field linking components to
+        their parent.
+        """
+        newer_versions = self.model.objects.filter(
+            version_group_id=OuterRef("version_group_id"),
+            pk__gt=OuterRef("pk"),
+        ).filter(self.as_at_outer_transaction_filter(depth=depth + 1))
+
+        return (
+            self.filter(
+                **{
+                    f"{parent_field}__version_group_id": nested_outer_ref(
+                        "version_group_id",
+                        depth,
+                    ),
+                },
+            )
+            .filter(self.as_at_outer_transaction_filter(depth=depth))
+            .exclude(update_type=UpdateType.DELETE)
+            .exclude(Exists(newer_versions))
+        )
+
+    def duty_sentence_subquery(self, parent_field: str) -> Coalesce:
+        """
+        Returns an expression evaluating to the duty sentence of the measure or
+        condition in the outer query, for annotating a queryset of parents.
+
+        The result matches :meth:`duty_sentence` for each parent, so a whole
+        page of parents can be given duty sentences in a single query.
+        """
+        # As in `duty_sentence`, only the components from the latest
+        # transaction of those current for the parent are used.
+        latest_transaction_id = (
+            self.model.objects.approved_up_to_parent_transaction(parent_field, 2)
+            .order_by("-transaction_id")
+            .values("transaction_id")[:1]
+        )
+        components = self.approved_up_to_parent_transaction(parent_field).filter(
+            transaction_id=Subquery(latest_transaction_id),
+        )
+
+        return Coalesce(
+            Subquery(
+                components.order_by()
+                .values(f"{parent_field}__version_group_id")
+                .annotate(duty_sentence=self.duty_sentence_aggregate())
+                .values("duty_sentence"),
+                output_field=CharField(),
+            ),
+            Value(""),
         )
-        return duty_sentence.get("duty_sentence", "")
 
 
 class MeasuresQuerySet(TrackedModelQuerySet, ValidityQuerySet):
     def with_validity_field(self):
         return self.with_effective_valid_between()
 
+    def with_duty_sentence(self):
+        """
+        Annotates each measure with its ``db_duty_sentence``, as returned by
+        :attr:`~measures.models.Measure.duty_sentence`, computed in the
+        database.
+        """
+        Component = self.model._meta.get_field("components").related_model
+        return self.annotate(
+            db_duty_sentence=Component.objects.duty_sentence_subquery(
+                "component_measure",
+            ),
+        )
+
     def with_effective_valid_between(self):
+        """
+        Annotates each measure with its ``db_effective_end_date`` and
+        ``db_effective_valid_between``, taking into account any end date
+        inherited from the regulations that generate it.
+
+        The values are read from the
+        :class:`~measures.models.MeasureEffectiveValidity` row stored for every
+        measure, which is kept up to date by :meth:`refresh_effective_validity`.
+        Queries that only filter or sort on the effective validity should use
+        ``effective_validity__valid_between`` or ``effective_validity__end_date``
+        directly.
+        """
+        return self.annotate(
+            db_effective_end_date=F("effective_validity__end_date"),
+            db_effective_valid_between=F("effective_validity__valid_between"),
+        )
+
+    def refresh_effective_validity(self) -> int:
+        """
+        Recomputes and stores the effective validity of every measure in this
+        queryset, returning the number of measures that were refreshed.
+
+        The effective end date is computed in the database but the range is
+        built here, so that measures whose effective end date falls before
+        their start date (see :class:`~measures.business_rules.ME25`) are
+        stored without a range rather than raising a database error.
+
+        Unlike :meth:`with_computed_effective_valid_between`, only the
+        amendments to each measure's own generating regulation are aggregated,
+        so refreshing a few measures as they are saved stays cheap.
+        """
+        EffectiveValidity = self.model._meta.get_field(
+            "effective_validity",
+        ).related_model
+        Regulation = self.model._meta.get_field(
+            "generating_regulation",
+        ).remote_field.model
+
+        amended_end_date = Subquery(
+            Regulation.objects.filter(pk=OuterRef("generating_regulation_id"))
+            .annotate(amended_end_date=self.amended_end_date_aggregate())
+            .values("amended_end_date"),
+            output_field=DateField(),
+        )
+
+        # A modification regulation may amend more than one base regulation,
+        # which produces one row per amended regulation. Keep the latest of the
+        # end dates, treating open-ended as the latest of all.
+        end_dates = {}
+        rows = (
+            self.annotate(
+                db_effective_end_date=self.effective_end_date_expression(
+                    amended_end_date,
+                ),
+            )
+            .values_list("pk", StartDate("valid_between"), "db_effective_end_date")
+            .order_by()
+        )
+        for pk, start_date, end_date in rows:
+            if pk in end_dates:
+                previous_end_date = end_dates[pk][1]
+                if previous_end_date is None or (
+                    end_date is not None and end_date <= previous_end_date
+                ):
+                    continue
+            end_dates[pk] = (start_date, end_date)
+
+        EffectiveValidity.objects.bulk_create(
+            [
+                EffectiveValidity(
+                    measure_id=pk,
+                    end_date=end_date,
+                    valid_between=(
+                        TaricDateRange(start_date, end_date)
+                        if end_date is None or start_date <= end_date
+                        else None
+                    ),
+                )
+                for pk, (start_date, end_date) in end_dates.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["measure"],
+            update_fields=["end_date", "valid_between"],
+        )
+        return len(end_dates)
+
+    def with_computed_effective_valid_between(self):
         """
         There are five ways in which measures can get end dated:
 
@@ -212,26 +383,13 @@ class MeasuresQuerySet(TrackedModelQuerySet, ValidityQuerySet):
         # aggregating over all of the modifications to the base regulation,
         # where there is one. So we pull this out into a CTE to let Postgres
         # know that none of this caluclation depends on the queryset filters.
-        #
-        # We also turn NULLs into "infinity" such that they sort to the top:
-        # i.e. if any modification regulation is open-ended, so is the measure.
-        # We then turn infinity back into NULL to be used in the date range.
         Regulation = self.model._meta.get_field(
             "generating_regulation",
         ).remote_field.model
 
         end_date_from_modifications = With(
             Regulation.objects.annotate(
-                amended_end_date=NullIf(
-                    Max(
-                        Coalesce(
-                            F("amendments__enacting_regulation__effective_end_date"),
-                            EndDate("amendments__enacting_regulation__valid_between"),
-                            Cast(Value("infinity"), DateField()),
-                        ),
-                    ),
-                    Cast(Value("infinity"), DateField()),
-                ),
+                amended_end_date=self.amended_end_date_aggregate(),
             ),
             "end_date_from_modifications",
         )
@@ -243,33 +401,81 @@ class MeasuresQuerySet(TrackedModelQuerySet, ValidityQuerySet):
             )
             .with_cte(end_date_from_modifications)
             .annotate(
-                db_effective_end_date=Coalesce(
-                    # Case 1 – explicit end date, which is always used if present
-                    EndDate("valid_between"),
-                    # Case 2 and 3 – end date of regulation
-                    F("generating_regulation__effective_end_date"),
-                    EndDate("generating_regulation__valid_between"),
-                    # Case 4 – generating regulation is a base regulation, and
-                    # the modification regulation is end-dated
+                db_effective_end_date=self.effective_end_date_expression(
                     end_date_from_modifications.col.amended_end_date,
-                    # Case 5 – generating regulation is a modification regulation,
-                    # and the base it modifies is end-dated. Note that the above
-                    # means that this only applies if the modification has no end date.
-                    F("generating_regulation__amends__effective_end_date"),
-                    EndDate("generating_regulation__amends__valid_between"),
-                ),
-                db_effective_valid_between=Func(
-                    StartDate("valid_between"),
-                    F("db_effective_end_date"),
-                    Value("[]"),
-                    function="DATERANGE",
-                    output_field=TaricDateRangeField(),
                 ),
+                db_effective_valid_between=self.effective_valid_between_expression(),
             )
         )
 
+    @staticmethod
+    def amended_end_date_aggregate() -> NullIf:
+        """
+        Returns the latest end date of the modification regulations that amend
+        a regulation, for annotating a queryset of regulations.
+
+        NULLs are turned into "infinity" such that they sort to the top: i.e. if
+        any modification regulation is open-ended, so is the measure. Infinity
+        is then turned back into NULL to be used in the date range.
+        """
+        return NullIf(
+            Max(
+                Coalesce(
+                    F("amendments__enacting_regulation__effective_end_date"),
+                    EndDate("amendments__enacting_regulation__valid_between"),
+                    Cast(Value("infinity"), DateField()),
+                ),
+            ),
+            Cast(Value("infinity"), DateField()),
+        )
+
+    @staticmethod
+    def effective_end_date_expression(amended_end_date) -> Coalesce:
+        """Returns the effective end date of a measure, as described in
+        :meth:`with_computed_effective_valid_between`, given the end date from
+        the modifications to its generating regulation (case 4)."""
+        return Coalesce(
+            # Case 1 – explicit end date, which is always used if present
+            EndDate("valid_between"),
+            # Case 2 and 3 – end date of regulation
+            F("generating_regulation__effective_end_date"),
+            EndDate("generating_regulation__valid_between"),
+            # Case 4 – generating regulation is a base regulation, and
+            # the modification regulation is end-dated
+            amended_end_date,
+            # Case 5 – generating regulation is a modification regulation,
+            # and the base it modifies is end-dated. Note that the above
+            # means that this only applies if the modification has no end date.
+            F("generating_regulation__amends__effective_end_date"),
+            EndDate("generating_regulation__amends__valid_between"),
+            output_field=DateField(),
+        )
+
+    @staticmethod
+    def effective_valid_between_expression() -> Func:
+        """Returns the effective validity period of a measure, running up to
+        its ``db_effective_end_date``."""
+        return Func(
+            StartDate("valid_between"),
+            F("db_effective_end_date"),
+            Value("[]"),
+            function="DATERANGE",
+            output_field=TaricDateRangeField(),
+        )
+
 
 class MeasureConditionQuerySet(TrackedModelQuerySet):
+    def with_duty_sentence(self):
+        """
+        Annotates each condition with its ``db_duty_sentence``, as returned by
+        :attr:`~measures.models.MeasureCondition.duty_sentence`, computed in the
+        database.
+        """
+        Component = self.model._meta.get_field("components").related_model
+        return self.annotate(
+            db_duty_sentence=Component.objects.duty_sentence_subquery("condition"),
+        )
+
     def with_reference_price_string(self):
         """
         Returns a MeasureCondition queryset annotated with
@@ -1,10 +1,15 @@
 from typing import Type
 
+from django.db.models import Q
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
 from django.db.models.signals import pre_save
 from django.dispatch import receiver
 
 from common.validators import UpdateType
 from measures import models
+from regulations.models import Amendment
+from regulations.models import Regulation
 
 
 @receiver(pre_save, sender=models.Measure, dispatch_uid="update_terminating_regulation")
@@ -52,3 +57,58 @@ def handle_changed_commodity_code(sender: Type, **kwargs):
             instance.copy(instance.transaction.workbasket.new_transaction())
             instance.goods_nomenclature = previous.goods_nomenclature
             instance.update_type = UpdateType.DELETE
+
+
+@receiver(post_save, sender=models.Measure, dispatch_uid="refresh_measure_validity")
+def refresh_measure_effective_validity(sender: Type, **kwargs):
+    """Recompute the stored effective validity of a measure whenever it is
+    saved, so that every measure version has one."""
+    instance: models.Measure = kwargs["instance"]
+    models.Measure.objects.filter(pk=instance.pk).refresh_effective_validity()
+
+
+@receiver(
+    post_save,
+    sender=Regulation,
+    dispatch_uid="refresh_regulation_measures_validity",
+)
+def refresh_regulation_measures_effective_validity(sender: Type, **kwargs):
+    """
+    Recompute the stored effective validity of every measure whose end date may
+    be inherited from a regulation whenever that regulation is saved.
+
+    This is any measure generated by the regulation itself, by a base regulation
+    that it modifies or by a modification regulation that modifies it.
+    """
+    instance: Regulation = kwargs["instance"]
+    affected = models.Measure.objects.filter(
+        Q(generating_regulation=instance)
+        | Q(generating_regulation__amendments__enacting_regulation=instance)
+        | Q(generating_regulation__amends=instance),
+    )
+    models.Measure.objects.filter(
+        pk__in=affected.values("pk"),
+    ).refresh_effective_validity()
+
+
+@receiver(
+    post_save,
+    sender=Amendment,
+    dispatch_uid="refresh_amendment_measures_validity",
+)
+@receiver(
+    post_delete,
+    sender=Amendment,
+    dispatch_uid="refresh_deleted_amendment_measures_validity",
+)
+def refresh_amendment_measures_effective_validity(sender: Type, **kwargs):
+    """Recompute the stored effective validity of measures generated by either
+    side of an amendment whenever it is saved or deleted, as this changes which
+    end dates they inherit."""
+    instance: Amendment = kwargs["instance"]
+    models.Measure.objects.filter(
+        generating_regulation_id__in=[
+            instance.enacting_regulation_id,
+            instance.target_regulation_id,
+        ],
+    ).refresh_effective_validity()
@@ -63,7 +63,7 @@ class MeasureSnapshot:
             self.get_branch_measures(commodity)
             .with_effective_valid_between()
             .excluding_versions_of(measure.version_group)
-            .filter(db_effective_valid_between__overlap=valid_between)
+            .filter(effective_validity__valid_between__overlap=valid_between)
         )
 
     @classmethod
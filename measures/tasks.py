@@ -58,7 +58,10 @@ def bulk_edit_measures(measures_bulk_editor_pk: int) -> None:
     try:
         measures = measures_bulk_editor.edit_measures()
     except Exception as e:
+        # The edit has been rolled back, so none of the measures that were
+        # reported as edited so far remain edited.
         measures_bulk_editor.processing_failed()
+        measures_bulk_editor.successfully_processed_count = 0
         measures_bulk_editor.save()
         logger.error(
             f"MeasuresBulkCreator({measures_bulk_editor.pk}) task failed "
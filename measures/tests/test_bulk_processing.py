@@ -4,12 +4,20 @@ from unittest.mock import patch
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.transaction import atomic
+from django.test.utils import CaptureQueriesContext
 
 from common.models.utils import override_current_transaction
 from common.tests import factories
 from common.util import TaricDateRange
 from common.validators import ApplicabilityCode
+from common.validators import UpdateType
 from measures import forms
+from measures.editors import MeasuresBulkEditEngine
+from measures.models import Measure
+from measures.models import MeasureComponent
+from measures.models import MeasureExcludedGeographicalArea
 from measures.models import MeasuresBulkCreator
 from measures.models import MeasuresBulkEditor
 from measures.models import ProcessingState
@@ -425,3 +433,191 @@ def test_bulk_editor_log_form_errors_displays_detailed_error(
 
     mock_bulk_editor._log_form_errors(form_class=form_class, form_or_formset=form)
     assert expected_error in caplog.text
+
+
+def test_bulk_edit_engine_edits_measures_and_dependents(user_empty_workbasket):
+    """Test that MeasuresBulkEditEngine creates new versions of the selected
+    measures in a single transaction, moves their dependent rows onto the new
+    versions and reports progress after each batch."""
+    measures = factories.MeasureFactory.create_batch(2)
+    measure = measures[0]
+    component = factories.MeasureComponentFactory.create(component_measure=measure)
+    condition = factories.MeasureConditionFactory.create(dependent_measure=measure)
+    exclusion = factories.MeasureExcludedGeographicalAreaFactory.create(
+        modified_measure=measure,
+    )
+    association = factories.FootnoteAssociationMeasureFactory.create(
+        footnoted_measure=measure,
+    )
+    end_date = datetime.date(2030, 1, 1)
+    progress = []
+
+    editor = MeasuresBulkEditEngine(
+        user_empty_workbasket,
+        Measure.objects.filter(pk__in=[m.pk for m in measures]),
+        {"end_date": end_date},
+        progress_callback=progress.append,
+    )
+    editor.batch_size = 1
+    edited_measures = editor.edit_measures()
+
+    assert progress == [1, 2]
+    assert user_empty_workbasket.transactions.count() == 1
+    transaction = user_empty_workbasket.transactions.get()
+    assert {m.version_group for m in edited_measures} == {
+        m.version_group for m in measures
+    }
+
+    new_measure = Measure.objects.get(
+        version_group=measure.version_group,
+        transaction=transaction,
+    )
+    assert new_measure.update_type == UpdateType.UPDATE
+    assert new_measure.valid_between.upper == end_date
+    assert new_measure.terminating_regulation == new_measure.generating_regulation
+
+    for dependent, field in [
+        (component, "component_measure"),
+        (condition, "dependent_measure"),
+        (exclusion, "modified_measure"),
+        (association, "footnoted_measure"),
+    ]:
+        new_dependent = type(dependent).objects.get(
+            version_group=dependent.version_group,
+            transaction=transaction,
+        )
+        assert new_dependent.update_type == UpdateType.UPDATE
+        assert getattr(new_dependent, field) == new_measure
+
+
+def test_bulk_edit_engine_diffs_new_duties(
+    user_empty_workbasket,
+    duty_sentence_parser,
+    percent_or_amount,
+    plus_percent_or_amount,
+):
+    """Test that MeasuresBulkEditEngine updates, creates and deletes measure
+    components to match newly entered duties."""
+    updated = factories.MeasureComponentFactory.create(
+        duty_amount=9.000,
+        duty_expression=percent_or_amount,
+    )
+    measure = updated.component_measure
+    factories.MeasureComponentFactory.create(
+        component_measure=measure,
+        duty_amount=1.000,
+        duty_expression=plus_percent_or_amount[1],
+    )
+
+    MeasuresBulkEditEngine(
+        user_empty_workbasket,
+        [measure],
+        {"duties": "8.000% + 2.000%"},
+    ).edit_measures()
+
+    transaction = user_empty_workbasket.transactions.get()
+    components = MeasureComponent.objects.filter(transaction=transaction)
+
+    assert {(c.duty_expression, c.update_type) for c in components} == {
+        (percent_or_amount, UpdateType.UPDATE),
+        (plus_percent_or_amount[0], UpdateType.CREATE),
+        (plus_percent_or_amount[1], UpdateType.DELETE),
+    }
+    assert components.get(version_group=updated.version_group).duty_amount == 8.000
+    with override_current_transaction(transaction):
+        assert set(
+            MeasureComponent.objects.current()
+            .filter(component_measure__version_group=measure.version_group)
+            .values_list("duty_amount", flat=True),
+        ) == {8.000, 2.000}
+
+
+def test_bulk_edit_engine_replaces_edited_exclusions(user_empty_workbasket):
+    """Test that MeasuresBulkEditEngine adds and removes excluded geographical
+    areas when the exclusions have been edited."""
+    removed = factories.MeasureExcludedGeographicalAreaFactory.create()
+    measure = removed.modified_measure
+    added_area = factories.GeographicalAreaFactory.create(area_code=0)
+
+    MeasuresBulkEditEngine(
+        user_empty_workbasket,
+        [measure],
+        {
+            "fields_to_edit": ["geographical_area_exclusions"],
+            "formset-geographical_area_exclusions": [
+                {"excluded_area": added_area, "DELETE": False},
+            ],
+        },
+    ).edit_measures()
+
+    transaction = user_empty_workbasket.transactions.get()
+    exclusions = MeasureExcludedGeographicalArea.objects.filter(
+        transaction=transaction,
+    )
+
+    assert {(e.excluded_geographical_area, e.update_type) for e in exclusions} == {
+        (removed.excluded_geographical_area, UpdateType.DELETE),
+        (added_area, UpdateType.CREATE),
+    }
+
+
+def test_bulk_edit_engine_queries_do_not_grow_with_batch(user_empty_workbasket):
+    """Test that MeasuresBulkEditEngine edits a batch of measures using the same
+    number of queries however many measures there are."""
+
+    def count_edit_queries(measures):
+        editor = MeasuresBulkEditEngine(
+            user_empty_workbasket,
+            Measure.objects.filter(pk__in=[m.pk for m in measures]),
+            {"end_date": datetime.date(2030, 1, 1)},
+        )
+        with CaptureQueriesContext(connection) as queries:
+            editor.edit_measures()
+        return len(queries)
+
+    # Warm up the caches that the first edit fills.
+    count_edit_queries(factories.MeasureFactory.create_batch(1))
+    one = count_edit_queries(factories.MeasureFactory.create_batch(1))
+    three = count_edit_queries(factories.MeasureFactory.create_batch(3))
+
+    assert three == one
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "progress"])
+def test_bulk_editor_progress_is_recorded_outside_transaction():
+    """Test that MeasuresBulkEditor records the progress of an edit even though
+    the transaction the measures are edited in has not been committed."""
+    editor = MeasuresBulkEditorFactory.create()
+
+    with pytest.raises(ValidationError):
+        with atomic():
+            editor._report_progress(3)
+            raise ValidationError("Roll back the edit")
+
+    editor = MeasuresBulkEditor.objects.get(pk=editor.pk)
+    assert editor.successfully_processed_count == 3
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "progress"])
+def test_bulk_edit_measures_resets_progress_on_failure():
+    """Test that the progress reported by a bulk edit that then fails is reset,
+    as the edit is rolled back."""
+    from measures.tasks import bulk_edit_measures
+
+    editor = MeasuresBulkEditorFactory.create()
+
+    def edit_some_measures_then_fail(self):
+        self._report_progress(3)
+        raise ValidationError("Edit failed")
+
+    with patch.object(
+        MeasuresBulkEditor,
+        "edit_measures",
+        edit_some_measures_then_fail,
+    ):
+        with pytest.raises(ValidationError):
+            bulk_edit_measures(editor.pk)
+
+    editor = MeasuresBulkEditor.objects.get(pk=editor.pk)
+    assert editor.processing_state == ProcessingState.FAILED_PROCESSING
+    assert editor.successfully_processed_count == 0
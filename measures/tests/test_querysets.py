@@ -12,6 +12,7 @@ import pytest
 from common.tests import factories
 from measures.models import Measure
 from measures.models import MeasureCondition
+from measures.models import MeasureEffectiveValidity
 from measures.validators import validate_duties
 
 pytestmark = pytest.mark.django_db
@@ -150,6 +151,99 @@ def test_duty_sentence_with_history(
     assert test_instance.duty_sentence == expected
 
 
+@pytest.mark.parametrize(
+    "component_factory,model_factory,field_name",
+    (
+        (
+            factories.MeasureComponentFactory,
+            factories.MeasureFactory,
+            "component_measure",
+        ),
+        (
+            factories.MeasureConditionComponentFactory,
+            factories.MeasureConditionFactory,
+            "condition",
+        ),
+    ),
+    ids=(
+        factories.MeasureFactory._meta.model.__name__,
+        factories.MeasureConditionFactory._meta.model.__name__,
+    ),
+)
+def test_with_duty_sentence_matches_duty_sentence(
+    component_factory: factory.django.DjangoModelFactory,
+    model_factory: factory.django.DjangoModelFactory,
+    field_name: str,
+    reversible_duty_sentence_data: Tuple[str, List[Dict]],
+    django_assert_num_queries,
+):
+    expected, component_data = reversible_duty_sentence_data
+    model = model_factory()
+    create_duty_components(component_factory, component_data, field_name, model)
+    other_model = model_factory()
+
+    annotated = model_factory._meta.model.objects.with_duty_sentence()
+
+    assert annotated.get(pk=model.pk).db_duty_sentence == expected
+    assert annotated.get(pk=other_model.pk).db_duty_sentence == ""
+
+    instances = list(annotated.filter(pk__in=[model.pk, other_model.pk]))
+    with django_assert_num_queries(0):
+        assert {instance.duty_sentence for instance in instances} == {expected, ""}
+
+
+@pytest.mark.parametrize(
+    "component_factory,model_factory,field_name",
+    (
+        (
+            factories.MeasureComponentFactory,
+            factories.MeasureFactory,
+            "component_measure",
+        ),
+        (
+            factories.MeasureConditionComponentFactory,
+            factories.MeasureConditionFactory,
+            "condition",
+        ),
+    ),
+    ids=(
+        factories.MeasureFactory._meta.model.__name__,
+        factories.MeasureConditionFactory._meta.model.__name__,
+    ),
+)
+def test_with_duty_sentence_with_history(
+    component_factory: factory.django.DjangoModelFactory,
+    model_factory: factory.django.DjangoModelFactory,
+    field_name: str,
+    duty_sentence_x_2_data: List[Tuple[str, List[Dict]]],
+):
+    """Checks that each version of a model is annotated with the same duty
+    sentence as its duty_sentence property, going back in transaction time."""
+    model_1 = model_factory()
+    create_duty_components(
+        component_factory,
+        duty_sentence_x_2_data[0][1],
+        field_name,
+        model_1,
+    )
+    model_2 = model_1.new_version(model_1.transaction.workbasket)
+    create_duty_components(
+        component_factory,
+        duty_sentence_x_2_data[1][1],
+        field_name,
+        model_2,
+    )
+    model_3 = model_2.new_version(model_2.transaction.workbasket)
+
+    annotated = model_factory._meta.model.objects.with_duty_sentence()
+    for version, (expected, _) in zip(
+        (model_1, model_2, model_3),
+        (*duty_sentence_x_2_data, duty_sentence_x_2_data[1]),
+    ):
+        assert version.duty_sentence == expected
+        assert annotated.get(pk=version.pk).db_duty_sentence == expected
+
+
 def test_measures_not_in_effect(date_ranges):
     """Tests that only measures whose validity_field_name
     (`db_effective_valid_between` in this case) does not contain the selected
@@ -196,6 +290,63 @@ def test_get_measures_not_yet_in_effect(date_ranges):
     assert measure_no_longer_in_effect not in qs
 
 
+def test_stored_effective_valid_between_matches_computed(date_ranges):
+    """Tests that the stored effective validity read by
+    `with_effective_valid_between` matches the validity computed from the
+    regulation chain."""
+    factories.MeasureFactory.create(valid_between=date_ranges.no_end)
+    factories.MeasureFactory.create(valid_between=date_ranges.normal)
+    factories.MeasureFactory.create(
+        generating_regulation__effective_end_date=date_ranges.normal.upper,
+        valid_between=date_ranges.no_end,
+    )
+
+    stored = Measure.objects.with_effective_valid_between().values_list(
+        "pk",
+        "db_effective_valid_between",
+    )
+    computed = Measure.objects.with_computed_effective_valid_between().values_list(
+        "pk",
+        "db_effective_valid_between",
+    )
+    assert set(stored) == set(computed)
+
+
+def test_effective_valid_between_reads_stored_validity(date_ranges):
+    """Tests that the effective validity of a measure is read from its stored
+    row rather than being computed from the regulation chain."""
+    measure = factories.MeasureFactory.create(
+        generating_regulation__valid_between=date_ranges.no_end,
+        valid_between=date_ranges.no_end,
+    )
+    MeasureEffectiveValidity.objects.filter(measure=measure).update(
+        end_date=date_ranges.normal.upper,
+        valid_between=date_ranges.normal,
+    )
+
+    annotated = Measure.objects.with_effective_valid_between().get(pk=measure.pk)
+
+    assert annotated.db_effective_end_date == date_ranges.normal.upper
+    assert annotated.db_effective_valid_between == date_ranges.normal
+    assert not Measure.objects.filter(
+        effective_validity__valid_between__contains=date_ranges.later.lower,
+    ).exists()
+
+
+def test_refresh_effective_validity_stores_invalid_range_as_null(date_ranges):
+    """Tests that a measure whose effective end date falls before its start
+    date is stored without a range rather than raising an error."""
+    measure = factories.MeasureFactory.create(
+        generating_regulation__valid_between=date_ranges.earlier,
+        valid_between=date_ranges.no_end,
+    )
+
+    assert Measure.objects.filter(pk=measure.pk).refresh_effective_validity() == 1
+    validity = MeasureEffectiveValidity.objects.get(measure=measure)
+    assert validity.end_date == date_ranges.earlier.upper
+    assert validity.valid_between is None
+
+
 def test_get_measures_not_current():
     """Tests that only measures which are not the latest approved version are
     returned."""
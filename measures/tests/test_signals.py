@@ -1,6 +1,7 @@
 import pytest
 
 from common.tests import factories
+from measures.models import MeasureEffectiveValidity
 
 pytestmark = pytest.mark.django_db
 
@@ -34,3 +35,54 @@ def test_terminating_regulation_update(
     )
     assert (new_version.terminating_regulation is not None) == expect_any
     assert (new_version.terminating_regulation == regulation) == expect_same
+
+
+def get_effective_validity(measure):
+    return MeasureEffectiveValidity.objects.get(measure=measure)
+
+
+def test_measure_effective_validity_refreshed_on_save(date_ranges):
+    """Tests that the stored effective validity of a measure is refreshed when
+    the measure is saved."""
+    measure = factories.MeasureFactory.create(valid_between=date_ranges.no_end)
+    assert get_effective_validity(measure).end_date is None
+
+    measure.valid_between = date_ranges.normal
+    measure.save(force_write=True)
+
+    assert get_effective_validity(measure).end_date == date_ranges.normal.upper
+    assert get_effective_validity(measure).valid_between == date_ranges.normal
+
+
+def test_measure_effective_validity_refreshed_on_regulation_save(date_ranges):
+    """Tests that the stored effective validity of a measure is refreshed when a
+    regulation that it inherits its end date from is saved."""
+    measure = factories.MeasureFactory.create(
+        generating_regulation__valid_between=date_ranges.no_end,
+        valid_between=date_ranges.no_end,
+    )
+    assert get_effective_validity(measure).end_date is None
+
+    regulation = measure.generating_regulation
+    regulation.effective_end_date = date_ranges.normal.upper
+    regulation.save(force_write=True)
+
+    assert get_effective_validity(measure).end_date == date_ranges.normal.upper
+
+
+def test_measure_effective_validity_refreshed_on_amendment_save(date_ranges):
+    """Tests that the stored effective validity of a measure is refreshed when
+    its generating regulation is amended by an end-dated modification
+    regulation."""
+    measure = factories.MeasureFactory.create(
+        generating_regulation__valid_between=date_ranges.no_end,
+        valid_between=date_ranges.no_end,
+    )
+    assert get_effective_validity(measure).end_date is None
+
+    factories.AmendmentFactory.create(
+        target_regulation=measure.generating_regulation,
+        enacting_regulation__valid_between=date_ranges.normal,
+    )
+
+    assert get_effective_validity(measure).end_date == date_ranges.normal.upper
@@ -28,7 +28,7 @@ class MeasureMultipleDelete(MeasureSelectionQuerysetMixin, TemplateView, ListVie
     template_name = "measures/delete-multiple-measures.jinja"
 
     def get_context_data(self, **kwargs):
-        store_objects = self.get_queryset()
+        store_objects = self.get_queryset().with_duty_sentence()
         self.object_list = store_objects
         context = super().get_context_data(**kwargs)
 
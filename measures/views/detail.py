@@ -15,6 +15,7 @@ class MeasureDetail(MeasureMixin, TrackedModelDetailView):
     def get_context_data(self, **kwargs: Any):
         conditions = (
             self.object.conditions.current()
+            .with_duty_sentence()
             .prefetch_related(
                 "condition_code",
                 "required_certificate",
@@ -10,14 +10,13 @@ from rest_framework.reverse import reverse
 from additional_codes.models import AdditionalCode
 from certificates.models import Certificate
 from commodities.models.orm import GoodsNomenclature
-from common.pagination import build_pagination_list
+from common.pagination import KeysetPaginator
 from common.views import SortingMixin
 from common.views import TamatoListView
 from footnotes.models import Footnote
 from geo_areas.models import GeographicalArea
 from measures import models
 from measures.filters import MeasureFilter
-from measures.pagination import MeasurePaginator
 from regulations.models import Regulation
 from workbaskets.forms import SelectableObjectsForm
 
@@ -56,7 +55,7 @@ class MeasureList(
         "measure_type": "measure_type__sid",
         "geo_area": "geographical_area__area_id",
         "start_date": "valid_between",
-        "end_date": "db_effective_end_date",
+        "end_date": "effective_validity__end_date",
     }
 
     def dispatch(self, *args, **kwargs):
@@ -64,35 +63,18 @@ class MeasureList(
             return HttpResponseRedirect(reverse("measure-ui-search"))
         return super().dispatch(*args, **kwargs)
 
-    def get_queryset(self):
-        queryset = super().get_queryset()
-
-        ordering = self.get_ordering()
-
-        if ordering:
-            if ordering in "-db_effective_end_date":
-                queryset = queryset.with_effective_valid_between()
-
-            ordering = (ordering,)
-            queryset = queryset.order_by(*ordering)
-
-        return queryset
-
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        page = self.paginator.get_page(self.request.GET.get("page", 1))
-        kwargs["objects"] = page.object_list
+        kwargs["objects"] = self.page.object_list
         return kwargs
 
     def cleaned_query_params(self):
-        # Remove the sort_by and ordered params in order to stop them being duplicated in the base url
-        if "sort_by" and "ordered" in self.filterset.data:
-            cleaned_filterset = self.filterset.data.copy()
-            cleaned_filterset.pop("sort_by")
-            cleaned_filterset.pop("ordered")
-            return cleaned_filterset
-        else:
-            return self.filterset.data
+        # Remove the sort_by and ordered params in order to stop them being duplicated in the base url.
+        # The cursor is also removed, so that changing the sort order starts from the first page.
+        cleaned_filterset = self.filterset.data.copy()
+        for param in ("sort_by", "ordered", "cursor"):
+            cleaned_filterset.pop(param, None)
+        return cleaned_filterset
 
     def selected_filter_formatter(self) -> List[List[str]]:
         """
@@ -205,7 +187,7 @@ class MeasureList(
     def paginator(self):
         filterset_class = self.get_filterset_class()
         self.filterset = self.get_filterset(filterset_class)
-        return MeasurePaginator(
+        return KeysetPaginator(
             self.filterset.qs.select_related(
                 "additional_code",
                 "generating_regulation",
@@ -213,14 +195,28 @@ class MeasureList(
                 "goods_nomenclature",
                 "measure_type",
                 "order_number",
-            ),
+            ).with_duty_sentence(),
             per_page=40,
+            ordering=self.get_ordering(),
         )
 
+    @cached_property
+    def page(self):
+        return self.paginator.get_page(self.request.GET.get("cursor"))
+
     def get_context_data(self, **kwargs):
         # References to page or pagination in the template were heavily increasing load time. By setting everything we need in the context,
         # we can reduce load time
-        page = self.paginator.get_page(self.request.GET.get("page", 1))
+        page = self.page
+
+        # Only the planner's estimate of the number of results is available
+        # unless every result fits on this page.
+        results_count_estimated = page.has_other_pages()
+        if results_count_estimated:
+            results_count = max(self.paginator.estimated_count, len(page))
+        else:
+            results_count = len(page)
+
         context = {}
         context.update(
             {
@@ -228,26 +224,18 @@ class MeasureList(
                 "form": self.get_form(),
                 "view": self,
                 "is_paginated": True,
-                "results_count": self.paginator.count,
-                "results_limit_breached": self.paginator.limit_breached,
-                "page_count": self.paginator.num_pages,
+                "results_count": results_count,
+                "results_count_estimated": results_count_estimated,
                 "has_other_pages": page.has_other_pages(),
                 "has_previous_page": page.has_previous(),
                 "has_next_page": page.has_next(),
-                "page_number": page.number,
-                "list_items_count": self.paginator.per_page,
-                "page_links": build_pagination_list(
-                    page.number,
-                    page.paginator.num_pages,
-                ),
+                "previous_cursor": page.previous_cursor,
+                "next_cursor": page.next_cursor,
+                "list_items_count": len(page),
                 "selected_filter_lists": self.selected_filter_formatter(),
                 "workbasket": self.workbasket,
             },
         )
-        if context["has_previous_page"]:
-            context["prev_page_number"] = page.previous_page_number()
-        if context["has_next_page"]:
-            context["next_page_number"] = page.next_page_number()
 
         context["measure_selections"] = models.Measure.objects.filter(
             pk__in=self.measure_selections,
@@ -114,7 +114,7 @@ class MeasureEditWizard(
             context["form"].is_bound = False
         context["no_form_tags"] = FormHelper()
         context["no_form_tags"].form_tag = False
-        context["measures"] = self.get_queryset()
+        context["measures"] = self.get_queryset().with_duty_sentence()
         return context
 
     def get_form_kwargs(self, step):
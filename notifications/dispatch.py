@@ -0,0 +1,140 @@
+import logging
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from django.db.models import F
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.db.transaction import atomic
+from django.utils import timezone
+
+from notifications.models import Notification
+from notifications.models import NotificationLog
+from notifications.transports import NotificationTransport
+from notifications.transports import get_transport
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDispatcher:
+    """
+    Sends notification emails in batches.
+
+    Recipients are looked up once per type of notification in a batch rather
+    than once per notification, and the resulting `NotificationLog` rows are
+    written with a single bulk insert.
+    """
+
+    batch_size = 100
+    """The maximum number of pending notifications dispatched together."""
+
+    def __init__(self, transport: Optional[NotificationTransport] = None) -> None:
+        self.transport = transport or get_transport()
+
+    def dispatch(self, notifications: Iterable[Notification]) -> None:
+        """Send the emails for each of `notifications`, and record them as
+        sent."""
+        recipients_by_type = {}
+        logs = []
+        dispatched_pks = []
+
+        for notification in notifications:
+            notification = notification.return_subclass_instance()
+            dispatched_pks.append(notification.pk)
+
+            notification_type = notification.notification_type
+            if notification_type not in recipients_by_type:
+                recipients_by_type[notification_type] = [
+                    user.email for user in notification.notified_users()
+                ]
+
+            email_addresses = recipients_by_type[notification_type]
+            if not email_addresses:
+                logger.error(
+                    f"No notified users for {notification.__class__.__name__} "
+                    f"with pk={notification.pk}",
+                )
+                continue
+
+            try:
+                result = self.transport.send(
+                    notification.notify_template_id(),
+                    notification.get_personalisation(),
+                    email_addresses,
+                )
+            except Exception:
+                logger.exception(
+                    f"Failed to send {notification.__class__.__name__} "
+                    f"with pk={notification.pk}",
+                )
+                logs.append(
+                    NotificationLog(
+                        recipients="".join(f"{email} \n" for email in email_addresses),
+                        notification=notification,
+                        success=False,
+                    ),
+                )
+                continue
+
+            logs.append(
+                NotificationLog(
+                    response_ids=result["response_ids"],
+                    recipients=result["recipients"],
+                    notification=notification,
+                ),
+            )
+
+            # if any emails failed create a log for unsuccessful emails
+            if result["failed_recipients"]:
+                logs.append(
+                    NotificationLog(
+                        recipients=result["failed_recipients"],
+                        notification=notification,
+                        success=False,
+                    ),
+                )
+
+        now = timezone.now()
+        NotificationLog.objects.bulk_create(logs)
+        Notification.objects.filter(pk__in=dispatched_pks).update(
+            claimed_at=Coalesce(F("claimed_at"), Value(now)),
+            sent_at=now,
+        )
+
+    def claim_pending(self) -> List[Notification]:
+        """
+        Claim up to `batch_size` pending notifications, returning them.
+
+        The claim is committed before any emails are sent, so that concurrent
+        dispatchers skip the claimed notifications and a failure while
+        recording them as sent cannot cause them to be sent again.
+        """
+        with atomic():
+            pending = list(
+                Notification.objects.pending()
+                .select_for_update(skip_locked=True)
+                .order_by("pk")[: self.batch_size],
+            )
+            Notification.objects.filter(
+                pk__in=[notification.pk for notification in pending],
+            ).update(claimed_at=timezone.now())
+
+        return pending
+
+    def dispatch_pending(self) -> int:
+        """
+        Dispatch notifications that have not yet been sent, in batches, until
+        none remain, returning the number dispatched.
+
+        Each batch is claimed before it is dispatched, and its emails are sent
+        outside of any transaction.
+        """
+        count = 0
+        while True:
+            pending = self.claim_pending()
+            if not pending:
+                return count
+
+            self.dispatch(pending)
+            count += len(pending)
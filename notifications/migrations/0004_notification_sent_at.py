@@ -0,0 +1,28 @@
+from django.db import migrations
+from django.db import models
+from django.utils import timezone
+
+
+def mark_existing_notifications_sent(apps, schema_editor):
+    """Notifications that existed before dispatching was batched have already
+    been sent (or attempted), so must not be picked up as pending."""
+    Notification = apps.get_model("notifications", "Notification")
+    Notification.objects.update(sent_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications", "0003_auto_20230911_0924"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="sent_at",
+            field=models.DateTimeField(default=None, null=True),
+        ),
+        migrations.RunPython(
+            mark_existing_notifications_sent,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations
+from django.db import models
+
+
+def mark_sent_notifications_claimed(apps, schema_editor):
+    """Notifications that have already been sent must not be picked up as
+    pending."""
+    Notification = apps.get_model("notifications", "Notification")
+    Notification.objects.exclude(sent_at=None).update(claimed_at=models.F("sent_at"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications", "0004_notification_sent_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="claimed_at",
+            field=models.DateTimeField(default=None, null=True),
+        ),
+        migrations.RunPython(
+            mark_sent_notifications_claimed,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -7,7 +7,6 @@ from django.urls import reverse
 
 from common.models.mixins import TimestampedMixin
 from notifications.notify import prepare_link_to_file
-from notifications.notify import send_emails
 from notifications.tasks import send_emails_task
 
 logger = logging.getLogger(__name__)
@@ -76,6 +75,13 @@ class NotificationTypeChoices(models.TextChoices):
     )
 
 
+class NotificationQuerySet(models.QuerySet):
+    def pending(self) -> "NotificationQuerySet":
+        """Returns the notifications that have not yet been claimed for
+        sending."""
+        return self.filter(claimed_at__isnull=True)
+
+
 class Notification(models.Model):
     """
     Base class to manage sending notifications.
@@ -98,6 +104,22 @@ class Notification(models.Model):
         choices=NotificationTypeChoices.choices,
     )
 
+    sent_at = models.DateTimeField(
+        default=None,
+        null=True,
+    )
+    """When the notification's emails were sent, or None while they are
+    pending."""
+
+    claimed_at = models.DateTimeField(
+        default=None,
+        null=True,
+    )
+    """When the notification was claimed for sending by a dispatcher, or None
+    while it is pending."""
+
+    objects = NotificationQuerySet.as_manager()
+
     def return_subclass_instance(self) -> "Notification":
         subclasses = {
             NotificationTypeChoices.GOODS_REPORT: GoodsSuccessfulImportNotification,
@@ -147,42 +169,25 @@ class Notification(models.Model):
         send_emails_task(self.pk)
 
     def schedule_send_emails(self, countdown=1):
-        """Schedule a call to send a notification email, run as an asynchronous
-        background task."""
-        send_emails_task.apply_async(args=[self.pk], countdown=countdown)
+        """
+        Schedule a call to send pending notification emails, run as an
+        asynchronous background task.
 
-    def send_notification_emails(self):
-        """Send the notification emails to users via GOV.UK Notify."""
-
-        notified_users = self.notified_users()
-        if not notified_users:
-            logger.error(
-                f"No notified users for {self.__class__.__name__} "
-                f"with pk={self.pk}",
-            )
+        If other notifications are already waiting to be sent then a task has
+        already been scheduled, and this notification is sent in the same batch
+        rather than scheduling another task.
+        """
+        if Notification.objects.pending().exclude(pk=self.pk).exists():
             return
 
-        personalisation = self.get_personalisation()
-
-        result = send_emails(
-            self.notify_template_id(),
-            personalisation,
-            [user.email for user in notified_users],
-        )
+        send_emails_task.apply_async(args=[self.pk], countdown=countdown)
 
-        NotificationLog.objects.create(
-            response_ids=result["response_ids"],
-            recipients=result["recipients"],
-            notification=self,
-        )
+    def send_notification_emails(self):
+        """Send the notification emails to users via the configured
+        transport."""
+        from notifications.dispatch import NotificationDispatcher
 
-        # if any emails failed create a log for unsuccessful emails
-        if result["failed_recipients"]:
-            NotificationLog.objects.create(
-                recipients=result["failed_recipients"],
-                notification=self,
-                success=False,
-            )
+        NotificationDispatcher().dispatch([self])
 
 
 class EnvelopeReadyForProcessingNotification(Notification):
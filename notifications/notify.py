@@ -34,8 +34,7 @@ def prepare_link_to_file(
 
     with NamedTemporaryFile(suffix=".xlsx") as tmp:
         reporter = GoodsReporter(file)
-        goods_report = reporter.create_report()
-        goods_report.xlsx_file(tmp)
+        reporter.write_xlsx_file(tmp)
         return prepare_upload(
             tmp,
             is_csv,
@@ -1,18 +1,22 @@
 import logging
+from typing import Optional
 
 from celery import shared_task
-from django.db.transaction import atomic
 
 logger = logging.getLogger(__name__)
 
 
 @shared_task
-@atomic
-def send_emails_task(notification_pk: int):
-    """Task for emailing all users signed up to receive packaging updates and
-    creating a log to record which users received which email template."""
-    from notifications.models import Notification
+def send_emails_task(notification_pk: Optional[int] = None):
+    """
+    Task for emailing all users signed up to receive packaging updates and
+    creating a log to record which users received which email template.
 
-    notification = Notification.objects.get(pk=notification_pk)
-    sub_notification = notification.return_subclass_instance()
-    sub_notification.send_notification_emails()
+    All pending notifications are sent in batches, including the one identified
+    by `notification_pk` (which is kept for compatibility with already queued
+    tasks), so a burst of notifications is handled by a single task.
+    """
+    from notifications.dispatch import NotificationDispatcher
+
+    count = NotificationDispatcher().dispatch_pending()
+    logger.info(f"Dispatched {count} pending notifications.")
@@ -0,0 +1,134 @@
+from unittest.mock import patch
+
+import pytest
+
+from common.tests import factories
+from notifications.dispatch import NotificationDispatcher
+from notifications.models import Notification
+from notifications.models import NotificationLog
+from notifications.transports import InMemoryTransport
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture()
+def transport():
+    transport = InMemoryTransport()
+    transport.outbox = []
+    return transport
+
+
+@pytest.fixture()
+def goods_report_notifications(goods_report_notification):
+    notification, present_email, _ = goods_report_notification
+    notifications = [notification] + [
+        factories.GoodsSuccessfulImportNotificationFactory(
+            notified_object_pk=notification.notified_object_pk,
+        )
+        for _ in range(2)
+    ]
+    return notifications, present_email
+
+
+def test_dispatch_pending_sends_each_notification_once(
+    goods_report_notifications,
+    transport,
+):
+    notifications, present_email = goods_report_notifications
+
+    with patch(
+        "notifications.models.prepare_link_to_file",
+        return_value={"file": "VGVzdA=="},
+    ):
+        dispatcher = NotificationDispatcher(transport)
+        assert dispatcher.dispatch_pending() == len(notifications)
+        assert dispatcher.dispatch_pending() == 0
+
+    assert [email["email_address"] for email in transport.outbox] == [
+        present_email,
+    ] * len(notifications)
+    assert not Notification.objects.pending().exists()
+    assert NotificationLog.objects.filter(success=True).count() == len(
+        notifications,
+    )
+
+
+def test_dispatch_pending_in_batches(goods_report_notifications, transport):
+    notifications, _ = goods_report_notifications
+
+    dispatcher = NotificationDispatcher(transport)
+    dispatcher.batch_size = 2
+    with (
+        patch(
+            "notifications.models.prepare_link_to_file",
+            return_value={"file": "VGVzdA=="},
+        ),
+        patch.object(
+            dispatcher,
+            "dispatch",
+            wraps=dispatcher.dispatch,
+        ) as mocked_dispatch,
+    ):
+        dispatcher.dispatch_pending()
+
+    assert [len(call.args[0]) for call in mocked_dispatch.call_args_list] == [2, 1]
+
+
+def test_dispatch_pending_does_not_resend_after_failing_to_record(
+    goods_report_notification,
+    transport,
+):
+    notification, present_email, _ = goods_report_notification
+
+    dispatcher = NotificationDispatcher(transport)
+    with (
+        patch(
+            "notifications.models.prepare_link_to_file",
+            return_value={"file": "VGVzdA=="},
+        ),
+        patch.object(
+            NotificationLog.objects,
+            "bulk_create",
+            side_effect=Exception("Database is down"),
+        ),
+        pytest.raises(Exception, match="Database is down"),
+    ):
+        dispatcher.dispatch_pending()
+
+    assert dispatcher.dispatch_pending() == 0
+    assert [email["email_address"] for email in transport.outbox] == [present_email]
+    assert not Notification.objects.pending().exists()
+
+
+def test_dispatch_logs_transport_failures(goods_report_notification, transport):
+    notification, present_email, _ = goods_report_notification
+
+    with (
+        patch(
+            "notifications.models.prepare_link_to_file",
+            return_value={"file": "VGVzdA=="},
+        ),
+        patch.object(transport, "send", side_effect=Exception("Notify is down")),
+    ):
+        NotificationDispatcher(transport).dispatch([notification])
+
+    log = NotificationLog.objects.get(notification=notification)
+    assert not log.success
+    assert present_email in log.recipients
+    assert not Notification.objects.pending().exists()
+
+
+def test_schedule_send_emails_only_once_while_pending(goods_report_notification):
+    notification, _, _ = goods_report_notification
+
+    with patch(
+        "notifications.tasks.send_emails_task.apply_async",
+    ) as mocked_apply_async:
+        notification.schedule_send_emails()
+        mocked_apply_async.assert_called_once()
+
+        another_notification = factories.GoodsSuccessfulImportNotificationFactory(
+            notified_object_pk=notification.notified_object_pk,
+        )
+        another_notification.schedule_send_emails()
+        mocked_apply_async.assert_called_once()
@@ -204,7 +204,7 @@ def test_send_notification_emails(ready_for_packaging_notification):
     ) = ready_for_packaging_notification
 
     with patch(
-        "notifications.models.send_emails",
+        "notifications.transports.InMemoryTransport.send",
         return_value={
             "response_ids": " \n".join([str(factory.Faker("uuid"))]),
             "recipients": " \n".join([expected_present_email]),
@@ -223,7 +223,7 @@ def test_send_notification_emails(ready_for_packaging_notification):
     assert expected_present_email in log_success.recipients
 
     with patch(
-        "notifications.models.send_emails",
+        "notifications.transports.InMemoryTransport.send",
         return_value={
             "response_ids": "",
             "recipients": "",
@@ -0,0 +1,88 @@
+"""Transports that deliver notification emails."""
+
+import json
+from typing import Dict
+from typing import List
+from uuid import uuid4
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from notifications.notify import send_emails
+
+
+class NotificationTransport:
+    """
+    Base class for the ways that notification emails can be delivered.
+
+    `send` returns a dict of newline separated "response_ids", "recipients" and
+    "failed_recipients" – see `notifications.notify.send_emails`.
+    """
+
+    def send(
+        self,
+        template_id: str,
+        personalisation: dict,
+        email_addresses: List[str],
+    ) -> Dict[str, str]:
+        raise NotImplementedError
+
+
+class NotifyTransport(NotificationTransport):
+    """Delivers emails via GOV.UK Notify."""
+
+    def send(self, template_id, personalisation, email_addresses):
+        return send_emails(template_id, personalisation, email_addresses)
+
+
+class InMemoryTransport(NotificationTransport):
+    """Records emails in `InMemoryTransport.outbox` instead of delivering them,
+    for use in tests and local development."""
+
+    outbox: List[dict] = []
+
+    def record(self, email: dict) -> None:
+        self.outbox.append(email)
+
+    def send(self, template_id, personalisation, email_addresses):
+        response_ids = ""
+        recipients = ""
+        for email_address in email_addresses:
+            response_id = str(uuid4())
+            self.record(
+                {
+                    "template_id": template_id,
+                    "personalisation": personalisation,
+                    "email_address": email_address,
+                    "response_id": response_id,
+                },
+            )
+            response_ids += f"{response_id} \n"
+            recipients += f"{email_address} \n"
+
+        return {
+            "response_ids": response_ids,
+            "recipients": recipients,
+            "failed_recipients": "",
+        }
+
+
+class FileTransport(InMemoryTransport):
+    """Appends emails as JSON lines to the file named by the
+    NOTIFICATIONS_FILE_TRANSPORT_PATH setting instead of delivering them."""
+
+    def record(self, email: dict) -> None:
+        with open(settings.NOTIFICATIONS_FILE_TRANSPORT_PATH, "a") as file:
+            file.write(f"{json.dumps(email, default=str)}\n")
+
+
+def get_transport() -> NotificationTransport:
+    """Get the notification transport from the NOTIFICATIONS_TRANSPORT
+    setting."""
+    transport_class = import_string(settings.NOTIFICATIONS_TRANSPORT)
+    if not issubclass(transport_class, NotificationTransport):
+        raise ValueError(
+            "NOTIFICATIONS_TRANSPORT must inherit from NotificationTransport",
+        )
+
+    return transport_class()
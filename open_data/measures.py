@@ -4,9 +4,12 @@ from django.db import connection
 
 from common.models.transactions import Transaction
 from common.models.utils import override_current_transaction
+from measures.models import Measure
 from open_data.models import ReportMeasure
 from open_data.models import ReportMeasureCondition
 
+BATCH_SIZE = 2000
+
 # The operations in this module are the most expensive in time.
 # I tried to merge create_measure_components and update_measures, so the measure table
 # was read only once, but merging the two results in an increase of 15 minutes!
@@ -81,16 +84,27 @@ def update_measure(verbose):
         print("Updating measure")
 
     with override_current_transaction(tx):
-        measures_qs = (
-            ReportMeasure.objects.filter(sid__gte=20000000)
-            .only("trackedmodel_ptr", "duty_sentence")
-            .select_related("trackedmodel_ptr")
+        # The duty sentences are computed in the database, in batches, rather
+        # than with a query per measure
+        duty_sentences = (
+            Measure.objects.filter(
+                pk__in=ReportMeasure.objects.filter(sid__gte=20000000).values(
+                    "trackedmodel_ptr",
+                ),
+            )
+            .with_duty_sentence()
+            .exclude(db_duty_sentence="")
+            .values_list("pk", "db_duty_sentence")
         )
-        for measure in measures_qs:
-            duty_sentence = measure.trackedmodel_ptr.duty_sentence
-            if duty_sentence:
-                measure.duty_sentence = duty_sentence
-                measure.save()
+        batch = []
+        for pk, duty_sentence in duty_sentences.iterator(chunk_size=BATCH_SIZE):
+            batch.append(
+                ReportMeasure(trackedmodel_ptr_id=pk, duty_sentence=duty_sentence),
+            )
+            if len(batch) == BATCH_SIZE:
+                ReportMeasure.objects.bulk_update(batch, ["duty_sentence"])
+                batch = []
+        ReportMeasure.objects.bulk_update(batch, ["duty_sentence"])
 
     if verbose:
         print(f"Update measure elapsed time {time.time() - start}")
@@ -10,6 +10,7 @@ from common.models.utils import override_current_transaction
 from open_data.apps import APP_LABEL
 from open_data.commodities import save_commodities_parent
 from open_data.geo_areas import save_geo_areas
+from open_data.measures import BATCH_SIZE
 from open_data.measures import create_measure_components
 from open_data.measures import update_measure
 from open_data.models.datestamp import EventChoice
@@ -22,23 +23,28 @@ from open_data.models.utils import get_lookup_name
 def add_description(model, verbose=True):
     # The open data description is in the main table, not in a different table,
     # because we only need the current version.
-    # The field is populated using the orm get_description() on the tracked table
-    # Not efficient, but correct
+    # The field is populated from the latest description of the tracked table,
+    # annotated in the database and saved in batches rather than row by row
     if not issubclass(model, ReportModel):
         return
     if model.update_description:
         if issubclass(model.shadowed_model, DescribedMixin):
-            queryset = model.objects.select_related(
-                "trackedmodel_ptr",
-            ).all()
             start = time.time()
-            for row in queryset:
-                description = model.shadowed_model.objects.get(
-                    pk=row.trackedmodel_ptr_id,
-                ).get_description()
-                if description:
-                    row.description = description.description
-                    row.save()
+            descriptions = (
+                model.shadowed_model.objects.filter(
+                    pk__in=model.objects.values("trackedmodel_ptr"),
+                )
+                .with_latest_description()
+                .filter(description__isnull=False)
+                .values_list("pk", "description")
+            )
+            batch = []
+            for pk, description in descriptions.iterator(chunk_size=BATCH_SIZE):
+                batch.append(model(trackedmodel_ptr_id=pk, description=description))
+                if len(batch) == BATCH_SIZE:
+                    model.objects.bulk_update(batch, ["description"])
+                    batch = []
+            model.objects.bulk_update(batch, ["description"])
             if verbose:
                 print(f"Elapsed time {model._meta.db_table} {time.time() - start}")
 
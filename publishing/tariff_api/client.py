@@ -1,3 +1,9 @@
+import os
+from io import BytesIO
+from typing import IO
+from typing import Optional
+from uuid import uuid4
+
 import requests
 from django.conf import settings
 from requests import Response
@@ -6,6 +12,50 @@ from publishing.models.envelope import Envelope
 from publishing.models.envelope import EnvelopeId
 
 
+class MultipartFileUpload:
+    """
+    A multipart/form-data request body containing a single file, which reads
+    the file as the request is sent rather than loading it into memory first.
+
+    `requests` reads the whole of any file passed via its `files` argument
+    before sending it, whereas a file-like body with a known length is streamed
+    a block at a time.
+    """
+
+    def __init__(self, field_name: str, filename: str, file: IO[bytes]) -> None:
+        boundary = uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        header = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; '
+            f'filename="{filename}"\r\n\r\n'
+        ).encode()
+        footer = f"\r\n--{boundary}--\r\n".encode()
+
+        file.seek(0, os.SEEK_END)
+        file_size = file.tell()
+        file.seek(0)
+
+        self._parts = [BytesIO(header), file, BytesIO(footer)]
+        self._length = len(header) + file_size + len(footer)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while self._parts and size != 0:
+            chunk = self._parts[0].read(size)
+            if not chunk or size < 0:
+                self._parts.pop(0)
+            if chunk:
+                chunks.append(chunk)
+                if size > 0:
+                    size -= len(chunk)
+        return b"".join(chunks)
+
+
 class TariffAPIClient:
     def __init__(self) -> None:
         self.api_host = settings.CROWN_DEPENDENCIES_API_HOST
@@ -25,16 +75,31 @@ class TariffAPIClient:
         response = requests.get(full_api_url, headers=headers, timeout=60)
         return response
 
-    def post_envelope(self, envelope: Envelope) -> Response:
-        """Upload envelope to Tariff API."""
+    def post_envelope(
+        self,
+        envelope: Envelope,
+        body: Optional[IO[bytes]] = None,
+    ) -> Response:
+        """
+        Upload envelope to Tariff API.
+
+        The envelope is streamed from `body` if given, or otherwise directly
+        from the envelope's `xml_file`.
+        """
         full_api_url = self.api_host + self.api_url_path + envelope.envelope_id
 
+        if body is None:
+            body = envelope.xml_file.open(mode="rb")
+        upload = MultipartFileUpload(
+            "file",
+            os.path.basename(envelope.xml_file.name),
+            body,
+        )
+
         headers = {
             "X-API-KEY": self.post_api_key,
-        }
-        files = {
-            "file": envelope.xml_file.open(mode="rb"),
+            "Content-Type": upload.content_type,
         }
 
-        response = requests.post(full_api_url, headers=headers, files=files, timeout=60)
+        response = requests.post(full_api_url, headers=headers, data=upload, timeout=60)
         return response
@@ -1,5 +1,8 @@
 from abc import ABC
 from abc import abstractmethod
+from typing import IO
+from typing import Dict
+from typing import Optional
 
 from requests import Response
 
@@ -14,7 +17,11 @@ class TariffAPIBase(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def post_envelope(self, envelope: Envelope) -> Response:
+    def post_envelope(
+        self,
+        envelope: Envelope,
+        body: Optional[IO[bytes]] = None,
+    ) -> Response:
         raise NotImplementedError
 
 
@@ -52,11 +59,53 @@ class TariffAPIStubbed(TariffAPIBase):
         """Get envelope from Tariff API."""
         return self.stubbed_get_response(envelope_id=envelope_id)
 
-    def post_envelope(self, envelope: Envelope = None) -> Response:
+    def post_envelope(
+        self,
+        envelope: Envelope = None,
+        body: Optional[IO[bytes]] = None,
+    ) -> Response:
         """Upload envelope to Tariff API."""
         return self.stubbed_post_response(envelope=envelope)
 
 
+class TariffAPIFake(TariffAPIBase):
+    """
+    Tariff API fake interface.
+
+    Keeps uploaded envelopes in `TariffAPIFake.envelopes`, keyed by envelope
+    ID in the order they were uploaded, so that publishing can be exercised
+    locally end to end.
+    """
+
+    envelopes: Dict[EnvelopeId, bytes] = {}
+
+    def get_envelope(self, envelope_id: EnvelopeId) -> Response:
+        """Get envelope from the fake Tariff API."""
+        response = Response()
+        if envelope_id in self.envelopes:
+            response.status_code = 200
+            response._content = self.envelopes[envelope_id]
+        else:
+            response.status_code = 404
+            response.reason = "404 Taric file does not exist"
+        return response
+
+    def post_envelope(
+        self,
+        envelope: Envelope,
+        body: Optional[IO[bytes]] = None,
+    ) -> Response:
+        """Upload envelope to the fake Tariff API."""
+        if body is None:
+            body = envelope.xml_file.open(mode="rb")
+        self.envelopes[envelope.envelope_id] = body.read()
+
+        response = Response()
+        response.status_code = 200
+        response.reason = "200 OK File uploaded"
+        return response
+
+
 class TariffAPI(TariffAPIBase):
     def __init__(self):
         super().__init__()
@@ -66,6 +115,10 @@ class TariffAPI(TariffAPIBase):
         """Get envelope from Tariff API."""
         return self.client.get_envelope(envelope_id=envelope_id)
 
-    def post_envelope(self, envelope: Envelope) -> Response:
+    def post_envelope(
+        self,
+        envelope: Envelope,
+        body: Optional[IO[bytes]] = None,
+    ) -> Response:
         """Upload envelope to Tariff API."""
-        return self.client.post_envelope(envelope=envelope)
+        return self.client.post_envelope(envelope=envelope, body=body)
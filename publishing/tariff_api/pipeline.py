@@ -0,0 +1,197 @@
+import logging
+import shutil
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from tempfile import SpooledTemporaryFile
+from typing import IO
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import requests
+from django.conf import settings
+
+from publishing.models.envelope import Envelope
+from publishing.models.envelope import EnvelopeId
+from publishing.models.packaged_workbasket import PackagedWorkBasket
+from publishing.tariff_api.interface import TariffAPIBase
+from publishing.tasks import CrownDependenciesException
+
+logger = logging.getLogger(__name__)
+
+ENVELOPE_CHUNK_SIZE = 1024 * 1024
+"""The number of bytes read from storage at a time when loading an
+envelope."""
+
+ENVELOPE_MEMORY_SIZE = 10 * 1024 * 1024
+"""The size above which a loaded envelope is spilled from memory to a temporary
+file on disk."""
+
+
+@dataclass
+class PreparedEnvelope:
+    """A packaged workbasket whose envelope has been loaded from storage and is
+    ready to publish."""
+
+    packaged_workbasket: PackagedWorkBasket
+    body: IO[bytes]
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def close(self) -> None:
+        self.body.close()
+
+
+class PublishingPipeline:
+    """
+    Publishes envelopes to the Tariff API strictly in order, while the
+    envelopes that follow the one being published are loaded from storage in
+    the background.
+
+    Each envelope passes through three stages: "load" reads it from storage,
+    "post" uploads it to the Tariff API and "update" records the outcome. The
+    seconds spent in each stage are logged, and kept in `timings`.
+    """
+
+    def __init__(
+        self,
+        interface: TariffAPIBase,
+        prefetch: Optional[int] = None,
+    ) -> None:
+        self.interface = interface
+        self.prefetch = (
+            settings.CROWN_DEPENDENCIES_API_PREFETCH if prefetch is None else prefetch
+        )
+        self.timings: List[Tuple[EnvelopeId, Dict[str, float]]] = []
+
+    def load(
+        self,
+        packaged_workbasket: PackagedWorkBasket,
+        envelope: Envelope,
+    ) -> PreparedEnvelope:
+        """
+        Load `envelope` from storage, a chunk at a time, into a temporary file
+        that is only held in memory while it is small.
+
+        This is run on a background thread, so `envelope` is passed in rather
+        than being fetched from the database here.
+        """
+        start = time.perf_counter()
+        body = SpooledTemporaryFile(max_size=ENVELOPE_MEMORY_SIZE)
+        with envelope.xml_file.open(mode="rb") as xml_file:
+            shutil.copyfileobj(xml_file, body, ENVELOPE_CHUNK_SIZE)
+        body.seek(0)
+
+        return PreparedEnvelope(
+            packaged_workbasket=packaged_workbasket,
+            body=body,
+            timings={"load": time.perf_counter() - start},
+        )
+
+    def prepared(
+        self,
+        packaged_workbaskets: Iterable[PackagedWorkBasket],
+    ) -> Iterator[PreparedEnvelope]:
+        """
+        Yield each of `packaged_workbaskets` in order with its envelope loaded,
+        keeping up to `prefetch` of the envelopes that follow loading in the
+        background.
+
+        Each envelope's body is closed once the caller moves on to the next, and
+        any envelopes still loading are discarded if the caller stops early.
+        """
+        packaged_workbaskets = iter(packaged_workbaskets)
+        loading: Deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                while True:
+                    while len(loading) <= self.prefetch:
+                        packaged_workbasket = next(packaged_workbaskets, None)
+                        if packaged_workbasket is None:
+                            break
+                        loading.append(
+                            executor.submit(
+                                self.load,
+                                packaged_workbasket,
+                                packaged_workbasket.envelope,
+                            ),
+                        )
+
+                    if not loading:
+                        return
+
+                    prepared = loading.popleft().result()
+                    try:
+                        yield prepared
+                    finally:
+                        prepared.close()
+            finally:
+                for future in loading:
+                    if not future.cancel() and future.exception() is None:
+                        future.result().close()
+
+    def publish(
+        self,
+        packaged_workbasket: PackagedWorkBasket,
+        body: Optional[IO[bytes]] = None,
+        timings: Optional[Dict[str, float]] = None,
+    ) -> requests.Response:
+        """
+        Publish envelope to Tariff API, from `body` if it has already been
+        loaded.
+
+        If successful, transition `CrownDependenciesEnvelope` to `SUCCESSFULLY_PUBLISHED`.
+        else, transition `CrownDependenciesEnvelope` to `FAILED_PUBLISHING`.
+        @returns: response
+        """
+        crown_dependencies_envelope = packaged_workbasket.crown_dependencies_envelope
+        envelope_id = packaged_workbasket.envelope.envelope_id
+        timings = dict(timings or {})
+        logger.info(f"Publishing: {crown_dependencies_envelope}")
+
+        start = time.perf_counter()
+        try:
+            response = self.interface.post_envelope(
+                envelope=packaged_workbasket.envelope,
+                body=body,
+            )
+        except requests.exceptions.Timeout:
+            raise CrownDependenciesException("Tariff API timed out")
+        posted = time.perf_counter()
+        timings["post"] = posted - start
+
+        if response.status_code == 200:
+            logger.info(f"Successfully published: {crown_dependencies_envelope}")
+            crown_dependencies_envelope.publishing_succeeded()
+        else:
+            logger.warning(
+                f"Failed publishing: {crown_dependencies_envelope} - {response.text}",
+            )
+            # send notification and updates state
+            crown_dependencies_envelope.publishing_failed()
+        timings["update"] = time.perf_counter() - posted
+
+        self.timings.append((envelope_id, timings))
+        logger.info(
+            f"Envelope {envelope_id} stage timings: "
+            + ", ".join(
+                f"{stage}={seconds:.3f}s" for stage, seconds in timings.items()
+            ),
+        )
+        return response
+
+    def publish_prepared(self, prepared: PreparedEnvelope) -> requests.Response:
+        """Publish an envelope that has been loaded by `prepared()`."""
+        return self.publish(
+            prepared.packaged_workbasket,
+            body=prepared.body,
+            timings=prepared.timings,
+        )
@@ -1,5 +1,6 @@
 import logging
 import time
+from contextlib import closing
 from contextlib import contextmanager
 
 import requests
@@ -157,35 +158,9 @@ def publish_to_api():
     from publishing.models import PackagedWorkBasket
     from publishing.models.state import CrownDependenciesPublishingState
     from publishing.tariff_api import get_tariff_api_interface
+    from publishing.tariff_api.pipeline import PublishingPipeline
 
-    interface = get_tariff_api_interface()
-
-    def publish(packaged_workbasket: PackagedWorkBasket) -> requests.Response:
-        """
-        Publish envelope to Tariff API.
-
-        If successful, transition `CrownDependenciesEnvelope` to `SUCCESSFULLY_PUBLISHED`.
-        else, transition `CrownDependenciesEnvelope` to `FAILED_PUBLISHING`.
-        @returns: response
-        """
-        logger.info(f"Publishing: {packaged_workbasket.crown_dependencies_envelope}")
-
-        try:
-            response = interface.post_envelope(envelope=packaged_workbasket.envelope)
-        except requests.exceptions.Timeout:
-            raise CrownDependenciesException("Tariff API timed out")
-        if response.status_code == 200:
-            logger.info(
-                f"Successfully published: {packaged_workbasket.crown_dependencies_envelope}",
-            )
-            packaged_workbasket.crown_dependencies_envelope.publishing_succeeded()
-        else:
-            logger.warning(
-                f"Failed publishing: {packaged_workbasket.crown_dependencies_envelope} - {response.text}",
-            )
-            # send notification and updates state
-            packaged_workbasket.crown_dependencies_envelope.publishing_failed()
-        return response
+    pipeline = PublishingPipeline(get_tariff_api_interface())
 
     def pause_queue_and_log_error(task: CrownDependenciesPublishingTask, message: str):
         """Pauses publishing queue by updating
@@ -256,7 +231,7 @@ def publish_to_api():
                 # check if envelope posted to api
 
                 try:
-                    response = interface.get_envelope(
+                    response = pipeline.interface.get_envelope(
                         envelope_id=packaged_workbasket.envelope.envelope_id,
                     )
                 except requests.exceptions.Timeout:
@@ -283,7 +258,7 @@ def publish_to_api():
                 )
                 publishing_envelope.publishing_succeeded()
             else:
-                response = publish(packaged_workbasket)
+                response = pipeline.publish(packaged_workbasket)
                 if response.status_code != 200:
                     publishing_task.error = response.text
                     publishing_task.save()
@@ -291,25 +266,34 @@ def publish_to_api():
                         "Unexpected response from Tariff API.",
                     )
 
-        # Process unpublished packaged workbaskets
-        for unpublished in unpublished_packaged_workbaskets:
-            # checks if expected sequence
-            if not unpublished.next_expected_to_api():
-                message = f"""Cannot publish PackagedWorkBasket instance to tariff API,
-                    Envelope Id {unpublished.envelope.envelope_id} is not the next expected envelope.
-                    Pausing Queue."""
-                pause_queue_and_log_error(publishing_task, message)
-                return
+        # Process unpublished packaged workbaskets, in order, loading the
+        # envelopes that follow from storage while each one is published.
+        with closing(
+            pipeline.prepared(
+                unpublished_packaged_workbaskets.select_related("envelope"),
+            ),
+        ) as prepared_envelopes:
+            for prepared in prepared_envelopes:
+                unpublished = prepared.packaged_workbasket
+                # checks if expected sequence
+                if not unpublished.next_expected_to_api():
+                    message = f"""Cannot publish PackagedWorkBasket instance to tariff API,
+                        Envelope Id {unpublished.envelope.envelope_id} is not the next expected envelope.
+                        Pausing Queue."""
+                    pause_queue_and_log_error(publishing_task, message)
+                    return
+
+                CrownDependenciesEnvelope.objects.create(
+                    packaged_work_basket=unpublished,
+                )
+                unpublished.refresh_from_db()
 
-            CrownDependenciesEnvelope.objects.create(
-                packaged_work_basket=unpublished,
-            )
-            unpublished.refresh_from_db()
-
-            # publish to api
-            response = publish(unpublished)
-            if response.status_code != 200:
-                publishing_task.error = response.text
-                publishing_task.save()
-                raise CrownDependenciesException("Unexpected response from Tariff API.")
+                # publish to api
+                response = pipeline.publish_prepared(prepared)
+                if response.status_code != 200:
+                    publishing_task.error = response.text
+                    publishing_task.save()
+                    raise CrownDependenciesException(
+                        "Unexpected response from Tariff API.",
+                    )
         logger.info("No more envelopes to publish")
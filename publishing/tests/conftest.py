@@ -11,6 +11,7 @@ from unittest.mock import patch
 
 import factory
 import pytest
+from django.core.files.base import ContentFile
 
 from common.tests import factories
 from publishing.models import QueueState
@@ -60,3 +61,20 @@ def mocked_create_xml_envelope_file_apply_sync():
         return_value=MagicMock(id=factory.Faker("uuid4")),
     ) as mocked_apply_sync:
         yield mocked_apply_sync
+
+
+@pytest.fixture()
+def envelope_storage_reads(s3, envelope_storage):
+    """
+    Read envelopes from `envelope_storage` directly through the moto client.
+
+    The publishing pipeline loads envelopes on a background thread, which
+    cannot read back envelopes saved through the mocked storage.
+    """
+
+    def open_from_s3(self, name, mode="rb"):
+        s3_object = s3.get_object(Bucket=envelope_storage.bucket_name, Key=name)
+        return ContentFile(s3_object["Body"].read(), name=name)
+
+    with patch("publishing.storages.EnvelopeStorage.open", open_from_s3):
+        yield envelope_storage
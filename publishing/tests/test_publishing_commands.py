@@ -49,6 +49,7 @@ def test_publish_to_api_exits_no_unpublished_envelopes():
         call_command("publish_to_api", "--publish-async")
 
 
+@pytest.mark.usefixtures("envelope_storage_reads")
 def test_publish_to_api_publishes_envelopes(successful_envelope_factory, settings):
     """Test that publish_to_api triggers the task to upload unpublished
     envelopes to the Tariff API."""
@@ -0,0 +1,54 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.base import ContentFile
+
+from publishing.models import Envelope
+from publishing.tariff_api.client import MultipartFileUpload
+from publishing.tariff_api.client import TariffAPIClient
+
+pytestmark = pytest.mark.django_db
+
+
+def test_multipart_file_upload_reads_file_in_blocks():
+    content = b"<envelope />" * 1000
+    upload = MultipartFileUpload("file", "DIT240001.xml", BytesIO(content))
+
+    blocks = []
+    while block := upload.read(1024):
+        blocks.append(block)
+    body = b"".join(blocks)
+
+    assert len(body) == len(upload)
+    assert max(len(block) for block in blocks) == 1024
+    boundary = upload.content_type.split("boundary=")[1]
+    assert (
+        body
+        == (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="file"; filename="DIT240001.xml"'
+            "\r\n\r\n"
+        ).encode()
+        + content
+        + f"\r\n--{boundary}--\r\n".encode()
+    )
+
+
+def test_client_streams_envelope_body(requests_mock, settings):
+    settings.CROWN_DEPENDENCIES_API_HOST = "https://tariff-api.example.com/"
+    envelope = Envelope(envelope_id="240001")
+    envelope.xml_file.name = "envelope/DIT240001.xml"
+    requests_mock.post(
+        "https://tariff-api.example.com/api/v1/taricfiles/240001",
+        status_code=200,
+    )
+
+    response = TariffAPIClient().post_envelope(
+        envelope=envelope,
+        body=ContentFile(b"<envelope />"),
+    )
+
+    assert response.status_code == 200
+    request = requests_mock.last_request
+    assert request.headers["Content-Type"].startswith("multipart/form-data")
+    assert int(request.headers["Content-Length"]) == len(request.body.read())
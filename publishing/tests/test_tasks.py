@@ -91,6 +91,7 @@ def test_create_and_upload_envelope_fails(
         mock_save.assert_not_called()
 
 
+@pytest.mark.usefixtures("envelope_storage_reads")
 def test_publish_to_api_successfully_published(successful_envelope_factory, settings):
     """Test when an envelope has been successfully published to the Tariff API
     that its state and published fields are updated accordingly."""
@@ -115,6 +116,7 @@ def test_publish_to_api_successfully_published(successful_envelope_factory, sett
     assert pwb.crown_dependencies_envelope.published
 
 
+@pytest.mark.usefixtures("envelope_storage_reads")
 def test_publish_to_api_failed_publishing(
     successful_envelope_factory,
     settings,
@@ -238,6 +240,7 @@ def test_publish_to_api_has_been_published(
     assert crown_dependencies_envelope.published
 
 
+@pytest.mark.usefixtures("envelope_storage_reads")
 def test_publish_to_api_published_in_sequence(successful_envelope_factory, settings):
     """Test that envelopes are published in sequence to the Tariff API."""
 
@@ -261,6 +264,7 @@ def test_publish_to_api_published_in_sequence(successful_envelope_factory, setti
     )
 
 
+@pytest.mark.usefixtures("envelope_storage_reads")
 def test_publish_to_api_creates_crown_dependencies_publishing_task(
     successful_envelope_factory,
     settings,
@@ -293,3 +297,85 @@ def test_publish_to_api_paused_publishing(
     publish_to_api()
 
     assert PackagedWorkBasket.objects.get_unpublished_to_api().count() == 1
+
+
+@pytest.fixture()
+def tariff_api_fake(settings, monkeypatch):
+    from publishing.tariff_api.interface import TariffAPIFake
+
+    settings.TARIFF_API_INTERFACE = "publishing.tariff_api.interface.TariffAPIFake"
+    monkeypatch.setattr(TariffAPIFake, "envelopes", {})
+    return TariffAPIFake
+
+
+@pytest.mark.usefixtures("envelope_storage_reads")
+def test_publish_to_api_publishes_envelope_contents_in_order(
+    successful_envelope_factory,
+    tariff_api_fake,
+    settings,
+):
+    """Test that the backlog of envelopes is uploaded to the Tariff API in
+    sequence, with each envelope's contents as stored."""
+
+    settings.ENABLE_PACKAGING_NOTIFICATIONS = False
+    settings.CROWN_DEPENDENCIES_API_PREFETCH = 1
+    for _ in range(3):
+        successful_envelope_factory()
+
+    pwbs = list(PackagedWorkBasket.objects.get_unpublished_to_api())
+    publish_to_api()
+
+    assert list(tariff_api_fake.envelopes) == [pwb.envelope.envelope_id for pwb in pwbs]
+    for pwb in pwbs:
+        with pwb.envelope.xml_file.open(mode="rb") as xml_file:
+            assert tariff_api_fake.envelopes[pwb.envelope.envelope_id] == (
+                xml_file.read()
+            )
+    assert not PackagedWorkBasket.objects.get_unpublished_to_api().exists()
+
+
+@pytest.mark.usefixtures("envelope_storage_reads")
+def test_publishing_pipeline_loads_ahead_and_closes_envelopes(
+    successful_envelope_factory,
+    tariff_api_fake,
+    settings,
+):
+    """Test that the pipeline loads envelopes ahead of the one being published,
+    closes each once it has been published and records per stage timings."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from publishing.tariff_api.pipeline import PublishingPipeline
+
+    settings.ENABLE_PACKAGING_NOTIFICATIONS = False
+    for _ in range(3):
+        successful_envelope_factory()
+    pwbs = list(PackagedWorkBasket.objects.get_unpublished_to_api())
+
+    pipeline = PublishingPipeline(tariff_api_fake(), prefetch=1)
+    with mock.patch.object(
+        ThreadPoolExecutor,
+        "submit",
+        autospec=True,
+        side_effect=ThreadPoolExecutor.submit,
+    ) as mocked_submit:
+        prepared_envelopes = pipeline.prepared(pwbs)
+        first = next(prepared_envelopes)
+        assert first.packaged_workbasket == pwbs[0]
+        assert [call.args[2] for call in mocked_submit.call_args_list] == pwbs[:2]
+
+        factories.CrownDependenciesEnvelopeFactory(packaged_work_basket=pwbs[0])
+        pwbs[0].refresh_from_db()
+        pipeline.publish_prepared(first)
+
+        second = next(prepared_envelopes)
+        assert second.packaged_workbasket == pwbs[1]
+        assert first.body.closed
+        assert [call.args[2] for call in mocked_submit.call_args_list] == pwbs
+
+        prepared_envelopes.close()
+        assert second.body.closed
+
+    assert [envelope_id for envelope_id, _ in pipeline.timings] == [
+        pwbs[0].envelope.envelope_id,
+    ]
+    assert set(pipeline.timings[0][1]) == {"load", "post", "update"}
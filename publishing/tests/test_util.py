@@ -1,12 +1,19 @@
 import os
+from io import BytesIO
 
 import pytest
+from django.conf import settings
 from lxml.etree import DocumentInvalid
 
 from common.tests import factories
+from common.util import get_xml_schema
 from exporter.serializers import MultiFileEnvelopeTransactionSerializer
 from exporter.util import dit_file_generator
+from publishing.util import RecordCounts
 from publishing.util import TaricDataAssertionError
+from publishing.util import count_envelope_records
+from publishing.util import get_expected_record_counts
+from publishing.util import model_taric_record_count
 from publishing.util import validate_envelope
 from workbaskets.models import WorkBasket
 
@@ -332,3 +339,77 @@ def test_validate_envelope_skip_no_declaration_check(caplog):
             pass
 
         assert "Expected XML declaration" not in caplog.text
+
+
+def test_get_xml_schema_is_cached():
+    """Test that the TARIC3 schema is only compiled once per process."""
+    assert get_xml_schema(settings.PATH_XSD_TARIC) is get_xml_schema(
+        settings.PATH_XSD_TARIC,
+    )
+
+
+def test_count_envelope_records():
+    """Test that transactions and records are counted while the envelope is
+    streamed through the schema validator."""
+    schema = get_xml_schema(settings.PATH_XSD_TARIC)
+
+    with open(f"{TEST_FILES_PATH}/envelope_no_declaration.xml", "rb") as envelope_file:
+        counts = count_envelope_records(envelope_file, schema)
+
+    assert counts.transactions == 1
+    assert counts.records > 0
+
+
+@pytest.mark.parametrize(
+    "envelope_bytes",
+    [
+        b"<env:envelope xmlns:env='urn:publicid:-:DGTAXUD:GENERAL:ENVELOPE:1.0' "
+        b"id='230001'><env:unexpected/></env:envelope>",
+        b"<env:envelope xmlns:env='urn:publicid:-:DGTAXUD:GENERAL:ENVELOPE:1.0' "
+        b"id='230001'><env:transaction id='1'>",
+    ],
+    ids=["invalid-element", "truncated"],
+)
+def test_count_envelope_records_raises_document_invalid(envelope_bytes):
+    """Test that schema violations found while streaming are raised as
+    DocumentInvalid, matching `XMLSchema.assertValid()`."""
+    schema = get_xml_schema(settings.PATH_XSD_TARIC)
+
+    with pytest.raises(DocumentInvalid):
+        count_envelope_records(BytesIO(envelope_bytes), schema)
+
+
+def test_get_expected_record_counts(queued_workbasket, django_assert_num_queries):
+    """Test that expected record counts are computed with a single grouped
+    query, excluding unqualified measurements and empty transactions."""
+    approved_transaction = queued_workbasket.transactions.approved().last()
+    factories.ApprovedTransactionFactory.create(workbasket=queued_workbasket)
+
+    factories.FootnoteTypeFactory.create(transaction=approved_transaction)
+    factories.MeasurementFactory.create(transaction=approved_transaction)
+    factories.MeasurementFactory.create(
+        transaction=approved_transaction,
+        measurement_unit_qualifier=None,
+    )
+
+    workbaskets = WorkBasket.objects.filter(pk=queued_workbasket.pk)
+    tracked_models = queued_workbasket.tracked_models.all()
+    expected_records = sum(
+        model_taric_record_count[type(model).__name__]
+        for model in tracked_models
+        if not (
+            type(model).__name__ == "Measurement"
+            and not model.measurement_unit_qualifier
+        )
+    )
+    expected_transactions = len({model.transaction_id for model in tracked_models})
+
+    # Warm the content type cache so that only the grouped query is counted.
+    get_expected_record_counts(workbaskets)
+    with django_assert_num_queries(1):
+        counts = get_expected_record_counts(workbaskets)
+
+    assert counts == RecordCounts(
+        transactions=expected_transactions,
+        records=expected_records,
+    )
@@ -1,10 +1,16 @@
 import logging
 import os
+from typing import NamedTuple
 
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count
+from django.db.models import Q
 from lxml import etree
 
-from common.util import parse_xml
+from common.models.trackedmodel import TrackedModel
+from common.util import check_docinfo
+from common.util import get_xml_schema
 from common.xml.namespaces import nsmap
 
 logger = logging.getLogger(__name__)
@@ -83,6 +89,13 @@ class TaricDataAssertionError(AssertionError):
 # and would not support the rendering of multiple envelopes
 
 
+class RecordCounts(NamedTuple):
+    """The number of non-empty transactions and TARIC records in an envelope."""
+
+    transactions: int
+    records: int
+
+
 def validate_envelope(
     envelope_file: bytes,
     workbaskets,
@@ -91,6 +104,9 @@ def validate_envelope(
     """
     Validate envelope content for XML issues and data missing & order issues.
 
+    The envelope is validated against the (cached) TARIC3 schema while it is
+    being incrementally parsed, so the whole document is never held in memory.
+
     Catches and re-raises DocumentInvalid and TaricDataAssertionError
     exceptions, although other exceptions may be possible.
     """
@@ -108,36 +124,111 @@ def validate_envelope(
 
         envelope_file.seek(position_before, os.SEEK_SET)
 
-    with open(settings.PATH_XSD_TARIC) as xsd_file:
-        schema = etree.XMLSchema(parse_xml(xsd_file))
-
-    xml = parse_xml(envelope_file)
+    schema = get_xml_schema(settings.PATH_XSD_TARIC)
 
     try:
-        schema.assertValid(xml)
+        envelope_counts = count_envelope_records(envelope_file, schema)
     except etree.DocumentInvalid as e:
         logger.error(f"Envelope did not validate against XSD: {e}")
         raise
 
     try:
-        validate_taric_xml_records(xml, workbaskets)
+        validate_taric_xml_records(envelope_counts, workbaskets)
     except TaricDataAssertionError as e:
         logger.error(e.args[0])
         raise
 
 
-def get_expected_model_taric_record_count(tracked_model):
-    expected_count = model_taric_record_count[tracked_model.__class__.__name__]
+def count_envelope_records(envelope_file, schema: etree.XMLSchema) -> RecordCounts:
+    """
+    Incrementally parse `envelope_file`, validating it against `schema` as it is
+    read, and return the number of transactions and records it contains.
+
+    Elements are cleared once they have been counted so memory use stays flat
+    regardless of envelope size. Schema violations are raised as
+    `etree.DocumentInvalid`, as they would be by `XMLSchema.assertValid()`.
+    """
+    transaction_tag = etree.QName(nsmap["env"], "transaction")
+    record_tag = etree.QName(nsmap["oub"], "record")
+
+    transaction_count = 0
+    record_count = 0
+    root_closed = False
+
+    context = etree.iterparse(
+        envelope_file,
+        events=("end",),
+        schema=schema,
+        resolve_entities=False,
+    )
+    try:
+        for _, element in context:
+            if element.tag == record_tag:
+                record_count += 1
+            elif element.tag == transaction_tag:
+                transaction_count += 1
+                # Records have been counted, so the transaction's subtree and
+                # any preceding siblings are no longer needed.
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+            elif element.getparent() is None:
+                root_closed = True
+    except etree.XMLSyntaxError as e:
+        schema_errors = e.error_log.filter_domains([etree.ErrorDomains.SCHEMASV])
+        if schema_errors:
+            raise etree.DocumentInvalid(str(schema_errors.last_error)) from e
+        raise
+
+    if context.root is not None:
+        check_docinfo(context.root.getroottree(), forbid_dtd=True)
 
-    # add clause for possible exclusion of Measurement, based on no measurement qualifier
-    if tracked_model.__class__.__name__ == "Measurement":
-        if not tracked_model.measurement_unit_qualifier:
-            expected_count = 0
+    if not root_closed:
+        # Guard against truncated input, which is not always reported as a
+        # syntax error when parsing with a schema.
+        raise etree.DocumentInvalid("Envelope ended before its root element closed")
 
-    return expected_count
+    return RecordCounts(transactions=transaction_count, records=record_count)
 
 
-def validate_taric_xml_records(xml, workbaskets):
+def get_expected_record_counts(workbaskets) -> RecordCounts:
+    """
+    Return the number of non-empty transactions and TARIC records that an
+    envelope of `workbaskets` is expected to contain.
+
+    Counts are computed by a single query grouped by transaction and model type,
+    rather than by loading every tracked model in the workbaskets.
+    """
+    rows = (
+        TrackedModel.objects.filter(transaction__workbasket__in=workbaskets)
+        .values("transaction_id", "polymorphic_ctype_id")
+        .annotate(
+            model_count=Count("pk"),
+            # Measurements without a qualifier are not output as records.
+            unqualified_count=Count(
+                "pk",
+                filter=Q(measurement__measurement_unit_qualifier__isnull=True),
+            ),
+        )
+        .order_by()
+    )
+
+    transaction_ids = set()
+    record_count = 0
+    for row in rows:
+        model = ContentType.objects.get_for_id(row["polymorphic_ctype_id"])
+        model_name = model.model_class().__name__
+
+        transaction_ids.add(row["transaction_id"])
+        model_count = row["model_count"]
+        if model_name == "Measurement":
+            model_count -= row["unqualified_count"]
+        record_count += model_count * model_taric_record_count[model_name]
+
+    return RecordCounts(transactions=len(transaction_ids), records=record_count)
+
+
+def validate_taric_xml_records(envelope_counts: RecordCounts, workbaskets):
     """
     Raise AssertionError if:
 
@@ -145,38 +236,17 @@ def validate_taric_xml_records(xml, workbaskets):
     - missing tracked_models (record)
     """
 
-    # only validate against workbasket if workbasket available
-    expected_record_count = 0
-    workbasket_transaction_count = 0
-    for transaction in workbaskets.ordered_transactions():
-        tracked_models = transaction.tracked_models.record_ordering()
-        if tracked_models.count():
-            workbasket_transaction_count += 1
-            for tracked_model in tracked_models:
-                # dictionary that maps the tracked model class to taric record count
-                expected_record_count += get_expected_model_taric_record_count(
-                    tracked_model,
-                )
-
-    envelope_record_count = 0
-    envelope_transaction_count = 0
-
-    for transaction in xml.findall(".//env:transaction", namespaces=nsmap):
-        # Count the number of records to compare with the workbasket tracked models
-        envelope_transaction_count += 1
-        envelope_record_count += len(
-            transaction.findall(".//oub:record", namespaces=nsmap),
-        )
+    expected_counts = get_expected_record_counts(workbaskets)
 
-    if not envelope_transaction_count:
+    if not envelope_counts.transactions:
         raise TaricDataAssertionError(
             f"Envelope does not have any transactions!",
         )
-    elif envelope_record_count != expected_record_count:
+    elif envelope_counts.records != expected_counts.records:
         raise TaricDataAssertionError(
-            f"Missing records in XML: {envelope_record_count}, while {expected_record_count} expected",
+            f"Missing records in XML: {envelope_counts.records}, while {expected_counts.records} expected",
         )
-    elif envelope_transaction_count != workbasket_transaction_count:
+    elif envelope_counts.transactions != expected_counts.transactions:
         raise TaricDataAssertionError(
-            f"Envelope transaction count {envelope_transaction_count} don't match the workbasket transaction {workbasket_transaction_count}!",
+            f"Envelope transaction count {envelope_counts.transactions} don't match the workbasket transaction {expected_counts.transactions}!",
         )
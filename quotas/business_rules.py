@@ -1,10 +1,18 @@
 """Business rules for quotas."""
 
 import datetime
+from collections import defaultdict
 from datetime import date
 from decimal import Decimal
 
+from django.db.models import Exists
+from django.db.models import F
+from django.db.models import OuterRef
+from django.db.models import prefetch_related_objects
+
 import measures.models as measures_models
+from common.business_rules import BatchBusinessRule
+from common.business_rules import BatchValidityPeriodContained
 from common.business_rules import BusinessRule
 from common.business_rules import ExclusionMembership
 from common.business_rules import MustExist
@@ -245,7 +253,7 @@ class QD1(UniqueIdentifyingFields):
     identifying_fields = ("order_number__sid", "valid_between__lower")
 
 
-class QD7(ValidityPeriodContained):
+class QD7(BatchValidityPeriodContained):
     """The validity period of the quota definition must be spanned by one of the
     validity periods of the referenced quota order number."""
 
@@ -256,21 +264,21 @@ class QD7(ValidityPeriodContained):
     container_field_name = "order_number"
 
 
-class QD8(ValidityPeriodContained):
+class QD8(BatchValidityPeriodContained):
     """The validity period of the monetary unit code must span the validity
     period of the quota definition."""
 
     container_field_name = "monetary_unit"
 
 
-class QD10(ValidityPeriodContained):
+class QD10(BatchValidityPeriodContained):
     """The validity period measurement unit code must span the validity period
     of the quota definition."""
 
     container_field_name = "measurement_unit"
 
 
-class QD11(ValidityPeriodContained):
+class QD11(BatchValidityPeriodContained):
     """The validity period of the measurement unit qualifier code must span the
     validity period of the quota definition."""
 
@@ -319,33 +327,35 @@ class QuotaBlockingPeriodMustReferToANonDeletedQuotaDefinition(
         return quota_definition.quotablocking_set.model
 
 
-class OverlappingQuotaDefinition(BusinessRule):
+class OverlappingQuotaDefinition(BatchBusinessRule):
     """There may be no overlap in time of two quota definitions with the same
     quota order number id."""
 
-    def validate(self, quota_definition):
-        potential_quota_definition_matches = (
-            type(quota_definition)
-            .objects.approved_up_to_transaction(
-                quota_definition.transaction,
+    def violations(self, quota_definitions):
+        model = type(quota_definitions[0])
+        overlapping = (
+            model.objects.approved_up_to_transaction(
+                quota_definitions[0].transaction,
             )
             .filter(
-                order_number=quota_definition.order_number,
-                valid_between__overlap=quota_definition.valid_between,
+                order_number=OuterRef("order_number"),
+                valid_between__overlap=OuterRef("valid_between"),
+                version_group__current_version=F("pk"),
             )
-            .exclude(sid=quota_definition.sid)
+            .exclude(sid=OuterRef("sid"))
+        )
+        violating = set(
+            model.objects.filter(pk__in=[d.pk for d in quota_definitions])
+            .filter(Exists(overlapping))
+            .values_list("pk", flat=True),
         )
 
-        if potential_quota_definition_matches.exists():
-            for potential_quota_definition in potential_quota_definition_matches:
-                if (
-                    potential_quota_definition
-                    == potential_quota_definition.current_version
-                ):
-                    raise self.violation(quota_definition)
+        for quota_definition in quota_definitions:
+            if quota_definition.pk in violating:
+                yield self.violation(quota_definition)
 
 
-class VolumeAndInitialVolumeMustMatch(BusinessRule):
+class VolumeAndInitialVolumeMustMatch(BatchBusinessRule):
     """
     Unless it is the main quota in a quota association, a definition's volume
     and initial_volume values should always be the same.
@@ -355,23 +365,40 @@ class VolumeAndInitialVolumeMustMatch(BusinessRule):
     """
 
     def validate(self, quota_definition):
-        if quota_definition.valid_between.lower < datetime.date.today():
-            return True
+        super().validate(quota_definition)
+        return True
 
-        if quota_definition.sub_quota_associations.approved_up_to_transaction(
-            self.transaction,
-        ).exists():
-            return True
+    def violations(self, quota_definitions):
+        from quotas.models import QuotaAssociation
 
-        if quota_definition.volume != quota_definition.initial_volume:
-            raise self.violation(quota_definition)
+        mismatched = [
+            quota_definition
+            for quota_definition in quota_definitions
+            if quota_definition.valid_between.lower >= datetime.date.today()
+            and quota_definition.volume != quota_definition.initial_volume
+        ]
+        if not mismatched:
+            return
+
+        main_quotas = set(
+            QuotaAssociation.objects.approved_up_to_transaction(self.transaction)
+            .filter(
+                main_quota__version_group__in=[
+                    quota_definition.version_group_id for quota_definition in mismatched
+                ],
+            )
+            .values_list("main_quota__version_group", flat=True),
+        )
+        for quota_definition in mismatched:
+            if quota_definition.version_group_id not in main_quotas:
+                yield self.violation(quota_definition)
 
 
 class QA1(UniqueIdentifyingFields):
     """The association between two quota definitions must be unique."""
 
 
-class QA2(ValidityPeriodContained):
+class QA2(BatchValidityPeriodContained):
     """The sub-quota's validity period must be entirely enclosed within the
     validity period of the main quota."""
 
@@ -391,7 +418,7 @@ def check_QA2_dict(sub_definition_valid_between, main_definition_valid_between):
         return sub_definition_valid_between.lower >= main_definition_valid_between.lower
 
 
-class QA3(BusinessRule):
+class QA3(BatchBusinessRule):
     """
     When converted to the measurement unit of the main quota, the volume of a
     sub-quota must always be lower than or equal to the volume of the main
@@ -404,18 +431,20 @@ class QA3(BusinessRule):
     has no conversion ratios or other way of relating units to each other.)
     """
 
-    def validate(self, association):
-        main = association.main_quota
-        sub = association.sub_quota
-        if not check_QA3_dict(
-            main_definition_unit=main.measurement_unit,
-            sub_definition_unit=sub.measurement_unit,
-            main_definition_volume=main.volume,
-            sub_definition_volume=sub.volume,
-            main_initial_volume=main.initial_volume,
-            sub_initial_volume=sub.initial_volume,
-        ):
-            raise self.violation(association)
+    def violations(self, associations):
+        prefetch_related_objects(associations, "main_quota", "sub_quota")
+        for association in associations:
+            main = association.main_quota
+            sub = association.sub_quota
+            if not check_QA3_dict(
+                main_definition_unit=main.measurement_unit_id,
+                sub_definition_unit=sub.measurement_unit_id,
+                main_definition_volume=main.volume,
+                sub_definition_volume=sub.volume,
+                main_initial_volume=main.initial_volume,
+                sub_initial_volume=sub.initial_volume,
+            ):
+                yield self.violation(association)
 
 
 def check_QA3_dict(
@@ -452,7 +481,7 @@ def check_QA4_dict(coefficient):
     return coefficient > 0
 
 
-class QA5(BusinessRule):
+class QA5(BatchBusinessRule):
     """
     Whenever a sub-quota is defined with the 'equivalent' type, it must have the
     same volume as the ones associated with the parent quota.
@@ -461,46 +490,58 @@ class QA5(BusinessRule):
     defined with the 'normal' type must have a coefficient of 1.
     """
 
-    def validate(self, association):
+    def violations(self, associations):
         from quotas.models import QuotaAssociation
 
-        if association.sub_quota_relation_type == SubQuotaType.EQUIVALENT:
-            if not check_QA5_equivalent_coefficient(association.coefficient):
-                raise self.violation(
-                    model=association,
-                    message=(
-                        "A sub-quota defined with the 'equivalent' type must have a "
-                        "coefficient not equal to 1"
-                    ),
+        equivalent = [
+            association
+            for association in associations
+            if association.sub_quota_relation_type == SubQuotaType.EQUIVALENT
+        ]
+        sub_quota_volumes = defaultdict(set)
+        if equivalent:
+            for main_quota_id, volume in (
+                QuotaAssociation.objects.approved_up_to_transaction(
+                    associations[0].transaction,
                 )
-
-            quota_associations = QuotaAssociation.objects.approved_up_to_transaction(
-                association.transaction
-            ).filter(main_quota=association.main_quota)
-            volumes = []
-            for association in quota_associations:
-                if association.sub_quota.volume not in volumes:
-                    volumes.append(association.sub_quota.volume)
-
-            if len(volumes) > 1:
-                raise self.violation(
-                    model=association,
-                    message=(
-                        "Whenever a sub-quota is defined with the 'equivalent' type, it "
-                        "must have the same volume as the ones associated with the "
-                        "parent quota."
-                    ),
-                )
-
-        elif association.sub_quota_relation_type == SubQuotaType.NORMAL:
-            if not check_QA5_normal_coefficient(association.coefficient):
-                raise self.violation(
-                    model=association,
-                    message=(
-                        "A sub-quota defined with the 'normal' type must have a coefficient "
-                        "equal to 1"
-                    ),
+                .filter(
+                    main_quota__in=[
+                        association.main_quota_id for association in equivalent
+                    ],
                 )
+                .values_list("main_quota", "sub_quota__volume")
+            ):
+                sub_quota_volumes[main_quota_id].add(volume)
+
+        for association in associations:
+            if association.sub_quota_relation_type == SubQuotaType.EQUIVALENT:
+                if not check_QA5_equivalent_coefficient(association.coefficient):
+                    yield self.violation(
+                        model=association,
+                        message=(
+                            "A sub-quota defined with the 'equivalent' type must "
+                            "have a coefficient not equal to 1"
+                        ),
+                    )
+                elif len(sub_quota_volumes[association.main_quota_id]) > 1:
+                    yield self.violation(
+                        model=association,
+                        message=(
+                            "Whenever a sub-quota is defined with the 'equivalent' "
+                            "type, it must have the same volume as the ones "
+                            "associated with the parent quota."
+                        ),
+                    )
+
+            elif association.sub_quota_relation_type == SubQuotaType.NORMAL:
+                if not check_QA5_normal_coefficient(association.coefficient):
+                    yield self.violation(
+                        model=association,
+                        message=(
+                            "A sub-quota defined with the 'normal' type must have a "
+                            "coefficient equal to 1"
+                        ),
+                    )
 
 
 def check_QA5_equivalent_coefficient(coefficient):
@@ -570,39 +611,48 @@ class SameMainAndSubQuota(BusinessRule):
             raise self.violation(association)
 
 
-class BlockingOnlyOfFCFSQuotas(BusinessRule):
+class BlockingOnlyOfFCFSQuotas(BatchBusinessRule):
     """Blocking periods are only applicable to FCFS quotas."""
 
-    def validate(self, blocking):
-        if (
-            blocking.quota_definition.order_number.mechanism
-            != AdministrationMechanism.FCFS
-        ):
-            raise self.violation(blocking)
+    def violations(self, blockings):
+        prefetch_related_objects(blockings, "quota_definition__order_number")
+        for blocking in blockings:
+            if (
+                blocking.quota_definition.order_number.mechanism
+                != AdministrationMechanism.FCFS
+            ):
+                yield self.violation(blocking)
 
 
-class QBP2(BusinessRule):
+class QBP2(BatchBusinessRule):
     """The start date of the quota blocking period must be later than or equal
     to the start date of the quota validity period."""
 
-    def validate(self, blocking):
-        if blocking.valid_between.lower < blocking.quota_definition.valid_between.lower:
-            raise self.violation(blocking)
+    def violations(self, blockings):
+        prefetch_related_objects(blockings, "quota_definition")
+        for blocking in blockings:
+            if (
+                blocking.valid_between.lower
+                < blocking.quota_definition.valid_between.lower
+            ):
+                yield self.violation(blocking)
 
 
-class SuspensionsOnlyToFCFSQuotas(BusinessRule):
+class SuspensionsOnlyToFCFSQuotas(BatchBusinessRule):
     """Quota suspensions are only applicable to First Come First Served
     quotas."""
 
-    def validate(self, suspension):
-        if (
-            suspension.quota_definition.order_number.mechanism
-            != AdministrationMechanism.FCFS
-        ):
-            raise self.violation(suspension)
+    def violations(self, suspensions):
+        prefetch_related_objects(suspensions, "quota_definition__order_number")
+        for suspension in suspensions:
+            if (
+                suspension.quota_definition.order_number.mechanism
+                != AdministrationMechanism.FCFS
+            ):
+                yield self.violation(suspension)
 
 
-class QSP2(ValidityPeriodContained):
+class QSP2(BatchValidityPeriodContained):
     """The validity period of the quota must span the quota suspension
     period."""
 
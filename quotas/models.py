@@ -37,6 +37,7 @@ class QuotaOrderNumber(TrackedModel, ValidityMixin):
     subrecord_code = "00"
 
     identifying_fields = ("sid",)
+    search_identifier_fields = ("order_number",)
 
     sid = SignedIntSID(db_index=True)
     order_number = models.CharField(
@@ -508,6 +508,29 @@ def test_overlapping_quota_definition(date_ranges):
         ).validate(overlapping_definition)
 
 
+@pytest.mark.business_rules
+def test_overlapping_quota_definition_violations(date_ranges):
+    """Overlapping definitions are found for a batch of definitions at once."""
+    order_number = factories.QuotaOrderNumberFactory.create()
+    factories.QuotaDefinitionFactory.create(
+        order_number=order_number,
+        valid_between=date_ranges.normal,
+    )
+    overlapping_definition = factories.QuotaDefinitionFactory.create(
+        order_number=order_number,
+        valid_between=date_ranges.overlap_normal,
+    )
+    separate_definition = factories.QuotaDefinitionFactory.create(
+        valid_between=date_ranges.normal,
+    )
+
+    violations = business_rules.OverlappingQuotaDefinition(
+        overlapping_definition.transaction,
+    ).violations([overlapping_definition, separate_definition])
+
+    assert [violation.model for violation in violations] == [overlapping_definition]
+
+
 @pytest.mark.business_rules
 def test_overlapping_quota_definition_on_deleted_records(
     date_ranges,
@@ -672,6 +695,19 @@ def test_QA2(date_ranges):
         business_rules.QA2(association.transaction).validate(association)
 
 
+@pytest.mark.business_rules
+def test_QA2_skips_deleted_association(date_ranges, delete_record):
+    """Deleting an association whose sub-quota is not enclosed by its main
+    quota does not violate QA2."""
+    association = factories.QuotaAssociationFactory.create(
+        main_quota__valid_between=date_ranges.normal,
+        sub_quota__valid_between=date_ranges.overlap_normal,
+    )
+    deleted = delete_record(association)
+
+    business_rules.QA2(deleted.transaction).validate(deleted)
+
+
 @pytest.mark.business_rules
 @pytest.mark.parametrize(
     "sub_definition_valid_between, main_definition_valid_between, expected_response",
@@ -16,6 +16,7 @@ from common.serializers import AutoCompleteSerializer
 from common.tariffs_api import URLs
 from common.tariffs_api import get_quota_data
 from common.validators import UpdateType
+from common.views import CachedAutoCompleteMixin
 from common.views import SortingMixin
 from common.views import TamatoListView
 from common.views import TrackedModelDetailMixin
@@ -46,7 +47,7 @@ from .mixins import QuotaOrderNumberOriginUpdateMixin
 from .mixins import QuotaUpdateMixin
 
 
-class QuotaOrderNumberViewset(viewsets.ReadOnlyModelViewSet):
+class QuotaOrderNumberViewset(CachedAutoCompleteMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint that allows quota order numbers to be viewed."""
 
     serializer_class = AutoCompleteSerializer
@@ -3,22 +3,14 @@ from datetime import date
 from datetime import timedelta
 from typing import Optional
 
-from django.db.models import Q
-
-from commodities.models import GoodsNomenclature
-from commodities.models.dc import CommodityCollectionLoader
 from commodities.models.dc import CommodityTreeSnapshot
-from commodities.models.dc import SnapshotMoment
-from common.models import Transaction
 from common.util import TaricDateRange
-from geo_areas.models import GeographicalArea
-from geo_areas.models import GeographicalAreaDescription
-from measures.models import Measure
 from quotas.models import QuotaAssociation
-from quotas.models import QuotaDefinition
-from quotas.models import QuotaOrderNumber
-from quotas.models import QuotaSuspension
+from reference_documents.check.context import PREFERENTIAL_QUOTA_MEASURE_TYPE_SID
+from reference_documents.check.context import PREFERENTIAL_RATE_MEASURE_TYPE_SID
+from reference_documents.check.context import AlignmentCheckContext
 from reference_documents.models import AlignmentReportCheckStatus
+from reference_documents.models import ReferenceDocumentVersion
 from reference_documents.models import RefOrderNumber
 from reference_documents.models import RefQuotaDefinition
 from reference_documents.models import RefQuotaSuspension
@@ -37,6 +29,29 @@ class BaseCheck(abc.ABC):
 
     name = "Base check"
 
+    def __init__(
+        self,
+        reference_document_version: ReferenceDocumentVersion,
+        context: Optional[AlignmentCheckContext] = None,
+    ):
+        """
+        Initialises the check class.
+
+        args:
+            reference_document_version (ReferenceDocumentVersion): The version
+            of the reference document being checked
+            context (AlignmentCheckContext): Optional preloaded TAP data to
+            answer the check from. If not provided, a context that loads the
+            data for this check as it is needed is used.
+        """
+        if context is None:
+            context = AlignmentCheckContext(
+                reference_document_version,
+                ref_rates=reference_document_version.ref_rates.none(),
+                ref_order_numbers=reference_document_version.ref_order_numbers.none(),
+            )
+        self.context = context
+
     def tap_order_number(self, order_number: str):
         """
         Finds a TAP order number matching the provided order number string.
@@ -47,18 +62,7 @@ class BaseCheck(abc.ABC):
         returns:
             QuotaOrderNumber or None
         """
-
-        kwargs = {
-            "order_number": order_number,
-        }
-
-        try:
-            order_number = QuotaOrderNumber.objects.latest_approved().get(
-                **kwargs,
-            )
-            return order_number
-        except QuotaOrderNumber.DoesNotExist:
-            return None
+        return self.context.order_number(order_number)
 
     @abc.abstractmethod
     def run_check(self) -> (AlignmentReportCheckStatus, str):
@@ -93,58 +97,7 @@ class BaseCheck(abc.ABC):
         returns:
             [GeographicalAreas] or None
         """
-        geo_areas_to_search = []
-
-        try:
-            # get geo area
-            geo_area = GeographicalArea.objects.latest_approved().get(
-                area_id=self.get_area_id(),
-                valid_between__contains=self.get_validity().lower,
-            )
-
-            geo_areas_to_search.append(geo_area)
-
-            if geo_area.is_group():
-                # if it's a group collect members
-                members = list(
-                    x.member for x in geo_area.members.latest_approved().all()
-                )
-            else:
-                # if not a group - get single member
-                members = [geo_area]
-
-            # find all groups matching the validity range
-            query = Q(
-                valid_between__contains=self.get_validity().lower,
-            )
-
-            # filter groups by ends with - if available
-            if self.get_validity().upper:
-                query = query & Q(valid_between__contains=self.get_validity().upper)
-
-            geo_area_groups = GeographicalArea.objects.latest_approved().filter(query)
-
-            # filter the groups by members in group / single member
-            if len(members) > 0:
-                for geo_area_group in geo_area_groups:
-                    match = True
-                    for member in members:
-                        if (
-                            not geo_area_group.members.all()
-                            .filter(member=member)
-                            .exists()
-                        ):
-                            match = False
-                            break
-
-                    if match:
-                        geo_areas_to_search.append(geo_area_group)
-
-            # return results
-            return geo_areas_to_search
-
-        except GeographicalArea.DoesNotExist:
-            return []
+        return self.context.geo_areas(self.get_area_id(), self.get_validity())
 
 
 class BaseQuotaDefinitionCheck(BaseCheck, abc.ABC):
@@ -158,15 +111,23 @@ class BaseQuotaDefinitionCheck(BaseCheck, abc.ABC):
 
     name = "Base quota definition check"
 
-    def __init__(self, ref_quota_definition: RefQuotaDefinition):
+    def __init__(
+        self,
+        ref_quota_definition: RefQuotaDefinition,
+        context: Optional[AlignmentCheckContext] = None,
+    ):
         """
         Initialises the check class.
 
         args:
             ref_quota_definition (RefQuotaDefinition): The reference document quota definition
             object we are checking against
+            context (AlignmentCheckContext): Optional preloaded TAP data
         """
-        super().__init__()
+        super().__init__(
+            ref_quota_definition.ref_order_number.reference_document_version,
+            context,
+        )
         self.ref_quota_definition = ref_quota_definition
         self.ref_order_number = self.ref_quota_definition.ref_order_number
         self.reference_document_version = (
@@ -206,12 +167,7 @@ class BaseQuotaDefinitionCheck(BaseCheck, abc.ABC):
         returns:
             str: string associated with the GeographicalArea
         """
-        geo_area_desc = (
-            GeographicalAreaDescription.objects.latest_approved()
-            .filter(described_geographicalarea__area_id=self.reference_document.area_id)
-            .last()
-        )
-        return geo_area_desc.description
+        return self.context.geo_area_description
 
     def commodity_code(self):
         """
@@ -221,25 +177,20 @@ class BaseQuotaDefinitionCheck(BaseCheck, abc.ABC):
         returns:
             GoodsNomenclature or None
         """
-        goods = GoodsNomenclature.objects.latest_approved().filter(
-            Q(
-                valid_between__contains=TaricDateRange(
-                    self.ref_quota_definition.valid_between.lower,
-                    self.ref_quota_definition.valid_between.upper,
-                ),
-            )
-            | Q(
-                valid_between__startswith__lte=self.ref_quota_definition.valid_between.lower,
-                valid_between__endswith=None,
+        valid_between = self.ref_quota_definition.valid_between
+        return next(
+            (
+                good
+                for good in self.context.goods(self.ref_quota_definition.commodity_code)
+                if good.valid_between.contains(valid_between)
+                or (
+                    good.valid_between.lower <= valid_between.lower
+                    and good.valid_between.upper_inf
+                )
             ),
-            item_id=self.ref_quota_definition.commodity_code,
-            suffix=80,
+            None,
         )
 
-        if len(goods) == 0:
-            return None
-        return goods.first()
-
     def quota_definition(self):
         """
         Searches for the quota definition period in TAP of a given preferential
@@ -248,15 +199,10 @@ class BaseQuotaDefinitionCheck(BaseCheck, abc.ABC):
         returns:
             QuotaDefinition or None
         """
-        order_number = self.tap_order_number()
-        try:
-            quota_definition = QuotaDefinition.objects.latest_approved().get(
-                order_number=order_number,
-                valid_between=self.ref_quota_definition.valid_between,
-            )
-        except QuotaDefinition.DoesNotExist:
-            quota_definition = None
-        return quota_definition
+        return self.context.quota_definition(
+            self.tap_order_number(),
+            self.ref_quota_definition.valid_between,
+        )
 
     def measures(self):
         """
@@ -266,21 +212,21 @@ class BaseQuotaDefinitionCheck(BaseCheck, abc.ABC):
         new one was created.
 
         returns:
-            MeasuresQuerySet
-        """
-        measures = (
-            Measure.objects.latest_approved()
-            .filter(
-                valid_between__startswith__lte=self.ref_quota_definition.valid_between.upper,
-                valid_between__endswith__gte=self.ref_quota_definition.valid_between.lower,
-                order_number=self.tap_order_number(),
-                goods_nomenclature=self.commodity_code(),
-                geographical_area__in=self.tap_geo_areas(),
-                measure_type__sid=143,
-            )
-            .order_by("valid_between")
+            list(Measure): the matching measures, ordered by their validity
+        """
+        order_number = self.tap_order_number()
+        geo_areas = {geo_area.pk for geo_area in self.tap_geo_areas()}
+        return self.context.measures_overlapping(
+            (
+                measure
+                for measure in self.context.measures(self.commodity_code())
+                if measure.measure_type.sid == PREFERENTIAL_QUOTA_MEASURE_TYPE_SID
+                and measure.order_number_id
+                == (order_number.pk if order_number else None)
+                and measure.geographical_area_id in geo_areas
+            ),
+            self.ref_quota_definition.valid_between,
         )
-        return measures
 
     def measures_cover_quota_definition_validity_period(self):
         """
@@ -360,24 +306,19 @@ class BaseQuotaDefinitionCheck(BaseCheck, abc.ABC):
         if not tap_main_order_number:
             return None
 
-        try:
-            # QA2 : The sub-quota’s validity period must be entirely enclosed within the validity period of the main quota
-            tap_main_quota_definition = tap_main_order_number.definitions.latest_approved().get(
-                valid_between__startswith__gte=self.ref_quota_definition.ref_order_number.main_order_number.valid_between.lower,
-                valid_between__endswith__lte=self.ref_quota_definition.ref_order_number.main_order_number.valid_between.upper,
-            )
-        except QuotaDefinition.DoesNotExist:
+        # QA2 : The sub-quota’s validity period must be entirely enclosed within the validity period of the main quota
+        main_quota_definitions = self.context.quota_definitions_within(
+            tap_main_order_number,
+            self.ref_order_number.main_order_number.valid_between,
+        )
+        if len(main_quota_definitions) != 1:
             return None
 
-        try:
-            # There should be only one association
-            tap_association = QuotaAssociation.objects.latest_approved().get(
-                sub_quota=tap_sub_quota_definition,
-                main_quota=tap_main_quota_definition,
-            )
-            return tap_association
-        except QuotaAssociation.DoesNotExist:
-            return None
+        # There should be only one association
+        return self.context.quota_association(
+            tap_sub_quota_definition,
+            main_quota_definitions[0],
+        )
 
     def tap_association_exists(self):
         """
@@ -429,7 +370,7 @@ class BaseQuotaDefinitionCheck(BaseCheck, abc.ABC):
 
         duty_sentences = [measure.duty_sentence]
 
-        for condition in measure.conditions.latest_approved():
+        for condition in self.context.conditions(measure):
             duty_sentences.append(condition.duty_sentence)
 
         if self.ref_quota_definition.duty_rate not in duty_sentences:
@@ -449,15 +390,20 @@ class BaseOrderNumberCheck(BaseCheck, abc.ABC):
 
     name = "Base preferential quota order number check"
 
-    def __init__(self, ref_order_number: RefOrderNumber):
+    def __init__(
+        self,
+        ref_order_number: RefOrderNumber,
+        context: Optional[AlignmentCheckContext] = None,
+    ):
         """
         Initialises the check class.
 
         args:
             ref_order_number (RefOrderNumber): The reference document order number
             object we are checking against
+            context (AlignmentCheckContext): Optional preloaded TAP data
         """
-        super().__init__()
+        super().__init__(ref_order_number.reference_document_version, context)
         self.ref_order_number = ref_order_number
         self.reference_document = (
             ref_order_number.reference_document_version.reference_document
@@ -498,15 +444,23 @@ class BaseQuotaSuspensionCheck(BaseCheck, abc.ABC):
     throughout.
     """
 
-    def __init__(self, ref_quota_suspension: RefQuotaSuspension):
+    def __init__(
+        self,
+        ref_quota_suspension: RefQuotaSuspension,
+        context: Optional[AlignmentCheckContext] = None,
+    ):
         """
         Initialises the check class.
 
         args:
             ref_quota_suspension (RefQuotaSuspension): The reference document quota suspension
             object we are checking against
+            context (AlignmentCheckContext): Optional preloaded TAP data
         """
-        super().__init__()
+        super().__init__(
+            ref_quota_suspension.ref_quota_definition.ref_order_number.reference_document_version,
+            context,
+        )
         self.ref_quota_suspension = ref_quota_suspension
         self.reference_document = (
             ref_quota_suspension.ref_quota_definition.ref_order_number.reference_document_version.reference_document
@@ -534,16 +488,10 @@ class BaseQuotaSuspensionCheck(BaseCheck, abc.ABC):
         order_number = (
             self.ref_quota_suspension.ref_quota_definition.ref_order_number.order_number
         )
-
-        try:
-            quota_definition = QuotaDefinition.objects.latest_approved().get(
-                order_number__order_number=order_number,
-                valid_between=self.ref_quota_suspension.ref_quota_definition.valid_between,
-            )
-        except QuotaDefinition.DoesNotExist:
-            quota_definition = None
-
-        return quota_definition
+        return self.context.quota_definition_by_order_number(
+            order_number,
+            self.ref_quota_suspension.ref_quota_definition.valid_between,
+        )
 
     def tap_order_number(self, order_number: str = None):
         """
@@ -567,16 +515,13 @@ class BaseQuotaSuspensionCheck(BaseCheck, abc.ABC):
             QuotaSuspension or None: matching TAP suspension if available, or None if no match.
         """
         quota_definition = self.tap_quota_definition()
-
-        try:
-            suspension = quota_definition.quotasuspension_set.latest_approved().get(
-                valid_between=self.ref_quota_suspension.valid_between,
-            )
-
-        except QuotaSuspension.DoesNotExist:
+        if quota_definition is None:
             return None
 
-        return suspension
+        return self.context.quota_suspension(
+            quota_definition,
+            self.ref_quota_suspension.valid_between,
+        )
 
 
 class BaseRateCheck(BaseCheck, abc.ABC):
@@ -590,15 +535,20 @@ class BaseRateCheck(BaseCheck, abc.ABC):
 
     name = "Base preferential rate check"
 
-    def __init__(self, ref_rate: RefRate):
+    def __init__(
+        self,
+        ref_rate: RefRate,
+        context: Optional[AlignmentCheckContext] = None,
+    ):
         """
         Initialises the check class.
 
         args:
             ref_rate (RefRate): The reference document preferential rate
             object we are checking against
+            context (AlignmentCheckContext): Optional preloaded TAP data
         """
-        super().__init__()
+        super().__init__(ref_rate.reference_document_version, context)
         self.ref_rate = ref_rate
         self.reference_document = ref_rate.reference_document_version.reference_document
 
@@ -640,22 +590,7 @@ class BaseRateCheck(BaseCheck, abc.ABC):
         while item_id[-2:] == "00":
             item_id = item_id[0 : len(item_id) - 2]
 
-        commodities_collection = CommodityCollectionLoader(
-            prefix=item_id,
-        ).load(current_only=True)
-
-        latest_transaction = (
-            Transaction.objects.filter(workbasket__status="PUBLISHED")
-            .order_by("created_at")
-            .last()
-        )
-
-        snapshot = CommodityTreeSnapshot(
-            commodities=commodities_collection.commodities,
-            moment=SnapshotMoment(transaction=latest_transaction),
-        )
-
-        return snapshot
+        return self.context.snapshot(item_id)
 
     def tap_comm_code(self):
         """
@@ -668,21 +603,7 @@ class BaseRateCheck(BaseCheck, abc.ABC):
         if self.ref_rate.valid_between is None:
             return None
 
-        goods = GoodsNomenclature.objects.latest_approved().filter(
-            valid_between__contains=self.ref_rate.valid_between.lower,
-            item_id=self.ref_rate.commodity_code,
-            suffix=80,
-        )
-
-        if self.ref_rate.valid_between.upper:
-            goods = goods.filter(
-                valid_between__contains=self.ref_rate.valid_between.upper,
-            )
-
-        if len(goods) == 0:
-            return None
-
-        return goods.first()
+        return next(iter(self.matching_goods(self.ref_rate.commodity_code)), None)
 
     def tap_geo_area_description(self) -> Optional[str]:
         """
@@ -692,23 +613,7 @@ class BaseRateCheck(BaseCheck, abc.ABC):
         returns:
             string (the description of a geographical area) or None
         """
-        try:
-            geo_area_description = (
-                GeographicalAreaDescription.objects.latest_approved()
-                .filter(
-                    described_geographicalarea__area_id=self.reference_document.area_id,
-                )
-                .last()
-            )
-        except GeographicalAreaDescription.DoesNotExist:
-            return None
-        except AttributeError:
-            return None
-
-        if geo_area_description:
-            return geo_area_description.description
-        else:
-            return None
+        return self.context.geo_area_description
 
     def ref_doc_version_eif_date(self):
         """
@@ -735,65 +640,47 @@ class BaseRateCheck(BaseCheck, abc.ABC):
             comm_code_item_id: string or None, 10 digit item id for a comm code
 
         Returns:
-            TrackedModelQuerySet or [], matching results to the query or an empty list
-            depending on query results
+            list(Measure): the matching measures, which may be empty
         """
         if comm_code_item_id:
-            query = Q(
-                (
-                    Q(
-                        valid_between__contains=self.ref_rate.valid_between.lower,
-                    )
-                ),
-                item_id=comm_code_item_id,
-                suffix=80,
+            goods = self.matching_goods(comm_code_item_id)
+            good = goods[0] if len(goods) == 1 else None
+        else:
+            good = self.tap_comm_code()
+
+        geo_areas = {geo_area.pk for geo_area in self.tap_geo_areas()}
+        return [
+            measure
+            for measure in self.context.measures(good)
+            if measure.measure_type.sid == PREFERENTIAL_RATE_MEASURE_TYPE_SID
+            and measure.geographical_area_id in geo_areas
+            and self.context.valid_on(
+                measure.valid_between,
+                self.ref_rate.valid_between.lower,
+                self.ref_rate.valid_between.upper,
             )
+        ]
 
-            if self.ref_rate.valid_between.upper:
-                query = query & Q(
-                    valid_between__contains=self.ref_rate.valid_between.upper,
-                )
-
-            good = GoodsNomenclature.objects.latest_approved().filter(query)
-
-            if len(good) == 1:
-                query = Q(
-                    valid_between__contains=self.ref_rate.valid_between.lower,
-                    geographical_area__in=self.tap_geo_areas(),
-                    measure_type__sid__in=[
-                        142,
-                    ],
-                )
-
-                if self.ref_rate.valid_between.upper:
-                    query = query & Q(
-                        valid_between__contains=self.ref_rate.valid_between.upper,
-                    )
-
-                return good.first().measures.latest_approved().filter(query)
-            else:
-                return []
-
-        else:
-            tap_comm_code = self.tap_comm_code()
-
-            if tap_comm_code:
-                query = Q(
-                    valid_between__contains=self.ref_rate.valid_between.lower,
-                    geographical_area__in=self.tap_geo_areas(),
-                    measure_type__sid__in=[
-                        142,
-                    ],
-                )
+    def matching_goods(self, item_id: str):
+        """
+        Finds the latest approved versions of a commodity code that are valid
+        throughout the reference document rate.
 
-                if self.ref_rate.valid_between.upper:
-                    query = query & Q(
-                        valid_between__contains=self.ref_rate.valid_between.upper,
-                    )
+        Args:
+            item_id: string, 10 digit item id for a comm code
 
-                return self.tap_comm_code().measures.latest_approved().filter(query)
-            else:
-                return []
+        Returns:
+            list(GoodsNomenclature): matching goods
+        """
+        return [
+            good
+            for good in self.context.goods(item_id)
+            if self.context.valid_on(
+                good.valid_between,
+                self.ref_rate.valid_between.lower,
+                self.ref_rate.valid_between.upper,
+            )
+        ]
 
     def tap_recursive_comm_code_check(
         self,
@@ -1,10 +1,14 @@
 import logging
+from typing import Dict
+from typing import List
+from typing import Optional
 
 from reference_documents.check.base import BaseCheck
 from reference_documents.check.base import BaseOrderNumberCheck
 from reference_documents.check.base import BaseQuotaDefinitionCheck
 from reference_documents.check.base import BaseQuotaSuspensionCheck
 from reference_documents.check.base import BaseRateCheck
+from reference_documents.check.context import AlignmentCheckContext
 from reference_documents.check.ref_order_numbers import OrderNumberChecks  # noqa
 from reference_documents.check.ref_quota_definitions import (  # noqa
     QuotaDefinitionChecks,
@@ -41,13 +45,26 @@ class Checks:
     results are stored against the database and available via the UI under alignment checks.
     """
 
-    def __init__(self, reference_document_version: ReferenceDocumentVersion):
+    work_unit_size = 50
+    """The maximum number of rates or order numbers in a unit of work."""
+
+    result_batch_size = 1000
+    """The number of results saved to the database per query."""
+
+    def __init__(
+        self,
+        reference_document_version: ReferenceDocumentVersion,
+        alignment_report: Optional[AlignmentReport] = None,
+    ):
         self.logger = logger
         self.reference_document_version = reference_document_version
-        self.alignment_report = AlignmentReport.objects.create(
-            reference_document_version=self.reference_document_version,
-            status=AlignmentReportStatus.PENDING,
-        )
+        self.results = []
+        if alignment_report is None:
+            alignment_report = AlignmentReport.objects.create(
+                reference_document_version=self.reference_document_version,
+                status=AlignmentReportStatus.PENDING,
+            )
+        self.alignment_report = alignment_report
 
     @staticmethod
     def get_checks_for(check_class):
@@ -92,58 +109,209 @@ class Checks:
         Returns:
             None
         """
-        # try:
         logger.info("starting alignment check run")
         self.alignment_report.in_processing()
         self.alignment_report.save()
 
-        # Preferential rate checks
-        for ref_rate in self.reference_document_version.ref_rates.all():
-            logger.info(f"starting checks for rate {ref_rate.commodity_code}")
-            for ref_rate_check in Checks.get_checks_for(BaseRateCheck):
-                logger.info(f"starting run: check {ref_rate_check.__class__.__name__}")
-                self.capture_check_result(
-                    ref_rate_check(ref_rate),
-                    ref_rate=ref_rate,
-                    target_start_date=ref_rate.valid_between.lower,
-                )
+        self.run_checks(
+            ref_rates=self.reference_document_version.ref_rates.all(),
+            ref_order_numbers=self.reference_document_version.ref_order_numbers.all(),
+        )
+
+        self.alignment_report.complete()
+        self.alignment_report.save()
+        logger.info("finished alignment check run")
+
+    def work_units(self) -> List[Dict[str, List[int]]]:
+        """
+        Splits the reference document version into units of work that can be
+        checked independently of each other, for example by separate workers.
+
+        Each preferential rate is checked on its own, and each order number is
+        checked together with its quota definitions and suspensions, as those
+        are only checked if the order number passes. Units contain up to
+        ``work_unit_size`` rates or order numbers.
+
+        Returns:
+            list(dict): keyword arguments for :meth:`run_checks_for`
+        """
+        units = []
+        for key, queryset in (
+            ("ref_rate_ids", self.reference_document_version.ref_rates),
+            ("ref_order_number_ids", self.reference_document_version.ref_order_numbers),
+        ):
+            ids = list(queryset.order_by("pk").values_list("pk", flat=True))
+            for index in range(0, len(ids), self.work_unit_size):
+                units.append({key: ids[index : index + self.work_unit_size]})
+        return units
+
+    def run_checks_for(self, ref_rate_ids=(), ref_order_number_ids=()):
+        """
+        Runs the checks for a single unit of work, as returned by
+        :meth:`work_units`.
+
+        Args:
+            ref_rate_ids: list(int): primary keys of RefRates to check
+            ref_order_number_ids: list(int): primary keys of RefOrderNumbers to check
+
+        Returns:
+            None
+        """
+        self.run_checks(
+            ref_rates=self.reference_document_version.ref_rates.filter(
+                pk__in=ref_rate_ids,
+            ),
+            ref_order_numbers=self.reference_document_version.ref_order_numbers.filter(
+                pk__in=ref_order_number_ids,
+            ),
+        )
+
+    def run_checks(self, ref_rates, ref_order_numbers):
+        """
+        Runs checks for the provided preferential rates and order numbers
+        (including the order numbers' quota definitions and suspensions) and
+        saves the results to the database in bulk.
+
+        Args:
+            ref_rates: QuerySet of RefRate to check
+            ref_order_numbers: QuerySet of RefOrderNumber to check
+
+        Returns:
+            None
+        """
+        # Load the TAP data that the checks need once, rather than per check
+        context = AlignmentCheckContext(
+            self.reference_document_version,
+            ref_rates=ref_rates,
+            ref_order_numbers=ref_order_numbers,
+        )
+
+        for ref_rate in ref_rates:
+            self.check_rate(ref_rate, context)
+
+        for ref_order_number in ref_order_numbers:
+            self.check_order_number(ref_order_number, context)
+
+        self.save_results()
+
+    def save_results(self):
+        """
+        Saves the results captured since the last save to the database.
+
+        Returns:
+            None
+        """
+        AlignmentReportCheck.objects.bulk_create(
+            self.results,
+            batch_size=self.result_batch_size,
+        )
+        self.results = []
 
-        # Order number checks
-        for ref_order_number in self.reference_document_version.ref_order_numbers.all():
+    def check_rate(self, ref_rate, context: AlignmentCheckContext):
+        """
+        Runs the preferential rate checks for a single rate.
+
+        Args:
+            ref_rate: RefRate to check
+            context: AlignmentCheckContext to answer the checks from
+
+        Returns:
+            None
+        """
+        logger.info(f"starting checks for rate {ref_rate.commodity_code}")
+        for ref_rate_check in Checks.get_checks_for(BaseRateCheck):
+            logger.info(f"starting run: check {ref_rate_check.__class__.__name__}")
+            self.capture_check_result(
+                ref_rate_check(ref_rate, context),
+                ref_rate=ref_rate,
+                target_start_date=ref_rate.valid_between.lower,
+            )
+
+    def check_order_number(self, ref_order_number, context: AlignmentCheckContext):
+        """
+        Runs the order number checks for a single order number, followed by the
+        checks for its quota definitions and suspensions.
+
+        Args:
+            ref_order_number: RefOrderNumber to check
+            context: AlignmentCheckContext to answer the checks from
+
+        Returns:
+            None
+        """
+        logger.info(
+            f"starting checks for order number {ref_order_number.order_number}",
+        )
+        order_number_check_statuses = []
+        for order_number_check in Checks.get_checks_for(BaseOrderNumberCheck):
             logger.info(
-                f"starting checks for order number {ref_order_number.order_number}",
+                f"starting run: check {order_number_check.__class__.__name__}",
             )
-            order_number_check_statuses = []
-            for order_number_check in Checks.get_checks_for(BaseOrderNumberCheck):
+            order_number_check_statuses.append(
+                self.capture_check_result(
+                    order_number_check(ref_order_number, context),
+                    ref_order_number=ref_order_number,
+                    target_start_date=ref_order_number.valid_between.lower,
+                ),
+            )
+
+            # Quota definition checks
+            for ref_quota_definition in ref_order_number.ref_quota_definitions.all():
                 logger.info(
-                    f"starting run: check {order_number_check.__class__.__name__}",
-                )
-                order_number_check_statuses.append(
-                    self.capture_check_result(
-                        order_number_check(ref_order_number),
-                        ref_order_number=ref_order_number,
-                        target_start_date=ref_order_number.valid_between.lower,
-                    ),
+                    f"starting checks for quota definition {ref_quota_definition.commodity_code} for order number {ref_quota_definition.ref_order_number.order_number}",
                 )
+                pref_quota_check_statuses = []
+                for quota_definition_check in Checks.get_checks_for(
+                    BaseQuotaDefinitionCheck,
+                ):
+                    logger.info(
+                        f"starting run: check {quota_definition_check.__class__.__name__}",
+                    )
+                    pref_quota_check_statuses.append(
+                        self.capture_check_result(
+                            quota_definition_check(ref_quota_definition, context),
+                            ref_quota_definition=ref_quota_definition,
+                            parent_has_failed_or_skipped_result=self.status_contains_failed_or_skipped(
+                                order_number_check_statuses,
+                            ),
+                            target_start_date=ref_quota_definition.valid_between.lower,
+                        ),
+                    )
 
-                # Quota definition checks
+                    # Quota suspension checks
+                    for ref_quota_suspension in RefQuotaSuspension.objects.all().filter(
+                        ref_quota_definition=ref_quota_definition,
+                    ):
+                        logger.info(f"starting checks for quota suspensions")
+                        for quota_suspension_check in Checks.get_checks_for(
+                            BaseQuotaSuspensionCheck,
+                        ):
+                            logger.info(
+                                f"starting run: check {quota_suspension_check.__class__.__name__}",
+                            )
+                            self.capture_check_result(
+                                quota_suspension_check(ref_quota_suspension, context),
+                                ref_quota_suspension=ref_quota_suspension,
+                                parent_has_failed_or_skipped_result=self.status_contains_failed_or_skipped(
+                                    pref_quota_check_statuses,
+                                ),
+                                target_start_date=ref_quota_suspension.valid_between.lower,
+                            )
+            # Quota definition checks (range)
+            for (
+                ref_quota_definition_range
+            ) in ref_order_number.ref_quota_definition_ranges.all():
                 for (
                     ref_quota_definition
-                ) in ref_order_number.ref_quota_definitions.all():
-                    logger.info(
-                        f"starting checks for quota definition {ref_quota_definition.commodity_code} for order number {ref_quota_definition.ref_order_number.order_number}",
-                    )
+                ) in ref_quota_definition_range.dynamic_quota_definitions():
                     pref_quota_check_statuses = []
                     for quota_definition_check in Checks.get_checks_for(
                         BaseQuotaDefinitionCheck,
                     ):
-                        logger.info(
-                            f"starting run: check {quota_definition_check.__class__.__name__}",
-                        )
                         pref_quota_check_statuses.append(
                             self.capture_check_result(
-                                quota_definition_check(ref_quota_definition),
-                                ref_quota_definition=ref_quota_definition,
+                                quota_definition_check(ref_quota_definition, context),
+                                ref_quota_definition_range=ref_quota_definition_range,
                                 parent_has_failed_or_skipped_result=self.status_contains_failed_or_skipped(
                                     order_number_check_statuses,
                                 ),
@@ -151,74 +319,31 @@ class Checks:
                             ),
                         )
 
-                        # Quota suspension checks
-                        for (
-                            ref_quota_suspension
-                        ) in RefQuotaSuspension.objects.all().filter(
-                            ref_quota_definition=ref_quota_definition,
+                        # Quota suspension checks (range)
+                        for quota_suspension_check in Checks.get_checks_for(
+                            BaseQuotaSuspensionCheck,
                         ):
-                            logger.info(f"starting checks for quota suspensions")
-                            for quota_suspension_check in Checks.get_checks_for(
-                                BaseQuotaSuspensionCheck,
-                            ):
-                                logger.info(
-                                    f"starting run: check {quota_suspension_check.__class__.__name__}",
-                                )
-                                self.capture_check_result(
-                                    quota_suspension_check(ref_quota_suspension),
-                                    ref_quota_suspension=ref_quota_suspension,
-                                    parent_has_failed_or_skipped_result=self.status_contains_failed_or_skipped(
-                                        pref_quota_check_statuses,
-                                    ),
-                                    target_start_date=ref_quota_suspension.valid_between.lower,
-                                )
-                # Quota definition checks (range)
-                for (
-                    ref_quota_definition_range
-                ) in ref_order_number.ref_quota_definition_ranges.all():
-                    for (
-                        ref_quota_definition
-                    ) in ref_quota_definition_range.dynamic_quota_definitions():
-                        pref_quota_check_statuses = []
-                        for quota_definition_check in Checks.get_checks_for(
-                            BaseQuotaDefinitionCheck,
-                        ):
-                            pref_quota_check_statuses.append(
-                                self.capture_check_result(
-                                    quota_definition_check(ref_quota_definition),
-                                    ref_quota_definition_range=ref_quota_definition_range,
-                                    parent_has_failed_or_skipped_result=self.status_contains_failed_or_skipped(
-                                        order_number_check_statuses,
-                                    ),
-                                    target_start_date=ref_quota_definition.valid_between.lower,
-                                ),
-                            )
-
-                            # Quota suspension checks (range)
-                            for quota_suspension_check in Checks.get_checks_for(
-                                BaseQuotaSuspensionCheck,
+                            for (
+                                ref_quota_suspension_range
+                            ) in (
+                                ref_quota_definition_range.ref_quota_suspension_ranges.all()
                             ):
                                 for (
-                                    ref_quota_suspension_range
+                                    pref_suspension
                                 ) in (
-                                    ref_quota_definition_range.ref_quota_suspension_ranges.all()
+                                    ref_quota_suspension_range.dynamic_quota_suspensions()
                                 ):
-                                    for (
-                                        pref_suspension
-                                    ) in (
-                                        ref_quota_suspension_range.dynamic_quota_suspensions()
-                                    ):
-                                        self.capture_check_result(
-                                            quota_suspension_check(pref_suspension),
-                                            ref_quota_suspension_range=ref_quota_suspension_range,
-                                            parent_has_failed_or_skipped_result=self.status_contains_failed_or_skipped(
-                                                pref_quota_check_statuses,
-                                            ),
-                                            target_start_date=pref_suspension.valid_between.lower,
-                                        )
-        self.alignment_report.complete()
-        self.alignment_report.save()
-        logger.info("finished alignment check run")
+                                    self.capture_check_result(
+                                        quota_suspension_check(
+                                            pref_suspension,
+                                            context,
+                                        ),
+                                        ref_quota_suspension_range=ref_quota_suspension_range,
+                                        parent_has_failed_or_skipped_result=self.status_contains_failed_or_skipped(
+                                            pref_quota_check_statuses,
+                                        ),
+                                        target_start_date=pref_suspension.valid_between.lower,
+                                    )
 
     def capture_check_result(
         self,
@@ -233,8 +358,8 @@ class Checks:
         target_start_date=None,
     ) -> AlignmentReportCheckStatus:
         """
-        Captures the result if a single check and stores it in the database as a
-        AlignmentReportCheck.
+        Captures the result if a single check as a AlignmentReportCheck, to be
+        stored in the database by :meth:`save_results`.
 
         Args:
             check: Instance if check class BaseCheck or subclass
@@ -270,6 +395,6 @@ class Checks:
             "target_start_date": target_start_date,
         }
 
-        AlignmentReportCheck.objects.create(**kwargs)
+        self.results.append(AlignmentReportCheck(**kwargs))
 
         return status
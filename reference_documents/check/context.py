@@ -0,0 +1,470 @@
+from collections import defaultdict
+from datetime import date
+from datetime import timedelta
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models import QuerySet
+from django.db.models.functions import Left
+
+from commodities.models import GoodsNomenclature
+from commodities.models.dc import CommodityCollectionLoader
+from commodities.models.dc import CommodityTreeSnapshot
+from commodities.models.dc import SnapshotMoment
+from common.models import Transaction
+from common.util import TaricDateRange
+from geo_areas.models import GeographicalArea
+from geo_areas.models import GeographicalAreaDescription
+from geo_areas.models import GeographicalMembership
+from measures.models import Measure
+from measures.models import MeasureCondition
+from quotas.models import QuotaAssociation
+from quotas.models import QuotaDefinition
+from quotas.models import QuotaOrderNumber
+from quotas.models import QuotaSuspension
+from reference_documents.models import ReferenceDocumentVersion
+
+PREFERENTIAL_RATE_MEASURE_TYPE_SID = "142"
+PREFERENTIAL_QUOTA_MEASURE_TYPE_SID = "143"
+
+
+def _range_key(valid_between: TaricDateRange):
+    return valid_between.lower, valid_between.upper
+
+
+class AlignmentCheckContext:
+    """
+    An in-memory index of the TAP data needed to check a reference document
+    version.
+
+    Running every check against the database fires thousands of near-identical
+    queries, as each rate, order number, quota definition and suspension looks
+    up the same goods, measures, geographical areas and quotas. The context
+    instead loads the latest approved versions of that data once, for every
+    commodity heading and order number that the reference document version
+    mentions, and the checks answer their questions from the lookups below.
+
+    Related data is indexed by the version group of the model it belongs to,
+    so that rows pointing at a superseded version of that model are still
+    found.
+
+    The preloaded data can be limited to the rates and order numbers that are
+    about to be checked. Commodities and order numbers outside of those are
+    loaded the first time that they are asked for, so the context always gives
+    the same answers as querying the database directly would.
+    """
+
+    def __init__(
+        self,
+        reference_document_version: ReferenceDocumentVersion,
+        ref_rates: Optional[QuerySet] = None,
+        ref_order_numbers: Optional[QuerySet] = None,
+    ):
+        self.reference_document_version = reference_document_version
+        self.area_id = reference_document_version.reference_document.area_id
+        self.ref_rates = (
+            reference_document_version.ref_rates.all()
+            if ref_rates is None
+            else ref_rates
+        )
+        self.ref_order_numbers = (
+            reference_document_version.ref_order_numbers.all()
+            if ref_order_numbers is None
+            else ref_order_numbers
+        )
+
+        self._goods: Dict[str, List[GoodsNomenclature]] = defaultdict(list)
+        self._measures: Dict[int, List[Measure]] = defaultdict(list)
+        self._conditions: Dict[int, List[MeasureCondition]] = defaultdict(list)
+        self._loaded_headings: Set[str] = set()
+        self._snapshots: Dict[str, CommodityTreeSnapshot] = {}
+        self._geo_areas_cache = {}
+        self._order_numbers: Dict[str, QuotaOrderNumber] = {}
+        self._definitions: Dict[int, List[QuotaDefinition]] = defaultdict(list)
+        self._definitions_by_order_number = {}
+        self._associations = {}
+        self._suspensions = {}
+        self._loaded_order_numbers: Set[str] = set()
+
+        self.load_geo_areas()
+        self.load_order_numbers(self.order_numbers())
+        self.load_headings(self.commodity_codes())
+
+        self.latest_transaction = (
+            Transaction.objects.filter(workbasket__status="PUBLISHED")
+            .order_by("created_at")
+            .last()
+        )
+
+    def commodity_codes(self) -> Set[str]:
+        """Returns the commodity codes of every rate and quota to be checked."""
+        codes = set(self.ref_rates.values_list("commodity_code", flat=True))
+        for ref_order_number in self.ref_order_numbers:
+            codes.update(
+                ref_order_number.ref_quota_definitions.values_list(
+                    "commodity_code",
+                    flat=True,
+                ),
+            )
+            codes.update(
+                ref_order_number.ref_quota_definition_ranges.values_list(
+                    "commodity_code",
+                    flat=True,
+                ),
+            )
+        return codes
+
+    def load_headings(self, commodity_codes: Iterable[str]) -> None:
+        """
+        Loads the goods, measures and measure conditions for every commodity
+        under the four digit headings of the passed commodity codes.
+
+        Whole headings are loaded so that the parents and children of each
+        commodity, which rate checks fall back to, are also available.
+        """
+        headings = {code[:4] for code in commodity_codes} - self._loaded_headings
+        if not headings:
+            return
+        self._loaded_headings.update(headings)
+
+        goods = (
+            GoodsNomenclature.objects.latest_approved()
+            .annotate(heading=Left("item_id", 4))
+            .filter(heading__in=headings, suffix=80)
+            .order_by("pk")
+        )
+        for good in goods:
+            self._goods[good.item_id].append(good)
+
+        measures = (
+            Measure.objects.latest_approved()
+            .filter(
+                goods_nomenclature__version_group__in=goods.values("version_group"),
+                measure_type__sid__in=[
+                    PREFERENTIAL_RATE_MEASURE_TYPE_SID,
+                    PREFERENTIAL_QUOTA_MEASURE_TYPE_SID,
+                ],
+            )
+            .select_related("measure_type")
+            .annotate(goods_version_group_id=F("goods_nomenclature__version_group"))
+            .with_duty_sentence()
+            .order_by("pk")
+        )
+        for measure in measures:
+            self._measures[measure.goods_version_group_id].append(measure)
+
+        conditions = (
+            MeasureCondition.objects.latest_approved()
+            .filter(
+                dependent_measure__version_group__in=measures.values("version_group"),
+            )
+            .annotate(measure_version_group_id=F("dependent_measure__version_group"))
+            .with_duty_sentence()
+            .order_by("pk")
+        )
+        for condition in conditions:
+            self._conditions[condition.measure_version_group_id].append(condition)
+
+    def load_geo_areas(self) -> None:
+        """
+        Loads every geographical area along with the members of each group.
+
+        The areas and memberships are the same for every unit of work that a
+        reference document version's checks are split into, and for every other
+        version, so they are cached keyed on the latest approved transaction.
+        Approving a workbasket changes the key, so the cache never needs to be
+        explicitly invalidated.
+        """
+        latest_approved = Transaction.latest_approved()
+        self._areas, self._members, self._all_members = cache.get_or_set(
+            f"alignment-check-geo-areas:{latest_approved and latest_approved.pk}",
+            self._query_geo_areas,
+            settings.ALIGNMENT_CHECK_CACHE_TIMEOUT,
+        )
+
+        description = (
+            GeographicalAreaDescription.objects.latest_approved()
+            .filter(described_geographicalarea__area_id=self.area_id)
+            .last()
+        )
+        self.geo_area_description = description.description if description else None
+
+    @staticmethod
+    def _query_geo_areas():
+        areas = list(GeographicalArea.objects.latest_approved().order_by("pk"))
+
+        members = defaultdict(list)
+        for group_id, member_id in (
+            GeographicalMembership.objects.latest_approved()
+            .order_by("pk")
+            .values_list("geo_group__version_group", "member__version_group")
+        ):
+            members[group_id].append(member_id)
+
+        # Groups are matched against the members of any version of the group
+        # membership, as well as the latest approved one.
+        all_members = defaultdict(set)
+        for group_id, member_id in GeographicalMembership.objects.values_list(
+            "geo_group__version_group",
+            "member__version_group",
+        ):
+            all_members[group_id].add(member_id)
+
+        return areas, members, all_members
+
+    def order_numbers(self) -> Set[str]:
+        """Returns the order numbers to be checked, along with their main order
+        numbers."""
+        order_numbers = set()
+        for ref_order_number in self.ref_order_numbers.select_related(
+            "main_order_number",
+        ):
+            order_numbers.add(ref_order_number.order_number)
+            if ref_order_number.main_order_number:
+                order_numbers.add(ref_order_number.main_order_number.order_number)
+        return order_numbers
+
+    def load_order_numbers(self, order_numbers: Iterable[str]) -> None:
+        """Loads the passed order numbers along with their definitions,
+        associations and suspensions."""
+        order_numbers = set(order_numbers) - self._loaded_order_numbers
+        if not order_numbers:
+            return
+        self._loaded_order_numbers.update(order_numbers)
+
+        for order_number in (
+            QuotaOrderNumber.objects.latest_approved()
+            .filter(order_number__in=order_numbers)
+            .order_by("pk")
+        ):
+            self._order_numbers.setdefault(order_number.order_number, order_number)
+
+        definitions = (
+            QuotaDefinition.objects.latest_approved()
+            .filter(order_number__order_number__in=order_numbers)
+            .select_related("order_number")
+            .order_by("pk")
+        )
+        for definition in definitions:
+            self._definitions[definition.order_number.version_group_id].append(
+                definition,
+            )
+            self._definitions_by_order_number.setdefault(
+                (
+                    definition.order_number.order_number,
+                    _range_key(definition.valid_between),
+                ),
+                definition,
+            )
+
+        self._associations.update(
+            (
+                (
+                    association.sub_quota_version_group_id,
+                    association.main_quota_version_group_id,
+                ),
+                association,
+            )
+            for association in QuotaAssociation.objects.latest_approved()
+            .filter(sub_quota__version_group__in=definitions.values("version_group"))
+            .annotate(
+                sub_quota_version_group_id=F("sub_quota__version_group"),
+                main_quota_version_group_id=F("main_quota__version_group"),
+            )
+        )
+
+        self._suspensions.update(
+            (
+                (
+                    suspension.definition_version_group_id,
+                    _range_key(suspension.valid_between),
+                ),
+                suspension,
+            )
+            for suspension in QuotaSuspension.objects.latest_approved()
+            .filter(
+                quota_definition__version_group__in=definitions.values(
+                    "version_group",
+                ),
+            )
+            .annotate(definition_version_group_id=F("quota_definition__version_group"))
+            .order_by("-pk")
+        )
+
+    def order_number(self, order_number: str) -> Optional[QuotaOrderNumber]:
+        self.load_order_numbers([order_number])
+        return self._order_numbers.get(order_number)
+
+    def quota_definition(
+        self,
+        order_number: Optional[QuotaOrderNumber],
+        valid_between: TaricDateRange,
+    ) -> Optional[QuotaDefinition]:
+        """Returns the definition of the passed order number with exactly the
+        passed validity."""
+        if order_number is None:
+            return None
+        for definition in self._definitions[order_number.version_group_id]:
+            if _range_key(definition.valid_between) == _range_key(valid_between):
+                return definition
+        return None
+
+    def quota_definition_by_order_number(
+        self,
+        order_number: str,
+        valid_between: TaricDateRange,
+    ) -> Optional[QuotaDefinition]:
+        self.load_order_numbers([order_number])
+        return self._definitions_by_order_number.get(
+            (order_number, _range_key(valid_between)),
+        )
+
+    def quota_definitions_within(
+        self,
+        order_number: QuotaOrderNumber,
+        valid_between: TaricDateRange,
+    ) -> List[QuotaDefinition]:
+        """Returns the definitions of the passed order number that fall entirely
+        within the passed validity."""
+        return [
+            definition
+            for definition in self._definitions[order_number.version_group_id]
+            if definition.valid_between.lower >= valid_between.lower
+            and (
+                valid_between.upper is None
+                or (
+                    definition.valid_between.upper is not None
+                    and definition.valid_between.upper <= valid_between.upper
+                )
+            )
+        ]
+
+    def quota_association(
+        self,
+        sub_quota: Optional[QuotaDefinition],
+        main_quota: QuotaDefinition,
+    ) -> Optional[QuotaAssociation]:
+        if sub_quota is None:
+            return None
+        return self._associations.get(
+            (sub_quota.version_group_id, main_quota.version_group_id),
+        )
+
+    def quota_suspension(
+        self,
+        quota_definition: QuotaDefinition,
+        valid_between: TaricDateRange,
+    ) -> Optional[QuotaSuspension]:
+        return self._suspensions.get(
+            (quota_definition.version_group_id, _range_key(valid_between)),
+        )
+
+    def goods(self, item_id: str) -> List[GoodsNomenclature]:
+        """Returns the latest approved goods with the passed item ID and a
+        suffix of 80."""
+        self.load_headings([item_id])
+        return self._goods.get(item_id, [])
+
+    def measures(
+        self,
+        goods_nomenclature: Optional[GoodsNomenclature],
+    ) -> List[Measure]:
+        """Returns the preferential rate and quota measures on the passed
+        goods."""
+        if goods_nomenclature is None:
+            return []
+        return self._measures.get(goods_nomenclature.version_group_id, [])
+
+    def conditions(self, measure: Measure) -> List[MeasureCondition]:
+        return self._conditions.get(measure.version_group_id, [])
+
+    def geo_areas(self, area_id: str, validity: TaricDateRange):
+        """
+        Returns the geographical area with the passed area ID along with any
+        groups that contain all of its members and are valid throughout the
+        passed validity.
+
+        See :meth:`~reference_documents.check.base.BaseCheck.tap_geo_areas`.
+        """
+        key = (area_id, _range_key(validity))
+        if key not in self._geo_areas_cache:
+            self._geo_areas_cache[key] = self._find_geo_areas(area_id, validity)
+        return list(self._geo_areas_cache[key])
+
+    def _find_geo_areas(self, area_id: str, validity: TaricDateRange):
+        geo_area = next(
+            (
+                area
+                for area in self._areas
+                if area.area_id == area_id and validity.lower in area.valid_between
+            ),
+            None,
+        )
+        if geo_area is None:
+            return []
+
+        geo_areas = [geo_area]
+        if geo_area.is_group():
+            members = set(self._members[geo_area.version_group_id])
+        else:
+            members = {geo_area.version_group_id}
+
+        if members:
+            for group in self._areas:
+                if (
+                    validity.lower in group.valid_between
+                    and (not validity.upper or validity.upper in group.valid_between)
+                    and members <= self._all_members[group.version_group_id]
+                ):
+                    geo_areas.append(group)
+
+        return geo_areas
+
+    def snapshot(self, prefix: str) -> CommodityTreeSnapshot:
+        """Returns a snapshot of the current commodity tree under the passed
+        prefix."""
+        if prefix not in self._snapshots:
+            commodities_collection = CommodityCollectionLoader(
+                prefix=prefix,
+            ).load(current_only=True)
+            self._snapshots[prefix] = CommodityTreeSnapshot(
+                commodities=commodities_collection.commodities,
+                moment=SnapshotMoment(transaction=self.latest_transaction),
+            )
+        return self._snapshots[prefix]
+
+    @staticmethod
+    def measures_overlapping(
+        measures: Iterable[Measure],
+        valid_between: TaricDateRange,
+    ) -> List[Measure]:
+        """
+        Returns the passed measures that overlap the passed validity, ordered by
+        their validity.
+
+        Open-ended measures are excluded, as they are when comparing the end of
+        the measures' validity in the database.
+        """
+        return sorted(
+            (
+                measure
+                for measure in measures
+                if measure.valid_between.lower <= valid_between.upper
+                and measure.valid_between.upper is not None
+                and measure.valid_between.upper + timedelta(days=1)
+                >= valid_between.lower
+            ),
+            key=lambda measure: _range_key(measure.valid_between),
+        )
+
+    @staticmethod
+    def valid_on(valid_between: TaricDateRange, *dates: Optional[date]) -> bool:
+        """Returns True if the passed validity contains all of the passed
+        dates, ignoring any that are None."""
+        return all(day in valid_between for day in dates if day)
@@ -30,7 +30,7 @@ class QuotaDefinitionChecks(BaseQuotaDefinitionCheck):
             return AlignmentReportCheckStatus.FAIL, message
 
         elif not self.duty_rate_matches():
-            measure = self.measures().first()
+            measure = self.measures()[0]
 
             # get all duty sentences
             if measure.duty_sentence != "":
@@ -38,7 +38,7 @@ class QuotaDefinitionChecks(BaseQuotaDefinitionCheck):
             else:
                 duty_sentences = []
 
-            for condition in measure.conditions.latest_approved():
+            for condition in self.context.conditions(measure):
                 if condition.duty_sentence != "":
                     duty_sentences.append(condition.duty_sentence)
 
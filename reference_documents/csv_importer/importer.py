@@ -1,9 +1,11 @@
 import csv
 import re
+from collections import defaultdict
 from datetime import datetime
 from io import StringIO
 from logging import getLogger
 
+from django.db import models
 from django.db import transaction
 
 from common.util import TaricDateRange
@@ -21,8 +23,25 @@ logger = getLogger(__name__)
 
 
 class ReferenceDocumentCSVImporter:
+    """
+    Imports the preferential rates, order numbers and quota definitions in a
+    CSVUpload.
+
+    Each CSV is validated in memory against lookups that are fetched once per
+    import (valid area IDs, reference document versions and the rows that
+    already exist in them), and the new rows are then inserted in batches.
+    """
+
+    batch_size = 1000
+    """The number of rows inserted into the database per query."""
+
     def __init__(self, csv_upload: CSVUpload):
         self.csv_upload = csv_upload
+        self.area_ids = set()
+        self.reference_document_versions = {}
+        self.existing_rates = {}
+        self.existing_order_numbers = {}
+        self.existing_quota_definitions = {}
 
     def run(self):
         """
@@ -121,10 +140,26 @@ class ReferenceDocumentCSVImporter:
 
         return None
 
-    @staticmethod
-    def verify_area_id_exists(area_id):
+    def load_area_ids(self, data):
+        """
+        Fetches the area ids used in the CSV data that exist in the database, so
+        that each row can be verified without a query.
+
+        Args:
+            data: list(dict), key value pairs of data from the CSV rows
+
+        Returns:
+            None
+        """
+        self.area_ids.update(
+            GeographicalArea.objects.latest_approved()
+            .filter(area_id__in={row["area_id"] for row in data})
+            .values_list("area_id", flat=True),
+        )
+
+    def verify_area_id_loaded(self, area_id):
         """
-        Verifies that an area id exists in the database.
+        Verifies that an area id is one of those loaded by load_area_ids.
 
         Args:
             area_id: the area id, e.g. 'JP'
@@ -132,11 +167,7 @@ class ReferenceDocumentCSVImporter:
         Returns:
             None or raises exception
         """
-        if (
-            not GeographicalArea.objects.latest_approved()
-            .filter(area_id=area_id)
-            .exists()
-        ):
+        if area_id not in self.area_ids:
             raise ValueError(f"Area ID does not exist in TAP data: {area_id}")
 
     def verify_comm_code(self, comm_code):
@@ -159,6 +190,98 @@ class ReferenceDocumentCSVImporter:
                 f"{comm_code} is not a valid comm code, it should be 10 characters long",
             )
 
+    @staticmethod
+    def parse_date(value):
+        """
+        Parses a date from the CSV data.
+
+        Args:
+            value: the date as a string in the format YYYY-MM-DD, or empty
+
+        Returns:
+            date, or None if the value is empty
+        """
+        if value == "":
+            return None
+        return datetime(*[int(x) for x in value.split("-")]).date()
+
+    @staticmethod
+    def verify_date(value):
+        """
+        Verifies that a date from the CSV data is valid, in the same way as when
+        it is used in a database lookup.
+
+        Args:
+            value: the date as a string in the format YYYY-MM-DD
+
+        Returns:
+            None or raises exception
+        """
+        models.DateField().to_python(value)
+
+    def get_existing_rates(self, reference_document_version):
+        """
+        Returns the commodity codes and start dates of the preferential rates
+        in a reference document version, fetching them on first use.
+
+        Args:
+            reference_document_version: ReferenceDocumentVersion
+
+        Returns:
+            set(tuple(str, date))
+        """
+        if reference_document_version.pk not in self.existing_rates:
+            self.existing_rates[reference_document_version.pk] = {
+                (commodity_code, valid_between.lower)
+                for commodity_code, valid_between in reference_document_version.ref_rates.values_list(
+                    "commodity_code",
+                    "valid_between",
+                )
+            }
+        return self.existing_rates[reference_document_version.pk]
+
+    def get_existing_order_numbers(self, reference_document_version):
+        """
+        Returns the order numbers in a reference document version, fetching
+        them on first use.
+
+        Args:
+            reference_document_version: ReferenceDocumentVersion
+
+        Returns:
+            dict(str, list(RefOrderNumber)): order numbers in primary key order
+        """
+        if reference_document_version.pk not in self.existing_order_numbers:
+            order_numbers = defaultdict(list)
+            ref_order_numbers = reference_document_version.ref_order_numbers
+            for ref_order_number in ref_order_numbers.order_by("pk"):
+                order_numbers[ref_order_number.order_number].append(ref_order_number)
+            self.existing_order_numbers[reference_document_version.pk] = order_numbers
+        return self.existing_order_numbers[reference_document_version.pk]
+
+    def get_existing_quota_definitions(self, reference_document_version):
+        """
+        Returns the commodity codes, order numbers and start dates of the quota
+        definitions in a reference document version, fetching them on first
+        use.
+
+        Args:
+            reference_document_version: ReferenceDocumentVersion
+
+        Returns:
+            set(tuple(str, str, date))
+        """
+        if reference_document_version.pk not in self.existing_quota_definitions:
+            self.existing_quota_definitions[reference_document_version.pk] = {
+                (commodity_code, order_number, valid_between.lower)
+                for commodity_code, order_number, valid_between in reference_document_version.ref_quota_definitions().values_list(
+                    "commodity_code",
+                    "ref_order_number__order_number",
+                    "valid_between",
+                )
+            }
+        return self.existing_quota_definitions[reference_document_version.pk]
+
     def import_preferential_rates_csv_data(self):
         """
         Imports preferential rates data from CSV files.
@@ -187,48 +310,61 @@ class ReferenceDocumentCSVImporter:
                     f"CSV data for preferential rates missing header {header}",
                 )
 
+        self.load_area_ids(data)
+        ref_rates = []
         for row in data:
-            self.verify_area_id_exists(row["area_id"])
+            self.verify_area_id_loaded(row["area_id"])
             self.verify_comm_code(row["comm_code"])
             reference_document_version = self.get_or_create_reference_document_version(
                 row,
             )
+            self.verify_date(row["validity_start"])
 
-            # check if data row exists, use comm code and start date
-            matching_row = reference_document_version.ref_rates.filter(
-                commodity_code=row["comm_code"],
-                valid_between__startswith=row["validity_start"],
-            )
-
-            start_date = datetime(
-                *[int(x) for x in row["validity_start"].split("-")],
-            ).date()
-            end_date = row["validity_end"]
-
-            if end_date == "":
-                end_date = None
-            else:
-                end_date = datetime(
-                    *[int(x) for x in row["validity_end"].split("-")],
-                ).date()
+            start_date = self.parse_date(row["validity_start"])
+            end_date = self.parse_date(row["validity_end"])
 
-            if matching_row.exists():
+            # check if data row exists, use comm code and start date
+            existing_rates = self.get_existing_rates(reference_document_version)
+            if (row["comm_code"], start_date) in existing_rates:
                 raise Exception(
                     f"Preferential Rate already exists, details : {row}, matched on commodity_code and start_date.",
                 )
-            else:
-                RefRate.objects.create(
+
+            existing_rates.add((row["comm_code"], start_date))
+            ref_rates.append(
+                RefRate(
                     reference_document_version=reference_document_version,
                     commodity_code=row["comm_code"],
                     duty_rate=row["rate"],
                     valid_between=TaricDateRange(start_date, end_date),
-                )
+                ),
+            )
+
+        RefRate.objects.bulk_create(ref_rates, batch_size=self.batch_size)
         logger.info(f" -- COMPLETED IMPORTING PREFERENTIAL RATES : count: {len(data)}")
 
     def get_or_create_reference_document_version(self, row):
         """
         Gets or creates the reference document version based on the CSV row.
 
+        Args:
+            row: dict, key value pairs of data from the CSV row
+
+        Returns:
+            ReferenceDocumentVersion or raises exception
+        """
+        key = (row["area_id"], float(row["document_version"]))
+        if key not in self.reference_document_versions:
+            self.reference_document_versions[key] = (
+                self.find_or_create_reference_document_version(row)
+            )
+        return self.reference_document_versions[key]
+
+    def find_or_create_reference_document_version(self, row):
+        """
+        Finds or creates the reference document version based on the CSV row,
+        without using the versions already found during the import.
+
         Args:
             row: dict, key value pairs of data from the CSV row
 
@@ -293,20 +429,41 @@ class ReferenceDocumentCSVImporter:
             if header not in data[0].keys():
                 raise ValueError(f"CSV data for order numbers missing header {header}")
 
+        self.load_area_ids(data)
+        ref_order_numbers = []
+
         # only ones without parents
         for row in data:
-            self.verify_area_id_exists(row["area_id"])
+            self.verify_area_id_loaded(row["area_id"])
 
             if row["parent_order_number"] != "":
                 continue
-            self.process_order_number(row)
+            ref_order_numbers.append(self.process_order_number(row))
 
         # process order numbers with parents
         for row in data:
             if row["parent_order_number"] == "":
                 continue
 
-            self.process_order_number(row)
+            ref_order_numbers.append(self.process_order_number(row))
+
+        # Order numbers can only be saved once their parent has been saved, so
+        # save each level of the hierarchy in turn.
+        while ref_order_numbers:
+            RefOrderNumber.objects.bulk_create(
+                [
+                    ref_order_number
+                    for ref_order_number in ref_order_numbers
+                    if ref_order_number.main_order_number is None
+                    or ref_order_number.main_order_number.pk
+                ],
+                batch_size=self.batch_size,
+            )
+            ref_order_numbers = [
+                ref_order_number
+                for ref_order_number in ref_order_numbers
+                if ref_order_number.pk is None
+            ]
         logger.info(f" -- COMPLETED IMPORTING ORDER NUMBERS : count: {len(data)}")
 
     def process_order_number(self, row):
@@ -317,25 +474,19 @@ class ReferenceDocumentCSVImporter:
             row: dict, key value pairs of data from the CSV row
 
         Returns:
-            None or raises exception
+            RefOrderNumber, not yet saved to the database, or raises exception
         """
         reference_document_version = self.get_or_create_reference_document_version(row)
-        start_date = datetime(
-            *[int(x) for x in row["validity_start"].split("-")],
-        ).date()
-        end_date = row["validity_end"]
-        if end_date == "":
-            end_date = None
-        else:
-            end_date = datetime(
-                *[int(x) for x in row["validity_end"].split("-")],
-            ).date()
+        start_date = self.parse_date(row["validity_start"])
+        end_date = self.parse_date(row["validity_end"])
         # check if data row exists, use comm code and start date
-        matching_row = reference_document_version.ref_order_numbers.filter(
-            order_number=row["order_number"],
-            valid_between__startswith=row["validity_start"],
+        existing_order_numbers = self.get_existing_order_numbers(
+            reference_document_version,
         )
-        if matching_row.exists():
+        if any(
+            ref_order_number.valid_between.lower == start_date
+            for ref_order_number in existing_order_numbers[row["order_number"]]
+        ):
             raise Exception(
                 f"Order Number already exists, details : {row}, matched on order number and start_date.",
             )
@@ -350,13 +501,8 @@ class ReferenceDocumentCSVImporter:
             if parent_order_number == "":
                 parent_order_number = None
             else:
-                parent_order_number_query = (
-                    reference_document_version.ref_order_numbers.filter(
-                        order_number=parent_order_number,
-                    )
-                )
-                if parent_order_number_query.exists():
-                    parent_order_number = parent_order_number_query.first()
+                if existing_order_numbers[parent_order_number]:
+                    parent_order_number = existing_order_numbers[parent_order_number][0]
                 else:
                     raise Exception(
                         f"Parent Order Number {parent_order_number} does not exist.",
@@ -365,7 +511,7 @@ class ReferenceDocumentCSVImporter:
             if relationship_type == "":
                 relationship_type = None
 
-            RefOrderNumber.objects.create(
+            ref_order_number = RefOrderNumber(
                 reference_document_version=reference_document_version,
                 order_number=row["order_number"],
                 valid_between=TaricDateRange(start_date, end_date),
@@ -373,6 +519,8 @@ class ReferenceDocumentCSVImporter:
                 main_order_number=parent_order_number,
                 relation_type=relationship_type,
             )
+            existing_order_numbers[row["order_number"]].append(ref_order_number)
+            return ref_order_number
 
     def import_quota_definition_csv_data(self):
         """
@@ -404,55 +552,55 @@ class ReferenceDocumentCSVImporter:
                     f"CSV data for quota definitions missing header {header}",
                 )
 
+        self.load_area_ids(data)
+        ref_quota_definitions = []
         for row in data:
-            self.verify_area_id_exists(row["area_id"])
+            self.verify_area_id_loaded(row["area_id"])
             self.verify_comm_code(row["comm_code"])
             reference_document_version = self.get_or_create_reference_document_version(
                 row,
             )
+            self.verify_date(row["validity_start"])
 
-            # check if data row exists, use comm code and start date
-            matching_row = reference_document_version.ref_quota_definitions().filter(
-                commodity_code=row["comm_code"],
-                ref_order_number__order_number=row["order_number"],
-                valid_between__startswith=row["validity_start"],
-            )
-
-            start_date = datetime(
-                *[int(x) for x in row["validity_start"].split("-")],
-            ).date()
-            end_date = row["validity_end"]
+            start_date = self.parse_date(row["validity_start"])
+            end_date = self.parse_date(row["validity_end"])
 
-            if end_date == "":
-                end_date = None
-            else:
-                end_date = datetime(
-                    *[int(x) for x in row["validity_end"].split("-")],
-                ).date()
-
-            order_number = reference_document_version.ref_order_numbers.filter(
-                order_number=row["order_number"],
-            )
+            order_numbers = self.get_existing_order_numbers(
+                reference_document_version,
+            )[row["order_number"]]
 
-            if not order_number.exists():
+            if not order_numbers:
                 raise Exception(f'Order Number {row["order_number"]} does not exist.')
 
             volume = float(row["initial_volume"])
             measurement = row["measurement"]
 
-            if matching_row.exists():
+            # check if data row exists, use comm code and start date
+            existing_quota_definitions = self.get_existing_quota_definitions(
+                reference_document_version,
+            )
+            key = (row["comm_code"], row["order_number"], start_date)
+            if key in existing_quota_definitions:
                 raise Exception(
                     f"Quota Definition already exists, details : {row}, matched on commodity_code, order number and start_date.",
                 )
-            else:
-                RefQuotaDefinition.objects.create(
+
+            existing_quota_definitions.add(key)
+            ref_quota_definitions.append(
+                RefQuotaDefinition(
                     commodity_code=row["comm_code"],
                     duty_rate=row["duty_rate"],
                     valid_between=TaricDateRange(start_date, end_date),
-                    ref_order_number=order_number.first(),
+                    ref_order_number=order_numbers[0],
                     volume=volume,
                     measurement=measurement,
-                )
+                ),
+            )
+
+        RefQuotaDefinition.objects.bulk_create(
+            ref_quota_definitions,
+            batch_size=self.batch_size,
+        )
         logger.info(f" -- COMPLETED IMPORTING QUOTA DEFINITIONS : count: {len(data)}")
 
     def get_dictionary_from_csv_data(self, string):
@@ -1,16 +1,22 @@
 from logging import getLogger
+from typing import List
+
+from celery import group
 
 from common.celery import app
 from reference_documents.check.check_runner import Checks
 from reference_documents.csv_importer.importer import ReferenceDocumentCSVImporter
+from reference_documents.models import AlignmentReport
 from reference_documents.models import CSVUpload
 from reference_documents.models import ReferenceDocumentVersion
+from reference_documents.models import ReferenceDocumentVersionStatus
 
 logger = getLogger(__name__)
 
 
-@app.task
+@app.task(bind=True)
 def run_alignment_check(
+    self,
     reference_document_version_id: int,
 ):
     """
@@ -18,6 +24,10 @@ def run_alignment_check(
 
     The task executes alignment checks against a reference document version and
     records the results in the TAP database for later review.
+
+    The reference document version is split into units of work which are
+    checked in parallel by :func:`run_alignment_check_unit` tasks, after which
+    :func:`complete_alignment_check` marks the alignment report as complete.
     """
 
     logger.info(
@@ -35,10 +45,74 @@ def run_alignment_check(
     )
 
     check_runner = Checks(ref_doc_ver)
-    check_runner.run()
+    alignment_report = check_runner.alignment_report
+    alignment_report.in_processing()
+    alignment_report.save()
+
+    work_units = check_runner.work_units()
+    if not work_units:
+        return complete_alignment_check(alignment_report.pk)
+
+    # Create a workflow: firstly check all of the units of work (in parallel)
+    # and then once they are all done mark the alignment report as complete.
+    workflow = group(
+        run_alignment_check_unit.si(alignment_report.pk, **work_unit)
+        for work_unit in work_units
+    ) | complete_alignment_check.si(alignment_report.pk)
+
+    # Execute the workflow by replacing this task with it.
+    return self.replace(workflow)
+
+
+@app.task
+def run_alignment_check_unit(
+    alignment_report_id: int,
+    ref_rate_ids: List[int] = (),
+    ref_order_number_ids: List[int] = (),
+):
+    """Task for checking a single unit of work within a reference document
+    version, as returned by :meth:`Checks.work_units`, recording the results
+    against the passed alignment report."""
+
+    alignment_report = AlignmentReport.objects.get(pk=alignment_report_id)
+    check_runner = Checks(
+        alignment_report.reference_document_version,
+        alignment_report=alignment_report,
+    )
+    check_runner.run_checks_for(
+        ref_rate_ids=ref_rate_ids,
+        ref_order_number_ids=ref_order_number_ids,
+    )
+
+
+@app.task
+def complete_alignment_check(alignment_report_id: int):
+    """Task for marking an alignment report as complete once all of its checks
+    have been run."""
+
+    alignment_report = AlignmentReport.objects.get(pk=alignment_report_id)
+    alignment_report.complete()
+    alignment_report.save()
 
     logger.info(
-        f"COMPLETED ALIGNMENT CHECKS : ReferenceDocumentVersion: {reference_document_version_id}",
+        f"COMPLETED ALIGNMENT CHECKS : ReferenceDocumentVersion: {alignment_report.reference_document_version_id}",
+    )
+
+
+@app.task(bind=True)
+def run_all_alignment_checks(self):
+    """Task for running alignment checks against every published reference
+    document version, in parallel."""
+
+    reference_document_version_ids = ReferenceDocumentVersion.objects.filter(
+        status=ReferenceDocumentVersionStatus.PUBLISHED,
+    ).values_list("pk", flat=True)
+
+    return self.replace(
+        group(
+            run_alignment_check.si(reference_document_version_id)
+            for reference_document_version_id in reference_document_version_ids
+        ),
     )
 
 
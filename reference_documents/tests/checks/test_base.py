@@ -23,6 +23,7 @@ from reference_documents.check.base import BaseOrderNumberCheck
 from reference_documents.check.base import BaseQuotaDefinitionCheck
 from reference_documents.check.base import BaseQuotaSuspensionCheck
 from reference_documents.check.base import BaseRateCheck
+from reference_documents.check.context import AlignmentCheckContext
 from reference_documents.models import AlignmentReportCheckStatus
 from reference_documents.tests import factories
 
@@ -50,10 +51,30 @@ class TestBaseCheck:
             def get_validity(self):
                 pass
 
-        target = Target()
+        target = Target(factories.ReferenceDocumentVersionFactory.create())
 
         assert target.run_check() is None
 
+    def test_init_builds_context(self):
+        class Target(BaseCheck):
+            def run_check(self):
+                pass
+
+            def get_area_id(self):
+                pass
+
+            def get_validity(self):
+                pass
+
+        reference_document_version = factories.ReferenceDocumentVersionFactory.create()
+        target = Target(reference_document_version)
+
+        assert isinstance(target.context, AlignmentCheckContext)
+        assert target.context.reference_document_version == reference_document_version
+
+        context = AlignmentCheckContext(reference_document_version)
+        assert Target(reference_document_version, context).context is context
+
 
 @pytest.mark.reference_documents
 class TestBaseQuotaDefinitionCheck:
@@ -199,3 +199,34 @@ class TestChecks:
         assert target.status_contains_failed_or_skipped(statuses_with_skipped) is True
         assert target.status_contains_failed_or_skipped(statuses_with_failed) is True
         assert target.status_contains_failed_or_skipped(statuses_all_pass) is False
+
+    def test_work_units(self):
+        ref_doc_ver = self.data_setup_for_test_run()
+        factories.RefRateFactory.create_batch(2, reference_document_version=ref_doc_ver)
+        target = self.target_class(ref_doc_ver)
+        target.work_unit_size = 2
+
+        ref_rate_ids = list(
+            ref_doc_ver.ref_rates.order_by("pk").values_list("pk", flat=True),
+        )
+        assert target.work_units() == [
+            {"ref_rate_ids": ref_rate_ids[:2]},
+            {"ref_rate_ids": ref_rate_ids[2:]},
+            {
+                "ref_order_number_ids": list(
+                    ref_doc_ver.ref_order_numbers.values_list("pk", flat=True),
+                ),
+            },
+        ]
+
+    def test_run_checks_for_saves_results(self):
+        ref_doc_ver = self.data_setup_for_test_run()
+        target = self.target_class(ref_doc_ver)
+        ref_rate = ref_doc_ver.ref_rates.get()
+
+        target.run_checks_for(ref_rate_ids=[ref_rate.pk])
+
+        assert target.results == []
+        check = target.alignment_report.alignment_report_checks.get()
+        assert check.ref_rate == ref_rate
+        assert check.check_name == RateChecks.name
@@ -0,0 +1,188 @@
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from common.tests.factories import GeographicalAreaFactory
+from common.tests.factories import GeographicalMembershipFactory
+from common.tests.factories import GeoGroupFactory
+from common.tests.factories import GoodsNomenclatureFactory
+from common.tests.factories import MeasureConditionFactory
+from common.tests.factories import MeasureFactory
+from common.tests.factories import QuotaDefinitionFactory
+from common.tests.factories import QuotaSuspensionFactory
+from common.util import TaricDateRange
+from reference_documents.check.context import AlignmentCheckContext
+from reference_documents.check.ref_quota_definitions import QuotaDefinitionChecks
+from reference_documents.check.ref_quota_suspensions import QuotaSuspensionChecks
+from reference_documents.check.ref_rates import RateChecks
+from reference_documents.tests import factories
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def valid_between():
+    return TaricDateRange(date(2020, 1, 1), date(2020, 12, 31))
+
+
+@pytest.fixture
+def ref_doc_ver():
+    return factories.ReferenceDocumentVersionFactory.create(
+        reference_document__area_id="ZZ",
+    )
+
+
+@pytest.mark.reference_documents
+class TestAlignmentCheckContext:
+    def test_rate_checks_match_data_loaded_on_demand(self, ref_doc_ver, valid_between):
+        ref_rate = factories.RefRateFactory.create(
+            reference_document_version=ref_doc_ver,
+            valid_between=valid_between,
+        )
+        goods = GoodsNomenclatureFactory.create(
+            item_id=ref_rate.commodity_code,
+            valid_between=valid_between,
+        )
+        MeasureFactory.create(
+            measure_type__sid=142,
+            valid_between=valid_between,
+            goods_nomenclature=goods,
+            geographical_area__area_id="ZZ",
+            geographical_area__valid_between=TaricDateRange(date(2000, 1, 1)),
+        )
+
+        context = AlignmentCheckContext(ref_doc_ver)
+        preloaded = RateChecks(ref_rate, context)
+        on_demand = RateChecks(ref_rate)
+
+        assert preloaded.tap_comm_code() == goods
+        assert preloaded.tap_geo_areas() == on_demand.tap_geo_areas()
+        assert preloaded.tap_related_measures() == on_demand.tap_related_measures()
+        assert preloaded.run_check() == on_demand.run_check()
+
+    def test_quota_checks_match_data_loaded_on_demand(self, ref_doc_ver, valid_between):
+        ref_order_number = factories.RefOrderNumberFactory.create(
+            reference_document_version=ref_doc_ver,
+            valid_between=valid_between,
+        )
+        ref_quota_definition = factories.RefQuotaDefinitionFactory.create(
+            ref_order_number=ref_order_number,
+            valid_between=valid_between,
+        )
+        ref_quota_suspension = factories.RefQuotaSuspensionFactory.create(
+            ref_quota_definition=ref_quota_definition,
+            valid_between=valid_between,
+        )
+        quota_definition = QuotaDefinitionFactory.create(
+            order_number__order_number=ref_order_number.order_number,
+            valid_between=valid_between,
+        )
+        QuotaSuspensionFactory.create(
+            quota_definition=quota_definition,
+            valid_between=valid_between,
+        )
+        MeasureFactory.create(
+            geographical_area__area_id="ZZ",
+            goods_nomenclature__item_id=ref_quota_definition.commodity_code,
+            goods_nomenclature__suffix=80,
+            goods_nomenclature__valid_between=TaricDateRange(date(2000, 1, 1)),
+            measure_type__sid=143,
+            order_number=quota_definition.order_number,
+            valid_between=valid_between,
+        )
+
+        context = AlignmentCheckContext(ref_doc_ver)
+        preloaded = QuotaDefinitionChecks(ref_quota_definition, context)
+        on_demand = QuotaDefinitionChecks(ref_quota_definition)
+
+        assert preloaded.quota_definition() == quota_definition
+        assert preloaded.measures() == on_demand.measures()
+        assert preloaded.run_check() == on_demand.run_check()
+
+        suspension_check = QuotaSuspensionChecks(ref_quota_suspension, context)
+        assert (
+            suspension_check.tap_suspension()
+            == QuotaSuspensionChecks(ref_quota_suspension).tap_suspension()
+        )
+
+    def test_geo_areas_include_groups_containing_members(
+        self,
+        ref_doc_ver,
+        valid_between,
+    ):
+        area = GeographicalAreaFactory.create(
+            area_id="ZZ",
+            valid_between=TaricDateRange(date(2000, 1, 1)),
+        )
+        group = GeoGroupFactory.create(valid_between=TaricDateRange(date(2000, 1, 1)))
+        GeographicalMembershipFactory.create(geo_group=group, member=area)
+        ref_rate = factories.RefRateFactory.create(
+            reference_document_version=ref_doc_ver,
+            valid_between=valid_between,
+        )
+
+        context = AlignmentCheckContext(ref_doc_ver)
+
+        assert RateChecks(ref_rate, context).tap_geo_areas() == [area, group]
+        assert RateChecks(ref_rate).tap_geo_areas() == [area, group]
+
+    def test_goods_outside_preloaded_headings_are_loaded(self, ref_doc_ver):
+        context = AlignmentCheckContext(ref_doc_ver)
+        goods = GoodsNomenclatureFactory.create(item_id="9999990000")
+
+        assert context.goods("9999990000") == [goods]
+
+    def test_related_data_on_superseded_versions_is_found(self, ref_doc_ver):
+        goods = GoodsNomenclatureFactory.create(item_id="0101010000", suffix=80)
+        measure = MeasureFactory.create(goods_nomenclature=goods, measure_type__sid=142)
+        condition = MeasureConditionFactory.create(dependent_measure=measure)
+        workbasket = goods.transaction.workbasket
+        new_goods = goods.new_version(workbasket)
+        new_measure = measure.new_version(workbasket)
+
+        context = AlignmentCheckContext(ref_doc_ver)
+
+        assert context.goods("0101010000") == [new_goods]
+        assert context.measures(new_goods) == [new_measure]
+        assert context.conditions(new_measure) == [condition]
+
+    def test_geo_areas_include_groups_of_superseded_versions(
+        self,
+        ref_doc_ver,
+        valid_between,
+    ):
+        area = GeographicalAreaFactory.create(
+            area_id="ZZ",
+            valid_between=TaricDateRange(date(2000, 1, 1)),
+        )
+        group = GeoGroupFactory.create(valid_between=TaricDateRange(date(2000, 1, 1)))
+        GeographicalMembershipFactory.create(geo_group=group, member=area)
+        new_area = area.new_version(area.transaction.workbasket)
+        new_group = group.new_version(group.transaction.workbasket)
+        ref_rate = factories.RefRateFactory.create(
+            reference_document_version=ref_doc_ver,
+            valid_between=valid_between,
+        )
+
+        context = AlignmentCheckContext(ref_doc_ver)
+
+        assert RateChecks(ref_rate, context).tap_geo_areas() == [new_area, new_group]
+
+    def test_geo_areas_are_loaded_once_per_approved_transaction(self, ref_doc_ver):
+        cache.clear()
+        with patch.object(
+            AlignmentCheckContext,
+            "_query_geo_areas",
+            wraps=AlignmentCheckContext._query_geo_areas,
+        ) as query_geo_areas:
+            AlignmentCheckContext(ref_doc_ver)
+            AlignmentCheckContext(ref_doc_ver)
+            assert query_geo_areas.call_count == 1
+
+            area = GeographicalAreaFactory.create(area_id="ZZ")
+            context = AlignmentCheckContext(ref_doc_ver)
+            assert query_geo_areas.call_count == 2
+
+        assert area in context._areas
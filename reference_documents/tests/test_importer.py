@@ -322,3 +322,59 @@ class TestReferenceDocumentCSVImporter:
             csv_upload.error_details
             == "Exception:Reference document version NZ:1.0 has status PUBLISHED and can not be altered."
         )
+
+    def test_imports_nested_order_numbers(self):
+        csv_upload = CSVUploadFactory.create(
+            order_number_csv_data="""order_number,validity_start,validity_end,parent_order_number,coefficient,relationship_type,area_id,document_version,
+059002,2023-01-01,,059001,1.3,EQ,NZ,1.0
+059003,2023-01-01,,059002,1.3,EQ,NZ,1.0
+059001,2023-01-01,,,,,NZ,1.0""",
+        )
+        GeographicalAreaFactory.create(area_id="NZ")
+        target = ReferenceDocumentCSVImporter(csv_upload)
+        target.run()
+
+        assert csv_upload.status == ReferenceDocumentCsvUploadStatus.COMPLETE
+        ref_doc_ver = target.reference_document_versions[("NZ", 1.0)]
+        assert (
+            ref_doc_ver.ref_order_numbers.get(
+                order_number="059003",
+            ).main_order_number.main_order_number.order_number
+            == "059001"
+        )
+
+    def test_fails_when_preferential_rate_duplicated_in_csv_data(self):
+        csv_upload = CSVUploadFactory.create(
+            preferential_rates_csv_data="""comm_code,rate,validity_start,validity_end,area_id,document_version
+0100000000,0.00%,2024-01-01,,NZ,1.0
+0100000000,5.00%,2024-01-01,,NZ,1.0""",
+        )
+        GeographicalAreaFactory.create(area_id="NZ")
+        target = ReferenceDocumentCSVImporter(csv_upload)
+        target.run()
+
+        assert csv_upload.status == ReferenceDocumentCsvUploadStatus.ERRORED
+        assert csv_upload.error_details.startswith(
+            "Exception:Preferential Rate already exists",
+        )
+        assert not target.reference_document_versions[("NZ", 1.0)].ref_rates.exists()
+
+    def test_number_of_queries_does_not_depend_on_number_of_rows(
+        self,
+        django_assert_max_num_queries,
+    ):
+        rows = "\n".join(
+            f"{index:010},0.00%,2024-01-01,,NZ,1.0" for index in range(1, 501)
+        )
+        csv_upload = CSVUploadFactory.create(
+            preferential_rates_csv_data="comm_code,rate,validity_start,validity_end,area_id,document_version\n"
+            + rows,
+        )
+        GeographicalAreaFactory.create(area_id="NZ")
+        target = ReferenceDocumentCSVImporter(csv_upload)
+
+        with django_assert_max_num_queries(20):
+            target.run()
+
+        assert csv_upload.status == ReferenceDocumentCsvUploadStatus.COMPLETE
+        assert target.reference_document_versions[("NZ", 1.0)].ref_rates.count() == 500
@@ -0,0 +1,75 @@
+from unittest import mock
+
+import pytest
+
+from reference_documents import tasks
+from reference_documents.models import AlignmentReportStatus
+from reference_documents.models import ReferenceDocumentVersionStatus
+from reference_documents.tests import factories
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.reference_documents
+def test_run_alignment_check():
+    ref_doc_ver = factories.ReferenceDocumentVersionFactory.create()
+    ref_rates = factories.RefRateFactory.create_batch(
+        3,
+        reference_document_version=ref_doc_ver,
+    )
+    factories.RefOrderNumberFactory.create(reference_document_version=ref_doc_ver)
+
+    # The task will replace itself with a new workflow, so capture the workflow
+    # and run its tasks directly.
+    with mock.patch("celery.app.task.Task.replace", new=lambda _, t: t):
+        workflow = tasks.run_alignment_check(ref_doc_ver.pk)  # type: ignore
+
+    alignment_report = ref_doc_ver.alignment_reports.get()
+    assert alignment_report.status == AlignmentReportStatus.PROCESSING
+
+    assert len(workflow.tasks) == 2
+    for task in workflow.tasks:
+        assert task.task == tasks.run_alignment_check_unit.name
+        assert task.args == (alignment_report.pk,)
+        tasks.run_alignment_check_unit(*task.args, **task.kwargs)
+
+    assert workflow.body.task == tasks.complete_alignment_check.name
+    tasks.complete_alignment_check(*workflow.body.args)
+
+    alignment_report.refresh_from_db()
+    assert alignment_report.status == AlignmentReportStatus.COMPLETE
+    assert alignment_report.alignment_report_checks.filter(
+        ref_rate__isnull=False,
+    ).count() == len(ref_rates)
+    assert alignment_report.alignment_report_checks.filter(
+        ref_order_number__isnull=False,
+    ).exists()
+
+
+@pytest.mark.reference_documents
+def test_run_alignment_check_without_data():
+    ref_doc_ver = factories.ReferenceDocumentVersionFactory.create()
+
+    tasks.run_alignment_check(ref_doc_ver.pk)
+
+    alignment_report = ref_doc_ver.alignment_reports.get()
+    assert alignment_report.status == AlignmentReportStatus.COMPLETE
+    assert not alignment_report.alignment_report_checks.exists()
+
+
+@pytest.mark.reference_documents
+def test_run_all_alignment_checks():
+    published = factories.ReferenceDocumentVersionFactory.create(
+        status=ReferenceDocumentVersionStatus.PUBLISHED,
+    )
+    factories.ReferenceDocumentVersionFactory.create(
+        status=ReferenceDocumentVersionStatus.EDITING,
+    )
+
+    with mock.patch("celery.app.task.Task.replace", new=lambda _, t: t):
+        workflow = tasks.run_all_alignment_checks()  # type: ignore
+
+    assert [task.task for task in workflow.tasks] == [
+        tasks.run_alignment_check.name,
+    ]
+    assert workflow.tasks[0].args == (published.pk,)
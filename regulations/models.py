@@ -69,6 +69,7 @@ class Regulation(TrackedModel, ValidityMixin):
     """
 
     identifying_fields = ("role_type", "regulation_id")
+    search_identifier_fields = ("regulation_id",)
 
     record_code = "285"
     subrecord_code = "00"
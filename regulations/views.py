@@ -8,6 +8,7 @@ from rest_framework import viewsets
 from common.models import TrackedModel
 from common.serializers import AutoCompleteSerializer
 from common.validators import UpdateType
+from common.views import CachedAutoCompleteMixin
 from common.views import SortingMixin
 from common.views import TamatoListView
 from common.views import TrackedModelDetailMixin
@@ -28,7 +29,7 @@ from workbaskets.views.generic import CreateTaricUpdateView
 from workbaskets.views.generic import EditTaricView
 
 
-class RegulationViewSet(viewsets.ReadOnlyModelViewSet):
+class RegulationViewSet(CachedAutoCompleteMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint that allows regulations to be viewed."""
 
     serializer_class = AutoCompleteSerializer
@@ -0,0 +1,34 @@
+import django.core.serializers.json
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reports", "0002_create_custom_permissions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReportResult",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("report_slug", models.CharField(max_length=255, unique=True)),
+                ("generated_at", models.DateTimeField()),
+                (
+                    "data",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+            ],
+        ),
+    ]
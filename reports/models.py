@@ -1,3 +1,4 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
 
@@ -5,3 +6,21 @@ class Report(models.Model):
     class Meta:
         # Define the name for the database table (optional)
         db_table = "report"
+
+
+class ReportResult(models.Model):
+    """
+    The stored output of a report that is too expensive to run each time it is
+    viewed.
+
+    Results are regenerated periodically by the
+    :func:`reports.tasks.generate_reports` task and the report page and its
+    exports are served from the stored data.
+    """
+
+    report_slug = models.CharField(max_length=255, unique=True)
+    generated_at = models.DateTimeField()
+    data = models.JSONField(encoder=DjangoJSONEncoder)
+
+    def __str__(self):
+        return f"{self.report_slug} ({self.generated_at:%d %b %Y %H:%M})"
@@ -1,7 +1,10 @@
 from abc import ABC
 
+from django.utils import timezone
 from django.utils.text import slugify
 
+from reports.models import ReportResult
+
 
 class ReportBase(ABC):
     name = "Base Report"
@@ -9,6 +12,9 @@ class ReportBase(ABC):
     report_template = "text"
     description = "This report is pending a description"
     enabled = True
+    materialised = False
+    """If True the report is generated in the background and viewed and
+    exported from its stored result, rather than being run on every request."""
 
     def __init__(self):
         pass
@@ -18,3 +24,44 @@ class ReportBase(ABC):
         result = slugify(cls.name).replace("-", "_")
         result = result.replace("__", "_")
         return result
+
+    def serialise(self) -> dict:
+        """Returns the output of the report, keyed by the name of the method
+        that produces it, in a form that can be stored as JSON."""
+        return {}
+
+    @classmethod
+    def materialise(cls) -> ReportResult:
+        """Runs the report and stores its output, replacing any previously
+        stored result."""
+        result, _ = ReportResult.objects.update_or_create(
+            report_slug=cls.slug(),
+            defaults={
+                "generated_at": timezone.now(),
+                "data": cls().serialise(),
+            },
+        )
+        return result
+
+
+class MaterialisedReport:
+    """
+    Presents the stored result of a report with the same interface as the
+    report itself, so that it can be rendered and exported in the same way.
+
+    Methods whose output was stored return it from the result; everything else
+    is looked up on the report.
+    """
+
+    def __init__(self, report: ReportBase, result: ReportResult):
+        self.report = report
+        self.result = result
+
+    @property
+    def generated_at(self):
+        return self.result.generated_at
+
+    def __getattr__(self, name):
+        if name in self.result.data:
+            return lambda: self.result.data[name]
+        return getattr(self.report, name)
@@ -11,6 +11,9 @@ class ReportBaseChart(ReportBase):
     def __init__(self):
         pass
 
+    def serialise(self) -> dict:
+        return {"data": self.data(), "labels": self.labels()}
+
     @abstractmethod
     def query(self):
         pass
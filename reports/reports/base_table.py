@@ -1,6 +1,7 @@
 from abc import abstractmethod
 
 from django.urls import reverse
+from django.utils.safestring import SafeString
 from django.utils.safestring import mark_safe
 
 from reports.reports.base import ReportBase
@@ -14,6 +15,34 @@ class ReportBaseTable(ReportBase):
     def __init__(self):
         pass
 
+    def serialise(self) -> dict:
+        tables = [("headers", "rows")]
+        if self.tabular_reports:
+            tables += [(f"headers{n}", f"rows{n}") for n in range(2, 5)]
+
+        data = {}
+        for headers, rows in tables:
+            data[headers] = [
+                self.serialise_cell(header) for header in getattr(self, headers)()
+            ]
+            data[rows] = [
+                [self.serialise_cell(cell) for cell in row]
+                for row in getattr(self, rows)()
+            ]
+        return data
+
+    @staticmethod
+    def serialise_cell(cell: dict) -> dict:
+        """Converts a table cell to JSON, keeping rendered links as HTML and
+        anything else as the text it would be displayed as."""
+        cell = dict(cell)
+        text = cell.get("text")
+        if isinstance(text, SafeString):
+            cell["html"] = str(cell.pop("text"))
+        elif not isinstance(text, (str, int, float, bool, type(None))):
+            cell["text"] = str(text)
+        return cell
+
     def link_renderer_for_quotas(self, order_number, text, fragment=None):
         url = reverse("quota-ui-detail", args=[order_number.sid])
         href = url + fragment if fragment else url
@@ -10,6 +10,9 @@ class ReportBaseText(ReportBase):
     def __init__(self):
         pass
 
+    def serialise(self) -> dict:
+        return {"text": self.text()}
+
     @abstractmethod
     def text(self):
         return "Some text from query method"
@@ -6,6 +6,7 @@ from reports.reports.base_table import ReportBaseTable
 
 class Report(ReportBaseTable):
     name = "Blank Goods Nomenclature descriptions"
+    materialised = True
     description = (
         "Goods nomenclature objects which have a blank description object attached."
     )
@@ -13,6 +13,7 @@ from reports.reports.base_table import ReportBaseTable
 class Report(ReportBaseTable):
     name = "Quotas expiring soon"
     enabled = True
+    materialised = True
     description = "This table shows quotas with definition, sub-quota, blocking or suspension periods due to expire in the next 2 months with no future definition period."
     tabular_reports = True
     tab_name = "Definitions"
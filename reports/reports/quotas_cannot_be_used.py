@@ -15,6 +15,7 @@ from reports.reports.base_table import ReportBaseTable
 class Report(ReportBaseTable):
     name = "Quotas missing data"
     enabled = True
+    materialised = True
     description = "This table shows quotas that traders won't be able to use."
 
     def headers(self) -> [dict]:
@@ -0,0 +1,30 @@
+from celery import group
+from celery.utils.log import get_task_logger
+
+from common.celery import app
+from reports import utils
+
+logger = get_task_logger(__name__)
+
+
+@app.task
+def generate_report(report_slug: str):
+    """Runs the report identified by `report_slug` and stores its result."""
+    report_class = utils.get_report_by_slug(report_slug)
+    result = report_class.materialise()
+    logger.info(f"Generated report {report_slug} at {result.generated_at}.")
+
+
+@app.task(bind=True)
+def generate_reports(self):
+    """Regenerates the stored results of all materialised reports, one task per
+    report."""
+    report_slugs = [
+        report_class.slug()
+        for report_class in utils.get_reports()
+        if report_class.materialised
+    ]
+    if not report_slugs:
+        return
+
+    return self.replace(group(generate_report.si(slug) for slug in report_slugs))
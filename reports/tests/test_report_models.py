@@ -1,5 +1,8 @@
 # Create your tests here.
+from datetime import date
+
 import pytest
+from django.utils.safestring import mark_safe
 
 from reports.reports.base import ReportBase
 from reports.reports.base_chart import ReportBaseChart
@@ -147,3 +150,18 @@ class TestIndex:
 
         assert row[0]["text"] == "Blank Goods Nomenclature descriptions"
         assert row[1]["html"] == f'<a href="/reports/{Report.slug()}">View report</a>'
+
+
+class TestReportBaseTableSerialise:
+    def test_serialise_cell_keeps_links_as_html(self):
+        link = mark_safe("<a href='/quotas/1/'>054321</a>")
+
+        assert ReportBaseTable.serialise_cell({"text": link}) == {
+            "html": "<a href='/quotas/1/'>054321</a>",
+        }
+
+    def test_serialise_cell_converts_values_to_text(self):
+        assert ReportBaseTable.serialise_cell({"text": date(2024, 1, 2)}) == {
+            "text": "2024-01-02",
+        }
+        assert ReportBaseTable.serialise_cell({"text": 80}) == {"text": 80}
@@ -1,7 +1,12 @@
 # Create your tests here.
 import pytest
 from django.urls import reverse
+from django.utils import timezone
 
+from reports.models import ReportResult
+from reports.reports.blank_goods_nomenclature_descriptions import (
+    Report as BlankDescriptionsReport,
+)
 from reports.reports.cds_approved import Report as ChartReport
 from reports.reports.expiring_quotas_with_no_definition_period import Report
 from reports.utils import get_reports
@@ -77,3 +82,58 @@ class TestReportViews:
             response["Content-Disposition"]
             == f'attachment; filename="{report_slug}_report.xlsx"'
         )
+
+    def test_materialised_report_rendered_from_stored_result(
+        self,
+        superuser_client,
+    ):
+        ReportResult.objects.create(
+            report_slug=BlankDescriptionsReport.slug(),
+            generated_at=timezone.now(),
+            data={
+                "headers": [{"text": "Commodity code"}],
+                "rows": [[{"text": "0101010101"}]],
+            },
+        )
+
+        response = superuser_client.get(
+            reverse(f"reports:{BlankDescriptionsReport.slug()}"),
+        )
+
+        assert response.status_code == 200
+        assert "0101010101" in response.content.decode()
+        assert "Last updated" in response.content.decode()
+
+    def test_materialised_report_generated_when_not_stored(self, superuser_client):
+        response = superuser_client.get(
+            reverse(f"reports:{BlankDescriptionsReport.slug()}"),
+        )
+
+        assert response.status_code == 200
+        assert ReportResult.objects.filter(
+            report_slug=BlankDescriptionsReport.slug(),
+        ).exists()
+
+    def test_export_report_to_csv_streams_stored_result(self, request):
+        ReportResult.objects.create(
+            report_slug=Report.slug(),
+            generated_at=timezone.now(),
+            data={
+                "headers2": [{"text": "Main quota order number"}],
+                "rows2": [
+                    [{"html": "<a class='govuk-link' href='/quotas/1/'>054321</a>"}],
+                ],
+            },
+        )
+
+        response = export_report_to_csv(
+            request,
+            Report.slug(),
+            current_tab="sub-quota_associations",
+        )
+
+        assert response.streaming
+        assert b"".join(response.streaming_content).decode().splitlines() == [
+            "Main quota order number",
+            "054321",
+        ]
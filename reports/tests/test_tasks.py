@@ -0,0 +1,41 @@
+from unittest import mock
+
+import pytest
+
+from reports import tasks
+from reports.models import ReportResult
+from reports.utils import get_reports
+
+pytestmark = pytest.mark.django_db
+
+
+def test_generate_reports():
+    # The task will replace itself with a new workflow, so capture the workflow
+    # and run its tasks directly.
+    with mock.patch("celery.app.task.Task.replace", new=lambda _, t: t):
+        workflow = tasks.generate_reports()  # type: ignore
+
+    materialised_slugs = {
+        report.slug() for report in get_reports() if report.materialised
+    }
+    assert {task.args[0] for task in workflow.tasks} == materialised_slugs
+
+    for task in workflow.tasks:
+        tasks.generate_report(*task.args)
+
+    assert (
+        set(ReportResult.objects.values_list("report_slug", flat=True))
+        == materialised_slugs
+    )
+
+
+def test_generate_report_replaces_stored_result():
+    report_slug = next(report.slug() for report in get_reports() if report.materialised)
+
+    tasks.generate_report(report_slug)
+    first = ReportResult.objects.get(report_slug=report_slug)
+    tasks.generate_report(report_slug)
+    second = ReportResult.objects.get(report_slug=report_slug)
+
+    assert first.pk == second.pk
+    assert second.generated_at > first.generated_at
@@ -1,3 +1,4 @@
+from reports.models import ReportResult
 from reports.reports import base
 
 
@@ -30,6 +31,24 @@ def get_report_by_slug(slug):
     return None
 
 
+def get_report(report_class):
+    """
+    Returns the report to be viewed or exported.
+
+    Materialised reports are returned from their stored result, which is
+    generated now if it has not been generated yet.
+    """
+    report = report_class()
+    if not report_class.materialised:
+        return report
+
+    result = ReportResult.objects.filter(report_slug=report_class.slug()).first()
+    if result is None:
+        result = report_class.materialise()
+
+    return base.MaterialisedReport(report, result)
+
+
 def get_template_by_type(template_type):
     known_template_types = ["text", "table", "chart", "chart_timescale"]
 
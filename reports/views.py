@@ -1,8 +1,10 @@
 import csv
 import re
+import tempfile
 
 from django.contrib.auth.decorators import permission_required
-from django.http import HttpResponse
+from django.http import FileResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
 from openpyxl import Workbook
 from openpyxl.chart import BarChart
@@ -27,7 +29,7 @@ def report(request):
     report_class = utils.get_report_by_slug(request.resolver_match.url_name)
 
     context = {
-        "report": report_class(),
+        "report": utils.get_report(report_class),
     }
 
     return render(
@@ -37,106 +39,102 @@ def report(request):
     )
 
 
+class Echo:
+    """A pseudo-buffer that returns each value written to it, so that rows can
+    be streamed from :class:`csv.writer` as they are written."""
+
+    def write(self, value):
+        return value
+
+
+def cell_text(cell):
+    """Returns the text of a table cell, with any link reduced to its text."""
+    text = cell.get("html", cell.get("text"))
+    if str(text).startswith("<a"):
+        match = re.search(r">(.*?)<", text)
+        if match:
+            text = match.group(1)
+    return text
+
+
 def export_report_to_csv(request, report_slug, current_tab=None):
     report_class = utils.get_report_by_slug(report_slug)
-    report_instance = report_class()
-
-    response = HttpResponse(content_type="text/csv")
+    report_instance = utils.get_report(report_class)
 
     if current_tab:
-        response["Content-Disposition"] = (
-            f'attachment; filename="{report_slug + "_for_" + current_tab}_report.csv"'
-        )
+        filename = f"{report_slug}_for_{current_tab}_report.csv"
         formatted_current_tab = current_tab.capitalize().replace("_", " ")
 
-        # Define a dictionary to map current_tab values to methods
+        # Map tab names to the methods that produce each tab, so that only the
+        # requested tab is run
         tab_mapping = {
-            report_instance.tab_name: (
-                report_instance.headers(),
-                report_instance.rows(),
-            ),
-            report_instance.tab_name2: (
-                report_instance.headers2(),
-                report_instance.rows2(),
-            ),
-            report_instance.tab_name3: (
-                report_instance.headers3(),
-                report_instance.rows3(),
-            ),
-            report_instance.tab_name4: (
-                report_instance.headers4(),
-                report_instance.rows4(),
-            ),
+            report_instance.tab_name: ("headers", "rows"),
+            report_instance.tab_name2: ("headers2", "rows2"),
+            report_instance.tab_name3: ("headers3", "rows3"),
+            report_instance.tab_name4: ("headers4", "rows4"),
         }
 
         # Use the dictionary to get the methods based on current_tab
         methods = tab_mapping.get(formatted_current_tab)
 
         if methods:
-            headers, rows = methods
+            headers, rows = (getattr(report_instance, name)() for name in methods)
         else:
             # Raise an exception if current_tab doesn't match any expected values
             raise ValueError(f"Invalid current_tab value: {formatted_current_tab}")
     else:
-        response["Content-Disposition"] = (
-            f'attachment; filename="{report_slug}_report.csv"'
-        )
+        filename = f"{report_slug}_report.csv"
         headers = (
             report_instance.headers() if hasattr(report_instance, "headers") else None
         )
         rows = report_instance.rows() if hasattr(report_instance, "rows") else None
 
-    writer = csv.writer(response)
-
-    # Check if the report is a table or a chart
-    if hasattr(report_instance, "headers"):
-        # For table reports
-        writer.writerow([header["text"] for header in headers])
-        for row in rows:
-            for column in row:
-                if str(column["text"]).startswith("<a"):
-                    match = re.search(r">(.*?)<", column["text"])
-                    if match:
-                        column["text"] = match.group(1)
-            writer.writerow([column["text"] for column in row])
-    else:
-        writer.writerow(["Date", "Data"])
+    def csv_rows():
+        writer = csv.writer(Echo())
+
+        # Check if the report is a table or a chart
+        if headers is not None:
+            # For table reports
+            yield writer.writerow([header["text"] for header in headers])
+            for row in rows:
+                yield writer.writerow([cell_text(column) for column in row])
+        else:
+            yield writer.writerow(["Date", "Data"])
+
+            for item in report_instance.data():
+                yield writer.writerow([item["x"], item["y"]])
 
-        for item in report_instance.data():
-            writer.writerow([item["x"], item["y"]])
+                # Add an additional row with empty values because Excel needs this for data recognition
+                yield writer.writerow(["", ""])
 
-            # Add an additional row with empty values because Excel needs this for data recognition
-            writer.writerow(["", ""])
+    response = StreamingHttpResponse(csv_rows(), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
 
     return response
 
 
 def export_report_to_excel(request, report_slug):
     report_class = utils.get_report_by_slug(report_slug)
-    report_instance = report_class()
-
-    response = HttpResponse(
-        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    )
+    report_instance = utils.get_report(report_class)
 
-    response["Content-Disposition"] = (
-        f'attachment; filename="{report_slug}_report.xlsx"'
-    )
-
-    workbook = Workbook()
-    sheet = workbook.active
+    # Write-only workbooks are streamed to disk rather than held in memory, but
+    # do not keep track of how many rows have been written
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
 
     sheet.append(["Date", "Data"])
+    row_count = 1
 
     for item in report_instance.data():
         sheet.append([item["x"], item["y"]])
 
         # Add an additional row with empty values because Excel needs this for data recognition
         sheet.append(["", ""])
+        row_count += 2
 
     chart = BarChart()
-    data = Reference(sheet, min_col=2, min_row=1, max_col=2, max_row=sheet.max_row)
-    categories = Reference(sheet, min_col=1, min_row=2, max_row=sheet.max_row)
+    data = Reference(sheet, min_col=2, min_row=1, max_col=2, max_row=row_count)
+    categories = Reference(sheet, min_col=1, min_row=2, max_row=row_count)
     chart.add_data(data, titles_from_data=True)
     chart.set_categories(categories)
     chart.title = report_instance.name
@@ -148,6 +146,13 @@ def export_report_to_excel(request, report_slug):
 
     sheet.add_chart(chart, "E5")
 
-    workbook.save(response)
+    output = tempfile.TemporaryFile()
+    workbook.save(output)
+    output.seek(0)
 
-    return response
+    return FileResponse(
+        output,
+        as_attachment=True,
+        filename=f"{report_slug}_report.xlsx",
+        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )
@@ -166,6 +166,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "common.models.utils.RequestCacheMiddleware",
     "common.models.utils.ValidateUserWorkBasketMiddleware",
     "common.models.utils.TransactionMiddleware",
     "csp.middleware.CSPMiddleware",
@@ -349,6 +350,15 @@ else:
 
 SQLITE = DB_URL.startswith("sqlite")
 
+# A second connection to the default database, used to record the progress of
+# long running tasks while the transaction that they run in is still open.
+PROGRESS_DATABASE_ALIAS = "progress"
+if DATABASES:
+    DATABASES[PROGRESS_DATABASE_ALIAS] = {
+        **DATABASES["default"],
+        "TEST": {"MIRROR": "default"},
+    }
+
 # -- Cache
 
 # DBT PaaS
@@ -377,6 +387,31 @@ CACHES = {
     },
 }
 
+# Number of seconds that API autocomplete results are cached for. Cache keys
+# change whenever a workbasket is approved or the user's workbasket is edited.
+AUTOCOMPLETE_CACHE_TIMEOUT = int(os.environ.get("AUTOCOMPLETE_CACHE_TIMEOUT", "3600"))
+
+# Number of seconds that tariff API responses are cached for, and the number of
+# seconds after that during which a stale response is still served while it is
+# refreshed in the background. Setting the first to 0 disables caching.
+TARIFF_API_CACHE_TIMEOUT = int(os.environ.get("TARIFF_API_CACHE_TIMEOUT", "300"))
+TARIFF_API_CACHE_STALE_TIMEOUT = int(
+    os.environ.get("TARIFF_API_CACHE_STALE_TIMEOUT", "3600"),
+)
+
+# Number of seconds that commodity tree snapshots used by the commodity views
+# are cached for. Cache keys change whenever a workbasket is approved.
+COMMODITY_TREE_CACHE_TIMEOUT = int(
+    os.environ.get("COMMODITY_TREE_CACHE_TIMEOUT", str(60 * 60 * 24)),
+)
+
+# Number of seconds that the geographical areas and memberships loaded by the
+# reference document alignment checks are cached for. Cache keys change
+# whenever a workbasket is approved.
+ALIGNMENT_CHECK_CACHE_TIMEOUT = int(
+    os.environ.get("ALIGNMENT_CHECK_CACHE_TIMEOUT", str(60 * 60 * 24)),
+)
+
 # Importer settings
 NURSERY_CACHE_ENGINE = os.getenv(
     "NURSERY_CACHE_ENGINE",
@@ -587,6 +622,10 @@ CROWN_DEPENDENCIES_API_URL_PATH = os.environ.get(
 )
 CROWN_DEPENDENCIES_GET_API_KEY = os.environ.get("CROWN_DEPENDENCIES_GET_API_KEY", "")
 CROWN_DEPENDENCIES_POST_API_KEY = os.environ.get("CROWN_DEPENDENCIES_POST_API_KEY", "")
+# Number of envelopes to load from storage ahead of the one being published
+CROWN_DEPENDENCIES_API_PREFETCH = int(
+    os.environ.get("CROWN_DEPENDENCIES_API_PREFETCH", "2"),
+)
 
 
 if is_copilot():
@@ -648,6 +687,27 @@ if ENABLE_CROWN_DEPENDENCIES_PUBLISHING:
         "schedule": CROWN_DEPENDENCIES_API_CRON,
     }
 
+ENABLE_REPORTS_SCHEDULE = is_truthy(
+    os.environ.get("ENABLE_REPORTS_SCHEDULE", "True"),
+)
+if ENABLE_REPORTS_SCHEDULE:
+    # `REPORTS_CRONTAB` sets the time, in crontab format, that the stored
+    # results of materialised reports are regenerated.
+    REPORTS_CRONTAB = os.environ.get(
+        "REPORTS_CRONTAB",
+        "0 * * * *",
+    )
+    CELERY_BEAT_SCHEDULE["generate_reports"] = {
+        "task": "reports.tasks.generate_reports",
+        "schedule": crontab(*REPORTS_CRONTAB.split()),
+    }
+
+# Sweep up any pending notifications whose dispatch task was lost.
+CELERY_BEAT_SCHEDULE["send_pending_notifications"] = {
+    "task": "notifications.tasks.send_emails_task",
+    "schedule": crontab(minute="*/10"),
+}
+
 CELERY_ROUTES = {
     "workbaskets.tasks.call_check_workbasket_sync": {
         "queue": "rule-check",
@@ -673,7 +733,7 @@ CELERY_ROUTES = {
     re.compile(r"(taric_parsers)\.tasks\..*"): {
         "queue": "importer",
     },
-    re.compile(r"(exporter|notifications|publishing)\.tasks\..*"): {
+    re.compile(r"(exporter|notifications|publishing|reports)\.tasks\..*"): {
         "queue": "standard",
     },
     "measures.tasks.bulk_create_measures": {
@@ -897,10 +957,6 @@ TRANSACTION_SCHEMA = os.getenv("TRANSACTION_SCHEMA", "workbaskets.models.SEED_FI
 
 # Default max number of objects that will be accurately counted by LimitedPaginator.
 LIMITED_PAGINATOR_MAX_COUNT = 200
-# Default max number of objects that will be accurately counted by MeasurePaginator.
-MEASURES_PAGINATOR_MAX_COUNT = int(
-    os.environ.get("MEASURES_PAGINATOR_MAX_COUNT", "1000"),
-)
 
 # key used to instantiate GOVUK Notify python client
 NOTIFICATIONS_API_KEY = os.environ.get("NOTIFICATIONS_API_KEY")
@@ -912,6 +968,18 @@ MAX_LOADING_REPORT_FILE_SIZE_MEGABYTES = int(
     os.environ.get("MAX_LOADING_REPORT_FILE_SIZE_MEGABYTES", "2"),
 )
 
+# Dotted path of the class used to deliver notification emails - see
+# notifications.transports.
+NOTIFICATIONS_TRANSPORT = os.environ.get(
+    "NOTIFICATIONS_TRANSPORT",
+    "notifications.transports.NotifyTransport",
+)
+# File that notification emails are appended to when using FileTransport.
+NOTIFICATIONS_FILE_TRANSPORT_PATH = os.environ.get(
+    "NOTIFICATIONS_FILE_TRANSPORT_PATH",
+    "notifications.jsonl",
+)
+
 # GOV.UK Notify template IDs used for publishing package notifications.
 READY_FOR_CDS_TEMPLATE_ID = os.environ.get("READY_FOR_CDS_TEMPLATE_ID")
 CDS_ACCEPTED_TEMPLATE_ID = os.environ.get("CDS_ACCEPTED_TEMPLATE_ID")
@@ -39,6 +39,11 @@ CACHES = {
 
 NURSERY_CACHE_ENGINE = "importer.cache.memory.MemoryCacheEngine"
 
+# Don't cache tariff API responses, which are mocked differently by each test.
+TARIFF_API_CACHE_TIMEOUT = 0
+
+NOTIFICATIONS_TRANSPORT = "notifications.transports.InMemoryTransport"
+
 SKIP_WORKBASKET_VALIDATION = is_truthy(os.getenv("SKIP_WORKBASKET_VALIDATION", True))
 USE_IMPORTER_CACHE = is_truthy(os.getenv("USE_IMPORTER_CACHE", False))
 
@@ -1,6 +1,5 @@
 """WorkBasket models."""
 
-import hashlib
 import importlib
 import logging
 from abc import ABCMeta
@@ -13,13 +12,22 @@ from typing import Tuple
 from celery.result import AsyncResult
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.aggregates import StringAgg
 from django.core.exceptions import ImproperlyConfigured
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import CharField
+from django.db.models import Count
 from django.db.models import Max
 from django.db.models import Q
 from django.db.models import QuerySet
 from django.db.models import Subquery
+from django.db.models import Value
+from django.db.models.functions import MD5
+from django.db.models.functions import Cast
+from django.db.models.functions import Concat
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.utils.timezone import make_aware
 from django_fsm import FSMField
 from django_fsm import transition
@@ -35,6 +43,8 @@ from common.models.trackedmodel import TrackedModel
 from common.models.transactions import Transaction
 from common.models.transactions import TransactionPartition
 from common.models.transactions import TransactionQueryset
+from common.models.utils import clear_request_cache
+from common.models.utils import request_cached
 from measures.models import Measure
 from measures.querysets import MeasuresQuerySet
 from workbaskets.util import serialize_uploaded_data
@@ -472,8 +482,10 @@ class WorkBasket(TimestampedMixin):
         Used by the missing measures check to compare the state of measures and
         commodities in a workbasket to see what's changed.
 
-        Uses __dict__ to look at tracked model values then hashes the result so
-        we can keep to a fixed output length. See MissingMeasuresCheck and
+        The fingerprint is computed in the database from the identity, version
+        and last update time of each commodity and measure in the workbasket,
+        so it changes whenever one is added, removed, reordered or edited
+        without having to load and serialise them. See MissingMeasuresCheck and
         check_workbasket_for_missing_measures.
         """
         # avoid circular import
@@ -481,18 +493,22 @@ class WorkBasket(TimestampedMixin):
 
         changes = self.tracked_models.filter(
             Q(instance_of=GoodsNomenclature) | Q(instance_of=Measure),
-        ).order_by("pk")
-        snapshot = "".join(
-            [
-                # ignore django's ModelState object
-                "".join([str(v) for k, v in c.__dict__.items() if k != "_state"])
-                for c in changes
-            ],
         )
-        value = bytes(f"{snapshot}", "utf-8")
-        hash = hashlib.sha256()
-        hash.update(value)
-        return hash.hexdigest()
+        version = Concat(
+            Cast("pk", CharField()),
+            Value(":"),
+            Cast("transaction_id", CharField()),
+            Value(":"),
+            Cast("update_type", CharField()),
+            Value(":"),
+            Cast("updated_at", CharField()),
+            output_field=CharField(),
+        )
+        return changes.aggregate(
+            hash=MD5(
+                StringAgg(version, delimiter=",", ordering="pk", default=Value("")),
+            ),
+        )["hash"]
 
     def __str__(self):
         return f"({self.pk}) [{self.status}]"
@@ -615,21 +631,42 @@ class WorkBasket(TimestampedMixin):
     def measures(self) -> MeasuresQuerySet:
         return Measure.objects.filter(transaction__workbasket=self)
 
+    def get_contents_state(self) -> str:
+        """Returns a string that changes whenever a model is added to, removed
+        from or edited within the workbasket."""
+        state = self.tracked_models.aggregate(
+            count=Count("pk"),
+            latest_pk=Max("pk"),
+            latest_update=Max("updated_at"),
+        )
+        return (
+            f"{self.pk}:{state['count']}:{state['latest_pk']}:{state['latest_update']}"
+        )
+
     @classmethod
     def current(cls, request):
-        """Get the user's current workbasket."""
-        try:
-            workbasket = request.user.current_workbasket
-        except AttributeError:
-            return None
+        """
+        Get the user's current workbasket.
 
-        if workbasket is not None:
-            if workbasket.status != WorkflowStatus.EDITING:
-                request.user.remove_current_workbasket()
+        The workbasket is resolved at most once per request (see
+        ``common.models.utils.request_cached()``).
+        """
+
+        def get_current_workbasket():
+            try:
+                workbasket = request.user.current_workbasket
+            except AttributeError:
+                return None
+
+            if workbasket is not None:
+                if workbasket.status != WorkflowStatus.EDITING:
+                    request.user.remove_current_workbasket()
+                    return None
+                return workbasket
+            else:
                 return None
-            return workbasket
-        else:
-            return None
+
+        return request_cached("current_workbasket", get_current_workbasket)
 
     @classmethod
     def get_current_transaction(cls, request):
@@ -637,7 +674,7 @@ class WorkBasket(TimestampedMixin):
         if workbasket:
             return workbasket.current_transaction
 
-        return Transaction.approved.last()
+        return Transaction.latest_approved()
 
     def new_transaction(self, **kwargs):
         """Create a new transaction in this workbasket."""
@@ -696,7 +733,10 @@ class WorkBasket(TimestampedMixin):
         This is last transaction ordered by partition and order, or the most
         recent approved transaction if no transactions are in the workbasket.
         """
-        return self.transactions.last() or Transaction.approved.last()
+        return request_cached(
+            ("current_transaction", self.pk),
+            lambda: self.transactions.last() or Transaction.latest_approved(),
+        )
 
     @property
     def tracked_model_checks(self):
@@ -798,6 +838,13 @@ class WorkBasket(TimestampedMixin):
         verbose_name_plural = "workbaskets"
 
 
+@receiver(post_save, sender=WorkBasket, dispatch_uid="workbasket_saved")
+def clear_request_cache_on_workbasket_change(sender, **kwargs):
+    """Values cached for the current request may include the user's current
+    workbasket, so clear them whenever a workbasket is saved."""
+    clear_request_cache()
+
+
 class DataUpload(models.Model):
     raw_data = models.TextField()
     workbasket = models.ForeignKey(
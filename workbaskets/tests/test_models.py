@@ -12,6 +12,7 @@ from checks.tests.factories import TransactionCheckFactory
 from common.models import TrackedModel
 from common.models.transactions import Transaction
 from common.models.transactions import TransactionPartition
+from common.models.utils import override_request_cache
 from common.tests import factories
 from common.tests.factories import ApprovedTransactionFactory
 from common.tests.factories import SeedFileTransactionFactory
@@ -330,6 +331,27 @@ def test_current_transaction_returns_last_approved_transaction(
     assert current == approved_transaction
 
 
+def test_current_workbasket_and_transaction_resolved_once_per_request(
+    session_request_with_workbasket,
+    django_assert_num_queries,
+):
+    """Check that the current workbasket and transaction are resolved from the
+    database once per request, and again after a transaction is created."""
+    request = session_request_with_workbasket
+
+    with override_request_cache():
+        workbasket = WorkBasket.current(request)
+        current = WorkBasket.get_current_transaction(request)
+
+        with django_assert_num_queries(0):
+            assert WorkBasket.current(request) == workbasket
+            assert WorkBasket.get_current_transaction(request) == current
+            assert workbasket.current_transaction == current
+
+        new_transaction = workbasket.new_transaction()
+        assert WorkBasket.get_current_transaction(request) == new_transaction
+
+
 @pytest.mark.parametrize(
     "method, source, target",
     [
@@ -500,6 +522,37 @@ def test_terminate_missing_measures_check_no_id():
     assert workbasket.terminate_missing_measures_check() is None
 
 
+def test_commodity_measure_changes_hash(
+    user_workbasket,
+    django_assert_num_queries,
+):
+    """Test that the commodity and measure fingerprint changes whenever a
+    commodity or measure in the workbasket is added, edited or removed, and is
+    computed with a single query."""
+    empty_hash = user_workbasket.commodity_measure_changes_hash
+
+    with user_workbasket.new_transaction() as transaction:
+        measure = factories.MeasureFactory.create(transaction=transaction)
+    with django_assert_num_queries(1):
+        added_hash = user_workbasket.commodity_measure_changes_hash
+    assert added_hash != empty_hash
+    assert added_hash == user_workbasket.commodity_measure_changes_hash
+
+    with user_workbasket.new_transaction() as transaction:
+        factories.FootnoteFactory.create(transaction=transaction)
+    assert user_workbasket.commodity_measure_changes_hash == added_hash
+
+    measure.save(force_write=True)
+    edited_hash = user_workbasket.commodity_measure_changes_hash
+    assert edited_hash != added_hash
+
+    measure.delete()
+    assert user_workbasket.commodity_measure_changes_hash not in (
+        added_hash,
+        edited_hash,
+    )
+
+
 def test_dequeue_reverts_current_version(valid_user, user_workbasket):
     """Test that when dequeueing a workbasket with 2 updates of the same object
     that the current version is correctly reverted."""
@@ -2162,6 +2162,53 @@ def test_workbasket_compare_found_measures(
     assert len(soup.select("tbody")[1].select("tr")) == 1
 
 
+def test_workbasket_compare_stores_rows(valid_user_client, user_workbasket):
+    url = reverse("workbaskets:workbasket-check-ui-compare")
+    data = {
+        "data": (
+            "0000000001\t1.000%\t20/05/2021\t31/08/2024\n"
+            "0000000002\t2.000%\t20/05/2021\t31/08/2024\n"
+        ),
+    }
+    valid_user_client.post(url, data)
+    valid_user_client.post(url, data)
+
+    data_upload = models.DataUpload.objects.get(workbasket=user_workbasket)
+    assert list(
+        data_upload.rows.order_by("pk").values_list("commodity", flat=True)
+    ) == [
+        "0000000001",
+        "0000000002",
+    ]
+
+
+def test_workbasket_compare_matching_measures_cached(
+    valid_user_client,
+    user_workbasket,
+):
+    url = reverse("workbaskets:workbasket-check-ui-compare")
+    valid_user_client.post(
+        url,
+        {"data": "0000000001\t1.000%\t20/05/2021\t31/08/2024\n"},
+    )
+
+    with patch.object(
+        ui.WorkBasketCompare,
+        "get_matching_measure_pks",
+        autospec=True,
+        return_value=[],
+    ) as get_matching_measure_pks:
+        valid_user_client.get(url)
+        valid_user_client.get(url)
+        assert get_matching_measure_pks.call_count == 1
+
+        # Changing the contents of the workbasket invalidates the cached matches.
+        with user_workbasket.new_transaction():
+            factories.MeasureFactory.create()
+        valid_user_client.get(url)
+        assert get_matching_measure_pks.call_count == 2
+
+
 def make_goods_import_batch(importer_storage, **kwargs):
     return factories.ImportBatchFactory.create(
         status=ImportBatchStatus.SUCCEEDED,
@@ -83,14 +83,20 @@ def find_date(cell):
         return cell
 
 
-def find_duty_sentence(cell, row_data):
+def create_duty_sentence_parser():
     from measures.parsers import DutySentenceParser
 
     # because we may not know the measure validity period, take today's date instead
     # we only need to look for something that looks like a duty sentence, not necessarily a valid one
-    duty_sentence_parser = DutySentenceParser.create(
+    return DutySentenceParser.create(
         date.today(),
     )
+
+
+def find_duty_sentence(cell, row_data, duty_sentence_parser=None):
+    if duty_sentence_parser is None:
+        duty_sentence_parser = create_duty_sentence_parser()
+
     duty_sentence = cell.replace(" ", "")
     try:
         duty_sentence_parser.parse(duty_sentence)
@@ -153,6 +159,9 @@ def serialize_uploaded_data(data):
     serialized = []
     rows = data.strip().split("\n")
     table = [row.strip().split("\t") for row in rows]
+    # Creating a parser loads the duty expressions and units from the
+    # database, so create one to share between all of the cells
+    duty_sentence_parser = None
 
     for row in table:
         row_data = TableRow()
@@ -170,7 +179,9 @@ def serialize_uploaded_data(data):
                 dates.append(found_date)
                 continue
 
-            duty_sentence = find_duty_sentence(cell, row_data)
+            if duty_sentence_parser is None:
+                duty_sentence_parser = create_duty_sentence_parser()
+            duty_sentence = find_duty_sentence(cell, row_data, duty_sentence_parser)
             if duty_sentence:
                 continue
 
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import re
 from datetime import date
@@ -13,12 +14,15 @@ from celery.result import AsyncResult
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.exceptions import PermissionDenied
 from django.core.paginator import Paginator
 from django.db.models import Case
 from django.db.models import DateField
+from django.db.models import Exists
 from django.db.models import F
+from django.db.models import OuterRef
 from django.db.models import ProtectedError
 from django.db.models import Q
 from django.db.models import QuerySet
@@ -1224,56 +1228,87 @@ class WorkBasketCompare(WithCurrentWorkBasket, FormView):
     def workbasket_measures(self):
         return self.workbasket.measures.all()
 
-    @property
+    matching_measures_cache_timeout = 60 * 60
+    """The number of seconds that the measures matching an upload are cached
+    for."""
+
+    @cached_property
     def data_upload(self):
         try:
             return DataUpload.objects.get(workbasket=self.workbasket)
         except DataUpload.DoesNotExist:
             return None
 
+    @atomic
     def form_valid(self, form):
-        try:
-            existing = DataUpload.objects.get(workbasket=self.workbasket)
-            existing.raw_data = form.cleaned_data["raw_data"]
-            existing.rows.all().delete()
-            for row in form.cleaned_data["data"]:
-                DataRow.objects.create(
-                    valid_between=row.valid_between,
-                    duty_sentence=row.duty_sentence,
-                    commodity=row.commodity,
-                    data_upload=existing,
-                )
-            existing.save()
-        except DataUpload.DoesNotExist:
-            data_upload = DataUpload.objects.create(
-                raw_data=form.cleaned_data["raw_data"],
-                workbasket=self.workbasket,
+        data_upload, created = DataUpload.objects.update_or_create(
+            workbasket=self.workbasket,
+            defaults={"raw_data": form.cleaned_data["raw_data"]},
+        )
+        if not created:
+            data_upload.rows.all().delete()
+
+        DataRow.objects.bulk_create(
+            DataRow(
+                valid_between=row.valid_between,
+                duty_sentence=row.duty_sentence,
+                commodity=row.commodity,
+                data_upload=data_upload,
             )
-            for row in form.cleaned_data["data"]:
-                DataRow.objects.create(
-                    valid_between=row.valid_between,
-                    duty_sentence=row.duty_sentence,
-                    commodity=row.commodity,
-                    data_upload=data_upload,
-                )
+            for row in form.cleaned_data["data"]
+        )
         return super().form_valid(form)
 
-    @property
+    def get_matching_measures_cache_key(self) -> str:
+        """Returns a cache key that changes whenever the upload or the contents
+        of the workbasket change."""
+        key = ":".join(
+            [
+                str(self.data_upload.pk),
+                self.data_upload.raw_data,
+                self.workbasket.get_contents_state(),
+            ],
+        )
+        return f"worksheet-compare:{hashlib.sha256(key.encode()).hexdigest()}"
+
+    def get_matching_measure_pks(self) -> list[int]:
+        """Returns the primary keys of workbasket measures that have the same
+        commodity code, validity period and duty sentence as an uploaded row,
+        found in a single query."""
+        matching_rows = self.data_upload.rows.filter(
+            commodity=OuterRef("goods_nomenclature__item_id"),
+            valid_between=OuterRef("valid_between"),
+            duty_sentence=OuterRef("db_duty_sentence"),
+        )
+        return list(
+            self.workbasket_measures.with_duty_sentence()
+            .filter(Exists(matching_rows))
+            .order_by("goods_nomenclature__item_id", "sid")
+            .values_list("pk", flat=True),
+        )
+
+    @cached_property
     def matching_measures(self):
-        measures = []
-        if self.data_upload:
-            for row in self.data_upload.rows.all():
-                matches = self.workbasket_measures.filter(
-                    valid_between=row.valid_between,
-                    goods_nomenclature__item_id=row.commodity,
-                )
-                duty_matches = [
-                    measure
-                    for measure in matches
-                    if measure.duty_sentence == row.duty_sentence
-                ]
-                measures += duty_matches
-        return measures
+        if not self.data_upload:
+            return []
+
+        pks = cache.get_or_set(
+            self.get_matching_measures_cache_key(),
+            self.get_matching_measure_pks,
+            self.matching_measures_cache_timeout,
+        )
+        measures = (
+            Measure.objects.filter(pk__in=pks)
+            .select_related(
+                "measure_type",
+                "goods_nomenclature",
+                "additional_code__type",
+                "geographical_area",
+                "order_number",
+            )
+            .with_duty_sentence()
+        )
+        return sorted(measures, key=lambda measure: pks.index(measure.pk))
 
     def get_context_data(self, *args, **kwargs):
         return super().get_context_data(
@@ -1586,6 +1621,7 @@ class WorkBasketReviewMeasuresView(WorkBasketReviewView):
                 "order_number",
                 "generating_regulation",
             )
+            .with_duty_sentence()
             .order_by("sid")
         )
 
@@ -2020,7 +2056,7 @@ class AutoEndDateMeasures(SortingMixin, WithPaginationListMixin, ListView):
         )
 
         return measures.with_effective_valid_between().exclude(
-            db_effective_valid_between__not_gt=F("commodity_valid_between"),
+            effective_validity__valid_between__not_gt=F("commodity_valid_between"),
         )
 
     def get_footnote_associations_to_end_date(self) -> QuerySet: